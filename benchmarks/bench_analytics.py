@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Benchmark: dict-of-dicts player statistics vs. the vectorized PlayerMatrix.
+
+Generates a synthetic archive set (default 1,000 players × 1,000 days, each
+player present on ~70% of days) and times the same statistics both ways.
+
+Usage:
+    uv run benchmarks/bench_analytics.py
+    uv run benchmarks/bench_analytics.py --players 200 --days 365 --h2h 30
+"""
+import sys
+import time
+import bisect
+import random
+import argparse
+import statistics
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from fan2quizz.analytics import PlayerMatrix  # noqa: E402
+
+
+def make_archives(n_players, n_days, presence=0.7, seed=0):
+    rng = random.Random(seed)
+    names = [f"player{i:05d}" for i in range(n_players)]
+    skill = {name: rng.uniform(6, 16) for name in names}
+    start = date(2022, 1, 1)
+    archives = []
+    for d in range(n_days):
+        results = []
+        for name in names:
+            if rng.random() > presence:
+                continue
+            score = max(0, min(20, int(rng.gauss(skill[name], 2.5))))
+            results.append({"user": name, "good_responses": score, "elapsed_time": rng.randint(60, 400)})
+        results.sort(key=lambda r: (-r["good_responses"], r["elapsed_time"]))
+        for rank, r in enumerate(results, 1):
+            r["rank"] = rank
+        archives.append({"date": (start + timedelta(days=d)).isoformat(), "results": results})
+    return names, archives
+
+
+def legacy_stats(archives, players, window, threshold, h2h_players):
+    """The pre-PlayerMatrix approach: per-player dicts and Python loops."""
+    wanted = {p.lower() for p in players}
+    evolution = {}
+    day_keys = {}
+    for archive in archives:
+        day = archive["date"]
+        keys = []
+        for entry in archive["results"]:
+            user = entry["user"].lower()
+            key = entry["good_responses"] * 1_000_000 - entry["elapsed_time"]
+            keys.append(key)
+            if user in wanted:
+                evolution.setdefault(user, {})[day] = (entry["good_responses"], key)
+        day_keys[day] = sorted(keys)
+
+    out = {}
+    for user, days in evolution.items():
+        dates = sorted(days)
+        scores = [days[d][0] for d in dates]
+        rolling = [statistics.mean(scores[max(0, i - window + 1):i + 1]) for i in range(len(scores))]
+        pct = []
+        for d in dates:
+            key = days[d][1]
+            others = day_keys[d]
+            below = bisect.bisect_left(others, key)
+            equal = bisect.bisect_right(others, key) - below
+            pct.append(100.0 * (below + 0.5 * (equal - 1)) / max(1, len(others) - 1))
+        longest = current = 0
+        for s in scores:
+            current = current + 1 if s >= threshold else 0
+            longest = max(longest, current)
+        out[user] = {
+            "avg": statistics.mean(scores), "best": max(scores), "worst": min(scores),
+            "trend": scores[-1] - scores[0], "rolling": rolling[-1], "pct": statistics.mean(pct),
+            "streak": (current, longest),
+        }
+
+    h2h = {}
+    for a in h2h_players:
+        for b in h2h_players:
+            if a == b:
+                continue
+            wins = played = 0
+            for d, (_, key_a) in evolution.get(a, {}).items():
+                other = evolution.get(b, {}).get(d)
+                if other is not None:
+                    played += 1
+                    wins += key_a > other[1]
+            h2h[(a, b)] = (wins, played)
+    return out, h2h
+
+
+def matrix_stats(archives, players, window, threshold, h2h_players):
+    matrix = PlayerMatrix.from_archives(archives, players)
+    stats = (
+        matrix.mean(), matrix.best(), matrix.worst(), matrix.trend(),
+        matrix.rolling_mean(window), matrix.percentile_rank().mean(axis=1),
+        matrix.streaks(threshold), matrix.trend_slopes(),
+    )
+    h2h = matrix.head_to_head(h2h_players)
+    return matrix, stats, h2h
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark player analytics")
+    parser.add_argument('--players', type=int, default=1000)
+    parser.add_argument('--days', type=int, default=1000)
+    parser.add_argument('--window', type=int, default=7)
+    parser.add_argument('--threshold', type=int, default=15)
+    parser.add_argument('--h2h', type=int, default=50,
+                        help='Players in the head-to-head comparison (legacy cost is quadratic)')
+    args = parser.parse_args()
+
+    print(f"🧪 Generating {args.players:,} players × {args.days:,} days...")
+    players, archives = make_archives(args.players, args.days)
+    h2h_players = players[:args.h2h]
+    entries = sum(len(a["results"]) for a in archives)
+    print(f"   {entries:,} leaderboard entries")
+
+    (legacy, legacy_h2h), t_legacy = timed(legacy_stats, archives, players, args.window, args.threshold, h2h_players)
+    (matrix, _, (_, wins, played)), t_matrix = timed(matrix_stats, archives, players, args.window, args.threshold, h2h_players)
+
+    # Sanity check: both paths agree on the basics
+    mean = matrix.mean()
+    for name in players[:20]:
+        if name in legacy:
+            assert abs(legacy[name]["avg"] - float(mean[matrix.row(name)])) < 1e-9, name
+    a, b = h2h_players[0], h2h_players[1]
+    assert legacy_h2h[(a, b)] == (int(wins[0, 1]), int(played[0, 1]))
+
+    print(f"\n{'Approach':<22} {'Time':>10}")
+    print("-" * 33)
+    print(f"{'dict-of-dicts loops':<22} {t_legacy:>9.2f}s")
+    print(f"{'PlayerMatrix (NumPy)':<22} {t_matrix:>9.2f}s")
+    print(f"\n⚡ Speed-up: {t_legacy / t_matrix:.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
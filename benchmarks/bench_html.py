@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark: HTML parsing in QuizypediaScraper, lxml (compiled XPath) vs the BeautifulSoup fallback.
+
+Pages come from benchmarks/corpus.py: an archive page with ``--players``
+leaderboard rows (embedded JSON, as the site serves it) and the same
+leaderboard rendered as an HTML table, plus a category listing and a quiz
+page from the stub server. Each operation runs with FAN2QUIZZ_HTML_PARSER set
+to each backend; the best of ``--repeat`` runs is reported.
+
+Usage:
+    uv run benchmarks/bench_html.py
+    uv run benchmarks/bench_html.py --players 20000 --repeat 3
+"""
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+for path in (ROOT, ROOT / "benchmarks"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import corpus as corpus_gen  # noqa: E402
+from stub_server import Catalog  # noqa: E402
+from fan2quizz.scraper import HTML_PARSER_ENV, QuizypediaScraper, parse_html  # noqa: E402
+from fan2quizz.utils import RateLimiter  # noqa: E402
+
+DAY = '2024-03-01'
+
+
+def table_page(rows, shell):
+    """The leaderboard as a server-rendered table (what fetch_daily_archive_player parses first)."""
+    head, foot = shell
+    body = "\n".join(
+        f'<tr><td class="rank">{r["rank"]}</td><td class="user"><a href="/membre/{r["user"]}/">{r["user"]}</a></td>'
+        f'<td>{r["good_responses"]} / {corpus_gen.QUESTIONS_PER_DAY}</td><td>{r["elapsed_time"]} s</td></tr>'
+        for r in rows)
+    return (f'<!DOCTYPE html><html lang="fr-FR"><head><title>Classement du {DAY}</title>{head}</head><body>'
+            f'<table class="classement"><thead><tr><th>#</th><th>Joueur</th><th>Score</th><th>Temps</th></tr></thead>'
+            f'<tbody>{body}</tbody></table>{foot}</body></html>')
+
+
+def best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scraper's HTML parsing backends")
+    parser.add_argument('--players', type=int, default=5000, help='Leaderboard rows per archive page')
+    parser.add_argument('--tracked', type=int, default=12, help='Players looked up on the same page')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    shell = corpus_gen.page_shell()
+    rows = corpus_gen.make_leaderboard(DAY, corpus_gen.player_names(args.players))
+    archive = corpus_gen.archive_html(DAY, corpus_gen.make_questions(DAY), rows, shell)
+    table = table_page(rows, shell)
+    catalog = Catalog(600)
+    listing = catalog.listing(catalog.slugs[0], 1)
+    quiz = catalog.quiz('quiz-00042')
+    last = rows[-1]['user']  # worst case: the row scanned last
+    tracked = [row['user'] for row in rows[::max(1, len(rows) // args.tracked)]][:args.tracked]
+    scraper = QuizypediaScraper(rate_limiter=RateLimiter(0))
+
+    cases = [
+        (f"parse table page ({len(table) // 1024} KiB)", lambda: parse_html(table)),
+        ("player row (table)", lambda: scraper.fetch_daily_archive_player(2024, 3, 1, last, html=table)),
+        (f"player row (JSON page, {len(archive) // 1024} KiB)",
+         lambda: scraper.fetch_daily_archive_player(2024, 3, 1, last, html=archive)),
+        (f"{len(tracked)} players, one call each (table)",
+         lambda: [scraper.fetch_daily_archive_player(2024, 3, 1, name, html=table) for name in tracked]),
+        (f"{len(tracked)} players, one batch (table)",
+         lambda: scraper.fetch_daily_archive_players(2024, 3, 1, tracked, html=table)),
+        (f"{len(tracked)} players, one batch (JSON page)",
+         lambda: scraper.fetch_daily_archive_players(2024, 3, 1, tracked, html=archive)),
+        ("quiz_links (listing)", lambda: scraper.quiz_links(listing)),
+        ("parse_daily_live (quiz)", lambda: scraper.parse_daily_live(quiz)),
+    ]
+    backends = ('lxml', 'bs4')
+    print(f"🧪 {args.players:,} leaderboard rows, best of {args.repeat}")
+    print(f"\n{'Operation':<34}" + "".join(f"{b:>11}" for b in backends) + f"{'Speedup':>10}")
+    print("-" * 66)
+    previous = os.environ.get(HTML_PARSER_ENV)
+    try:
+        for label, fn in cases:
+            timings = []
+            results = []
+            for backend in backends:
+                os.environ[HTML_PARSER_ENV] = backend
+                results.append(fn() if not label.startswith('parse table') else None)
+                timings.append(best_of(fn, args.repeat))
+            same = '' if results[0] == results[1] else '  ⚠️ results differ'
+            print(f"{label:<34}" + "".join(f"{t * 1000:>9.1f}ms" for t in timings)
+                  + f"{timings[1] / timings[0]:>9.1f}x{same}")
+    finally:
+        if previous is None:
+            os.environ.pop(HTML_PARSER_ENV, None)
+        else:
+            os.environ[HTML_PARSER_ENV] = previous
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
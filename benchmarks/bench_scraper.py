@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Benchmark: archive backfill through QuizypediaScraper against the local stub server.
+
+Starts benchmarks/stub_server.py in-process with the requested latency and
+fault injection, then fetches ``--days`` archive pages (as
+manage_archive.py --download does: fetch, extract the payload, decode it)
+sequentially and with ``--workers`` threads (one scraper/session each).
+Reports throughput, latency percentiles and the statuses the server sent.
+
+Usage:
+    uv run benchmarks/bench_scraper.py
+    uv run benchmarks/bench_scraper.py --days 60 --latency 120 --jitter 60 --workers 8
+    uv run benchmarks/bench_scraper.py --throttle-rate 0.1 --error-rate 0.05 --delay 0.2
+"""
+import sys
+import time
+import argparse
+import statistics
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+for path in (ROOT, ROOT / "benchmarks"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import requests  # noqa: E402
+
+from stub_server import StubServer  # noqa: E402
+from fan2quizz.leaderboard import bracket_scan_payload, parse_results  # noqa: E402
+from fan2quizz.scraper import QuizypediaScraper  # noqa: E402
+from fan2quizz.utils import RateLimiter  # noqa: E402
+
+
+def backfill_one(scraper, day):
+    """Fetch and decode one archive; returns (seconds, rows or None, error or None)."""
+    start = time.perf_counter()
+    try:
+        html = scraper.get_daily_archive_html(day.year, day.month, day.day)
+        raw = bracket_scan_payload(html)
+        rows = parse_results(raw) if raw else None
+        return time.perf_counter() - start, rows, None
+    except requests.RequestException as e:
+        status = getattr(e.response, 'status_code', None)
+        return time.perf_counter() - start, None, status or type(e).__name__
+
+
+def run(server_url, days, workers, delay):
+    def scraper():
+        return QuizypediaScraper(base_url=server_url, rate_limiter=RateLimiter(delay))
+
+    start = time.perf_counter()
+    if workers == 1:
+        s = scraper()
+        results = [backfill_one(s, day) for day in days]
+    else:
+        scrapers = [scraper() for _ in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda item: backfill_one(scrapers[item[0] % workers], item[1]),
+                                    enumerate(days)))
+    return time.perf_counter() - start, results
+
+
+def report(label, wall, results):
+    latencies = sorted(t for t, _, _ in results)
+    ok = sum(1 for _, rows, _ in results if rows)
+    errors = Counter(str(err) for _, _, err in results if err)
+    p95 = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+    print(f"{label:<18}{wall:>8.2f}s{len(results) / wall:>9.1f}/s{statistics.median(latencies) * 1000:>9.0f}ms"
+          f"{p95 * 1000:>9.0f}ms{ok:>6}   {dict(errors) if errors else ''}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark archive fetching against the stub server")
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--workers', type=int, default=4, help='Threads for the concurrent run')
+    parser.add_argument('--delay', type=float, default=0.0, help='RateLimiter delay per scraper (s)')
+    parser.add_argument('--players', type=int, default=1000, help='Player population of the pages')
+    parser.add_argument('--latency', type=float, default=50.0, help='Server latency (ms)')
+    parser.add_argument('--jitter', type=float, default=25.0, help='Latency spread (± ms)')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--max-rps', type=float)
+    args = parser.parse_args()
+
+    days = [date(2022, 1, 1) + timedelta(days=i) for i in range(args.days)]
+    with StubServer(players=args.players, latency=args.latency / 1000, jitter=args.jitter / 1000,
+                    error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+                    max_rps=args.max_rps) as server:
+        # Warm the server's page cache so both runs measure the same thing
+        warm = QuizypediaScraper(base_url=server.url, rate_limiter=RateLimiter(0))
+        for day in days:
+            try:
+                warm.get_daily_archive_html(day.year, day.month, day.day)
+            except requests.RequestException:
+                pass
+        before = server.stats()['statuses']
+
+        print(f"🧪 {args.days} archives, latency {args.latency:.0f}±{args.jitter:.0f} ms, "
+              f"errors {args.error_rate:.0%}, 429 {args.throttle_rate:.0%}"
+              + (f", max {args.max_rps:g} req/s" if args.max_rps else ""))
+        print(f"\n{'Run':<18}{'Wall':>9}{'Rate':>11}{'p50':>11}{'p95':>11}{'OK':>6}   Errors")
+        print("-" * 72)
+        report("sequential", *run(server.url, days, 1, args.delay))
+        report(f"{args.workers} workers", *run(server.url, days, args.workers, args.delay))
+
+        after = server.stats()['statuses']
+        sent = {k: v - before.get(k, 0) for k, v in after.items() if v - before.get(k, 0)}
+        print(f"\n📊 Server statuses: {sent}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
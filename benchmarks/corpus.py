@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""Deterministic synthetic quizypedia corpus for the benchmarks.
+
+Writes, under one directory, what the scripts read from data/:
+
+    archive/<date>.json[.gz|.zst]     leaderboard archives (fan2quizz.storage)
+    quiz_html/<date>.html[.zz|.zst]   archive pages: page shell, DC_DATA, DC_USER
+                                      and the leaderboard payload
+    results/mistakes_history.json     accumulated mistakes (same shape as
+                                      accumulate_mistakes.py writes)
+    corpus.json                       parameters, so a corpus can be reused
+
+The same scale and seed always give the same content. Each day draws its
+leaderboard from a population of ``players`` names with probability
+``presence``, so the 5-year scale keeps a realistic field per day instead
+of 50k entries every day. Archive pages are only written for the last
+``html_days`` days (that is all the page-level benchmarks and the weekly
+report read).
+
+Usage:
+    uv run benchmarks/corpus.py --scale small --out /tmp/corpus
+    uv run benchmarks/corpus.py --days 90 --players 3000 --presence 0.5 --out /tmp/corpus
+"""
+import sys
+import json
+import random
+import shutil
+import argparse
+from datetime import date, datetime, timedelta, UTC
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from fan2quizz import storage  # noqa: E402
+
+GENERATOR_VERSION = 1
+START_DATE = date(2022, 1, 1)
+QUESTIONS_PER_DAY = 20
+
+# name: (days, players, presence, html_days, db_days)
+SCALES = {
+    'tiny': (1, 100, 1.0, 1, 1),
+    'small': (30, 1_000, 0.8, 14, 7),
+    'medium': (365, 10_000, 0.3, 14, 7),
+    'large': (5 * 365, 50_000, 0.05, 14, 7),
+}
+
+SYLLABLES = ("ba", "be", "bi", "lo", "ma", "ni", "qu", "ra", "sa", "ti", "vo", "ze",
+             "zim", "kam", "iel", "tor", "gan", "dor", "lia", "mar")
+THEMES = (
+    "Capitales européennes", "Peintres impressionnistes", "Fleuves d'Afrique", "Rois de France",
+    "Opéras de Verdi", "Prix Nobel de littérature", "Champions du monde de football",
+    "Éléments chimiques", "Personnages de Molière", "Montagnes des Alpes", "Films de Hitchcock",
+    "Écrivains russes", "Batailles napoléoniennes", "Dieux grecs", "Instruments de musique",
+    "Oscars du meilleur film", "Pays d'Amérique du Sud", "Symphonies de Beethoven",
+    "Présidents de la Ve République", "Planètes et satellites",
+)
+WORDS = ("le", "la", "les", "quel", "quelle", "est", "a", "été", "dans", "de", "son", "premier",
+         "célèbre", "auteur", "ville", "fleuve", "roi", "roman", "peintre", "capitale", "année",
+         "siècle", "œuvre", "pays", "nom", "né", "mort", "grand", "prix", "film")
+HINT_TYPES = ("Indice", "Date", "Lieu", "Personnage")
+
+
+def player_names(n, seed=0):
+    rng = random.Random(f"names-{seed}")
+    names = set()
+    while len(names) < n:
+        name = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+        if rng.random() < 0.6:
+            name += str(rng.randint(1, 999))
+        names.add(name)
+    return sorted(names)
+
+
+def page_shell(seed=0, blocks=1200):
+    """Head and footer markup shared by every page (WordPress-like, ~150 KB)."""
+    rng = random.Random(f"shell-{seed}")
+    head, foot = [], []
+    for i in range(blocks):
+        kind = rng.choice(('link', 'script', 'style', 'menu'))
+        if kind == 'link':
+            line = (f'<link rel="stylesheet" id="wp-block-{i}-css" href="https://www.quizypedia.fr/'
+                    f'wp-content/plugins/block-{i}/style.min.css?ver=6.4.{i % 9}" media="all" />')
+        elif kind == 'script':
+            line = (f'<script src="https://www.quizypedia.fr/wp-includes/js/module-{i}.min.js?ver=3.{i % 7}.1" '
+                    f'id="module-{i}-js"></script>')
+        elif kind == 'style':
+            line = f'<style>.wp-container-{i} {{ display: flex; gap: {i % 24}px; }}</style>'
+        else:
+            line = (f'<li class="menu-item menu-item-type-post_type menu-item-{i}">'
+                    f'<a href="/categorie/{rng.choice(THEMES).lower().replace(" ", "-")}-{i}/">'
+                    f'{rng.choice(THEMES)}</a></li>')
+        (head if i < blocks * 3 // 4 else foot).append(line)
+    return "\n".join(head), "\n".join(foot)
+
+
+def day_rng(day: str, seed: int, what: str) -> random.Random:
+    return random.Random(f"{what}-{seed}-{day}")
+
+
+def make_questions(day: str, seed=0, accuracy=0.7):
+    """DC_DATA: the day's questions with the tracked player's answers."""
+    rng = day_rng(day, seed, 'questions')
+    questions = []
+    for _ in range(QUESTIONS_PER_DAY):
+        theme = rng.choice(THEMES)
+        responses = [{"response": " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 3))).capitalize()}
+                     for _ in range(4)]
+        correct = rng.randrange(4)
+        chosen = correct if rng.random() < accuracy else rng.choice([i for i in range(4) if i != correct])
+        questions.append({
+            "question": " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 16))).capitalize() + " ?",
+            "theme_title": theme,
+            "main_category_id": THEMES.index(theme) % 8 + 1,
+            "hints": [{"type": rng.choice(HINT_TYPES), "value": " ".join(rng.choice(WORDS) for _ in range(4))}
+                      for _ in range(rng.randint(0, 2))],
+            "proposed_responses": responses,
+            "response_index": correct,
+            "chosen_index": chosen,
+        })
+    return questions
+
+
+def make_leaderboard(day: str, names, presence=1.0, seed=0):
+    """Leaderboard rows as embedded in the archive page, best first."""
+    rng = day_rng(day, seed, 'board')
+    rows = []
+    for i, name in enumerate(names):
+        if presence < 1.0 and rng.random() > presence:
+            continue
+        skill = 8 + (i * 7919 % 1000) / 100  # stable per player, 8..18
+        score = max(0, min(QUESTIONS_PER_DAY, int(rng.gauss(skill, 2.5))))
+        rows.append({"good_responses": score, "user": name, "elapsed_time": rng.randint(45, 600)})
+    rows.sort(key=lambda r: (-r["good_responses"], r["elapsed_time"], r["user"]))
+    for rank, row in enumerate(rows, 1):
+        row["rank"] = rank
+    return rows
+
+
+def archive_html(day: str, questions, rows, shell) -> str:
+    """An archive page: shell, DC_DATA, DC_USER and the leaderboard payload."""
+    head, foot = shell
+    good = sum(q["chosen_index"] == q["response_index"] for q in questions)
+    return "\n".join((
+        '<!DOCTYPE html>',
+        '<html lang="fr-FR">',
+        f'<head><meta charset="UTF-8"><title>Défi du jour du {day} - Quizypedia</title>',
+        head,
+        '</head><body class="archive defi-du-jour">',
+        f'<h1>Défi du jour — archives du {day}</h1>',
+        f'<script>var DC_DATA = {json.dumps(questions, ensure_ascii=False)};</script>',
+        f'<script>var DC_USER = {{good_responses: {good},elapsed_time: {90 + good * 7},rank: 42}};</script>',
+        f'<script>\nvar results = {json.dumps(rows, ensure_ascii=False)};\n</script>',
+        '<div id="leaderboard"></div>',
+        foot,
+        '</body></html>',
+    ))
+
+
+def mistakes_for_day(day: str, questions):
+    """Entries of mistakes_history.json for one day (see accumulate_mistakes.extract_mistakes)."""
+    mistakes = []
+    for i, q in enumerate(questions, 1):
+        if q["chosen_index"] == q["response_index"]:
+            continue
+        choices = [r["response"] for r in q["proposed_responses"]]
+        mistakes.append({
+            'date': day,
+            'question_number': i,
+            'category': q["theme_title"],
+            'question': q["question"],
+            'hints': [f"{h['type']}: {h['value']}" for h in q["hints"]],
+            'your_answer': choices[q["chosen_index"]],
+            'correct_answer': choices[q["response_index"]],
+            'all_choices': choices,
+        })
+    return mistakes
+
+
+class Corpus:
+    """Paths and parameters of a generated corpus directory."""
+
+    def __init__(self, root: Path, params: dict):
+        self.root = Path(root)
+        self.params = params
+        self.archive_dir = self.root / "archive"
+        self.html_dir = self.root / "quiz_html"
+        self.mistakes_file = self.root / "results" / "mistakes_history.json"
+
+    def __repr__(self) -> str:
+        return f"Corpus({str(self.root)!r}, {self.params})"
+
+    @property
+    def dates(self):
+        return [(START_DATE + timedelta(days=d)).isoformat() for d in range(self.params['days'])]
+
+    @property
+    def html_dates(self):
+        return self.dates[-self.params['html_days']:]
+
+    @property
+    def db_dates(self):
+        return self.dates[-self.params['db_days']:]
+
+
+def scale_params(scale=None, *, days=None, players=None, presence=None, html_days=None, db_days=None, seed=0):
+    base = dict(zip(('days', 'players', 'presence', 'html_days', 'db_days'), SCALES[scale or 'small']))
+    for key, value in (('days', days), ('players', players), ('presence', presence),
+                       ('html_days', html_days), ('db_days', db_days)):
+        if value is not None:
+            base[key] = value
+    base['html_days'] = min(base['html_days'], base['days'])
+    base['db_days'] = min(base['db_days'], base['days'])
+    base['seed'] = seed
+    base['version'] = GENERATOR_VERSION
+    return base
+
+
+def generate(out: Path, params: dict, progress=None) -> Corpus:
+    """Write a corpus to ``out``; reuses it if ``out/corpus.json`` records the same parameters."""
+    corpus = Corpus(out, params)
+    meta_path = corpus.root / "corpus.json"
+    try:
+        if json.loads(meta_path.read_text(encoding='utf-8')) == params:
+            return corpus
+    except (OSError, ValueError):
+        pass
+    for stale in (corpus.archive_dir, corpus.html_dir, corpus.mistakes_file.parent, meta_path):
+        if stale.is_dir():
+            shutil.rmtree(stale)
+        elif stale.exists():
+            stale.unlink()
+
+    seed = params['seed']
+    names = player_names(params['players'], seed)
+    shell = page_shell(seed)
+    html_dates = set(corpus.html_dates)
+    fetched = datetime(2022, 1, 2, 6, 0, tzinfo=UTC)
+    history = []
+    for i, day in enumerate(corpus.dates):
+        questions = make_questions(day, seed)
+        rows = make_leaderboard(day, names, params['presence'], seed)
+        storage.write_json(corpus.archive_dir / f"{day}.json", {
+            'date': day,
+            'fetched_at': (fetched + timedelta(days=i)).isoformat(),
+            'count': len(rows),
+            'results': rows,
+        })
+        if day in html_dates:
+            storage.write_text(corpus.html_dir / f"{day}.html", archive_html(day, questions, rows, shell))
+        history.extend(mistakes_for_day(day, questions))
+        if progress is not None:
+            progress(i + 1, len(corpus.dates))
+    corpus.mistakes_file.parent.mkdir(parents=True, exist_ok=True)
+    corpus.mistakes_file.write_text(json.dumps(history, indent=2, ensure_ascii=False), encoding='utf-8')
+    meta_path.write_text(json.dumps(params, indent=2), encoding='utf-8')
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic quizypedia corpus")
+    parser.add_argument('--out', type=Path, required=True, help='Output directory')
+    parser.add_argument('--scale', choices=list(SCALES), default='small',
+                        help='Preset: ' + ', '.join(f"{k}={v[0]}d×{v[1]:,}p" for k, v in SCALES.items()))
+    parser.add_argument('--days', type=int)
+    parser.add_argument('--players', type=int, help='Player population')
+    parser.add_argument('--presence', type=float, help='Probability that a player plays on a given day')
+    parser.add_argument('--html-days', type=int, help='Write archive pages for the last N days')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    params = scale_params(args.scale, days=args.days, players=args.players, presence=args.presence,
+                          html_days=args.html_days, seed=args.seed)
+    print(f"🧪 Generating {params['days']:,} days × {params['players']:,} players "
+          f"(presence {params['presence']:.0%}) into {args.out}")
+    corpus = generate(args.out, params, progress=lambda i, n: print(f"\r   {i}/{n} days", end="", flush=True))
+    print(f"\n✅ {corpus.root}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""Benchmark suite: time the hot paths on a synthetic corpus and compare with a baseline.
+
+Cases (grouped, in run order):
+  parse     bracket_scan_payload, parse_results, extract_dc_data_from_html
+  analytics load_all_archives (player_evolution)
+  reports   weekly mistakes report (cached pages → markdown), study guide
+  db        QuizDB bulk load (quiz, questions, attempts + meta), daily_table,
+            quiz catalog ingestion row by row vs upsert_quizzes batches;
+            last, as their disk writes slow down whatever runs right after
+
+The corpus (see corpus.py) is generated once per scale under
+benchmarks/.corpus/ and reused. Every case runs up to --repeat times
+within a time budget; the best run (less noisy than the median) is
+compared with benchmarks/baseline.json (recorded per scale). Timings
+depend on the machine: record a baseline on the machine you compare on.
+
+Usage:
+    uv run benchmarks/run.py                          # small scale, all cases
+    uv run benchmarks/run.py --scale tiny --scale medium
+    uv run benchmarks/run.py --only parse db          # some groups (or case names)
+    uv run benchmarks/run.py --check                  # exit 1 if a case regressed
+    uv run benchmarks/run.py --update-baseline        # record the current timings
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import contextlib
+import statistics
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+for path in (ROOT, ROOT / "scripts", ROOT / "benchmarks"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import corpus as corpus_gen  # noqa: E402
+from fan2quizz import storage  # noqa: E402
+from fan2quizz.database import QuizDB  # noqa: E402
+from fan2quizz.leaderboard import bracket_scan_payload, parse_results  # noqa: E402
+
+BASELINE_PATH = ROOT / "benchmarks" / "baseline.json"
+CORPUS_DIR = ROOT / "benchmarks" / ".corpus"
+DEFAULT_TOLERANCE = 0.25
+
+# (name, group, setup); setup(corpus, tmp_dir) returns the zero-argument callable to time
+CASES = []
+
+
+def case(name, group):
+    def register(setup):
+        CASES.append((name, group, setup))
+        return setup
+    return register
+
+
+def load_pages(corpus):
+    return [storage.load_text(corpus.html_dir / f"{day}.html") for day in corpus.html_dates]
+
+
+# --- parse -----------------------------------------------------------------
+
+@case('bracket_scan_payload', 'parse')
+def setup_bracket_scan(corpus, tmp):
+    pages = load_pages(corpus)
+    return lambda: [bracket_scan_payload(html) for html in pages]
+
+
+@case('parse_results', 'parse')
+def setup_parse_results(corpus, tmp):
+    payloads = [bracket_scan_payload(html) for html in load_pages(corpus)]
+    return lambda: [parse_results(raw) for raw in payloads]
+
+
+@case('extract_dc_data_from_html', 'parse')
+def setup_extract_dc_data(corpus, tmp):
+    from weekly_mistakes_report import extract_dc_data_from_html
+    pages = load_pages(corpus)
+    return lambda: [extract_dc_data_from_html(html) for html in pages]
+
+
+# --- analytics -------------------------------------------------------------
+
+@case('load_all_archives', 'analytics')
+def setup_load_all_archives(corpus, tmp):
+    import player_evolution
+    player_evolution.CACHE_DIR = corpus.archive_dir
+    return player_evolution.load_all_archives
+
+
+# --- reports ---------------------------------------------------------------
+
+@case('weekly_mistakes_report', 'reports')
+def setup_weekly_report(corpus, tmp):
+    from datetime import datetime
+    import weekly_mistakes_report as weekly
+    weekly.CACHE_DIR = corpus.html_dir
+    dates = [datetime.strptime(day, '%Y-%m-%d') for day in corpus.html_dates]
+
+    def run():
+        quiz_data = [weekly.fetch_quiz_data(None, d) for d in dates]
+        return sum(1 for _ in weekly.generate_markdown_report(quiz_data, corpus.html_dates[0],
+                                                              corpus.html_dates[-1]))
+    return run
+
+
+@case('study guide', 'reports')
+def setup_study_guide(corpus, tmp):
+    import generate_failed_questions as guide
+    from fan2quizz.reportwriter import ReportWriter
+    guide.MISTAKES_FILE = corpus.mistakes_file
+    output = tmp / "guide.md"
+    args = argparse.Namespace(order='date', filter=None, domain=None, show_mistakes=True,
+                              show_choices=True, stats=True, output=str(output))
+
+    def run():
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            return guide.write_study_guide(args, ReportWriter(output))
+    return run
+
+
+# --- db --------------------------------------------------------------------
+
+def db_rows(corpus):
+    """(day, questions, leaderboard) for the days loaded into QuizDB."""
+    seed = corpus.params['seed']
+    return [(day, corpus_gen.make_questions(day, seed),
+             storage.load_json(corpus.archive_dir / f"{day}.json")['results'])
+            for day in corpus.db_dates]
+
+
+def load_db(path, days):
+    """Store every day's quiz, questions and leaderboard through the QuizDB API."""
+    Path(path).unlink(missing_ok=True)
+    db = QuizDB(str(path))
+    for day, questions, rows in days:
+        quiz_id = db.insert_quiz(f"https://www.quizypedia.fr/defi-du-jour/archives/{day.replace('-', '/')}/",
+                                 f"Défi du jour {day}", "", ["defi-du-jour"])
+        db.set_daily_quiz(day, quiz_id)
+        for i, q in enumerate(questions):
+            db.insert_question(quiz_id, i, q['question'], [r['response'] for r in q['proposed_responses']],
+                               q['response_index'])
+        correct = [q['response_index'] for q in questions]
+        for row in rows:
+            good = row['good_responses']
+            answers = correct[:good] + [(c + 1) % 4 for c in correct[good:]]
+            db.record_attempt(quiz_id, row['user'], answers)
+            attempt_id = db.conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+            db.update_attempt_meta(attempt_id, row['elapsed_time'], row['rank'])
+    return db
+
+
+@case('QuizDB bulk load', 'db')
+def setup_db_load(corpus, tmp):
+    days = db_rows(corpus)
+    path = tmp / "load.db"
+    return lambda: load_db(path, days).close()
+
+
+@case('QuizDB.daily_table', 'db')
+def setup_daily_table(corpus, tmp):
+    db = load_db(tmp / "query.db", db_rows(corpus))
+    return lambda: [db.daily_table(day) for day in corpus.db_dates]
+
+
+def catalog_quizzes(corpus):
+    """upsert_quizzes records: one quiz per corpus day, as fan2quizz.ingest builds them."""
+    seed = corpus.params['seed']
+    quizzes = []
+    for day in corpus.db_dates:
+        questions = corpus_gen.make_questions(day, seed)
+        quizzes.append({
+            'url': f"https://www.quizypedia.fr/quiz/{day}/",
+            'title': f"Quiz {day}",
+            'description': "",
+            'tags': sorted({q['theme_title'] for q in questions}),
+            'questions': [{'question_text': q['question'],
+                           'choices': [r['response'] for r in q['proposed_responses']],
+                           'correct_index': q['response_index']} for q in questions],
+        })
+    return quizzes
+
+
+def ingest_row_by_row(path, quizzes):
+    """The insert_quiz / insert_question API: one commit per row."""
+    Path(path).unlink(missing_ok=True)
+    db = QuizDB(str(path))
+    for quiz in quizzes:
+        quiz_id = db.insert_quiz(quiz['url'], quiz['title'], quiz['description'], quiz['tags'])
+        for i, q in enumerate(quiz['questions']):
+            db.insert_question(quiz_id, i, q['question_text'], q['choices'], q['correct_index'])
+    db.close()
+
+
+def ingest_batched(path, quizzes, batch_size=50):
+    Path(path).unlink(missing_ok=True)
+    db = QuizDB(str(path))
+    for i in range(0, len(quizzes), batch_size):
+        db.upsert_quizzes(quizzes[i:i + batch_size])
+    db.close()
+
+
+@case('ingest row by row', 'db')
+def setup_ingest_rows(corpus, tmp):
+    quizzes = catalog_quizzes(corpus)
+    return lambda: ingest_row_by_row(tmp / "ingest-rows.db", quizzes)
+
+
+@case('ingest upsert_quizzes', 'db')
+def setup_ingest_batched(corpus, tmp):
+    quizzes = catalog_quizzes(corpus)
+    return lambda: ingest_batched(tmp / "ingest-batched.db", quizzes)
+
+
+# --- runner ----------------------------------------------------------------
+
+def measure(fn, repeat, budget):
+    """Run ``fn`` up to ``repeat`` times, stopping early once ``budget`` seconds were spent."""
+    times = []
+    spent = 0.0
+    while len(times) < repeat and (not times or spent < budget):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        times.append(elapsed)
+        spent += elapsed
+    return {'median': statistics.median(times), 'min': min(times), 'runs': len(times)}
+
+
+def machine_info():
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(terse=True),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def load_baseline(path):
+    try:
+        return json.loads(Path(path).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {'machine': None, 'scales': {}}
+
+
+def fmt_time(seconds):
+    if seconds is None:
+        return '--'
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.0f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds:.2f} s"
+
+
+def compare(median, reference, tolerance):
+    if reference is None:
+        return None, 'new'
+    ratio = median / reference if reference else float('inf')
+    if ratio > 1 + tolerance:
+        return ratio, 'SLOWER'
+    if ratio < 1 / (1 + tolerance):
+        return ratio, 'faster'
+    return ratio, 'ok'
+
+
+def selected_cases(only):
+    if not only:
+        return CASES
+    wanted = {w.lower() for w in only}
+    return [c for c in CASES if c[0].lower() in wanted or c[1] in wanted]
+
+
+def run_scale(scale, args, baseline):
+    params = corpus_gen.scale_params(scale, seed=args.seed)
+    print(f"\n🧪 Scale '{scale}': {params['days']:,} days × {params['players']:,} players "
+          f"(presence {params['presence']:.0%}), {params['html_days']} pages, {params['db_days']} days in QuizDB")
+    start = time.perf_counter()
+    corpus = corpus_gen.generate(args.corpus_dir / f"{scale}-{args.seed}", params)
+    print(f"   Corpus ready in {time.perf_counter() - start:.1f}s ({corpus.root})")
+
+    reference = baseline['scales'].get(scale, {})
+    results = {}
+    regressions = []
+    print(f"\n   {'Case':<28}{'Median':>11}{'Min':>11}{'Runs':>6}{'Base min':>11}{'Ratio':>8}  Status")
+    print("   " + "-" * 84)
+    with tempfile.TemporaryDirectory(prefix="fan2quizz-bench-") as tmp:
+        for name, group, setup in selected_cases(args.only):
+            fn = setup(corpus, Path(tmp))
+            stats = measure(fn, args.repeat, args.budget)
+            results[name] = stats
+            base = reference.get(name, {}).get('min')
+            ratio, status = compare(stats['min'], base, args.tolerance)
+            if status == 'SLOWER':
+                regressions.append(name)
+            ratio_txt = f"{ratio:.2f}x" if ratio is not None else '--'
+            print(f"   {name:<28}{fmt_time(stats['median']):>11}{fmt_time(stats['min']):>11}{stats['runs']:>6}"
+                  f"{fmt_time(base):>11}{ratio_txt:>8}  {status}")
+    return results, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the benchmark suite on a synthetic corpus",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="Scales: " + ", ".join(f"{k} ({v[0]} days × {v[1]:,} players)" for k, v in corpus_gen.SCALES.items())
+    )
+    parser.add_argument('--scale', action='append', choices=list(corpus_gen.SCALES),
+                        help='Corpus scale (repeatable, default: small)')
+    parser.add_argument('--only', nargs='+', help='Case names or groups to run')
+    parser.add_argument('--repeat', type=int, default=5, help='Maximum runs per case (default: 5)')
+    parser.add_argument('--budget', type=float, default=2.0, help='Stop repeating a case after this many seconds')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--corpus-dir', type=Path, default=CORPUS_DIR, help='Where generated corpora are kept')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH)
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='Relative slowdown reported as a regression (default: 0.25)')
+    parser.add_argument('--check', action='store_true', help='Exit with status 1 if a case regressed')
+    parser.add_argument('--update-baseline', action='store_true', help='Store these timings as the baseline')
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline)
+    machine = machine_info()
+    if baseline.get('machine') and baseline['machine'] != machine:
+        print(f"⚠️  Baseline recorded on another setup ({baseline['machine']}): compare ratios with care")
+
+    all_regressions = []
+    for scale in args.scale or ['small']:
+        results, regressions = run_scale(scale, args, baseline)
+        all_regressions += [f"{scale}/{name}" for name in regressions]
+        if args.update_baseline:
+            baseline['scales'].setdefault(scale, {}).update(
+                {name: {'median': round(s['median'], 6), 'min': round(s['min'], 6)} for name, s in results.items()})
+
+    if args.update_baseline:
+        baseline['machine'] = machine
+        baseline['recorded_at'] = time.strftime('%Y-%m-%d')
+        args.baseline.write_text(json.dumps(baseline, indent=2, ensure_ascii=False) + "\n", encoding='utf-8')
+        print(f"\n💾 Baseline written to {args.baseline}")
+
+    if all_regressions:
+        print(f"\n❌ Slower than baseline (>{args.tolerance:.0%}): {', '.join(all_regressions)}")
+        return 1 if args.check else 0
+    print("\n✅ No regression against the baseline")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
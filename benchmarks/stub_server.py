@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""Local stand-in for quizypedia.fr, for offline load, latency and retry testing.
+
+Serves the paths the scraper uses:
+
+    /                                   homepage (login link, category links)
+    /wp-login.php                       WordPress login form; POST sets a
+                                        wordpress_logged_in_* cookie
+    /defi-du-jour/                      today's page (personal DC_USER once logged in)
+    /defi-du-jour/archives/Y/M/D/       archive page: DC_DATA, DC_USER, leaderboard payload
+    /categorie/<slug>/page/<n>          category listing, newest quizzes first (404 past the end)
+    /quiz/<slug>/                       quiz page (questions in DC_DATA)
+    /__stats                            JSON counters (requests, statuses, paths)
+
+Archive pages come from recorded fixtures (``--fixtures``: a directory of
+``<date>.html[.zz|.zst|.gz]`` files such as data/cache/quiz_html) or are
+generated on the fly with benchmarks/corpus.py (deterministic per date).
+Pages carry ``ETag`` / ``Last-Modified`` and conditional requests get a
+``304``. The quiz catalog (``--quizzes``) spreads quizzes over the corpus
+themes, some in two categories. ``server.catalog.grow(n)`` publishes ``n``
+new ones, which pushes the older quizzes towards later listing pages.
+
+Faults, applied to every request except /__stats:
+    --latency / --jitter    delay in ms (uniform in latency ± jitter)
+    --error-rate            share of 500/502/503 responses
+    --throttle-rate         share of 429 responses (with Retry-After)
+    --max-rps               token bucket: requests above this rate get a 429
+
+Point any script at it with QUIZYPEDIA_BASE_URL (see QuizypediaScraper):
+
+    uv run benchmarks/stub_server.py --port 8765 --latency 80 --jitter 40 --throttle-rate 0.05 &
+    QUIZYPEDIA_BASE_URL=http://127.0.0.1:8765 QUIZY_COOKIE=x=y uv run scripts/manage_archive.py --days 14 --download
+
+From Python (tests, benchmarks)::
+
+    with StubServer(latency=0.05) as server:
+        scraper = QuizypediaScraper(base_url=server.url, rate_limiter=RateLimiter(0))
+"""
+import sys
+import re
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+import unicodedata
+from collections import Counter
+from datetime import date, datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+ROOT = Path(__file__).resolve().parents[1]
+for path in (ROOT, ROOT / "benchmarks"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import corpus as corpus_gen  # noqa: E402
+from fan2quizz import storage  # noqa: E402
+
+LOGIN_COOKIE = "wordpress_logged_in_stub"
+# Fixed modification time of generated pages, so Last-Modified is stable across restarts
+GENERATED_MTIME = datetime(2022, 1, 1, tzinfo=timezone.utc)
+
+
+class Page:
+    __slots__ = ('body', 'etag', 'last_modified')
+
+    def __init__(self, body: bytes, last_modified: datetime):
+        self.body = body
+        self.etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+        self.last_modified = last_modified.replace(microsecond=0)
+
+
+class PageSource:
+    """Archive pages from a fixture directory, or generated from corpus.py when there is none."""
+
+    def __init__(self, fixtures=None, players=1000, presence=0.8, seed=0, cache_size=64):
+        self.fixtures = Path(fixtures) if fixtures else None
+        self.seed = seed
+        self.presence = presence
+        self._names = None
+        self._players = players
+        self._shell = None
+        self._cache = {}
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+
+    def _generate(self, day: str) -> Page:
+        if self._names is None:
+            self._names = corpus_gen.player_names(self._players, self.seed)
+            self._shell = corpus_gen.page_shell(self.seed)
+        questions = corpus_gen.make_questions(day, self.seed)
+        rows = corpus_gen.make_leaderboard(day, self._names, self.presence, self.seed)
+        return Page(corpus_gen.archive_html(day, questions, rows, self._shell).encode('utf-8'), GENERATED_MTIME)
+
+    def _load(self, day: str):
+        if self.fixtures is None:
+            return self._generate(day)
+        path = storage.find(self.fixtures / f"{day}.html")
+        if path is None:
+            return None
+        mtime = datetime.fromtimestamp(path.stat().st_mtime, timezone.utc)
+        return Page(storage.read_bytes(path), mtime)
+
+    def get(self, day: str):
+        with self._lock:
+            page = self._cache.get(day)
+            if page is None:
+                page = self._load(day)
+                if len(self._cache) >= self._cache_size:
+                    self._cache.pop(next(iter(self._cache)))
+                self._cache[day] = page
+            return page
+
+
+class Faults:
+    """Latency and injected errors, shared by all handler threads."""
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, throttle_rate=0.0, max_rps=None, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.max_rps = max_rps
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = float(max_rps or 0)
+        self._refilled = time.monotonic()
+
+    def delay(self) -> float:
+        with self._lock:
+            spread = self._rng.uniform(-self.jitter, self.jitter) if self.jitter else 0.0
+        return max(0.0, self.latency + spread)
+
+    def _over_rate(self) -> bool:
+        if not self.max_rps:
+            return False
+        now = time.monotonic()
+        self._tokens = min(float(self.max_rps), self._tokens + (now - self._refilled) * self.max_rps)
+        self._refilled = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return False
+        return True
+
+    def injected_status(self):
+        """429, a 5xx, or None for a normal response."""
+        with self._lock:
+            if self._over_rate() or (self.throttle_rate and self._rng.random() < self.throttle_rate):
+                return 429
+            if self.error_rate and self._rng.random() < self.error_rate:
+                return self._rng.choice((500, 502, 503))
+        return None
+
+
+def theme_slug(theme: str) -> str:
+    """ASCII URL slug of a corpus theme ("Fleuves d'Afrique" -> "fleuves-d-afrique")."""
+    ascii_ = unicodedata.normalize('NFKD', theme).encode('ascii', 'ignore').decode('ascii')
+    return '-'.join(re.findall(r'[a-z0-9]+', ascii_.lower()))
+
+
+class Catalog:
+    """Quizzes 0..size-1 (higher is newer); quiz q is listed in category q % n, and q * 7 % n if different."""
+
+    PER_PAGE = 20
+
+    def __init__(self, size=600):
+        self.size = size
+        self.slugs = [theme_slug(theme) for theme in corpus_gen.THEMES]
+        self._lock = threading.Lock()
+
+    def grow(self, n):
+        with self._lock:
+            self.size += n
+
+    def in_category(self, slug):
+        if slug not in self.slugs:
+            return None
+        index, n = self.slugs.index(slug), len(self.slugs)
+        return [q for q in range(self.size - 1, -1, -1) if q % n == index or q * 7 % n == index]
+
+    def listing(self, slug, page):
+        quizzes = self.in_category(slug)
+        if quizzes is None or page < 1:
+            return None
+        chunk = quizzes[(page - 1) * self.PER_PAGE:page * self.PER_PAGE]
+        if not chunk:
+            return None
+        items = "\n".join(f'<li><a href="/quiz/quiz-{q:05d}/">Quiz n°{q}</a></li>' for q in chunk)
+        return ('<!DOCTYPE html><html><head><title>Catégorie</title></head><body>'
+                '<nav><a href="/">Accueil</a> <a href="/defi-du-jour/">Défi du jour</a></nav>'
+                f'<ul class="quizzes">{items}</ul>'
+                f'<a class="next" href="/categorie/{slug}/page/{page + 1}">Suivant</a></body></html>')
+
+    def quiz(self, slug):
+        try:
+            q = int(slug.removeprefix('quiz-'))
+        except ValueError:
+            return None
+        if not 0 <= q < self.size:
+            return None
+        questions = corpus_gen.make_questions(slug)
+        return (f'<!DOCTYPE html><html><head><title>Quiz n°{q} - Quizypedia</title></head><body>'
+                f'<h1>Quiz n°{q}</h1><p class="description">Quiz généré n°{q}.</p>'
+                f'<script>var DC_DATA = {json.dumps(questions, ensure_ascii=False)};</script></body></html>')
+
+
+def homepage() -> str:
+    links = "\n".join(f'<li><a href="/categorie/{theme_slug(theme)}/">{theme}</a></li>'
+                      for theme in corpus_gen.THEMES)
+    return ('<!DOCTYPE html><html lang="fr-FR"><head><title>Quizypedia</title></head><body>'
+            '<header><a href="/wp-login.php">Connexion</a></header>'
+            '<div class="hero"><h2><a href="/defi-du-jour/">Le défi du jour</a></h2></div>'
+            f'<ul class="categories">{links}</ul></body></html>')
+
+
+def login_form(error: str = '') -> str:
+    return ('<!DOCTYPE html><html><head><title>Connexion</title></head><body>'
+            + (f'<div id="login_error">{error}</div>' if error else '') +
+            '<form name="loginform" id="loginform" action="/wp-login.php" method="post">'
+            '<input type="text" name="log" id="user_login" value="">'
+            '<input type="password" name="pwd" id="user_pass" value="">'
+            '<input type="checkbox" name="rememberme" value="forever">'
+            '<input type="submit" name="wp-submit" value="Se connecter">'
+            '<input type="hidden" name="redirect_to" value="/defi-du-jour/">'
+            '<input type="hidden" name="testcookie" value="1">'
+            '</form></body></html>')
+
+
+def personalize(body: bytes, logged_in: bool) -> bytes:
+    """Today's page as a logged-in (logout link) or anonymous (login notice) visitor sees it."""
+    if logged_in:
+        extra = '<a href="/wp-login.php?action=logout">Déconnexion</a>'
+    else:
+        extra = '<div class="login-required">Merci de vous identifier pour jouer le défi du jour</div>'
+    return body.replace(b'</body>', extra.encode('utf-8') + b'</body>', 1)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server_version = "QuizypediaStub/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    # --- plumbing ----------------------------------------------------------
+    def _send(self, status, body=b'', content_type='text/html; charset=UTF-8', headers=None):
+        self.server.count(self.path, status)
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body and self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _logged_in(self) -> bool:
+        return f"{LOGIN_COOKIE}=" in (self.headers.get('Cookie') or '')
+
+    def _faults(self) -> bool:
+        """Sleep, then answer with an injected error if one is drawn; True if the request is done."""
+        time.sleep(self.server.faults.delay())
+        status = self.server.faults.injected_status()
+        if status is None:
+            return False
+        headers = {'Retry-After': '1'} if status == 429 else None
+        self._send(status, f"<html><body>Erreur {status}</body></html>".encode(), headers=headers)
+        return True
+
+    def _send_page(self, page, body=None):
+        if page is None:
+            self._send(404, b"<html><body>Page introuvable</body></html>")
+            return
+        headers = {'ETag': page.etag, 'Last-Modified': format_datetime(page.last_modified, usegmt=True),
+                   'Cache-Control': 'no-cache'}
+        if_none_match = self.headers.get('If-None-Match')
+        if_modified_since = self.headers.get('If-Modified-Since')
+        not_modified = False
+        if if_none_match is not None:
+            not_modified = page.etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match == '*'
+        elif if_modified_since:
+            try:
+                not_modified = page.last_modified <= parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                pass
+        if not_modified:
+            self._send(304, headers=headers)
+        else:
+            self._send(200, page.body if body is None else body, headers=headers)
+
+    # --- routes ------------------------------------------------------------
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == '/__stats':
+            self._send(200, json.dumps(self.server.stats(), indent=2).encode(), 'application/json')
+            return
+        if self._faults():
+            return
+        parts = [p for p in path.split('/') if p]
+        if not parts:
+            self._send(200, homepage().encode('utf-8'))
+        elif parts == ['wp-login.php']:
+            self._send(200, login_form().encode('utf-8'))
+        elif parts == ['defi-du-jour']:
+            page = self.server.pages.get(date.today().isoformat())
+            body = None if page is None else personalize(page.body, self._logged_in())
+            self._send_page(page, body)
+        elif len(parts) == 5 and parts[:2] == ['defi-du-jour', 'archives']:
+            try:
+                day = date(int(parts[2]), int(parts[3]), int(parts[4])).isoformat()
+            except ValueError:
+                self._send(404, b"<html><body>Date invalide</body></html>")
+                return
+            self._send_page(self.server.pages.get(day))
+        elif len(parts) == 4 and parts[0] == 'categorie' and parts[2] == 'page' and parts[3].isdigit():
+            html = self.server.catalog.listing(parts[1], int(parts[3]))
+            if html is None:
+                self._send(404, b"<html><body>Page introuvable</body></html>")
+            else:
+                self._send(200, html.encode('utf-8'))
+        elif len(parts) == 2 and parts[0] == 'quiz':
+            html = self.server.catalog.quiz(parts[1])
+            if html is None:
+                self._send(404, b"<html><body>Page introuvable</body></html>")
+            else:
+                self._send(200, html.encode('utf-8'))
+        else:
+            self._send(404, b"<html><body>Page introuvable</body></html>")
+
+    def do_POST(self):
+        if self._faults():
+            return
+        length = int(self.headers.get('Content-Length') or 0)
+        form = {k: v[0] for k, v in parse_qs(self.rfile.read(length).decode('utf-8')).items()}
+        if urlsplit(self.path).path.rstrip('/') != '/wp-login.php':
+            self._send(404, b"<html><body>Page introuvable</body></html>")
+            return
+        expected = self.server.credentials
+        if not form.get('log') or (expected and (form.get('log'), form.get('pwd')) != expected):
+            self._send(200, login_form("Identifiant ou mot de passe incorrect.").encode('utf-8'))
+            return
+        token = hashlib.sha1(form['log'].encode('utf-8')).hexdigest()
+        self._send(302, headers={
+            'Location': form.get('redirect_to') or '/defi-du-jour/',
+            'Set-Cookie': f"{LOGIN_COOKIE}={form['log']}%7C{token}; Path=/; HttpOnly",
+        })
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded stub server; use as a context manager to run it in a background thread."""
+
+    daemon_threads = True
+
+    def __init__(self, host='127.0.0.1', port=0, *, fixtures=None, players=1000, presence=0.8, seed=0,
+                 latency=0.0, jitter=0.0, error_rate=0.0, throttle_rate=0.0, max_rps=None,
+                 credentials=None, quizzes=600, verbose=False):
+        super().__init__((host, port), StubHandler)
+        self.pages = PageSource(fixtures, players=players, presence=presence, seed=seed)
+        self.catalog = Catalog(quizzes)
+        self.faults = Faults(latency, jitter, error_rate, throttle_rate, max_rps, seed)
+        self.credentials = credentials
+        self.verbose = verbose
+        self._stats_lock = threading.Lock()
+        self._statuses = Counter()
+        self._paths = Counter()
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, path, status):
+        with self._stats_lock:
+            self._statuses[status] += 1
+            self._paths[urlsplit(path).path] += 1
+
+    def stats(self):
+        with self._stats_lock:
+            return {'requests': sum(self._statuses.values()),
+                    'statuses': {str(k): v for k, v in sorted(self._statuses.items())},
+                    'paths': dict(self._paths.most_common(20))}
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="quizypedia-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve a local stand-in for quizypedia.fr",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Point the scripts at it with QUIZYPEDIA_BASE_URL=http://127.0.0.1:<port>.
+Counters are at http://127.0.0.1:<port>/__stats.
+        """
+    )
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--fixtures', type=Path, help='Directory of recorded <date>.html pages (default: generated)')
+    parser.add_argument('--players', type=int, default=1000, help='Player population of generated pages')
+    parser.add_argument('--presence', type=float, default=0.8, help='Share of players on each generated leaderboard')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--latency', type=float, default=0.0, help='Response delay in ms')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Random delay spread (± ms)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Share of 5xx responses (0-1)')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Share of 429 responses (0-1)')
+    parser.add_argument('--max-rps', type=float, help='Answer 429 above this many requests per second')
+    parser.add_argument('--quizzes', type=int, default=600, help='Quizzes in the category listings')
+    parser.add_argument('--user', help='Accepted login (default: any)')
+    parser.add_argument('--password', help='Accepted password (with --user)')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args()
+
+    server = StubServer(args.host, args.port, fixtures=args.fixtures, players=args.players,
+                        presence=args.presence, seed=args.seed, latency=args.latency / 1000,
+                        jitter=args.jitter / 1000, error_rate=args.error_rate,
+                        throttle_rate=args.throttle_rate, max_rps=args.max_rps,
+                        credentials=(args.user, args.password) if args.user else None,
+                        quizzes=args.quizzes, verbose=args.verbose)
+    source = args.fixtures or f"generated pages ({args.players:,} players)"
+    print(f"🧪 Quizypedia stub on {server.url} — {source}")
+    print(f"   QUIZYPEDIA_BASE_URL={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n📊 {json.dumps(server.stats()['statuses'])}")
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
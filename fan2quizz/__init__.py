@@ -2,8 +2,34 @@
 
 __version__ = "0.2.0"
 
-from .database import QuizDB
-from .scraper import QuizypediaScraper
-from .utils import RateLimiter
+import importlib
+import os
 
 __all__ = ["QuizDB", "QuizypediaScraper", "RateLimiter"]
+
+# Re-exports are resolved on first access, so importing a light submodule
+# (e.g. fan2quizz.daemon from a thin client) does not pull in requests/bs4.
+_EXPORTS = {
+    "QuizDB": ".database",
+    "QuizypediaScraper": ".scraper",
+    "RateLimiter": ".utils",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
+
+
+# FAN2QUIZZ_PROFILE=cprofile|sample|memory profiles whichever script imported the package
+if os.environ.get("FAN2QUIZZ_PROFILE"):
+    from .profiling import start_from_env
+
+    start_from_env()
@@ -0,0 +1,278 @@
+"""Vectorized player × date analytics over archived daily leaderboards.
+
+Archives are loaded once into dense ``(players, dates)`` NumPy arrays with a
+shared mask for days a player did not play. Every statistic the evolution and
+history scripts need (averages, best/worst, trends, rolling means, streaks,
+per-day percentile ranks, head-to-head records) is then an array operation
+instead of a Python loop over dict-of-dicts.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Composite "leaderboard key": higher score wins, faster time breaks ties (see percentiles.leaderboard_key)
+from .percentiles import _TIME_SCALE
+
+FIELDS = ('score', 'time', 'rank')
+
+
+class PlayerMatrix:
+    """Dense, masked player × date view of the archived leaderboards.
+
+    ``scores``, ``times`` and ``ranks`` are int arrays of shape
+    ``(len(players), len(dates))``; ``mask`` is True where the player has no
+    entry for that date. Player names are stored lowercased.
+    """
+
+    def __init__(self, players: List[str], dates: List[str], scores: np.ndarray,
+                 times: np.ndarray, ranks: np.ndarray, mask: np.ndarray,
+                 field_sizes: Optional[np.ndarray] = None):
+        self.players = players
+        self.dates = dates
+        self.scores = scores
+        self.times = times
+        self.ranks = ranks
+        self.mask = mask
+        self.field_sizes = field_sizes if field_sizes is not None else np.zeros(len(dates), dtype=np.int32)
+        self._index = {p: i for i, p in enumerate(players)}
+
+    # --- construction ---
+    @classmethod
+    def from_archives(cls, archives: Iterable[Dict[str, Any]], players: Optional[Iterable[str]] = None) -> "PlayerMatrix":
+        """Build the matrix from archive dicts (``{'date', 'results': [...]}``).
+
+        ``players`` restricts the rows (case-insensitive); by default every
+        player seen in any archive gets a row.
+        """
+        archives = sorted((a for a in archives if a.get('date')), key=lambda a: a['date'])
+        dates = [a['date'] for a in archives]
+        wanted = {p.lower() for p in players} if players is not None else None
+
+        rows: Dict[str, int] = {}
+        if wanted is not None:
+            # Keep the caller's order for tracked players
+            for p in players:
+                rows.setdefault(p.lower(), len(rows))
+        else:
+            for archive in archives:
+                for entry in archive.get('results', []):
+                    user = (entry.get('user') or '').lower()
+                    if user and user not in rows:
+                        rows[user] = len(rows)
+
+        shape = (len(rows), len(dates))
+        scores = np.zeros(shape, dtype=np.int32)
+        times = np.zeros(shape, dtype=np.int32)
+        ranks = np.zeros(shape, dtype=np.int32)
+        mask = np.ones(shape, dtype=bool)
+        field_sizes = np.zeros(len(dates), dtype=np.int32)
+
+        for col, archive in enumerate(archives):
+            results = archive.get('results', [])
+            field_sizes[col] = len(results)
+            for entry in results:
+                row = rows.get((entry.get('user') or '').lower())
+                if row is None:
+                    continue
+                scores[row, col] = entry.get('good_responses') or 0
+                times[row, col] = entry.get('elapsed_time') or 0
+                ranks[row, col] = entry.get('rank') or 0
+                mask[row, col] = False
+        return cls(list(rows), dates, scores, times, ranks, mask, field_sizes)
+
+    @classmethod
+    def from_evolution(cls, evolution: Dict[str, Dict[str, Dict[str, Any]]]) -> "PlayerMatrix":
+        """Build the matrix from ``player_evolution.extract_player_evolution`` output."""
+        players = list(evolution)
+        dates = sorted({d for per_player in evolution.values() for d in per_player})
+        col_of = {d: i for i, d in enumerate(dates)}
+        shape = (len(players), len(dates))
+        scores = np.zeros(shape, dtype=np.int32)
+        times = np.zeros(shape, dtype=np.int32)
+        ranks = np.zeros(shape, dtype=np.int32)
+        mask = np.ones(shape, dtype=bool)
+        field_sizes = np.zeros(len(dates), dtype=np.int32)
+        for row, player in enumerate(players):
+            for date, data in evolution[player].items():
+                col = col_of[date]
+                scores[row, col] = data.get('score') or 0
+                times[row, col] = data.get('time') or 0
+                ranks[row, col] = data.get('rank') or 0
+                mask[row, col] = False
+                field_sizes[col] = max(field_sizes[col], data.get('total_players') or 0)
+        return cls(players, dates, scores, times, ranks, mask, field_sizes)
+
+    # --- accessors ---
+    def __contains__(self, player: str) -> bool:
+        return player.lower() in self._index
+
+    def row(self, player: str) -> int:
+        return self._index[player.lower()]
+
+    def field(self, name: str = 'score') -> np.ma.MaskedArray:
+        """Return the masked ``score``/``time``/``rank`` array."""
+        if name not in FIELDS:
+            raise ValueError(f"Unknown field {name!r} (expected one of {FIELDS})")
+        data = {'score': self.scores, 'time': self.times, 'rank': self.ranks}[name]
+        return np.ma.MaskedArray(data, mask=self.mask)
+
+    # --- per-player aggregates ---
+    def games(self) -> np.ndarray:
+        return (~self.mask).sum(axis=1)
+
+    def mean(self, name: str = 'score') -> np.ma.MaskedArray:
+        return self.field(name).mean(axis=1)
+
+    def median(self, name: str = 'score') -> np.ma.MaskedArray:
+        return np.ma.median(self.field(name), axis=1)
+
+    def best(self, name: str = 'score') -> np.ma.MaskedArray:
+        """Highest score, or lowest time/rank."""
+        f = self.field(name)
+        return f.max(axis=1) if name == 'score' else f.min(axis=1)
+
+    def worst(self, name: str = 'score') -> np.ma.MaskedArray:
+        f = self.field(name)
+        return f.min(axis=1) if name == 'score' else f.max(axis=1)
+
+    def first_last(self, name: str = 'score') -> Tuple[np.ma.MaskedArray, np.ma.MaskedArray]:
+        """Values on each player's first and last played day."""
+        played = ~self.mask
+        has_any = played.any(axis=1)
+        first_idx = played.argmax(axis=1)
+        last_idx = played.shape[1] - 1 - played[:, ::-1].argmax(axis=1)
+        data = self.field(name).data
+        rows = np.arange(data.shape[0])
+        first = np.ma.MaskedArray(data[rows, first_idx], mask=~has_any)
+        last = np.ma.MaskedArray(data[rows, last_idx], mask=~has_any)
+        return first, last
+
+    def trend(self, name: str = 'score') -> np.ma.MaskedArray:
+        """Last played value minus first played value (0 for a single game)."""
+        first, last = self.first_last(name)
+        return last - first
+
+    def trend_slopes(self, name: str = 'score') -> np.ma.MaskedArray:
+        """Least-squares slope per player, in units per archived day (matrix column)."""
+        w = (~self.mask).astype(np.float64)
+        y = self.field(name).data.astype(np.float64) * w
+        x = np.arange(len(self.dates), dtype=np.float64)
+        n = w.sum(axis=1)
+        sx = w @ x
+        sy = y.sum(axis=1)
+        sxx = w @ (x * x)
+        sxy = y @ x
+        denom = n * sxx - sx * sx
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = (n * sxy - sx * sy) / denom
+        return np.ma.MaskedArray(slope, mask=(n < 2) | (denom == 0))
+
+    # --- per-day series ---
+    def rolling_mean(self, window: int, name: str = 'score') -> np.ma.MaskedArray:
+        """Trailing mean over the last ``window`` dates, ignoring missed days.
+
+        Masked where the window holds no played day.
+        """
+        played = (~self.mask).astype(np.float64)
+        values = self.field(name).data.astype(np.float64) * played
+        zeros = np.zeros((values.shape[0], 1))
+        csum = np.concatenate([zeros, np.cumsum(values, axis=1)], axis=1)
+        ccount = np.concatenate([zeros, np.cumsum(played, axis=1)], axis=1)
+        ends = np.arange(1, values.shape[1] + 1)
+        starts = np.maximum(ends - window, 0)
+        sums = csum[:, ends] - csum[:, starts]
+        counts = ccount[:, ends] - ccount[:, starts]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = sums / counts
+        return np.ma.MaskedArray(means, mask=counts == 0)
+
+    def leaderboard_keys(self) -> np.ndarray:
+        """Sortable key per cell: higher is better (score first, then faster time)."""
+        return self.scores.astype(np.int64) * _TIME_SCALE - self.times.astype(np.int64)
+
+    def percentile_rank(self) -> np.ma.MaskedArray:
+        """Percentile (0-100) of each player among the matrix rows that played that day.
+
+        Share of the *other* players beaten, ties count half: the best gets
+        100, the last 0, and a player alone on a day 100. This is the
+        convention of :meth:`fan2quizz.percentiles.DayDistribution.percentile`.
+        All days are ranked in a single sort by offsetting each column's keys
+        into its own disjoint range.
+        """
+        n_players, n_dates = self.scores.shape
+        keys = self.leaderboard_keys()
+        low = keys.min() if keys.size else 0
+        span = (keys.max() - low + 1) if keys.size else 1
+        offsets = np.arange(n_dates, dtype=np.int64) * span
+        shifted = keys - low + offsets[np.newaxis, :]
+        present = shifted[~self.mask]
+        present.sort()
+        below = np.searchsorted(present, shifted, side='left') - np.searchsorted(present, offsets[np.newaxis, :], side='left')
+        at_or_below = np.searchsorted(present, shifted, side='right') - np.searchsorted(present, offsets[np.newaxis, :], side='left')
+        ties = at_or_below - below - 1
+        n_day = (~self.mask).sum(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct = 100.0 * (below + 0.5 * ties) / np.maximum(n_day - 1, 1)
+        pct = np.where(n_day[np.newaxis, :] == 1, 100.0, pct)
+        return np.ma.MaskedArray(pct, mask=self.mask)
+
+    def field_percentile(self) -> np.ma.MaskedArray:
+        """Share of the whole daily field ranked below the player (uses archive ranks)."""
+        sizes = self.field_sizes[np.newaxis, :].astype(np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct = 100.0 * (sizes - self.ranks) / np.maximum(sizes - 1, 1)
+        return np.ma.MaskedArray(np.clip(pct, 0, 100), mask=self.mask | (self.ranks == 0))
+
+    def streaks(self, threshold: int, name: str = 'score') -> Tuple[np.ndarray, np.ndarray]:
+        """Return ``(current, longest)`` runs of consecutive played days at/above ``threshold``.
+
+        For ``time``/``rank`` the condition is at/below the threshold. A missed
+        day breaks the streak.
+        """
+        data = self.field(name).data
+        hit = (data >= threshold) if name == 'score' else (data <= threshold)
+        hit &= ~self.mask
+        csum = np.cumsum(hit, axis=1)
+        resets = np.maximum.accumulate(np.where(~hit, csum, 0), axis=1)
+        runs = csum - resets
+        if runs.shape[1] == 0:
+            empty = np.zeros(runs.shape[0], dtype=np.int64)
+            return empty, empty
+        return runs[:, -1], runs.max(axis=1)
+
+    def head_to_head(self, players: Optional[Iterable[str]] = None,
+                     chunk_cells: int = 32_000_000) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Pairwise records on days both players took part.
+
+        Returns ``(names, wins, played)`` where ``wins[i, j]`` counts days row
+        ``i`` finished ahead of row ``j``. Days are processed in chunks so the
+        ``(P, P, days)`` comparison never exceeds ``chunk_cells`` booleans.
+        """
+        if players is None:
+            idx = np.arange(len(self.players))
+        else:
+            idx = np.array([self.row(p) for p in players if p in self], dtype=np.intp)
+        names = [self.players[i] for i in idx]
+        keys = self.leaderboard_keys()[idx]
+        played = ~self.mask[idx]
+        n = len(idx)
+        wins = np.zeros((n, n), dtype=np.int64)
+        both = np.zeros((n, n), dtype=np.int64)
+        step = max(1, chunk_cells // max(n * n, 1))
+        for start in range(0, keys.shape[1], step):
+            k = keys[:, start:start + step]
+            p = played[:, start:start + step]
+            together = p[:, np.newaxis, :] & p[np.newaxis, :, :]
+            wins += ((k[:, np.newaxis, :] > k[np.newaxis, :, :]) & together).sum(axis=2)
+            both += together.sum(axis=2)
+        np.fill_diagonal(both, 0)
+        return names, wins, both
+
+    def win_rates(self, players: Optional[Iterable[str]] = None) -> Tuple[List[str], np.ma.MaskedArray]:
+        names, wins, played = self.head_to_head(players)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rates = wins / played
+        return names, np.ma.MaskedArray(rates, mask=played == 0)
@@ -0,0 +1,167 @@
+"""Quiz category names and the theme → domain classifier.
+
+Quizypedia tags every question with a ``main_category_id`` (one of the eight
+:data:`CAT_ID_NAME` categories) and a free-text ``theme_title`` such as
+"Écrivains français du XIXe siècle (2)". Study guides group themes into
+broader domains by keyword (:data:`DOMAIN_MAP`).
+
+:class:`DomainClassifier` compiles every keyword into one regex and memoizes
+the result per distinct theme. Classifying a whole mistake history then
+costs one scan per distinct theme, and filtering by domain is a set lookup
+on the ``domains`` stored on each mistake by :func:`annotate_domains`.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence
+
+UNKNOWN_CATEGORY = "Unknown Category"
+
+# Canonical mapping for category IDs → French category names
+CAT_ID_NAME = {
+    1: "Culture classique",
+    2: "Culture moderne",
+    3: "Culture générale",
+    4: "Géographie",
+    5: "Histoire",
+    6: "Animaux et plantes",
+    7: "Sciences et techniques",
+    8: "Sport",
+}
+
+# Theme keyword → study domain (a theme may fall into several domains)
+DOMAIN_MAP = {
+    "Arts": ["Écrivains", "Personnages masculins d'opéras", "Peinture", "Actrices", "Shakespeare"],
+    "Culture": ["Pâtisseries", "Répliques des Guignols", "Oscars"],
+    "Histoire": ["Événements du XIIIe siècle", "Chanceliers", "Exécutions", "Titanic", "Prix Nobel"],
+    "Géographie": ["La Haute-Garonne", "Quartiers de villes", "Villes de la côte"],
+    "Musique": ["Groupes musicaux", "Célèbres chanteurs"],
+    "Sports": ["Joueurs de l'équipe", "Records de sélections", "Champions internationaux"],
+    "Sciences": ["Pathologies", "Plantes connues", "Reconnaissance de fleurs", "Rides"],
+    "Mythologie": ["Personnages légendaires"]
+}
+
+
+def resolve_category_name(value) -> str:
+    """Return display category name from a raw value.
+
+    Accepts integer IDs, numeric strings, or already formatted names.
+    Falls back to 'Unknown Category'.
+    """
+    if value is None:
+        return UNKNOWN_CATEGORY
+    if isinstance(value, (str, int, float)):
+        return _resolve_scalar(value)
+    return str(value)
+
+
+@lru_cache(maxsize=None)
+def _resolve_scalar(value) -> str:
+    """Cached part of :func:`resolve_category_name`, for the hashable IDs and names."""
+    if isinstance(value, str):
+        v = value.strip()
+        if v.isdigit():
+            try:
+                return CAT_ID_NAME.get(int(v), f"Catégorie {v}")
+            except ValueError:
+                return f"Catégorie {v}"
+        return v
+    if isinstance(value, (int, float)):
+        try:
+            return CAT_ID_NAME.get(int(value), f"Catégorie {int(value)}")
+        except (ValueError, OverflowError):
+            return f"Catégorie {value}"
+
+
+def extract_category(mistake: Dict[str, Any]) -> str:
+    """Extract standardized category from a mistake record.
+
+    Tries common keys: 'category', 'category_id', 'main_category_id'.
+    """
+    for key in ("category", "category_id", "main_category_id"):
+        if key in mistake and mistake[key] not in (None, ""):
+            return resolve_category_name(mistake[key])
+    return UNKNOWN_CATEGORY
+
+
+class DomainClassifier:
+    """Maps a theme title to the set of domains whose keywords it contains.
+
+    Matching is case-insensitive substring search, like testing every
+    keyword with ``in``, but done in a single regex pass. The pattern looks
+    ahead at each position and tries longer keywords first. Each keyword
+    also carries the domains of every keyword it contains, so overlapping
+    and nested keywords are not lost.
+    """
+
+    def __init__(self, domain_map: Mapping[str, Sequence[str]] = DOMAIN_MAP):
+        self.domains = list(domain_map)
+        direct: Dict[str, set] = {}
+        for domain, keywords in domain_map.items():
+            for keyword in keywords:
+                direct.setdefault(keyword.lower(), set()).add(domain)
+        self._keyword_domains: Dict[str, FrozenSet[str]] = {
+            keyword: frozenset().union(*(d for other, d in direct.items() if other in keyword))
+            for keyword in direct
+        }
+        alternation = '|'.join(re.escape(k) for k in sorted(direct, key=len, reverse=True))
+        self._pattern = re.compile(f"(?=({alternation}))") if direct else None
+        self._memo: Dict[str, FrozenSet[str]] = {}
+        self._sorted: Dict[Optional[str], tuple] = {}
+
+    def classify(self, theme: Optional[str]) -> FrozenSet[str]:
+        """Domains of a theme title (empty if it matches no keyword)."""
+        if not theme:
+            return frozenset()
+        found = self._memo.get(theme)
+        if found is None:
+            found = frozenset()
+            if self._pattern is not None:
+                for match in self._pattern.finditer(theme.lower()):
+                    found |= self._keyword_domains[match.group(1)]
+            self._memo[theme] = found
+        return found
+
+    def matching_domains(self, query: str) -> FrozenSet[str]:
+        """Domain names containing ``query`` (case-insensitive), as the ``--domain`` filter expects."""
+        query = query.lower()
+        return frozenset(d for d in self.domains if query in d.lower())
+
+    def annotate(self, mistakes: Iterable[Dict[str, Any]], key: str = 'category') -> List[Dict[str, Any]]:
+        """Store the sorted ``domains`` of each mistake's theme on the mistake itself.
+
+        Mistakes sharing a theme share one (immutable) tuple.
+        """
+        annotated = []
+        for mistake in mistakes:
+            theme = mistake.get(key)
+            domains = self._sorted.get(theme)
+            if domains is None:
+                domains = self._sorted[theme] = tuple(sorted(self.classify(theme)))
+            mistake['domains'] = domains
+            annotated.append(mistake)
+        return annotated
+
+    def cache_size(self) -> int:
+        return len(self._memo)
+
+
+_default: Optional[DomainClassifier] = None
+
+
+def default_classifier() -> DomainClassifier:
+    """Shared classifier over :data:`DOMAIN_MAP`, built on first use."""
+    global _default
+    if _default is None:
+        _default = DomainClassifier()
+    return _default
+
+
+def classify_domains(theme: Optional[str]) -> FrozenSet[str]:
+    return default_classifier().classify(theme)
+
+
+def annotate_domains(mistakes: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return default_classifier().annotate(mistakes)
@@ -1,32 +1,72 @@
 """Command-line interface entry points for fan2quizz."""
 
+import argparse
+import sys
 from pathlib import Path
 
+SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
 
-def parse_results_main():
-    """Entry point for parse-results command."""
-    scripts_dir = Path(__file__).parent.parent / "scripts"
-    script_path = scripts_dir / "parse_results.py"
-    
-    # Execute the script
+
+def run_script(name, argv=None):
+    """Execute ``scripts/<name>.py`` as ``__main__`` with ``argv`` as its arguments."""
+    script_path = SCRIPTS_DIR / f"{name.removesuffix('.py')}.py"
+    if argv is not None:
+        sys.argv = [str(script_path)] + list(argv)
     with open(script_path) as f:
         code = compile(f.read(), script_path, 'exec')
+    try:
         exec(code, {'__name__': '__main__', '__file__': str(script_path)})
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    return 0
+
+
+def parse_results_main():
+    """Entry point for parse-results command."""
+    return run_script("parse_results")
 
 
 def daily_report_main():
     """Entry point for daily-report command."""
-    scripts_dir = Path(__file__).parent.parent / "scripts"
-    script_path = scripts_dir / "daily_report.py"
-    
-    # Execute the script
-    with open(script_path) as f:
-        code = compile(f.read(), script_path, 'exec')
-        exec(code, {'__name__': '__main__', '__file__': str(script_path)})
+    return run_script("daily_report")
+
+
+def main(argv=None):
+    """Entry point for the unified ``fan2quizz`` command: run any script, optionally profiled."""
+    parser = argparse.ArgumentParser(
+        prog="fan2quizz",
+        description="Run a fan2quizz script (scripts/<name>.py), optionally under a profiler",
+        epilog="Example: fan2quizz --profile sample --memory weekly_mistakes_report --days 14",
+    )
+    parser.add_argument('--profile', nargs='?', const='cprofile', metavar='MODES',
+                        help="cprofile (default), sample, or both comma-separated; "
+                             "files go to data/profiles/")
+    parser.add_argument('--memory', action='store_true', help='Also report the tracemalloc peak and top allocations')
+    parser.add_argument('--profile-dir', type=Path, help='Where profiles are saved (default: data/profiles/)')
+    parser.add_argument('--top', type=int, default=25, help='Hotspots printed (default: 25)')
+    parser.add_argument('--list', action='store_true', help='List the available scripts')
+    parser.add_argument('script', nargs='?', help='Script name, e.g. weekly_mistakes_report')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='Arguments passed to the script')
+    args = parser.parse_args(argv)
+
+    if args.list or not args.script:
+        for path in sorted(SCRIPTS_DIR.glob("*.py")):
+            print(path.stem)
+        return 0
+    if not (SCRIPTS_DIR / f"{args.script.removesuffix('.py')}.py").is_file():
+        parser.error(f"no script named {args.script!r} (see --list)")
+
+    from . import profiling
+    try:
+        modes = profiling.parse_modes(args.profile)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.memory:
+        modes.add('memory')
+    if modes and profiling.active() is None:
+        profiling.start(args.script.removesuffix('.py'), modes, directory=args.profile_dir, top=args.top)
+    return run_script(args.script, args.args)
 
 
 if __name__ == "__main__":
-    print("This module provides CLI entry points.")
-    print("Available commands after 'pip install -e .':")
-    print("  - parse-results")
-    print("  - daily-report")
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""Minimal local request/response server over a Unix domain socket.
+
+A long-running process (``daily_report.py --serve``) keeps expensive state
+warm and answers requests from thin clients on the same machine. The wire
+format is one JSON object per line in each direction. Requests are handled
+one at a time in the serving thread, so a handler may redirect stdout and
+touch module globals without locking.
+
+The socket is created with mode 0600, so only the owning user can talk to
+the daemon.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+MAX_REQUEST_BYTES = 1 << 20
+DEFAULT_TIMEOUT = 120.0
+
+Handler = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+class DaemonUnavailable(ConnectionError):
+    """No daemon is listening on the socket."""
+
+
+def default_socket_path(name: str) -> Path:
+    """Per-user socket path in the temp directory (short enough for AF_UNIX limits)."""
+    uid = os.getuid() if hasattr(os, 'getuid') else 0
+    return Path(tempfile.gettempdir()) / f"fan2quizz-{name}-{uid}.sock"
+
+
+def _encode(obj: Dict[str, Any]) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline(MAX_REQUEST_BYTES)
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as e:
+            self.wfile.write(_encode({'code': 2, 'stdout': '', 'stderr': f"Bad request: {e}\n"}))
+            return
+        response = self.server.app(request)
+        if response.pop('stop', False):
+            self.server.stopping = True
+        self.wfile.write(_encode(response))
+
+
+class LocalServer(socketserver.UnixStreamServer):
+    """Unix socket server calling ``app(request) -> response`` for each JSON line received.
+
+    A response carrying ``stop: True`` shuts the server down after it is sent.
+    """
+
+    def __init__(self, path: Path, app: Handler):
+        self.path = Path(path)
+        self.app = app
+        self.stopping = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            if is_alive(self.path):
+                raise OSError(f"A daemon is already listening on {self.path}")
+            self.path.unlink()
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def serve_until_stopped(self, poll_interval: float = 0.5):
+        self.timeout = poll_interval
+        try:
+            while not self.stopping:
+                self.handle_request()
+        finally:
+            self.server_close()
+
+    def server_close(self):
+        super().server_close()
+        with contextlib.suppress(OSError):
+            self.path.unlink()
+
+
+def call(path: Path, request: Dict[str, Any], timeout: float = DEFAULT_TIMEOUT) -> Dict[str, Any]:
+    """Send one request and wait for the response; raises :class:`DaemonUnavailable` if nobody listens."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        try:
+            sock.connect(str(path))
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise DaemonUnavailable(str(e)) from e
+        sock.sendall(_encode(request))
+        with sock.makefile('rb') as f:
+            line = f.readline()
+    finally:
+        sock.close()
+    if not line:
+        raise DaemonUnavailable("connection closed without a response")
+    return json.loads(line)
+
+
+def is_alive(path: Path) -> bool:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+def captured(func: Callable[..., Any], *args, **kwargs) -> Tuple[Any, str, str]:
+    """Run ``func`` with stdout/stderr captured; returns (result, stdout, stderr)."""
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        result = func(*args, **kwargs)
+    return result, out.getvalue(), err.getvalue()
+
+
+def serve(path: Path, app: Handler, on_ready: Optional[Callable[[], None]] = None):
+    """Serve ``app`` on ``path`` until a handler returns ``stop: True`` (or Ctrl+C)."""
+    server = LocalServer(path, app)
+    if on_ready is not None:
+        on_ready()
+    try:
+        server.serve_until_stopped()
+    except KeyboardInterrupt:
+        pass
@@ -6,6 +6,9 @@ import os
 import sqlite3
 from typing import Iterable, Optional, List, Dict, Any, Tuple
 
+from . import metrics
+from .timing import timed
+
 SCHEMA = """
 PRAGMA foreign_keys=ON;
 CREATE TABLE IF NOT EXISTS quizzes (
@@ -57,6 +60,7 @@ class QuizDB:
         self.conn.commit()
 
     # Quiz storage
+    @timed('db.write')
     def insert_quiz(self, url: str, title: str, description: str, tags: Iterable[str]) -> int:
         tags_s = ','.join(tags)
         cur = self.conn.cursor()
@@ -76,11 +80,69 @@ class QuizDB:
             rowid = self.get_quiz_id_by_url(url) or 0
         return rowid
 
+    @timed('db.write')
+    def upsert_quizzes(self, quizzes: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """Store quizzes with their questions in one transaction, keyed by URL.
+
+        Each quiz is ``{url, title, description, tags, questions}`` with questions as
+        ``{question_text, choices, correct_index}`` (the shape of
+        :meth:`fan2quizz.scraper.QuizypediaScraper.parse_daily_live`). A known URL
+        has its title, description, tags and questions replaced, so storing the same
+        quiz twice changes nothing. Returns ``(inserted, updated)``.
+        """
+        inserted = updated = 0
+        questions_written = 0
+        with self.conn:
+            for quiz in quizzes:
+                url = quiz['url']
+                title = quiz.get('title') or ''
+                description = quiz.get('description') or ''
+                tags_s = ','.join(quiz.get('tags') or ())
+                row = self.conn.execute(
+                    "SELECT id, title, description, tags FROM quizzes WHERE url=?", (url,)).fetchone()
+                if row is None:
+                    quiz_id = self.conn.execute(
+                        "INSERT INTO quizzes (url, title, description, tags) VALUES (?,?,?,?)",
+                        (url, title, description, tags_s)).lastrowid
+                    self.conn.execute(
+                        "INSERT INTO quizzes_fts(rowid, title, description, tags) VALUES (?,?,?,?)",
+                        (quiz_id, title, description, tags_s))
+                    inserted += 1
+                else:
+                    quiz_id = row[0]
+                    if tuple(row[1:]) != (title, description, tags_s):
+                        # External-content FTS: the old terms must be removed with the old values
+                        self.conn.execute(
+                            "INSERT INTO quizzes_fts(quizzes_fts, rowid, title, description, tags) "
+                            "VALUES ('delete',?,?,?,?)", row)
+                        self.conn.execute(
+                            "UPDATE quizzes SET title=?, description=?, tags=? WHERE id=?",
+                            (title, description, tags_s, quiz_id))
+                        self.conn.execute(
+                            "INSERT INTO quizzes_fts(rowid, title, description, tags) VALUES (?,?,?,?)",
+                            (quiz_id, title, description, tags_s))
+                    updated += 1
+                    self.conn.execute("DELETE FROM questions WHERE quiz_id=?", (quiz_id,))
+                rows = [(quiz_id, i, q.get('question_text') or '', '||'.join(q.get('choices') or ()),
+                         q.get('correct_index')) for i, q in enumerate(quiz.get('questions') or ())]
+                self.conn.executemany(
+                    "INSERT INTO questions (quiz_id, qindex, question_text, choices, correct_index) "
+                    "VALUES (?,?,?,?,?)", rows)
+                questions_written += len(rows)
+        metrics.inc('fan2quizz_rows_written_total', inserted + updated, target='quizzes')
+        metrics.inc('fan2quizz_rows_written_total', questions_written, target='questions')
+        return inserted, updated
+
+    def quiz_urls(self) -> set:
+        """URLs of every stored quiz."""
+        return {r[0] for r in self.conn.execute("SELECT url FROM quizzes")}
+
     def get_quiz_id_by_url(self, url: str) -> Optional[int]:
         cur = self.conn.execute("SELECT id FROM quizzes WHERE url=?", (url,))
         r = cur.fetchone()
         return r[0] if r else None
 
+    @timed('db.write')
     def insert_question(self, quiz_id: int, qindex: int, question_text: str, choices: Iterable[str], correct_index: Optional[int]):
         choices_s = '||'.join(choices)
         self.conn.execute(
@@ -98,6 +160,7 @@ class QuizDB:
         return cur.fetchall()
 
     # Attempts
+    @timed('db.write')
     def record_attempt(self, quiz_id: int, player: str, answers: Iterable[int]):
         answers_list = list(answers)
         score = self._compute_score(quiz_id, answers_list)
@@ -106,6 +169,7 @@ class QuizDB:
             (quiz_id, player, score, len(answers_list), ','.join(map(str, answers_list))),
         )
         self.conn.commit()
+        metrics.inc('fan2quizz_rows_written_total', target='db')
         return score
 
     def _compute_score(self, quiz_id: int, answers: List[int]) -> int:
@@ -116,6 +180,7 @@ class QuizDB:
         corrects = [r[0] for r in cur.fetchall()]
         return sum(1 for i, a in enumerate(answers) if i < len(corrects) and corrects[i] is not None and a == corrects[i])
 
+    @timed('db.query')
     def leaderboard_for_date(self, date: str) -> List[Tuple[str, int, int]]:
         cur = self.conn.execute(
             "SELECT player, MAX(score) as best, MAX(total) as total FROM attempts a JOIN daily_quizzes d ON a.quiz_id=d.quiz_id WHERE d.date=? GROUP BY player ORDER BY best DESC, player",
@@ -123,6 +188,7 @@ class QuizDB:
         )
         return cur.fetchall()
 
+    @timed('db.query')
     def daily_table(self, date: str):
         """Return richer leaderboard rows for a date.
 
@@ -152,6 +218,7 @@ class QuizDB:
         return cur.fetchall()
 
     # Player-centric retrieval
+    @timed('db.query')
     def best_attempt_for_date_player(self, date: str, player: str):
         cur = self.conn.execute(
             """
@@ -167,6 +234,7 @@ class QuizDB:
         return cur.fetchone()
 
     # Daily quiz
+    @timed('db.write')
     def set_daily_quiz(self, date: str, quiz_id: int):
         self.conn.execute(
             "INSERT INTO daily_quizzes(date, quiz_id) VALUES(?,?) ON CONFLICT(date) DO UPDATE SET quiz_id=excluded.quiz_id",
@@ -209,6 +277,7 @@ class QuizDB:
             'questions': questions,
         }
 
+    @timed('db.write')
     def update_attempt_meta(self, attempt_id: int, duration: int | None, external_rank: int | None):
         sets = []
         params = []
@@ -0,0 +1,65 @@
+"""Derived-data store: memoize per-key results keyed by a fingerprint of their inputs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+
+def hash_text(text: str) -> str:
+    """Return a hex digest of a source document (HTML page, JSON archive...)."""
+    return hashlib.sha256(text.encode('utf-8', errors='surrogatepass')).hexdigest()
+
+
+def fingerprint(*parts: Any) -> str:
+    """Return a stable hex digest of arbitrary JSON-serializable inputs."""
+    blob = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str, separators=(',', ':'))
+    return hash_text(blob)
+
+
+class DerivedStore:
+    """One small JSON file per key under ``root/namespace``.
+
+    Each record remembers the fingerprint of the source it was computed from;
+    :meth:`get` only returns a value when the caller's fingerprint matches, so
+    a changed source page (or a bumped ``version``) transparently invalidates it.
+    """
+
+    def __init__(self, root: Path, namespace: str, version: int = 1):
+        self.dir = Path(root) / namespace
+        self.version = version
+
+    def _path(self, key: str) -> Path:
+        return self.dir / f"{key}.json"
+
+    def get(self, key: str, source_hash: str) -> Optional[Any]:
+        path = self._path(key)
+        if not path.is_file():
+            return None
+        try:
+            record = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if record.get('version') != self.version or record.get('source_hash') != source_hash:
+            return None
+        return record.get('value')
+
+    def put(self, key: str, source_hash: str, value: Any):
+        self.dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp = path.with_suffix('.json.tmp')
+        record = {'version': self.version, 'source_hash': source_hash, 'value': value}
+        tmp.write_text(json.dumps(record, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+        os.replace(tmp, path)
+
+    def clear(self) -> int:
+        """Delete every record in this namespace; returns the number removed."""
+        removed = 0
+        if self.dir.is_dir():
+            for path in self.dir.glob('*.json'):
+                path.unlink()
+                removed += 1
+        return removed
@@ -0,0 +1,397 @@
+"""Resumable crawl frontier for category and quiz discovery.
+
+Every URL the crawl has seen is a row of a small SQLite database
+(``data/db/frontier.db`` by default) with its kind, status and fetch time::
+
+    home      the homepage, source of the category list
+    listing   one page of a category listing (category path + page number)
+    quiz      a quiz page
+
+Rows go ``pending`` -> ``in_progress`` -> ``done`` (or back to ``pending``
+after an error, until ``failed`` once ``max_attempts`` is reached). The URL
+is the primary key, so a quiz listed in several categories is stored and
+fetched once.
+
+:class:`Crawler` runs worker threads that claim pending rows, fetch them and
+add the links they find. Every state change is committed immediately, so a
+crash or Ctrl-C loses at most the pages being fetched: rows left
+``in_progress`` go back to ``pending`` when the next crawl starts
+(:meth:`Frontier.recover`), which carries on where this one stopped.
+
+Listings are newest first. An incremental recrawl (``Crawler(incremental=True)``)
+re-queues page 1 of every category and follows the pagination only while a
+page still brings new quizzes, so a daily run costs one or two requests per
+category instead of the whole listing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from datetime import UTC, datetime
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+from . import metrics
+from .timing import timed
+from .utils import CircuitOpenError
+
+KINDS = ('home', 'listing', 'quiz')
+STATUSES = ('pending', 'in_progress', 'done', 'failed')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+  url TEXT PRIMARY KEY,
+  kind TEXT NOT NULL,
+  category TEXT,
+  page INTEGER,
+  status TEXT NOT NULL DEFAULT 'pending',
+  attempts INTEGER NOT NULL DEFAULT 0,
+  discovered_at TEXT NOT NULL,
+  fetched_at TEXT,
+  content_hash TEXT,
+  last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_urls_status ON urls(status, kind);
+"""
+
+
+def normalize_url(url: str) -> str:
+    """Site path of ``url`` without query or fragment, so the same page is always the same key."""
+    path = urlsplit(url).path or '/'
+    return path if path == '/' else path.rstrip('/') + '/'
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat(timespec='seconds')
+
+
+class FrontierEntry:
+    __slots__ = ('url', 'kind', 'category', 'page', 'attempts')
+
+    def __init__(self, url: str, kind: str, category: Optional[str], page: Optional[int], attempts: int):
+        self.url = url
+        self.kind = kind
+        self.category = category
+        self.page = page
+        self.attempts = attempts
+
+    def __repr__(self) -> str:
+        return f"FrontierEntry({self.kind} {self.url})"
+
+
+class Frontier:
+    """The crawl state in SQLite, safe to share between threads.
+
+    >>> frontier = Frontier('data/db/frontier.db')
+    >>> frontier.add('/quiz/les-capitales/', 'quiz', category='/categorie/geographie/')
+    True
+    >>> frontier.claim(['quiz'])
+    [FrontierEntry(quiz /quiz/les-capitales/)]
+    """
+
+    def __init__(self, path: str, max_attempts: int = 3):
+        dir_path = os.path.dirname(path)
+        if dir_path and not os.path.isdir(dir_path):
+            os.makedirs(dir_path, exist_ok=True)
+        self.path = path
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> "Frontier":
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        self.close()
+        return False
+
+    def recover(self) -> int:
+        """Put rows left ``in_progress`` by an interrupted run back to ``pending``; returns how many.
+
+        Only call it while no other crawl uses the frontier.
+        """
+        with self._lock:
+            cur = self.conn.execute("UPDATE urls SET status='pending' WHERE status='in_progress'")
+            self.conn.commit()
+            return cur.rowcount
+
+    @timed('db.write')
+    def add_many(self, rows: Iterable[Tuple[str, str, Optional[str], Optional[int]]], requeue: bool = False) -> int:
+        """Add ``(url, kind, category, page)`` rows; returns how many URLs were new.
+
+        Known URLs are left alone, unless ``requeue`` puts finished ones back to ``pending``.
+        """
+        now = _now()
+        rows = [(normalize_url(url), kind, category, page, now) for url, kind, category, page in rows]
+        with self._lock:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO urls (url, kind, category, page, discovered_at) VALUES (?,?,?,?,?)", rows)
+            added = self.conn.total_changes - before
+            if requeue:
+                self.conn.executemany(
+                    "UPDATE urls SET status='pending', attempts=0 WHERE url=? AND status IN ('done', 'failed')",
+                    [(row[0],) for row in rows])
+            self.conn.commit()
+        return added
+
+    def add(self, url: str, kind: str, category: Optional[str] = None, page: Optional[int] = None,
+            requeue: bool = False) -> bool:
+        """Add one URL; True if it was not known yet."""
+        return self.add_many([(url, kind, category, page)], requeue=requeue) > 0
+
+    @timed('db.write')
+    def requeue(self, kind: str, page: Optional[int] = None) -> int:
+        """Put the finished rows of ``kind`` (only listing page ``page`` if given) back to ``pending``."""
+        sql = "UPDATE urls SET status='pending', attempts=0 WHERE kind=? AND status IN ('done', 'failed')"
+        params: List[object] = [kind]
+        if page is not None:
+            sql += " AND page=?"
+            params.append(page)
+        with self._lock:
+            cur = self.conn.execute(sql, params)
+            self.conn.commit()
+            return cur.rowcount
+
+    @timed('db.write')
+    def claim(self, kinds: Sequence[str] = KINDS, limit: int = 1) -> List[FrontierEntry]:
+        """Mark up to ``limit`` pending rows of ``kinds`` as ``in_progress`` and return them.
+
+        The homepage comes first, then listings by page number (so every category
+        starts before any goes deep), then quizzes in discovery order.
+        """
+        marks = ','.join('?' * len(kinds))
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT url, kind, category, page, attempts FROM urls WHERE status='pending' AND kind IN ({marks}) "
+                "ORDER BY CASE kind WHEN 'home' THEN 0 WHEN 'listing' THEN 1 ELSE 2 END, page, discovered_at, url "
+                "LIMIT ?", (*kinds, limit)).fetchall()
+            self.conn.executemany("UPDATE urls SET status='in_progress' WHERE url=?", [(r[0],) for r in rows])
+            self.conn.commit()
+        return [FrontierEntry(*row) for row in rows]
+
+    @timed('db.write')
+    def complete(self, url: str, content_hash: Optional[str] = None):
+        with self._lock:
+            self.conn.execute(
+                "UPDATE urls SET status='done', fetched_at=?, content_hash=COALESCE(?, content_hash), "
+                "last_error=NULL WHERE url=?", (_now(), content_hash, url))
+            self.conn.commit()
+
+    @timed('db.write')
+    def fail(self, url: str, error: str) -> bool:
+        """Record a failed fetch; the row is retried later unless it reached ``max_attempts``.
+
+        Returns True if the row is now ``failed`` for good.
+        """
+        with self._lock:
+            self.conn.execute(
+                "UPDATE urls SET attempts=attempts+1, last_error=?, fetched_at=?, "
+                "status=CASE WHEN attempts+1 >= ? THEN 'failed' ELSE 'pending' END WHERE url=?",
+                (error[:500], _now(), self.max_attempts, url))
+            self.conn.commit()
+            row = self.conn.execute("SELECT status FROM urls WHERE url=?", (url,)).fetchone()
+        return bool(row) and row[0] == 'failed'
+
+    def release(self, url: str):
+        """Give a claimed row back untouched (the run is stopping before it was fetched)."""
+        with self._lock:
+            self.conn.execute("UPDATE urls SET status='pending' WHERE url=? AND status='in_progress'", (url,))
+            self.conn.commit()
+
+    @timed('db.query')
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """``{kind: {status: count}}`` for every kind and status."""
+        counts = {kind: {status: 0 for status in STATUSES} for kind in KINDS}
+        with self._lock:
+            rows = self.conn.execute("SELECT kind, status, COUNT(*) FROM urls GROUP BY kind, status").fetchall()
+        for kind, status, n in rows:
+            counts.setdefault(kind, {})[status] = n
+        return counts
+
+    @timed('db.query')
+    def urls(self, kind: str, statuses: Sequence[str] = STATUSES) -> List[str]:
+        """URLs of ``kind`` with one of ``statuses``, in discovery order."""
+        marks = ','.join('?' * len(statuses))
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT url FROM urls WHERE kind=? AND status IN ({marks}) ORDER BY discovered_at, url",
+                (kind, *statuses)).fetchall()
+        return [r[0] for r in rows]
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self.conn.execute("SELECT 1 FROM urls LIMIT 1").fetchone() is None
+
+    def failures(self, limit: int = 20) -> List[Tuple[str, int, str]]:
+        """``(url, attempts, last error)`` of the rows given up on, most recent first."""
+        with self._lock:
+            return self.conn.execute(
+                "SELECT url, attempts, last_error FROM urls WHERE status='failed' "
+                "ORDER BY fetched_at DESC LIMIT ?", (limit,)).fetchall()
+
+
+class Crawler:
+    """Discover categories and quizzes through a :class:`Frontier` with ``workers`` threads.
+
+    ``scraper_factory()`` builds one :class:`fan2quizz.scraper.QuizypediaScraper`
+    per worker; share a :class:`fan2quizz.utils.RateLimiter` and
+    :class:`fan2quizz.utils.CircuitBreaker` between them so the site sees one
+    polite client. With ``fetch_quizzes`` quiz pages are downloaded too and
+    handed to ``on_quiz(url, html)``; otherwise quiz rows stay ``pending`` as a
+    to-do list for a later pass.
+    """
+
+    def __init__(self, frontier: Frontier, scraper_factory: Callable[[], object], workers: int = 4,
+                 incremental: bool = False, fetch_quizzes: bool = False,
+                 on_quiz: Optional[Callable[[str, str], None]] = None,
+                 log: Callable[[str], None] = print):
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.frontier = frontier
+        self.scraper_factory = scraper_factory
+        self.workers = workers
+        self.incremental = incremental
+        self.kinds: Tuple[str, ...] = KINDS if fetch_quizzes else ('home', 'listing')
+        self.on_quiz = on_quiz
+        self.log = log
+        self.counts: Counter = Counter()
+        self.recovered = 0
+        self.error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+        self._busy = 0
+        self._stop = threading.Event()
+
+    def seed(self):
+        """Queue what this run starts from: the homepage on a new frontier, page 1 of each category when incremental."""
+        if self.frontier.is_empty():
+            self.frontier.add('/', 'home')
+        elif self.incremental:
+            self.frontier.requeue('home')
+            self.frontier.requeue('listing', page=1)
+
+    def stop(self):
+        """Ask the workers to stop after their current page."""
+        self._stop.set()
+
+    def run(self) -> Counter:
+        """Crawl until nothing is pending (or :meth:`stop`); returns the counts of this run."""
+        self.recovered = self.frontier.recover()
+        if self.recovered:
+            self.log(f"♻️  Resuming: {self.recovered} pages were left in progress by the previous run")
+        self.seed()
+        threads = [threading.Thread(target=self._worker, name=f"crawl-{i}", daemon=True)
+                   for i in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(0.2)
+        except KeyboardInterrupt:
+            self.stop()
+            for thread in threads:
+                thread.join()
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.counts
+
+    def _count(self, key: str, n: int = 1):
+        with self._lock:
+            self.counts[key] += n
+
+    def _next(self) -> Optional[FrontierEntry]:
+        """Claim the next row; None once nothing is pending and no other worker may still add some."""
+        while not self._stop.is_set():
+            with self._lock:
+                claimed = self.frontier.claim(self.kinds, 1)
+                if claimed:
+                    self._busy += 1
+                    return claimed[0]
+                if self._busy == 0:
+                    return None
+            time.sleep(0.05)
+        return None
+
+    def _worker(self):
+        scraper = self.scraper_factory()
+        while True:
+            entry = self._next()
+            if entry is None:
+                return
+            try:
+                self._process(scraper, entry)
+            except CircuitOpenError as e:
+                self.frontier.release(entry.url)
+                self.error = e
+                self.stop()
+            except requests.RequestException as e:
+                metrics.inc('fan2quizz_failures_total', stage='crawl')
+                status = getattr(e.response, 'status_code', None)
+                if self.frontier.fail(entry.url, str(status or e)):
+                    self._count('failed')
+                    self.log(f"❌ {entry.url}: {status or e}")
+            except BaseException as e:
+                # Anything else (a failing on_quiz, a bug) ends the crawl; run() re-raises it
+                self.frontier.release(entry.url)
+                if self.error is None:
+                    self.error = e
+                self.stop()
+                return
+            finally:
+                with self._lock:
+                    self._busy -= 1
+
+    def _process(self, scraper, entry: FrontierEntry):
+        if self._stop.is_set():
+            self.frontier.release(entry.url)
+            return
+        if entry.kind == 'home':
+            html = scraper.fetch(entry.url).text
+            categories = scraper.category_links(html)
+            added = self.frontier.add_many(
+                [(scraper.category_page_path(c, 1), 'listing', normalize_url(c), 1) for c in categories])
+            self._count('categories', len(categories))
+            self.log(f"🏠 {len(categories)} categories ({added} new)")
+        elif entry.kind == 'listing':
+            self._process_listing(scraper, entry)
+        else:
+            html = scraper.fetch_quiz(entry.url)
+            if self.on_quiz is not None:
+                self.on_quiz(entry.url, html)
+            self._count('quizzes_fetched')
+            self.frontier.complete(entry.url, hashlib.blake2b(html.encode('utf-8'), digest_size=16).hexdigest())
+            return
+        self.frontier.complete(entry.url)
+
+    def _process_listing(self, scraper, entry: FrontierEntry):
+        try:
+            html = scraper.fetch(entry.url).text
+        except requests.HTTPError as e:
+            if getattr(e.response, 'status_code', None) == 404:
+                return  # past the last page
+            raise
+        links = scraper.quiz_links(html)
+        self._count('listings')
+        if not links:
+            return
+        new = self.frontier.add_many([(link, 'quiz', entry.category, None) for link in links])
+        self._count('quizzes_found', new)
+        if new or not self.incremental:
+            self.frontier.add(scraper.category_page_path(entry.category, entry.page + 1), 'listing',
+                              entry.category, entry.page + 1, requeue=self.incremental)
+        if new:
+            self.log(f"📄 {entry.category} p.{entry.page}: {new} new quizzes")
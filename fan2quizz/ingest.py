@@ -0,0 +1,246 @@
+"""Streaming ingestion of quiz pages into :class:`fan2quizz.database.QuizDB`.
+
+Three stages connected by bounded queues::
+
+    discover ──urls──▶ fetch + parse (N workers) ──quizzes──▶ write (batched)
+
+- *discover* walks an iterable of quiz URLs (the crawl frontier, or
+  :func:`discover_quiz_urls` straight from the site) in its own thread,
+  skipping URLs already seen or, by default, already stored;
+- each *worker* has its own scraper (share the rate limiter and circuit
+  breaker between them), fetches a page and turns it into a quiz record with
+  :func:`parse_quiz_page`;
+- the *writer* runs in the calling thread, which owns the SQLite connection,
+  and stores ``batch_size`` quizzes per transaction with
+  :meth:`QuizDB.upsert_quizzes`. A partial batch is flushed once nothing
+  arrived for ``flush_interval`` seconds, so a slow crawl still lands in the
+  database as it goes.
+
+When the writer falls behind, the page queue fills up and workers block on
+it; when workers fall behind, discovery blocks on the URL queue. Memory stays
+bounded by the two queue sizes whatever the catalog size. Upserts are keyed
+by URL, so an interrupted ingestion can simply be run again. Given a
+:class:`fan2quizz.frontier.Frontier`, stored quizzes are marked done there
+(and failed fetches recorded), so the crawl does not fetch them again.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import re
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import requests
+
+from . import metrics
+from .frontier import normalize_url
+from .timing import span
+from .utils import CircuitOpenError
+
+_DC_DATA = re.compile(r'var DC_DATA = (\[.*?\]);', re.DOTALL)
+_SUFFIX = re.compile(r'\s*[-|–]\s*Quizypedia\s*$', re.IGNORECASE)
+
+
+def discover_quiz_urls(scraper) -> Iterator[str]:
+    """Every quiz URL of the site: each homepage category, page after page."""
+    for category in scraper.iter_category_urls():
+        yield from scraper.iter_quiz_urls_from_category(category)
+
+
+def parse_quiz_page(url: str, html: str, parse_html: Callable[[str], Dict[str, Any]]) -> Dict[str, Any]:
+    """A :meth:`QuizDB.upsert_quizzes` record for one quiz page.
+
+    Questions come from the embedded ``DC_DATA`` array when the page has one
+    (tags are then its question themes); otherwise from ``parse_html``, the
+    HTML heuristics of :meth:`fan2quizz.scraper.QuizypediaScraper.parse_daily_live`.
+    """
+    with span('parse'):
+        page = parse_html(html)
+        quiz = {
+            'url': url,
+            'title': _SUFFIX.sub('', page.get('title') or ''),
+            'description': page.get('description') or '',
+            'tags': [],
+            'questions': [{k: q.get(k) for k in ('question_text', 'choices', 'correct_index')}
+                          for q in page.get('questions') or ()],
+        }
+        match = _DC_DATA.search(html)
+        if match:
+            try:
+                data = json.loads(match.group(1))
+            except ValueError:
+                data = None
+            if isinstance(data, list):
+                quiz['questions'] = [{
+                    'question_text': q.get('question') or '',
+                    'choices': [r.get('response') or '' for r in q.get('proposed_responses') or ()],
+                    'correct_index': q.get('response_index'),
+                } for q in data if isinstance(q, dict)]
+                quiz['tags'] = sorted({q['theme_title'] for q in data if isinstance(q, dict) and q.get('theme_title')})
+        return quiz
+
+
+class IngestPipeline:
+    """Fetch, parse and store quizzes with bounded queues between the stages.
+
+    >>> pipeline = IngestPipeline(db, lambda: QuizypediaScraper(rate_limiter=limiter), workers=4)
+    >>> pipeline.run(frontier.urls('quiz'))
+    Counter({'fetched': 1520, 'inserted': 1520, 'questions': 30400, 'batches': 31, ...})
+    """
+
+    def __init__(self, db, scraper_factory: Callable[[], Any], workers: int = 4, batch_size: int = 50,
+                 queue_size: int = 100, flush_interval: float = 2.0, skip_known: bool = True,
+                 frontier=None, log: Callable[[str], None] = print):
+        if workers < 1 or batch_size < 1 or queue_size < 1:
+            raise ValueError("workers, batch_size and queue_size must be >= 1")
+        self.db = db
+        self.scraper_factory = scraper_factory
+        self.workers = workers
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.flush_interval = flush_interval
+        self.skip_known = skip_known
+        self.frontier = frontier
+        self.log = log
+        self.counts: Counter = Counter()
+        self.error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def stop(self):
+        """Stop discovering and fetching; what was already parsed is still written."""
+        self._stop.set()
+
+    def _count(self, key: str, n: int = 1):
+        with self._lock:
+            self.counts[key] += n
+
+    def _fail(self, error: BaseException):
+        if self.error is None:
+            self.error = error
+        self.stop()
+
+    def _put(self, q: queue.Queue, item) -> bool:
+        """Blocking put that gives up once the pipeline is stopping."""
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _discover(self, urls: Iterable[str], known: set, url_q: queue.Queue):
+        seen = set()
+        try:
+            for url in urls:
+                key = normalize_url(url)
+                if key in seen or key in known:
+                    self._count('skipped')
+                    continue
+                seen.add(key)
+                self._count('discovered')
+                if not self._put(url_q, key):
+                    return
+        except CircuitOpenError as e:
+            self._fail(e)
+        except requests.RequestException as e:
+            metrics.inc('fan2quizz_failures_total', stage='discover')
+            self.log(f"❌ Discovery stopped: {e}")
+            self._fail(e)
+
+    def _worker(self, url_q: queue.Queue, page_q: queue.Queue, discovery: threading.Thread):
+        scraper = self.scraper_factory()
+        while not self._stop.is_set():
+            try:
+                url = url_q.get(timeout=0.1)
+            except queue.Empty:
+                if not discovery.is_alive() and url_q.empty():
+                    return
+                continue
+            try:
+                html = scraper.fetch_quiz(url)
+            except CircuitOpenError as e:
+                self._fail(e)
+                return
+            except requests.RequestException as e:
+                metrics.inc('fan2quizz_failures_total', stage='ingest')
+                self._count('failed')
+                status = getattr(e.response, 'status_code', None)
+                self.log(f"❌ {url}: {status or e}")
+                if self.frontier is not None:
+                    self.frontier.fail(url, str(status or e))
+                continue
+            except Exception as e:
+                self._fail(e)
+                return
+            self._count('fetched')
+            try:
+                quiz = parse_quiz_page(self._site_url(scraper, url), html, scraper.parse_daily_live)
+            except Exception as e:
+                self._fail(e)
+                return
+            # Not _put: the writer drains the queue until every worker is done, so a page
+            # fetched before stop() is still stored
+            page_q.put(quiz)
+
+    @staticmethod
+    def _site_url(scraper, path: str) -> str:
+        """Quizzes are stored under their full URL, as :meth:`QuizDB.insert_quiz` callers do."""
+        return path if path.startswith('http') else f"{scraper.BASE}{path}"
+
+    def _flush(self, batch: List[Dict[str, Any]]):
+        inserted, updated = self.db.upsert_quizzes(batch)
+        if self.frontier is not None:
+            for quiz in batch:
+                self.frontier.complete(normalize_url(quiz['url']))
+        self._count('inserted', inserted)
+        self._count('updated', updated)
+        self._count('questions', sum(len(q['questions']) for q in batch))
+        self._count('batches')
+        batch.clear()
+
+    def run(self, urls: Iterable[str]) -> Counter:
+        """Ingest every quiz of ``urls`` (paths or full URLs); returns the counts of this run."""
+        known = set()
+        if self.skip_known:
+            known = {normalize_url(url) for url in self.db.quiz_urls()}
+        url_q: queue.Queue = queue.Queue(self.queue_size)
+        page_q: queue.Queue = queue.Queue(self.queue_size)
+        discovery = threading.Thread(target=self._discover, args=(urls, known, url_q),
+                                     name="ingest-discover", daemon=True)
+        workers = [threading.Thread(target=self._worker, args=(url_q, page_q, discovery),
+                                    name=f"ingest-{i}", daemon=True) for i in range(self.workers)]
+        discovery.start()
+        for thread in workers:
+            thread.start()
+
+        batch: List[Dict[str, Any]] = []
+        last_flush = time.monotonic()
+        try:
+            while True:
+                try:
+                    batch.append(page_q.get(timeout=0.2))
+                except queue.Empty:
+                    if not any(t.is_alive() for t in workers) and page_q.empty():
+                        break
+                    if batch and time.monotonic() - last_flush >= self.flush_interval:
+                        self._flush(batch)
+                        last_flush = time.monotonic()
+                    continue
+                if len(batch) >= self.batch_size:
+                    self._flush(batch)
+                    last_flush = time.monotonic()
+        except KeyboardInterrupt:
+            self.stop()
+            raise
+        finally:
+            if batch:
+                self._flush(batch)
+        if self.error is not None:
+            raise self.error
+        return self.counts
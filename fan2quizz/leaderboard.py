@@ -0,0 +1,252 @@
+"""Daily leaderboard payload parsing, diffing and live polling.
+
+Archive pages embed the whole leaderboard as a JSON array starting with
+``[{"good_responses"``. :func:`bracket_scan_payload` cuts it out of the HTML
+and :func:`parse_results` decodes it.
+
+During the quiz window :class:`LeaderboardPoller` re-fetches the page at an
+adaptive interval and reports only what changed since the previous poll:
+
+- the request is conditional (``If-None-Match`` / ``If-Modified-Since``), so an
+  unchanged page may cost a ``304`` and no body at all;
+- the payload is hashed before decoding, and an identical payload is not
+  parsed again;
+- rows are diffed by user on score and time. Rank shifts caused by someone
+  else finishing are not reported as changes.
+
+The interval drops back to ``min_interval`` whenever something changes and
+is multiplied by ``backoff`` (up to ``max_interval``) after each quiet poll.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import time
+from datetime import UTC, datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .timing import timed
+
+PAYLOAD_MARKER = '[{"good_responses"'
+_BRACKETS = re.compile(r'[\[\]]')
+_LINE_COMMENT = re.compile(r"//.*?\n")
+
+# Fields whose change makes a row worth reporting
+TRACKED_FIELDS = ('good_responses', 'elapsed_time')
+
+
+@timed('extract')
+def bracket_scan_payload(html: str) -> Optional[str]:
+    """The embedded ``[{"good_responses"...}]`` array, or None if the page has none."""
+    start = html.find(PAYLOAD_MARKER)
+    if start == -1:
+        return None
+    depth = 0
+    for match in _BRACKETS.finditer(html, start):
+        if match.group() == '[':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return html[start:match.end()]
+    return None
+
+
+@timed('decode')
+def parse_results(raw_payload: str) -> List[Dict[str, Any]]:
+    cleaned = raw_payload.strip()
+    if cleaned.endswith(';'):
+        cleaned = cleaned[:-1]
+    try:
+        return json.loads(cleaned)
+    except json.JSONDecodeError:
+        return json.loads(_LINE_COMMENT.sub("\n", cleaned))
+
+
+def row_user(row: Dict[str, Any]) -> str:
+    return row.get('user') or row.get('player') or ''
+
+
+def index_by_user(rows: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Rows keyed by lowercased user name (the last row wins on duplicates)."""
+    return {row_user(row).lower(): row for row in rows}
+
+
+class LeaderboardDiff:
+    """Rows that appeared, changed score/time, or disappeared between two snapshots."""
+
+    __slots__ = ('added', 'changed', 'removed')
+
+    def __init__(self, added: List[Dict[str, Any]], changed: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+                 removed: List[Dict[str, Any]]):
+        self.added = added
+        self.changed = changed  # (previous row, new row)
+        self.removed = removed
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    def __repr__(self) -> str:
+        return f"LeaderboardDiff(+{len(self.added)} ~{len(self.changed)} -{len(self.removed)})"
+
+
+def diff_leaderboards(previous: Dict[str, Dict[str, Any]], rows: List[Dict[str, Any]]) -> LeaderboardDiff:
+    """Compare ``rows`` with a previous :func:`index_by_user` snapshot."""
+    added, changed = [], []
+    seen = set()
+    for row in rows:
+        key = row_user(row).lower()
+        seen.add(key)
+        old = previous.get(key)
+        if old is None:
+            added.append(row)
+        elif any(old.get(f) != row.get(f) for f in TRACKED_FIELDS):
+            changed.append((old, row))
+    removed = [row for key, row in previous.items() if key not in seen]
+    return LeaderboardDiff(added, changed, removed)
+
+
+class PollResult:
+    """Outcome of one :meth:`LeaderboardPoller.poll_once`.
+
+    ``status`` is ``'changed'``, ``'unchanged'`` (same payload),
+    ``'not_modified'`` (HTTP 304), ``'empty'`` (no payload on the page) or
+    ``'error'``.
+    """
+
+    __slots__ = ('status', 'diff', 'rows', 'fetched_at', 'interval', 'error')
+
+    def __init__(self, status: str, diff: Optional[LeaderboardDiff] = None,
+                 rows: Optional[List[Dict[str, Any]]] = None, interval: float = 0.0,
+                 error: Optional[str] = None):
+        self.status = status
+        self.diff = diff
+        self.rows = rows
+        self.fetched_at = datetime.now(UTC).isoformat()
+        self.interval = interval
+        self.error = error
+
+    @property
+    def changed(self) -> bool:
+        return self.status == 'changed'
+
+    def __repr__(self) -> str:
+        detail = f" {self.diff!r}" if self.diff is not None else ''
+        return f"PollResult({self.status}{detail}, next in {self.interval:.0f}s)"
+
+
+class LeaderboardPoller:
+    """Poll one date's archive page and diff each new leaderboard against the last.
+
+    >>> poller = LeaderboardPoller(scraper, '2025-10-14', snapshots=SnapshotLog(path))
+    >>> for result in poller.watch():
+    ...     if result.changed:
+    ...         show(result.diff)
+
+    ``snapshots`` (a :class:`fan2quizz.snapshots.SnapshotLog`) receives every
+    changed leaderboard, and a poller built on an existing log resumes from
+    its last state.
+    """
+
+    def __init__(self, scraper, date_str: str, min_interval: float = 30.0, max_interval: float = 600.0,
+                 backoff: float = 2.0, snapshots=None,
+                 sleep: Callable[[float], None] = time.sleep):
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Need 0 < min_interval <= max_interval")
+        if backoff < 1:
+            raise ValueError("backoff must be >= 1")
+        self.scraper = scraper
+        self.date_str = date_str
+        y, m, d = map(int, date_str.split('-'))
+        self.path = f"/defi-du-jour/archives/{y:04d}/{m:02d}/{d:02d}/"
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = min_interval
+        self.snapshots = snapshots
+        self.sleep = sleep
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.payload_digest: Optional[str] = None
+        self.rows: List[Dict[str, Any]] = []
+        self.by_user: Dict[str, Dict[str, Any]] = {}
+        self.polls = 0
+        self.parses = 0
+        if snapshots is not None:
+            rows = snapshots.latest()
+            if rows is not None:
+                self._adopt(rows)
+
+    def _adopt(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+        self.by_user = index_by_user(rows)
+
+    def _conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def _quiet(self, status: str, error: Optional[str] = None) -> PollResult:
+        self.interval = min(self.max_interval, self.interval * self.backoff)
+        return PollResult(status, interval=self.interval, error=error)
+
+    def poll_once(self) -> PollResult:
+        """Fetch the page once and diff it against the previous leaderboard."""
+        self.polls += 1
+        try:
+            resp = self.scraper.fetch(self.path, headers=self._conditional_headers())
+        except Exception as e:
+            return self._quiet('error', str(e))
+        if resp.status_code == 304:
+            return self._quiet('not_modified')
+        self.etag = resp.headers.get('ETag') or self.etag
+        self.last_modified = resp.headers.get('Last-Modified') or self.last_modified
+
+        raw = bracket_scan_payload(resp.text)
+        if raw is None:
+            return self._quiet('empty')
+        digest = hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+        if digest == self.payload_digest:
+            return self._quiet('unchanged')
+        try:
+            rows = parse_results(raw)
+        except ValueError as e:
+            return self._quiet('error', f"JSON: {e}")
+        self.parses += 1
+        self.payload_digest = digest
+
+        diff = diff_leaderboards(self.by_user, rows)
+        if not diff:
+            # Same scores and times, only ranks or extra fields moved
+            self._adopt(rows)
+            return self._quiet('unchanged')
+        self._adopt(rows)
+        if self.snapshots is not None:
+            self.snapshots.append(rows)
+        self.interval = self.min_interval
+        return PollResult('changed', diff, rows, interval=self.interval)
+
+    def watch(self, max_polls: Optional[int] = None, until: Optional[float] = None) -> Iterator[PollResult]:
+        """Poll until ``max_polls`` polls were made or the ``until`` timestamp (``time.time()``) passes.
+
+        Yields every result, sleeping ``result.interval`` between polls.
+        """
+        done = 0
+        while True:
+            result = self.poll_once()
+            done += 1
+            yield result
+            if max_polls is not None and done >= max_polls:
+                return
+            delay = result.interval
+            if until is not None:
+                remaining = until - time.time()
+                if remaining <= 0:
+                    return
+                delay = min(delay, remaining)
+            self.sleep(delay)
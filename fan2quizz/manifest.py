@@ -0,0 +1,242 @@
+"""Index of the archive cache, kept next to the archives.
+
+``data/cache/archive/_manifest.json`` records, per date, what the archive
+file holds without having to open it::
+
+    {"version": 1, "entries": {"2025-10-14": {
+        "file": "2025-10-14.json.gz", "count": 412, "bytes": 6120,
+        "mtime_ns": 1760450000123456789, "fetched_at": "2025-10-15T06:02:11+00:00",
+        "sha256": "..."}}}
+
+``sha256`` is the hash of the compact JSON content, so it does not change
+when a file is only re-encoded (see :mod:`fan2quizz.storage`).
+
+Every archive write goes through :func:`save_archive`, which updates the
+entry under a lock and replaces the manifest atomically. The manifest's
+mtime is set to the directory's after each save: if the directory changed
+since (a file copied in or deleted by hand), :meth:`ArchiveManifest.open`
+re-syncs by stat and only decodes the files that differ.
+:meth:`ArchiveManifest.verify` rebuilds it from scratch.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from datetime import date as Date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from . import metrics, storage
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers are not serialized
+    fcntl = None
+
+MANIFEST_NAME = "_manifest.json"
+LOCK_NAME = "_manifest.lock"
+VERSION = 1
+
+Entry = Dict[str, Any]
+
+
+def content_hash(obj: Any) -> str:
+    return hashlib.sha256(storage.dump_json(obj)).hexdigest()
+
+
+def describe(path: Path, data: Any) -> Entry:
+    """Manifest entry for the archive ``data`` stored at ``path``."""
+    st = Path(path).stat()
+    results = data.get('results') if isinstance(data, dict) else None
+    return {
+        'file': Path(path).name,
+        'count': len(results) if isinstance(results, list) else 0,
+        'bytes': st.st_size,
+        'mtime_ns': st.st_mtime_ns,
+        'fetched_at': data.get('fetched_at') if isinstance(data, dict) else None,
+        'sha256': content_hash(data),
+    }
+
+
+def is_stale(day: str, entry: Entry) -> bool:
+    """True if the archive was fetched on or before its own quiz day (players may have been missing)."""
+    fetched_at = entry.get('fetched_at')
+    return not fetched_at or fetched_at[:10] <= day
+
+
+class ArchiveManifest:
+    """Per-date index of an archive directory.
+
+    >>> manifest = ArchiveManifest.open(archive_dir)
+    >>> manifest.dates()                 # sorted 'YYYY-MM-DD' strings
+    >>> manifest.missing(start, end)     # dates without an archive
+    >>> manifest.stale()                 # dates fetched before the day was over
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.path = self.directory / MANIFEST_NAME
+        self.entries: Dict[str, Entry] = {}
+
+    def __repr__(self) -> str:
+        return f"ArchiveManifest({str(self.directory)!r}, {len(self.entries)} dates)"
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, day: str) -> bool:
+        return day in self.entries
+
+    def get(self, day: str) -> Optional[Entry]:
+        return self.entries.get(day)
+
+    @classmethod
+    def open(cls, directory: Path) -> "ArchiveManifest":
+        """Load the manifest, re-syncing it first if the directory changed behind its back."""
+        manifest = cls(directory)
+        if not manifest._read() or manifest._directory_changed():
+            with manifest._locked():
+                manifest._read()
+                manifest.sync()
+        return manifest
+
+    # --- queries ---------------------------------------------------------
+    def dates(self) -> List[str]:
+        return sorted(self.entries)
+
+    def missing(self, start: Date, end: Date) -> List[str]:
+        """Dates from ``start`` to ``end`` (inclusive) that have no archive."""
+        days = []
+        current = start
+        while current <= end:
+            day = current.isoformat()
+            if day not in self.entries:
+                days.append(day)
+            current += timedelta(days=1)
+        return days
+
+    def stale(self) -> List[str]:
+        return [day for day in self.dates() if is_stale(day, self.entries[day])]
+
+    def total_bytes(self) -> int:
+        return sum(entry['bytes'] for entry in self.entries.values())
+
+    # --- maintenance -----------------------------------------------------
+    def sync(self) -> Tuple[int, int]:
+        """Match the entries to the files by name/size/mtime, decoding only the ones that differ.
+
+        Returns ``(updated, removed)`` entry counts.
+        """
+        files = storage.scan(self.directory, ".json")
+        updated = removed = 0
+        for day in [d for d in self.entries if d not in files]:
+            del self.entries[day]
+            removed += 1
+        for day, path in files.items():
+            entry = self.entries.get(day)
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            if (entry is not None and entry.get('file') == path.name and entry.get('bytes') == st.st_size
+                    and entry.get('mtime_ns') == st.st_mtime_ns):
+                continue
+            try:
+                self.entries[day] = describe(path, storage.read_json(path))
+                updated += 1
+            except (OSError, ValueError):
+                continue  # unreadable file: left out of the index, reported by verify()
+        self._write()
+        return updated, removed
+
+    def verify(self) -> Dict[str, List[str]]:
+        """Rebuild the manifest by decoding every archive and report what did not match.
+
+        Keys of the report: ``added`` (files missing from the manifest),
+        ``removed`` (entries without a file), ``changed`` (different size,
+        count or content hash) and ``unreadable`` (files that failed to decode).
+        """
+        report: Dict[str, List[str]] = {'added': [], 'removed': [], 'changed': [], 'unreadable': []}
+        with self._locked():
+            self._read()
+            old = self.entries
+            files = storage.scan(self.directory, ".json")
+            entries: Dict[str, Entry] = {}
+            for day, path in files.items():
+                try:
+                    entries[day] = describe(path, storage.read_json(path))
+                except (OSError, ValueError):
+                    report['unreadable'].append(day)
+                    continue
+                previous = old.get(day)
+                if previous is None:
+                    report['added'].append(day)
+                elif any(previous.get(k) != entries[day][k] for k in ('file', 'bytes', 'count', 'sha256')):
+                    report['changed'].append(day)
+            report['removed'] = sorted(day for day in old if day not in files)
+            self.entries = entries
+            self._write()
+        return report
+
+    def record(self, day: str, path: Path, data: Any):
+        """Index the archive just written to ``path`` and save the manifest."""
+        with self._locked():
+            if not self._read():
+                self.sync()  # no usable manifest yet: index the other archives too
+            self.entries[day] = describe(path, data)
+            self._write()
+
+    # --- file handling ---------------------------------------------------
+    def _read(self) -> bool:
+        try:
+            doc = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            self.entries = {}
+            return False
+        if not isinstance(doc, dict) or doc.get('version') != VERSION:
+            self.entries = {}
+            return False
+        self.entries = dict(doc.get('entries') or {})
+        return True
+
+    def _write(self):
+        doc = {'version': VERSION, 'entries': dict(sorted(self.entries.items()))}
+        self.directory.mkdir(parents=True, exist_ok=True)
+        storage.atomic_write(self.path, json.dumps(doc, ensure_ascii=False, indent=1).encode('utf-8'))
+        # Stamp the manifest with the directory mtime: any later change in the directory is newer
+        dir_mtime = self.directory.stat().st_mtime_ns
+        os.utime(self.path, ns=(dir_mtime, dir_mtime))
+
+    def _directory_changed(self) -> bool:
+        try:
+            return self.directory.stat().st_mtime_ns > self.path.stat().st_mtime_ns
+        except OSError:
+            return True
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / LOCK_NAME, 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def save_archive(base: Path, data: Dict[str, Any], codec: Optional[str] = None) -> Path:
+    """Write an archive (see :func:`fan2quizz.storage.write_json`) and index it; returns the file written."""
+    base = Path(base)
+    # Catch up with changes made behind the manifest's back before our own write hides them
+    manifest = ArchiveManifest.open(base.parent)
+    day = base.name[:-len('.json')]
+    path = storage.write_json(base, data, codec)
+    manifest.record(day, path, data)
+    metrics.inc('fan2quizz_rows_written_total', manifest.entries[day]['count'], target='archive')
+    return path
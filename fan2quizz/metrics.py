@@ -0,0 +1,268 @@
+"""Run metrics exported in the Prometheus text format, for node_exporter's textfile collector.
+
+Scheduled runs (cron) call :func:`enable` at start-up and :func:`write_textfile`
+before exiting; the file ``<dir>/fan2quizz_<job>.prom`` then reads::
+
+    # HELP fan2quizz_http_requests_total HTTP requests sent to the quiz site, by status code
+    # TYPE fan2quizz_http_requests_total counter
+    fan2quizz_http_requests_total{job="daily_report",status="200"} 42
+    ...
+    fan2quizz_stage_duration_seconds_bucket{job="daily_report",stage="fetch",le="0.5"} 40
+    fan2quizz_last_run_success{job="daily_report"} 1
+
+Counters and histograms are cumulative across runs: the values found in the
+previous file are added to this run's, so ``rate()``/``increase()`` work on
+the dashboards. Gauges (``fan2quizz_last_run_*``) describe the last run only.
+The file is replaced atomically, so the collector never reads it half written.
+
+Stage durations come from :mod:`fan2quizz.timing` spans (``fetch`` is the
+request latency, ``rate_limit`` the limiter wait, ``extract``/``decode`` the
+parse time...), so enabling metrics also enables timing. While metrics are
+disabled :func:`inc` and :func:`observe` return immediately; long-lived
+processes call :func:`disable` after writing each run.
+
+The destination comes from ``--metrics-dir`` or ``FAN2QUIZZ_METRICS_DIR``
+(typically node_exporter's ``--collector.textfile.directory``).
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from . import storage, timing
+
+METRICS_DIR_ENV = "FAN2QUIZZ_METRICS_DIR"
+PREFIX = "fan2quizz"
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# name -> (type, help); cumulative families first, then the per-run gauges
+FAMILIES: Dict[str, Tuple[str, str]] = {
+    'fan2quizz_http_requests_total': ('counter', "HTTP requests sent to the quiz site, by status code"),
+    'fan2quizz_http_retries_total': ('counter', "Requests retried, by reason (status code or error)"),
+    'fan2quizz_http_response_bytes_total': ('counter', "Response bytes downloaded from the quiz site"),
+    'fan2quizz_cache_requests_total': ('counter', "Cache lookups, by cache (archive, quiz_html) and result (hit, miss)"),
+    'fan2quizz_rows_written_total': ('counter', "Rows written, by target (archive, db, quizzes, questions)"),
+    'fan2quizz_failures_total': ('counter', "Failures, by stage"),
+    'fan2quizz_stage_duration_seconds': ('histogram', "Time spent per stage (fetch, rate_limit, extract, decode, "
+                                                      "parse, cache.read, cache.write, db.write, db.query, render)"),
+    'fan2quizz_last_run_timestamp_seconds': ('gauge', "End of the last run (Unix time)"),
+    'fan2quizz_last_run_duration_seconds': ('gauge', "Duration of the last run"),
+    'fan2quizz_last_run_success': ('gauge', "1 if the last run succeeded, 0 otherwise"),
+    'fan2quizz_last_success_timestamp_seconds': ('gauge', "End of the last successful run (Unix time)"),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+_enabled = False
+_lock = threading.Lock()
+_started = 0.0
+_counters: Dict[Tuple[str, Labels], float] = {}
+# (name, labels) -> [bucket counts..., sum, count]
+_histograms: Dict[Tuple[str, Labels], List[float]] = {}
+
+_SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})?\s+(\S+)\s*$')
+_LABEL = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+
+
+def _labels(labels: Dict[str, object]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _on_span(name: str, seconds: float):
+    observe('fan2quizz_stage_duration_seconds', seconds, stage=name)
+
+
+def enable():
+    """Start collecting (and timing, see :mod:`fan2quizz.timing`) for this run.
+
+    Counters and histograms start from zero: in a long-lived process (the
+    daily_report daemon) each run only exports its own samples.
+    """
+    global _enabled, _started
+    reset()
+    _enabled = True
+    _started = time.time()
+    timing.add_listener(_on_span)
+    timing.enable()
+
+
+def disable():
+    """Stop collecting and stop listening to timing spans (timing itself is left as is)."""
+    global _enabled
+    _enabled = False
+    timing.remove_listener(_on_span)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+
+def inc(name: str, value: float = 1, **labels: object):
+    """Add ``value`` to counter ``name`` (one of :data:`FAMILIES`)."""
+    if not _enabled:
+        return
+    key = (name, _labels(labels))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def total(name: str) -> float:
+    """Sum of counter ``name`` over all its labels in this run (e.g. failures, to decide success)."""
+    with _lock:
+        return sum(value for (n, _), value in _counters.items() if n == name)
+
+
+def observe(name: str, value: float, **labels: object):
+    """Record one observation in histogram ``name``."""
+    if not _enabled:
+        return
+    key = (name, _labels(labels))
+    with _lock:
+        series = _histograms.get(key)
+        if series is None:
+            series = _histograms[key] = [0.0] * (len(DURATION_BUCKETS) + 2)
+        for i, bound in enumerate(DURATION_BUCKETS):
+            if value <= bound:
+                series[i] += 1
+        series[-2] += value
+        series[-1] += 1
+
+
+def metrics_dir(override: Optional[str] = None) -> Optional[Path]:
+    """The textfile directory from ``override`` (a --metrics-dir value) or the environment, if any."""
+    value = override or os.environ.get(METRICS_DIR_ENV)
+    return Path(value) if value else None
+
+
+def textfile_path(directory: Path, job: str) -> Path:
+    return Path(directory) / f"{PREFIX}_{job}.prom"
+
+
+# --- text format -----------------------------------------------------------
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _unescape(value: str) -> str:
+    return re.sub(r'\\(.)', lambda m: '\n' if m.group(1) == 'n' else m.group(1), value)
+
+
+def _fmt_value(value: float) -> str:
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _fmt_bound(bound: float) -> str:
+    return '+Inf' if bound == float('inf') else repr(float(bound))
+
+
+def _family_of(sample: str) -> Optional[str]:
+    if sample in FAMILIES:
+        return sample
+    for suffix in ('_bucket', '_sum', '_count'):
+        if sample.endswith(suffix) and FAMILIES.get(sample[:-len(suffix)], ('',))[0] == 'histogram':
+            return sample[:-len(suffix)]
+    return None
+
+
+def parse_textfile(text: str) -> Dict[Tuple[str, Labels], float]:
+    """Samples of a file written by :func:`write_textfile` (comments and unknown lines skipped)."""
+    samples: Dict[Tuple[str, Labels], float] = {}
+    for line in text.splitlines():
+        if not line or line.startswith('#'):
+            continue
+        match = _SAMPLE.match(line)
+        if not match:
+            continue
+        try:
+            value = float(match.group(3))
+        except ValueError:
+            continue
+        labels = tuple(sorted((k, _unescape(v)) for k, v in _LABEL.findall(match.group(2) or '')))
+        samples[(match.group(1), labels)] = value
+    return samples
+
+
+def _current_samples() -> Dict[Tuple[str, Labels], float]:
+    samples: Dict[Tuple[str, Labels], float] = {}
+    with _lock:
+        for key, value in _counters.items():
+            samples[key] = value
+        for (name, labels), series in _histograms.items():
+            for bound, count in zip(DURATION_BUCKETS + (float('inf'),), series[:-2] + [series[-1]]):
+                samples[(f"{name}_bucket", tuple(sorted(labels + (('le', _fmt_bound(bound)),))))] = count
+            samples[(f"{name}_sum", labels)] = series[-2]
+            samples[(f"{name}_count", labels)] = series[-1]
+    return samples
+
+
+def _sort_key(item: Tuple[Tuple[str, Labels], float]):
+    (sample, labels), _ = item
+    family = _family_of(sample) or sample
+    suffix = sample[len(family):]
+    le = dict(labels).get('le')
+    return (list(FAMILIES).index(family) if family in FAMILIES else len(FAMILIES), family,
+            tuple(kv for kv in labels if kv[0] != 'le'), ('_bucket', '_sum', '_count', '').index(suffix),
+            float(le) if le else 0.0)
+
+
+def render(samples: Dict[Tuple[str, Labels], float]) -> str:
+    lines: List[str] = []
+    current_family = None
+    for (sample, labels), value in sorted(samples.items(), key=_sort_key):
+        family = _family_of(sample) or sample
+        if family != current_family:
+            current_family = family
+            if family in FAMILIES:
+                kind, help_text = FAMILIES[family]
+                lines.append(f"# HELP {family} {help_text}")
+                lines.append(f"# TYPE {family} {kind}")
+        # 'le' goes last, as Prometheus prints it
+        ordered = sorted(labels, key=lambda kv: (kv[0] == 'le', kv[0]))
+        label_txt = ','.join(f'{k}="{_escape(v)}"' for k, v in ordered)
+        lines.append(f"{sample}{{{label_txt}}} {_fmt_value(value)}" if label_txt else f"{sample} {_fmt_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(directory: Path, job: str, success: bool = True) -> Path:
+    """Merge this run into ``<directory>/fan2quizz_<job>.prom`` and replace it atomically."""
+    path = textfile_path(directory, job)
+    now = time.time()
+    job_label = (('job', job),)
+    try:
+        previous = parse_textfile(path.read_text(encoding='utf-8'))
+    except OSError:
+        previous = {}
+
+    samples: Dict[Tuple[str, Labels], float] = {}
+    for (sample, labels), value in previous.items():
+        family = _family_of(sample)
+        if family is not None and FAMILIES[family][0] != 'gauge':
+            samples[(sample, labels)] = value
+    for (sample, labels), value in _current_samples().items():
+        key = (sample, tuple(sorted(labels + job_label)))
+        samples[key] = samples.get(key, 0) + value
+
+    samples[('fan2quizz_last_run_timestamp_seconds', job_label)] = round(now, 3)
+    samples[('fan2quizz_last_run_duration_seconds', job_label)] = round(now - (_started or now), 6)
+    samples[('fan2quizz_last_run_success', job_label)] = 1 if success else 0
+    last_success = now if success else previous.get(('fan2quizz_last_success_timestamp_seconds', job_label))
+    if last_success is not None:
+        samples[('fan2quizz_last_success_timestamp_seconds', job_label)] = round(last_success, 3)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    storage.atomic_write(path, render(samples).encode('utf-8'))
+    return path
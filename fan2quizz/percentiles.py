@@ -0,0 +1,223 @@
+"""Per-day percentile engine for archived leaderboards.
+
+Every archived day is reduced to one sorted array of leaderboard keys
+(``score * 1e6 - elapsed_time``: higher score first, faster time breaks
+ties). "What percentile is (score, time) on date D?" is then a binary
+search over that day's array, so results can be compared across days with
+very different field sizes without re-reading the JSON archives.
+
+The arrays are persisted as a single packed int64 file next to a small JSON
+header under ``data/cache/derived/percentiles``. :meth:`PercentileIndex.refresh`
+only re-reads archives whose size or mtime changed since the last build.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from . import storage
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_ARCHIVE_DIR = ROOT / "data" / "cache" / "archive"
+DEFAULT_INDEX_DIR = ROOT / "data" / "cache" / "derived" / "percentiles"
+INDEX_VERSION = 2
+
+_TIME_SCALE = 1_000_000
+
+
+def leaderboard_key(score: int, elapsed_time: int) -> int:
+    """Sortable key for a result: higher is better."""
+    return int(score) * _TIME_SCALE - int(elapsed_time)
+
+
+def key_score(key: int) -> int:
+    """Recover the score from a :func:`leaderboard_key`."""
+    return -(-key // _TIME_SCALE)
+
+
+def _checksum(blob: bytes) -> str:
+    return hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+
+class DayDistribution:
+    """Sorted leaderboard keys for one day plus cheap summary statistics."""
+
+    __slots__ = ('date', 'keys', 'mean', 'std')
+
+    def __init__(self, date: str, keys: Sequence[int], mean: float, std: float):
+        self.date = date
+        self.keys = keys
+        self.mean = mean
+        self.std = std
+
+    @classmethod
+    def from_results(cls, date: str, results: List[Dict]) -> "DayDistribution":
+        keys = array('q', sorted(
+            leaderboard_key(r.get('good_responses') or 0, r.get('elapsed_time') or 0) for r in results
+        ))
+        scores = [key_score(k) for k in keys]
+        n = len(scores)
+        mean = sum(scores) / n if n else 0.0
+        std = math.sqrt(sum((s - mean) ** 2 for s in scores) / n) if n else 0.0
+        return cls(date, keys, mean, std)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def percentile(self, score: int, elapsed_time: int) -> Optional[float]:
+        """Percentile (0-100) of a result: share of the *other* players it beats, ties count half.
+
+        The result itself is left out of the field when it is there, so the
+        day's winner gets 100, the last 0, and a player alone on a day 100.
+        This is the convention of :meth:`fan2quizz.analytics.PlayerMatrix.percentile_rank`.
+        """
+        n = len(self.keys)
+        if not n:
+            return None
+        key = leaderboard_key(score, elapsed_time)
+        below = bisect_left(self.keys, key)
+        equal = bisect_right(self.keys, key, below) - below
+        if equal:
+            equal -= 1
+            n -= 1
+        if not n:
+            return 100.0
+        return 100.0 * (below + 0.5 * equal) / n
+
+    def rank(self, score: int, elapsed_time: int) -> int:
+        """1-based rank the result would have had on that day."""
+        return len(self.keys) - bisect_right(self.keys, leaderboard_key(score, elapsed_time)) + 1
+
+    def zscore(self, score: int) -> Optional[float]:
+        """Score in standard deviations from that day's mean (field-strength normalized)."""
+        if not self.keys or not self.std:
+            return None
+        return (score - self.mean) / self.std
+
+
+class PercentileIndex:
+    """All archived days' distributions, backed by ``keys.bin`` + ``index.json``."""
+
+    def __init__(self, index_dir: Path = DEFAULT_INDEX_DIR):
+        self.dir = Path(index_dir)
+        self._days: Dict[str, DayDistribution] = {}
+        self._sources: Dict[str, Tuple[int, int]] = {}
+
+    @classmethod
+    def open(cls, archive_dir: Path = DEFAULT_ARCHIVE_DIR,
+             index_dir: Path = DEFAULT_INDEX_DIR) -> "PercentileIndex":
+        """Load the persisted index, bring it up to date with ``archive_dir`` and save it."""
+        index = cls(index_dir)
+        index.load()
+        if index.refresh(archive_dir):
+            index.save()
+        return index
+
+    @property
+    def _header_path(self) -> Path:
+        return self.dir / "index.json"
+
+    @property
+    def _keys_path(self) -> Path:
+        return self.dir / "keys.bin"
+
+    def load(self) -> bool:
+        """Read the persisted index; returns False (and stays empty) if missing, stale or
+        if ``keys.bin`` is not the blob the header was written with (then rebuilt on refresh)."""
+        try:
+            header = json.loads(self._header_path.read_text(encoding='utf-8'))
+            blob = self._keys_path.read_bytes()
+        except (OSError, ValueError):
+            return False
+        if header.get('version') != INDEX_VERSION:
+            return False
+        # The two files are replaced one after the other: a header paired with another
+        # save's blob (crash or concurrent save in between) would point at the wrong keys
+        if header.get('bytes') != len(blob) or header.get('checksum') != _checksum(blob):
+            return False
+        keys = array('q')
+        keys.frombytes(blob)
+        view = memoryview(keys)
+        for date, meta in header.get('days', {}).items():
+            start, count = meta['offset'], meta['count']
+            self._days[date] = DayDistribution(date, view[start:start + count], meta['mean'], meta['std'])
+            self._sources[date] = (meta['mtime_ns'], meta['size'])
+        return True
+
+    def refresh(self, archive_dir: Path = DEFAULT_ARCHIVE_DIR) -> int:
+        """Re-read new or modified archives and drop deleted ones; returns the number of changes."""
+        changed = 0
+        seen = set()
+        for date, path in storage.scan(Path(archive_dir), ".json").items():
+            seen.add(date)
+            stat = path.stat()
+            source = (stat.st_mtime_ns, stat.st_size)
+            if self._sources.get(date) == source:
+                continue
+            try:
+                data = storage.read_json(path)
+            except (OSError, ValueError):
+                continue
+            self._days[date] = DayDistribution.from_results(date, data.get('results', []))
+            self._sources[date] = source
+            changed += 1
+        for date in set(self._days) - seen:
+            del self._days[date]
+            del self._sources[date]
+            changed += 1
+        return changed
+
+    def save(self):
+        """Write all distributions to disk (atomically replacing the previous files)."""
+        self.dir.mkdir(parents=True, exist_ok=True)
+        packed = array('q')
+        days = {}
+        for date in self.dates:
+            dist = self._days[date]
+            mtime_ns, size = self._sources[date]
+            days[date] = {
+                'offset': len(packed), 'count': len(dist), 'mean': dist.mean, 'std': dist.std,
+                'mtime_ns': mtime_ns, 'size': size,
+            }
+            packed.extend(dist.keys)
+        tmp_keys = self._keys_path.with_suffix('.bin.tmp')
+        tmp_header = self._header_path.with_suffix('.json.tmp')
+        blob = packed.tobytes()
+        tmp_keys.write_bytes(blob)
+        tmp_header.write_text(json.dumps({'version': INDEX_VERSION, 'bytes': len(blob), 'checksum': _checksum(blob),
+                                          'days': days}, separators=(',', ':')),
+                              encoding='utf-8')
+        os.replace(tmp_keys, self._keys_path)
+        os.replace(tmp_header, self._header_path)
+
+    @property
+    def dates(self) -> List[str]:
+        return sorted(self._days)
+
+    def __contains__(self, date: str) -> bool:
+        return date in self._days
+
+    def __iter__(self) -> Iterator[DayDistribution]:
+        return (self._days[d] for d in self.dates)
+
+    def day(self, date: str) -> Optional[DayDistribution]:
+        return self._days.get(date)
+
+    def field_size(self, date: str) -> int:
+        dist = self._days.get(date)
+        return len(dist) if dist is not None else 0
+
+    def percentile(self, date: str, score: int, elapsed_time: int) -> Optional[float]:
+        dist = self._days.get(date)
+        return dist.percentile(score, elapsed_time) if dist is not None else None
+
+    def zscore(self, date: str, score: int) -> Optional[float]:
+        dist = self._days.get(date)
+        return dist.zscore(score) if dist is not None else None
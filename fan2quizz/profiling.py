@@ -0,0 +1,264 @@
+"""Per-run profiling for any fan2quizz script: cProfile, a stack sampler and tracemalloc.
+
+Two ways to turn it on:
+
+- ``FAN2QUIZZ_PROFILE=<modes>`` in the environment, honored by every script
+  (profiling starts when the script imports :mod:`fan2quizz` and stops at exit);
+- ``fan2quizz --profile [MODES] <script> [args...]`` through the unified CLI
+  (see :mod:`fan2quizz.cli`).
+
+Modes (comma-separated):
+
+- ``cprofile`` (the default for ``1``): deterministic profile saved as
+  ``.pstats`` (open with ``python -m pstats`` or snakeviz);
+- ``sample``: a thread samples the main thread's stack every few milliseconds
+  and writes a ``.folded`` collapsed-stack file. Feed it to flamegraph.pl or
+  speedscope. It adds far less overhead than cProfile and suits long runs;
+- ``memory``: tracemalloc peak and top allocation sites.
+
+Files go to ``data/profiles/<script>-<YYYYmmdd-HHMMSS>.*`` (or
+``FAN2QUIZZ_PROFILE_DIR``). The top cumulative hotspots and the memory
+report are printed on stderr and also saved as ``.txt``.
+"""
+
+from __future__ import annotations
+
+import atexit
+import io
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+PROFILE_ENV = "FAN2QUIZZ_PROFILE"
+PROFILE_DIR_ENV = "FAN2QUIZZ_PROFILE_DIR"
+DEFAULT_DIR = Path(__file__).resolve().parents[1] / "data" / "profiles"
+MODES = ('cprofile', 'sample', 'memory')
+SAMPLE_INTERVAL = 0.005
+TOP = 25
+
+_active: Optional["Profiler"] = None
+
+
+def parse_modes(value: Optional[str]) -> Set[str]:
+    """Modes from a FAN2QUIZZ_PROFILE / --profile value ('1', 'cprofile', 'sample,memory'...)."""
+    if not value or value.strip().lower() in ('0', 'false', 'no', 'off'):
+        return set()
+    modes = set()
+    for part in value.lower().replace('+', ',').split(','):
+        part = part.strip()
+        if part in ('1', 'true', 'yes', 'on', ''):
+            modes.add('cprofile')
+        elif part in MODES:
+            modes.add(part)
+        else:
+            raise ValueError(f"unknown profiling mode {part!r} (expected {', '.join(MODES)})")
+    return modes
+
+
+def frame_label(frame) -> str:
+    """``module:qualname`` of a frame, safe for collapsed-stack files (no ';' or spaces)."""
+    code = frame.f_code
+    module = frame.f_globals.get('__name__') or Path(code.co_filename).stem
+    name = getattr(code, 'co_qualname', code.co_name)
+    return f"{module}:{name}".replace(';', ',').replace(' ', '_')
+
+
+class StackSampler:
+    """Samples one thread's call stack at a fixed interval from a background thread."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL, thread_id: Optional[int] = None):
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="fan2quizz-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        labels: Dict[object, str] = {}
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                label = labels.get(code)
+                if label is None:
+                    label = labels[code] = frame_label(frame)
+                stack.append(label)
+                frame = frame.f_back
+            self.stacks[';'.join(reversed(stack))] += 1
+            self.samples += 1
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def hotspots(self, top: int = TOP) -> List[tuple]:
+        """``(label, cumulative share, self share)``, sorted by cumulative share."""
+        cumulative: Counter = Counter()
+        own: Counter = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(';')
+            own[frames[-1]] += count
+            for label in set(frames):
+                cumulative[label] += count
+        total = self.samples or 1
+        return [(label, n / total, own[label] / total) for label, n in cumulative.most_common(top)]
+
+
+class Profiler:
+    """Profile a run with the given modes and save the results under ``directory``.
+
+    >>> with Profiler('weekly_mistakes_report', {'sample', 'memory'}):
+    ...     main()
+    """
+
+    def __init__(self, name: str, modes: Iterable[str] = ('cprofile',), directory: Optional[Path] = None,
+                 top: int = TOP, interval: float = SAMPLE_INTERVAL):
+        self.name = name
+        self.modes = set(modes)
+        self.directory = Path(directory or os.environ.get(PROFILE_DIR_ENV) or DEFAULT_DIR)
+        self.top = top
+        self.interval = interval
+        self.paths: List[Path] = []
+        self._profile = None
+        self._sampler: Optional[StackSampler] = None
+        self._started = 0.0
+        self._stopped = False
+
+    def __enter__(self) -> "Profiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        self.stop()
+        return False
+
+    def start(self):
+        self._started = time.perf_counter()
+        if 'memory' in self.modes:
+            import tracemalloc
+            tracemalloc.start()
+        if 'sample' in self.modes:
+            self._sampler = StackSampler(self.interval)
+            self._sampler.start()
+        if 'cprofile' in self.modes:
+            import cProfile
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    def stop(self) -> List[Path]:
+        """Stop profiling, write the files and print the report (once)."""
+        if self._stopped:
+            return self.paths
+        self._stopped = True
+        if self._profile is not None:
+            self._profile.disable()
+        if self._sampler is not None:
+            self._sampler.stop()
+        elapsed = time.perf_counter() - self._started
+
+        stem = self.directory / f"{self.name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        report = io.StringIO()
+        report.write(f"== Profile of {self.name} ({elapsed:.2f}s, {', '.join(sorted(self.modes))}) ==\n")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if self._profile is not None:
+                self._write_cprofile(stem, report)
+            if self._sampler is not None:
+                self._write_samples(stem, report)
+            if 'memory' in self.modes:
+                self._write_memory(report)
+            self.paths.append(self._save(stem.with_suffix('.txt'), report.getvalue()))
+        except OSError as e:
+            report.write(f"\n(could not save the profile: {e})\n")
+        for path in self.paths:
+            report.write(f"saved {path}\n")
+        print(report.getvalue(), file=sys.stderr, end='')
+        return self.paths
+
+    def _save(self, path: Path, text: str) -> Path:
+        path.write_text(text, encoding='utf-8')
+        return path
+
+    def _write_cprofile(self, stem: Path, report: io.StringIO):
+        import pstats
+        path = stem.with_suffix('.pstats')
+        self._profile.dump_stats(str(path))
+        self.paths.append(path)
+        report.write(f"\nTop {self.top} functions by cumulative time (cProfile):\n")
+        stats = pstats.Stats(self._profile, stream=report)
+        stats.strip_dirs().sort_stats('cumulative').print_stats(self.top)
+
+    def _write_samples(self, stem: Path, report: io.StringIO):
+        sampler = self._sampler
+        self.paths.append(self._save(stem.with_suffix('.folded'), sampler.folded()))
+        report.write(f"\nTop {self.top} frames by share of {sampler.samples} samples "
+                     f"(every {sampler.interval * 1000:g} ms):\n")
+        report.write(f"{'cumul':>7} {'self':>7}  frame\n")
+        for label, cumulative, own in sampler.hotspots(self.top):
+            report.write(f"{cumulative:>7.1%} {own:>7.1%}  {label}\n")
+
+    def _write_memory(self, report: io.StringIO):
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, __file__),
+        ])
+        tracemalloc.stop()
+        report.write(f"\nMemory (tracemalloc): peak {peak / 2**20:.1f} MiB, still allocated {current / 2**20:.1f} MiB\n")
+        report.write("Top allocation sites still alive at exit (imports excluded):\n")
+        for stat in snapshot.statistics('lineno')[:10]:
+            frame = stat.traceback[0]
+            report.write(f"{stat.size / 2**10:>10.1f} KiB {stat.count:>8} blocks  "
+                         f"{Path(frame.filename).name}:{frame.lineno}\n")
+
+
+def active() -> Optional[Profiler]:
+    return _active
+
+
+def start(name: str, modes: Iterable[str], **options) -> Profiler:
+    """Start profiling this process until exit (or :meth:`Profiler.stop`)."""
+    global _active
+    if _active is not None:
+        return _active
+    _active = Profiler(name, modes, **options)
+    _active.start()
+    atexit.register(_active.stop)
+    return _active
+
+
+def start_from_env() -> Optional[Profiler]:
+    """Honor FAN2QUIZZ_PROFILE in the main process (worker processes are left alone)."""
+    try:
+        modes = parse_modes(os.environ.get(PROFILE_ENV))
+    except ValueError as e:
+        print(f"{PROFILE_ENV}: {e}", file=sys.stderr)
+        return None
+    if not modes:
+        return None
+    import multiprocessing
+    if multiprocessing.parent_process() is not None:
+        return None
+    name = Path(sys.argv[0]).stem if sys.argv and sys.argv[0] else 'python'
+    return start(name or 'python', modes)
@@ -0,0 +1,253 @@
+"""Glicko-style skill ratings computed incrementally over the daily leaderboards.
+
+Each day's leaderboard is treated as one multiplayer game. A player's actual
+result is the share of the field they beat (ties count half), read straight
+off the sorted leaderboard. The expected result is measured against ``Q``
+quantile opponents of the field's rating distribution rather than every
+other player. One day therefore costs O(n log n + n·Q) instead of O(n²).
+
+The rating state is persisted to ``data/cache/derived/ratings.json`` together
+with the size/mtime of every archive already folded in, so a new day is one
+incremental step. If an already processed day is modified or an older day is
+backfilled, the state is rebuilt from scratch (ratings depend on day order).
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from datetime import date as _date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from . import storage
+from .percentiles import leaderboard_key
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_ARCHIVE_DIR = ROOT / "data" / "cache" / "archive"
+DEFAULT_RATINGS_PATH = ROOT / "data" / "cache" / "derived" / "ratings.json"
+STATE_VERSION = 1
+
+INITIAL_RATING = 1500.0
+INITIAL_RD = 350.0
+MIN_RD = 30.0
+# RD growth per idle day: an inactive player drifts back to INITIAL_RD in about a year
+RD_DRIFT = math.sqrt((INITIAL_RD ** 2 - 50.0 ** 2) / 365)
+QUANTILES = 32
+
+_Q = math.log(10) / 400
+
+
+def _g(rd: np.ndarray) -> np.ndarray:
+    return 1.0 / np.sqrt(1.0 + 3.0 * _Q ** 2 * rd ** 2 / math.pi ** 2)
+
+
+class PlayerRating:
+    """Current rating of one player."""
+
+    __slots__ = ('name', 'rating', 'rd', 'games', 'last_date', 'last_delta', 'peak')
+
+    def __init__(self, name: str, rating: float = INITIAL_RATING, rd: float = INITIAL_RD, games: int = 0,
+                 last_date: Optional[str] = None, last_delta: float = 0.0, peak: Optional[float] = None):
+        self.name = name
+        self.rating = rating
+        self.rd = rd
+        self.games = games
+        self.last_date = last_date
+        self.last_delta = last_delta
+        self.peak = rating if peak is None else peak
+
+    def to_list(self) -> List[Any]:
+        return [self.name, round(self.rating, 3), round(self.rd, 3), self.games,
+                self.last_date, round(self.last_delta, 3), round(self.peak, 3)]
+
+    @classmethod
+    def from_list(cls, values: List[Any]) -> "PlayerRating":
+        return cls(*values)
+
+    @property
+    def conservative(self) -> float:
+        """Rating minus two deviations: a cautious estimate used for leaderboards."""
+        return self.rating - 2 * self.rd
+
+
+def _params() -> Dict[str, Any]:
+    return {'initial_rating': INITIAL_RATING, 'initial_rd': INITIAL_RD, 'min_rd': MIN_RD,
+            'rd_drift': round(RD_DRIFT, 6), 'quantiles': QUANTILES}
+
+
+class RatingBook:
+    """All players' ratings plus the bookkeeping needed for incremental updates."""
+
+    def __init__(self, path: Path = DEFAULT_RATINGS_PATH):
+        self.path = Path(path)
+        self.players: Dict[str, PlayerRating] = {}
+        self.sources: Dict[str, Tuple[int, int]] = {}
+        # Unreadable archives, by the same (mtime_ns, size) source: retried only once the file changes
+        self.skipped: Dict[str, Tuple[int, int]] = {}
+        self.last_date: Optional[str] = None
+
+    @classmethod
+    def open(cls, archive_dir: Path = DEFAULT_ARCHIVE_DIR,
+             path: Path = DEFAULT_RATINGS_PATH, rebuild: bool = False) -> "RatingBook":
+        """Load persisted ratings, fold in new archives and save if anything changed."""
+        book = cls(path)
+        if not rebuild:
+            book.load()
+        if book.update(archive_dir):
+            book.save()
+        return book
+
+    def reset(self):
+        self.players.clear()
+        self.sources.clear()
+        self.skipped.clear()
+        self.last_date = None
+
+    def load(self) -> bool:
+        try:
+            state = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return False
+        if state.get('version') != STATE_VERSION or state.get('params') != _params():
+            return False
+        self.players = {}
+        for values in state.get('players', []):
+            player = PlayerRating.from_list(values)
+            self.players[player.name.lower()] = player
+        self.sources = {d: tuple(s) for d, s in state.get('sources', {}).items()}
+        self.skipped = {d: tuple(s) for d, s in state.get('skipped', {}).items()}
+        self.last_date = state.get('last_date')
+        return True
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            'version': STATE_VERSION,
+            'params': _params(),
+            'last_date': self.last_date,
+            'sources': self.sources,
+            'skipped': self.skipped,
+            'players': [p.to_list() for p in self.players.values()],
+        }
+        tmp = self.path.with_suffix('.json.tmp')
+        tmp.write_text(json.dumps(state, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+        os.replace(tmp, self.path)
+
+    def update(self, archive_dir: Path = DEFAULT_ARCHIVE_DIR) -> int:
+        """Process archives not yet folded in.
+
+        Returns the number of days newly handled (folded in, or recorded in
+        :attr:`skipped` when unreadable): non-zero means the state should be saved.
+        An unreadable day does not force a rebuild on later runs unless its file changes.
+        """
+        current = {}
+        for day, path in storage.scan(Path(archive_dir), ".json").items():
+            stat = path.stat()
+            current[day] = (path, (stat.st_mtime_ns, stat.st_size))
+
+        stale = any(current.get(d, (None, None))[1] != s for d, s in self.sources.items())
+        self.skipped = {d: s for d, s in self.skipped.items() if d in current}
+        pending = sorted(d for d in current
+                         if d not in self.sources and self.skipped.get(d) != current[d][1])
+        if stale or (pending and self.last_date and pending[0] < self.last_date):
+            self.reset()
+            pending = sorted(current)
+
+        processed = 0
+        for day in pending:
+            path, source = current[day]
+            try:
+                data = storage.read_json(path)
+            except (OSError, ValueError):
+                data = None
+            processed += 1
+            if not isinstance(data, dict):
+                self.skipped[day] = source
+                continue
+            self.skipped.pop(day, None)
+            self.process_day(day, data.get('results', []))
+            self.sources[day] = source
+        return processed
+
+    def process_day(self, day: str, results: Iterable[Dict[str, Any]]):
+        """Fold one day's leaderboard into the ratings."""
+        names: List[str] = []
+        keys: List[int] = []
+        seen = set()
+        for entry in results:
+            user = entry.get('user') or ''
+            if not user or user.lower() in seen:
+                continue
+            seen.add(user.lower())
+            names.append(user)
+            keys.append(leaderboard_key(entry.get('good_responses') or 0, entry.get('elapsed_time') or 0))
+        self.last_date = max(self.last_date or day, day)
+        n = len(names)
+        if n < 2:
+            return
+
+        today = _date.fromisoformat(day)
+        players = []
+        ratings = np.empty(n)
+        rds = np.empty(n)
+        for i, name in enumerate(names):
+            player = self.players.get(name.lower())
+            if player is None:
+                player = self.players[name.lower()] = PlayerRating(name)
+            rd = player.rd
+            if player.last_date:
+                idle = max(0, (today - _date.fromisoformat(player.last_date)).days)
+                rd = min(INITIAL_RD, math.sqrt(rd ** 2 + RD_DRIFT ** 2 * idle))
+            players.append(player)
+            ratings[i] = player.rating
+            rds[i] = rd
+
+        # Actual result: share of the other players beaten, read off the sorted keys
+        key_arr = np.asarray(keys, dtype=np.int64)
+        sorted_keys = np.sort(key_arr)
+        below = np.searchsorted(sorted_keys, key_arr, side='left')
+        equal = np.searchsorted(sorted_keys, key_arr, side='right') - below
+        actual = (below + 0.5 * (equal - 1)) / (n - 1)
+
+        # Expected result against Q quantile opponents of today's field
+        order = np.argsort(ratings, kind='stable')
+        q = min(n, QUANTILES)
+        picks = order[((np.arange(q) + 0.5) * n / q).astype(np.intp)]
+        opp_r = ratings[picks]
+        opp_g = _g(rds[picks])
+        expected = 1.0 / (1.0 + 10.0 ** (-opp_g[np.newaxis, :] * (ratings[:, np.newaxis] - opp_r[np.newaxis, :]) / 400))
+
+        # Glicko update, the whole day weighing as a single game
+        d2_inv = _Q ** 2 * (opp_g ** 2 * expected * (1 - expected)).mean(axis=1)
+        precision = 1.0 / rds ** 2 + d2_inv
+        delta = _Q / precision * (opp_g * (actual[:, np.newaxis] - expected)).mean(axis=1)
+        new_rds = np.maximum(np.sqrt(1.0 / precision), MIN_RD)
+
+        for i, player in enumerate(players):
+            player.name = names[i]
+            player.rating = float(ratings[i] + delta[i])
+            player.rd = float(new_rds[i])
+            player.games += 1
+            player.last_date = day
+            player.last_delta = float(delta[i])
+            player.peak = max(player.peak, player.rating)
+
+    def get(self, name: str) -> Optional[PlayerRating]:
+        return self.players.get(name.lower())
+
+    def leaderboard(self, min_games: int = 1) -> List[PlayerRating]:
+        """Players sorted by conservative rating (rating - 2·RD), best first."""
+        eligible = [p for p in self.players.values() if p.games >= min_games]
+        return sorted(eligible, key=lambda p: p.conservative, reverse=True)
+
+    def position(self, name: str, min_games: int = 1) -> Optional[int]:
+        """1-based position of a player in :meth:`leaderboard`."""
+        player = self.get(name)
+        if player is None or player.games < min_games:
+            return None
+        return 1 + sum(1 for p in self.players.values()
+                       if p.games >= min_games and p.conservative > player.conservative)
@@ -0,0 +1,299 @@
+"""Render independent matplotlib figures in a pool of worker processes.
+
+Figures are CPU-bound (Agg rasterization at high dpi) and share nothing, so
+they are farmed out to a :class:`~concurrent.futures.ProcessPoolExecutor`
+whose workers force the non-interactive ``Agg`` backend. The number of
+workers is capped by available memory as well as by CPU count, since a large
+figure at 300 dpi easily holds a few hundred MB of raster buffers.
+
+Plot functions may live in a package module or directly in a script under
+``scripts/``: script functions are shipped to the workers as
+``(file, name)`` and re-imported there, so this works whatever the start
+method or however the script was launched.
+
+Jobs can carry a ``fingerprint`` of everything that feeds the figure (data
+slice, players, style, dpi, plotting code). After a successful render it is
+stored in a ``<image>.json`` sidecar next to the image, and later runs skip
+any job whose image exists with a matching sidecar.
+
+:func:`lttb` downsamples long series for quick preview renders.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Rough peak RSS of one worker rendering a 16x9 inch figure at 300 dpi
+DEFAULT_WORKER_MB = 400
+
+_loaded_scripts: Dict[str, Any] = {}
+
+
+class RenderJob:
+    """One figure to render: ``func(**kwargs)`` is expected to write ``output``.
+
+    When ``fingerprint`` is set (see :func:`source_digest` and
+    :func:`fan2quizz.derived.fingerprint`), the render is skipped if ``output``
+    was already produced from the same inputs.
+    """
+
+    __slots__ = ('name', 'func', 'kwargs', 'output', 'fingerprint')
+
+    def __init__(self, name: str, func: Callable[..., Any], kwargs: Optional[Dict[str, Any]] = None,
+                 output: Optional[Path] = None, fingerprint: Optional[str] = None):
+        self.name = name
+        self.func = func
+        self.kwargs = kwargs or {}
+        self.output = Path(output) if output is not None else None
+        self.fingerprint = fingerprint
+
+
+class RenderResult:
+    """Outcome of a :class:`RenderJob`: output path, success flag and wall time in the worker."""
+
+    __slots__ = ('name', 'output', 'ok', 'seconds', 'error', 'pid', 'cached')
+
+    def __init__(self, name: str, output: Optional[Path], ok: bool, seconds: float,
+                 error: Optional[str] = None, pid: Optional[int] = None, cached: bool = False):
+        self.name = name
+        self.output = output
+        self.ok = ok
+        self.seconds = seconds
+        self.error = error
+        self.pid = pid
+        self.cached = cached
+
+    def __repr__(self) -> str:
+        status = 'ok' if self.ok else ('failed: ' + self.error if self.error else 'failed')
+        if self.cached:
+            status = 'cached'
+        return f"RenderResult({self.name!r}, {self.output}, {self.seconds:.2f}s, {status})"
+
+
+def manifest_path(output: Path) -> Path:
+    return Path(output).with_name(Path(output).name + '.json')
+
+
+def read_manifest(output: Path) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(manifest_path(output).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+
+def write_manifest(output: Path, fingerprint: str, seconds: float):
+    """Record the inputs fingerprint and render time of a freshly written image."""
+    path = manifest_path(output)
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_text(json.dumps({
+        'fingerprint': fingerprint,
+        'rendered_at': datetime.now().isoformat(timespec='seconds'),
+        'render_seconds': round(seconds, 3),
+    }, indent=2), encoding='utf-8')
+    os.replace(tmp, path)
+
+
+def is_fresh(output: Optional[Path], fingerprint: Optional[str]) -> bool:
+    """True if ``output`` exists and its sidecar records the same fingerprint."""
+    if output is None or fingerprint is None or not Path(output).is_file():
+        return False
+    manifest = read_manifest(output)
+    return manifest is not None and manifest.get('fingerprint') == fingerprint
+
+
+def source_digest(*funcs: Callable[..., Any]) -> str:
+    """Hash of the source files defining ``funcs``, so editing plot code invalidates cached figures."""
+    digest = hashlib.sha256()
+    for path in sorted({f.__code__.co_filename for f in funcs}):
+        try:
+            digest.update(Path(path).read_bytes())
+        except OSError:
+            digest.update(path.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def lttb(x: Sequence[float], y: Sequence[float], threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsampling: indices of ``threshold`` points to keep.
+
+    Keeps the first and last points and, in each bucket in between, the point
+    forming the largest triangle with the previous pick and the next bucket's
+    mean. Peaks and dips survive, unlike plain striding.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    xs = np.asarray(x, dtype=np.float64)
+    ys = np.asarray(y, dtype=np.float64)
+    every = (n - 2) / (threshold - 2)
+    bounds = np.minimum((np.arange(threshold) * every).astype(np.intp) + 1, n).tolist()
+    # Prefix sums give every bucket mean in O(1)
+    cx = np.concatenate(([0.0], np.cumsum(xs))).tolist()
+    cy = np.concatenate(([0.0], np.cumsum(ys))).tolist()
+    keep = np.empty(threshold, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = bounds[i], bounds[i + 1]
+        next_end = bounds[i + 2]
+        count = next_end - end
+        avg_x = (cx[next_end] - cx[end]) / count
+        avg_y = (cy[next_end] - cy[end]) / count
+        area = np.abs((xs[a] - avg_x) * (ys[start:end] - ys[a]) - (xs[a] - xs[start:end]) * (avg_y - ys[a]))
+        a = start + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def available_memory_mb() -> Optional[int]:
+    """MemAvailable from /proc/meminfo (Linux), falling back to sysconf; None if unknown."""
+    try:
+        with open('/proc/meminfo', 'r', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE') // (1024 * 1024)
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def worker_count(n_jobs: int, requested: Optional[int] = None, per_worker_mb: int = DEFAULT_WORKER_MB) -> int:
+    """Number of processes to use: min(requested or CPUs, jobs, memory / per-worker budget)."""
+    workers = requested or os.cpu_count() or 1
+    available = available_memory_mb()
+    if available is not None:
+        workers = min(workers, max(1, available // per_worker_mb))
+    return max(1, min(workers, n_jobs))
+
+
+def _func_ref(func: Callable[..., Any]) -> Tuple[str, str, str]:
+    module = sys.modules.get(func.__module__)
+    spec = getattr(module, '__spec__', None)
+    if spec is not None and spec.name not in ('__main__', '__mp_main__'):
+        return ('module', spec.name, func.__qualname__)
+    return ('file', func.__code__.co_filename, func.__name__)
+
+
+def _resolve(ref: Tuple[str, str, str]) -> Callable[..., Any]:
+    kind, where, name = ref
+    if kind == 'module':
+        target: Any = importlib.import_module(where)
+        for part in name.split('.'):
+            target = getattr(target, part)
+        return target
+    module = _loaded_scripts.get(where)
+    if module is None:
+        mod_name = f"_render_{Path(where).stem}"
+        spec = importlib.util.spec_from_file_location(mod_name, where)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[mod_name] = module
+        spec.loader.exec_module(module)
+        _loaded_scripts[where] = module
+    return getattr(module, name)
+
+
+def _init_worker():
+    os.environ['MPLBACKEND'] = 'Agg'
+    try:
+        import matplotlib
+        matplotlib.use('Agg', force=True)
+    except ImportError:
+        pass
+
+
+def _call(name: str, func: Callable[..., Any], kwargs: Dict[str, Any], output: Optional[Path]) -> RenderResult:
+    """Run one render; an exception is reported in the result instead of aborting the batch."""
+    start = time.perf_counter()
+    try:
+        ok = func(**kwargs)
+        ok = True if ok is None else bool(ok)
+        return RenderResult(name, output, ok, time.perf_counter() - start, pid=os.getpid())
+    except Exception as e:
+        detail = ''.join(traceback.format_exception_only(type(e), e)).strip()
+        return RenderResult(name, output, False, time.perf_counter() - start, error=detail, pid=os.getpid())
+
+
+def _run(name: str, ref: Tuple[str, str, str], kwargs: Dict[str, Any], output: Optional[Path]) -> RenderResult:
+    return _call(name, lambda **kw: _resolve(ref)(**kw), kwargs, output)
+
+
+def render_in_process(jobs: Iterable[RenderJob]) -> List[RenderResult]:
+    """Run jobs sequentially in the current process (interactive backends keep working)."""
+    return [_call(job.name, job.func, job.kwargs, job.output) for job in jobs]
+
+
+def render_all(jobs: Iterable[RenderJob], max_workers: Optional[int] = None,
+               per_worker_mb: int = DEFAULT_WORKER_MB, force: bool = False) -> List[RenderResult]:
+    """Render every job, in parallel when more than one worker is worthwhile.
+
+    Jobs whose output is up to date with their fingerprint are skipped unless
+    ``force`` is set. Results are returned in job order. ``max_workers=1``
+    renders in-process.
+    """
+    jobs = list(jobs)
+    results: Dict[int, RenderResult] = {}
+    todo = []
+    for i, job in enumerate(jobs):
+        if not force and is_fresh(job.output, job.fingerprint):
+            results[i] = RenderResult(job.name, job.output, True, 0.0, cached=True)
+        else:
+            todo.append(i)
+
+    workers = worker_count(len(todo), max_workers, per_worker_mb) if todo else 0
+    if workers == 1:
+        for i, result in zip(todo, render_in_process(jobs[i] for i in todo)):
+            results[i] = result
+    elif workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = {
+                pool.submit(_run, jobs[i].name, _func_ref(jobs[i].func), jobs[i].kwargs, jobs[i].output): i
+                for i in todo
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+    for i in todo:
+        job, result = jobs[i], results[i]
+        if result.ok and job.fingerprint and job.output is not None and job.output.is_file():
+            write_manifest(job.output, job.fingerprint, result.seconds)
+    return [results[i] for i in range(len(jobs))]
+
+
+class BackgroundRenderer:
+    """Render figures in a side process while the caller keeps working.
+
+    >>> with BackgroundRenderer() as bg:
+    ...     pending = bg.submit(RenderJob('radar', create_radar, {'date_str': d}))
+    ...     ...  # print the report
+    ...     result = pending.result()
+    """
+
+    def __init__(self, max_workers: int = 1):
+        self._pool = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker)
+
+    def submit(self, job: RenderJob) -> "Future[RenderResult]":
+        return self._pool.submit(_run, job.name, _func_ref(job.func), job.kwargs, job.output)
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> "BackgroundRenderer":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,129 @@
+"""Stream markdown reports to a file or stdout section by section.
+
+Report builders are generators that yield text chunks as they go;
+:class:`ReportWriter` writes each chunk as soon as it arrives, so the full
+document never has to exist in memory. Peak memory is one section, however
+long the history is.
+
+Files are written to a temporary sibling and moved into place when the
+writer closes cleanly, so an interrupted run never leaves a truncated report
+behind. A target of ``-`` streams to stdout instead; the
+stream is bound when the writer is created, so callers can then send their
+own progress messages elsewhere (see :func:`status_stream`).
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import sys
+from pathlib import Path
+from typing import Iterable, Optional, TextIO, Union
+
+STDOUT = '-'
+DEFAULT_BUFFER = 64 * 1024
+
+
+class ReportWriter:
+    """Incremental text sink that also counts what went through it.
+
+    >>> with ReportWriter(path) as out:
+    ...     out.write_all(header_chunks())
+    ...     out.write_all(body_chunks())
+    >>> out.line_count, out.char_count
+    """
+
+    def __init__(self, target: Union[str, Path] = STDOUT, encoding: str = 'utf-8',
+                 buffer_size: int = DEFAULT_BUFFER):
+        self.is_stdout = str(target) == STDOUT
+        self.path: Optional[Path] = None if self.is_stdout else Path(target)
+        self.encoding = encoding
+        self.buffer_size = buffer_size
+        self.char_count = 0
+        self.newline_count = 0
+        self._ends_with_newline = True
+        self._stdout = sys.stdout if self.is_stdout else None
+        self._tmp: Optional[Path] = None
+        self._fh: Optional[TextIO] = None
+
+    def __repr__(self) -> str:
+        return f"ReportWriter({STDOUT if self.is_stdout else str(self.path)!r})"
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines written, counted like ``str.splitlines``."""
+        return self.newline_count + (0 if self._ends_with_newline else 1)
+
+    def open(self) -> "ReportWriter":
+        if self._fh is not None:
+            return self
+        if self.is_stdout:
+            self._fh = self._stdout
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            self._fh = io.open(self._tmp, 'w', encoding=self.encoding, newline='', buffering=self.buffer_size)
+        return self
+
+    def write(self, chunk: str):
+        if not chunk:
+            return
+        if self._fh is None:
+            self.open()
+        self._fh.write(chunk)
+        self.char_count += len(chunk)
+        self.newline_count += chunk.count('\n')
+        self._ends_with_newline = chunk.endswith('\n')
+
+    def write_all(self, chunks: Iterable[str]) -> "ReportWriter":
+        """Write every chunk of a generator as it is produced."""
+        for chunk in chunks:
+            self.write(chunk)
+        return self
+
+    def write_lines(self, lines: Iterable[str], first: bool = True) -> "ReportWriter":
+        """Write lines separated by newlines, same output as ``"\\n".join(lines)``.
+
+        Pass ``first=False`` when continuing a document already written this way.
+        """
+        for line in lines:
+            if first:
+                first = False
+            else:
+                self.write('\n')
+            self.write(line)
+        return self
+
+    def close(self, discard: bool = False):
+        """Flush and, for files, atomically move the report into place (or drop it if ``discard``)."""
+        if self._fh is None:
+            return
+        if self.is_stdout:
+            self._fh.flush()
+            self._fh = None
+            return
+        self._fh.close()
+        self._fh = None
+        if discard:
+            self._tmp.unlink(missing_ok=True)
+        else:
+            os.replace(self._tmp, self.path)
+        self._tmp = None
+
+    def __enter__(self) -> "ReportWriter":
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(discard=exc_type is not None)
+
+
+def write_report(target: Union[str, Path], chunks: Iterable[str]) -> ReportWriter:
+    """Stream ``chunks`` to ``target`` (a path or ``-``) and return the closed writer for its counters."""
+    with ReportWriter(target) as writer:
+        writer.write_all(chunks)
+    return writer
+
+
+def status_stream(target: Union[str, Path, None]) -> TextIO:
+    """Where progress messages should go: stderr when the report itself is on stdout."""
+    return sys.stderr if target is not None and str(target) == STDOUT else sys.stdout
@@ -1,28 +1,269 @@
 # src/scraper.py
 import requests
-from bs4 import BeautifulSoup
-from typing import Iterator, Optional, List, Dict, Any
+from typing import Iterable, Iterator, Optional, List, Dict, Any, Tuple
 import os
+import re
 import json
-from .utils import RateLimiter, DEFAULT_USER_AGENT
+import time
+from abc import ABC, abstractmethod
+from .utils import RateLimiter, RetryPolicy, CircuitBreaker, DEFAULT_USER_AGENT
+from .timing import span
+from .leaderboard import bracket_scan_payload, parse_results, row_user
+from . import metrics
 
+try:
+	import lxml.html as _lxml_html
+	from lxml import etree as _etree
+except ImportError:  # BeautifulSoup with html.parser only
+	_lxml_html = None
+	_etree = None
 
 
+# --- HTML parsing ---
+# Pages are parsed with lxml.html and queried with precompiled XPath: several times faster
+# and lighter than a BeautifulSoup tree on archive pages with thousands of rows. BeautifulSoup
+# is the fallback when lxml is missing, or on demand with FAN2QUIZZ_HTML_PARSER=bs4.
+HTML_PARSER_ENV = "FAN2QUIZZ_HTML_PARSER"
+
+
+def _has_class(name: str) -> str:
+	return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# name -> (XPath from the context node, equivalent CSS selector for BeautifulSoup)
+QUERIES = {
+	'a': ('.//a', 'a'),
+	'h1': ('.//h1', 'h1'),
+	'h2': ('.//h2', 'h2'),
+	'title': ('.//title', 'title'),
+	'li': ('.//li', 'li'),
+	'ol li': ('.//ol//li', 'ol li'),
+	'table': ('.//table', 'table'),
+	'tr': ('.//tr', 'tr'),
+	'cell': ('.//*[self::td or self::th]', 'td, th'),
+	'form': ('.//form', 'form'),
+	'form#loginform': ('.//form[@id="loginform"]', 'form#loginform'),
+	'input': ('.//input', 'input'),
+	'intro': (f".//*[{_has_class('intro')} or {_has_class('description')} or {_has_class('quiz-intro')}]",
+			  '.intro, .description, .quiz-intro'),
+	'question': (f".//*[{_has_class('question')}]", '.question'),
+	'quiz-question': (f".//*[{_has_class('quiz-question')}]", '.quiz-question'),
+	'qtext': (f".//*[{_has_class('qtext')}]", '.qtext'),
+	'choice': (f".//*[{_has_class('answer')} or {_has_class('choice')} or self::li]", '.answer, .choice, li'),
+	'result': (f".//*[{_has_class('score')} or {_has_class('result')} or {_has_class('classement')} or self::li]",
+			   '.score, .result, .classement, li'),
+	'featured a': (f".//*[{_has_class('featured')}]//a", '.featured a'),
+	'hero a': (f".//*[{_has_class('hero')}]//a", '.hero a'),
+	'article a': ('.//article//a', 'article a'),
+	'h2 a': ('.//h2//a', 'h2 a'),
+}
+
+if _etree is not None:
+	_XPATHS = {name: _etree.XPath(xpath) for name, (xpath, _) in QUERIES.items()}
+	# Like BeautifulSoup's get_text(): script and style contents are not text
+	_TEXT = _etree.XPath('.//text()[not(parent::script or parent::style)]', smart_strings=False)
+
+
+
+class HtmlPage(ABC):
+	"""A parsed page; :data:`QUERIES` names select elements.
+
+	Test elements with ``is None``, never by truth value: an lxml element
+	without children is falsy.
+	"""
+
+	backend = ''
+	__slots__ = ('root',)
+
+	@abstractmethod
+	def select(self, query: str, node=None) -> list:
+		"""Elements matching :data:`QUERIES` ``query`` under ``node`` (default: the page), in document order."""
+
+	def first(self, *queries: str, node=None):
+		"""First element matching the first query that matches anything, or None."""
+		for query in queries:
+			found = self.select(query, node)
+			if found:
+				return found[0]
+		return None
+
+	@abstractmethod
+	def text(self, node=None, sep: str = ' ', strip: bool = True) -> str:
+		"""Text of ``node`` (default: the page), as BeautifulSoup's ``get_text(sep, strip=strip)``."""
+
+	@abstractmethod
+	def attr(self, node, name: str, default: Optional[str] = None) -> Optional[str]:
+		"""Attribute ``name`` of ``node`` as a string, or ``default``."""
+
+	@abstractmethod
+	def classes(self, node) -> str:
+		"""The class attribute, whitespace-normalized."""
+
+
+class LxmlPage(HtmlPage):
+	backend = 'lxml'
+	__slots__ = ()
+
+	def __init__(self, html: str):
+		if not html.strip():
+			html = '<html></html>'
+		try:
+			self.root = _lxml_html.document_fromstring(html)
+		except ValueError:  # a str declaring its encoding (<?xml encoding=...?>)
+			self.root = _lxml_html.document_fromstring(html.encode('utf-8'))
+
+	def select(self, query: str, node=None) -> list:
+		return _XPATHS[query](self.root if node is None else node)
+
+	def text(self, node=None, sep: str = ' ', strip: bool = True) -> str:
+		strings = _TEXT(self.root if node is None else node)
+		if strip:
+			return sep.join(s for s in (s.strip() for s in strings) if s)
+		return sep.join(strings)
+
+	def attr(self, node, name: str, default: Optional[str] = None) -> Optional[str]:
+		return node.get(name, default)
+
+	def classes(self, node) -> str:
+		return ' '.join((node.get('class') or '').split())
+
+
+class SoupPage(HtmlPage):
+	"""The BeautifulSoup fallback."""
+
+	backend = 'bs4'
+	__slots__ = ()
+
+	def __init__(self, html: str):
+		from bs4 import BeautifulSoup
+		self.root = BeautifulSoup(html, 'lxml' if _lxml_html is not None else 'html.parser')
+
+	def select(self, query: str, node=None) -> list:
+		return (self.root if node is None else node).select(QUERIES[query][1])
+
+	def text(self, node=None, sep: str = ' ', strip: bool = True) -> str:
+		return (self.root if node is None else node).get_text(sep, strip=strip)
+
+	def attr(self, node, name: str, default: Optional[str] = None) -> Optional[str]:
+		value = node.get(name, default)
+		return ' '.join(value) if isinstance(value, list) else value
+
+	def classes(self, node) -> str:
+		return ' '.join(node.get('class') or [])
+
+
+def parse_html(html: str, backend: Optional[str] = None) -> HtmlPage:
+	"""Parse a page with ``backend`` ('lxml' or 'bs4'; default: $FAN2QUIZZ_HTML_PARSER, else lxml if installed)."""
+	backend = backend or os.environ.get(HTML_PARSER_ENV) or 'lxml'
+	if backend == 'lxml' and _lxml_html is not None:
+		return LxmlPage(html)
+	return SoupPage(html)
+
+
+# --- Archive leaderboard rows ---
+# (rank, score, total, duration_seconds); any field may be None when the page does not show it
+ArchiveRow = Tuple[Optional[int], Optional[int], Optional[int], Optional[int]]
+
+_RANK_RE = re.compile(r"\b(\d{1,5})\b")
+_SCORE_RE = re.compile(r"(\d{1,3})\s*/\s*(\d{1,3})")
+_DURATION_RE = re.compile(r"(\d{1,5})\s*s")
+_LEADING_INT_RE = re.compile(r"^(\d+)")
+_LOOSE_SCORE_RE = re.compile(r"(\d+)\s*/\s*(\d+)")
+_LOOSE_DURATION_RE = re.compile(r"(\d+)\s*s")
+_DC_DATA_RE = re.compile(r'var DC_DATA = (\[.*?\]);', re.DOTALL)
+
+
+def _norm_cell(text: str) -> str:
+	return text.replace('\xa0', ' ').strip()
+
+
+def _norm_name(name: str) -> str:
+	"""Key players are matched on, in the JSON leaderboard and in table cells."""
+	return _norm_cell(name).lower()
+
+
+def _parse_row_cells(cells: List[str]) -> Optional[ArchiveRow]:
+	"""Rank (first integer of the first cell), score/total ("x / y") and duration ("### s") of a table row."""
+	rank = score = total = duration = None
+	m_rank = _RANK_RE.search(cells[0])
+	if m_rank:
+		rank = int(m_rank.group(1))
+	for c in cells:
+		m_sc = _SCORE_RE.search(c)
+		if m_sc:
+			score = int(m_sc.group(1))
+			total = int(m_sc.group(2))
+			break
+	for c in cells:
+		m_du = _DURATION_RE.search(c)
+		if m_du:
+			duration = int(m_du.group(1))
+			break
+	if rank is None and score is None and duration is None:
+		return None
+	return (rank, score, total, duration)
+
 
 class QuizypediaScraper:
 	BASE = "https://www.quizypedia.fr"
+	BASE_URL_ENV = "QUIZYPEDIA_BASE_URL"
 
-	def __init__(self, session: Optional[requests.Session] = None, rate_limiter: Optional[RateLimiter] = None):
+	def __init__(self, session: Optional[requests.Session] = None, rate_limiter: Optional[RateLimiter] = None,
+				 base_url: Optional[str] = None, retry: Optional[RetryPolicy] = None,
+				 breaker: Optional[CircuitBreaker] = None):
+		"""``base_url`` (or the QUIZYPEDIA_BASE_URL environment variable) points the scraper at another
+		server, e.g. the local stub in benchmarks/stub_server.py. ``retry`` and ``breaker`` govern
+		:meth:`fetch` (pass ``utils.NO_RETRY`` to fail on the first error)."""
 		self.session = session or requests.Session()
 		self.session.headers.update({"User-Agent": DEFAULT_USER_AGENT})
 		self.rate_limiter = rate_limiter or RateLimiter(0.7)
+		self.base = (base_url or os.environ.get(self.BASE_URL_ENV) or self.BASE).rstrip('/')
+		self.retry = retry or RetryPolicy()
+		self.breaker = breaker or CircuitBreaker()
 
-	def fetch(self, path: str) -> requests.Response:
-		url = path if path.startswith("http") else f"{self.BASE}{path}"
-		self.rate_limiter.wait()
-		resp = self.session.get(url, timeout=15)
-		resp.raise_for_status()
-		return resp
+	def fetch(self, path: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+		"""GET a site path (or absolute URL). Extra ``headers`` allow conditional requests (a 304 is returned as is).
+
+		Connection errors, timeouts and the statuses of ``self.retry`` (429, 5xx) are retried with
+		jittered exponential backoff, or after the server's Retry-After. Connection errors and 5xx
+		count towards ``self.breaker``, any other response resets it. While it is open, :class:`fan2quizz.utils.CircuitOpenError`
+		is raised without contacting the site.
+		"""
+		url = path if path.startswith("http") else f"{self.base}{path}"
+		attempt = 0
+		while True:
+			attempt += 1
+			self.breaker.check()
+			self.rate_limiter.wait()
+			with span('fetch'):
+				try:
+					resp = self.session.get(url, timeout=15, headers=headers)
+				except (requests.ConnectionError, requests.Timeout) as e:
+					error = e
+					resp = None
+			if resp is None:
+				metrics.inc('fan2quizz_http_requests_total', status='error')
+				self.breaker.record_failure()
+				if attempt >= self.retry.max_attempts:
+					raise error
+				self._wait_before_retry(attempt, 'error')
+				continue
+			metrics.inc('fan2quizz_http_requests_total', status=resp.status_code)
+			metrics.inc('fan2quizz_http_response_bytes_total', len(resp.content))
+			if resp.status_code >= 500:
+				self.breaker.record_failure()
+			else:
+				self.breaker.record_success()  # even a 429: the site is up
+			if resp.status_code in self.retry.retry_statuses and attempt < self.retry.max_attempts:
+				self._wait_before_retry(attempt, str(resp.status_code), resp.headers.get('Retry-After'))
+				continue
+			resp.raise_for_status()
+			return resp
+
+	def _wait_before_retry(self, attempt: int, reason: str, retry_after: Optional[str] = None):
+		metrics.inc('fan2quizz_http_retries_total', reason=reason)
+		with span('retry_wait'):
+			time.sleep(self.retry.delay(attempt, retry_after))
 
 	def discover_login_link(self, debug: bool = False) -> Optional[str]:
 		"""Attempt to discover a login/connexion link from homepage.
@@ -34,12 +275,12 @@ class QuizypediaScraper:
 			resp = self.fetch('/')
 		except Exception:
 			return None
-		soup = BeautifulSoup(resp.text, 'lxml')
+		page = parse_html(resp.text)
 		candidates = []
-		for a in soup.select('a'):
-			text = (a.get_text(' ', strip=True) or '').lower()
+		for a in page.select('a'):
+			text = page.text(a).lower()
 			if any(k in text for k in ['connexion','login','identifiant','se connecter']):
-				href = a.get('href') or ''
+				href = page.attr(a, 'href') or ''
 				if href:
 					candidates.append(href)
 		if debug:
@@ -63,7 +304,7 @@ class QuizypediaScraper:
 
 		Returns True on apparent success; False otherwise.
 		"""
-		login_path = f"{self.BASE}/wp-login.php"
+		login_path = f"{self.base}/wp-login.php"
 		# If wp-login.php 404s, attempt discovery
 		try:
 			self.rate_limiter.wait()
@@ -71,7 +312,7 @@ class QuizypediaScraper:
 			if probe.status_code == 404:
 				alt = self.discover_login_link(debug=debug)
 				if alt:
-					login_path = alt if alt.startswith('http') else f"{self.BASE}{alt}"
+					login_path = alt if alt.startswith('http') else f"{self.base}{alt}"
 					if debug:
 						print(f"[debug] using discovered login path: {login_path}")
 		except Exception as e:
@@ -86,22 +327,22 @@ class QuizypediaScraper:
 			if debug:
 				print(f"[debug] initial GET failed: {e}")
 			return False
-		soup = BeautifulSoup(resp_get.text, 'lxml')
-		form = soup.select_one('form#loginform') or soup.select_one('form')
+		page = parse_html(resp_get.text)
+		form = page.first('form#loginform', 'form')
 		payload = {}
-		if form:
-			for inp in form.select('input'):
-				name = inp.get('name')
+		if form is not None:
+			for inp in page.select('input', form):
+				name = page.attr(inp, 'name')
 				if not name:
 					continue
-				val = inp.get('value', '')
+				val = page.attr(inp, 'value', '')
 				payload[name] = val
 		# Override credential fields (common WP names: log, pwd)
 		payload['log'] = username
 		payload['pwd'] = password
 		# Ensure required fields
 		payload.setdefault('rememberme', 'forever')
-		payload.setdefault('redirect_to', f"{self.BASE}/defi-du-jour/")
+		payload.setdefault('redirect_to', f"{self.base}/defi-du-jour/")
 		payload.setdefault('testcookie', '1')
 		# Some themes require submit name
 		payload.setdefault('wp-submit', 'Log In')
@@ -120,7 +361,7 @@ class QuizypediaScraper:
 				return True
 			# As last resort, GET daily page and see if personalized markers exist
 			self.rate_limiter.wait()
-			daily_resp = self.session.get(f"{self.BASE}/defi-du-jour/", timeout=15)
+			daily_resp = self.session.get(f"{self.base}/defi-du-jour/", timeout=15)
 			if 'déconnexion' in daily_resp.text.lower() or 'logout' in daily_resp.text.lower():
 				return True
 			return False
@@ -156,27 +397,55 @@ class QuizypediaScraper:
 				name, value = part.split('=', 1)
 				self.session.cookies.set(name.strip(), value.strip())
 
-	def iter_category_urls(self) -> Iterator[str]:
-		"""Yield category page URLs from the homepage categories listing."""
-		resp = self.fetch("/")
-		soup = BeautifulSoup(resp.text, "lxml")
+	@staticmethod
+	def category_links(html: str) -> List[str]:
+		"""Category paths linked from a page (the homepage categories listing), in page order."""
+		page = parse_html(html)
 		seen = set()
-		for a in soup.select("a"):
-			href = a.get("href") or ""
+		links = []
+		for a in page.select('a'):
+			href = page.attr(a, 'href') or ""
 			if not href.startswith('/'):
 				continue
 			if 'categorie' in href and href not in seen:
 				seen.add(href)
-				yield href
+				links.append(href)
+		return links
+
+	@staticmethod
+	def quiz_links(html: str) -> List[str]:
+		"""Quiz links of a category listing page, in page order."""
+		page = parse_html(html)
+		links = []
+		for a in page.select('a'):
+			href = page.attr(a, 'href')
+			if href and '/quiz/' in href:
+				links.append(href)
+		return links
+
+	@staticmethod
+	def category_page_path(category_path: str, page: int) -> str:
+		return f"{category_path.rstrip('/')}/page/{page}"
+
+	def iter_category_urls(self) -> Iterator[str]:
+		"""Yield category page URLs from the homepage categories listing."""
+		resp = self.fetch("/")
+		yield from self.category_links(resp.text)
 
 	def iter_quiz_urls_from_category(self, category_path: str) -> Iterator[str]:
-		"""Follow pagination in a category and yield quiz URLs."""
+		"""Follow pagination in a category and yield quiz URLs.
+
+		For a crawl that survives restarts and skips already known quizzes, see :mod:`fan2quizz.frontier`.
+		"""
 		page = 1
 		while True:
-			path = f"{category_path.rstrip('/')}/page/{page}"
-			resp = self.fetch(path)
-			soup = BeautifulSoup(resp.text, "lxml")
-			links = [a.get('href') for a in soup.select('a') if a.get('href') and '/quiz/' in a.get('href')]
+			try:
+				resp = self.fetch(self.category_page_path(category_path, page))
+			except requests.HTTPError as e:
+				if page > 1 and getattr(e.response, 'status_code', None) == 404:
+					break  # past the last page
+				raise
+			links = self.quiz_links(resp.text)
 			if not links:
 				break
 			for link in links:
@@ -190,12 +459,12 @@ class QuizypediaScraper:
 	def guess_today_quiz_url(self) -> Optional[str]:
 		"""Heuristic to find today's 'quiz du jour' from homepage (placeholder)."""
 		resp = self.fetch('/')
-		soup = BeautifulSoup(resp.text, 'lxml')
+		page = parse_html(resp.text)
 		# Look for prominent quiz link (hero section) containing 'quiz' keyword
-		for sel in ['.featured a', '.hero a', 'article a', 'h2 a']:
-			for a in soup.select(sel):
-				href = a.get('href') or ''
-				text = a.get_text(strip=True).lower()
+		for sel in ['featured a', 'hero a', 'article a', 'h2 a']:
+			for a in page.select(sel):
+				href = page.attr(a, 'href') or ''
+				text = page.text(a, sep='').lower()
 				if '/quiz/' in href and ('jour' in text or 'quiz' in text):
 					return href
 		return None
@@ -215,12 +484,12 @@ class QuizypediaScraper:
 		Choices marked with class hints like 'correct', 'bonne', 'selected', 'chosen', 'user', 'votre'.
 		Returns dict: {title, description, questions:[{question_text, choices, correct_index, chosen_index}]}.
 		"""
-		soup = BeautifulSoup(html, 'lxml')
-		title_el = soup.select_one('h1') or soup.title
-		title = title_el.get_text(strip=True) if title_el else 'Défi du jour'
-		desc_el = soup.select_one('.intro, .description, .quiz-intro')
-		description = desc_el.get_text(strip=True) if desc_el else ''
-		plain = soup.get_text(' ', strip=True).lower()
+		page = parse_html(html)
+		title_el = page.first('h1', 'title')
+		title = page.text(title_el, sep='') if title_el is not None else 'Défi du jour'
+		desc_el = page.first('intro')
+		description = page.text(desc_el, sep='') if desc_el is not None else ''
+		plain = page.text().lower()
 		login_required_phrases = [
 			'merci de vous identifier',
 			'pour jouer le défi du jour',
@@ -228,19 +497,17 @@ class QuizypediaScraper:
 			'connexion',  # generic
 		]
 		is_auth = not any(p in plain for p in login_required_phrases)
-		q_nodes = soup.select('.question') or soup.select('.quiz-question')
-		if not q_nodes:
-			q_nodes = list(soup.select('ol li'))
+		q_nodes = page.select('question') or page.select('quiz-question') or page.select('ol li')
 		questions: List[Dict[str, Any]] = []
 		for qn in q_nodes:
-			q_text_el = qn.select_one('.qtext') or qn.select_one('h2') or qn
-			q_text = q_text_el.get_text(separator=' ', strip=True)
-			choice_nodes = qn.select('.answer, .choice, li') or qn.select('li')
-			choices = [c.get_text(' ', strip=True) for c in choice_nodes]
+			q_text_el = page.first('qtext', 'h2', node=qn)
+			q_text = page.text(qn if q_text_el is None else q_text_el)
+			choice_nodes = page.select('choice', qn)
+			choices = [page.text(c) for c in choice_nodes]
 			correct_index = None
 			chosen_index = None
 			for i, c in enumerate(choice_nodes):
-				classes = ' '.join(c.get('class') or []).lower()
+				classes = page.classes(c).lower()
 				# Correct answer hints
 				if any(h in classes for h in ['correct','bonne','right','reponse-correcte']):
 					correct_index = i
@@ -248,7 +515,7 @@ class QuizypediaScraper:
 				if any(h in classes for h in ['selected','chosen','votre','user','moi','answer-user']):
 					chosen_index = i
 				# Inline icon/text hints
-				text_low = c.get_text(' ', strip=True).lower()
+				text_low = choices[i].lower()
 				if chosen_index is None and ('(votre' in text_low or 'votre réponse' in text_low):
 					chosen_index = i
 				if correct_index is None and ('bonne réponse' in text_low or text_low.endswith('(correct)')):
@@ -271,92 +538,148 @@ class QuizypediaScraper:
 		"""Fetch a daily challenge archive page and extract a player's (rank, score, total, duration_seconds).
 
 		Returns tuple (rank, score, total, duration_seconds) where some values may be None
-		if not parsed, or None if the player row cannot be located.
+		if not parsed, or None if the player row cannot be located. To look up several
+		players, use :meth:`fetch_daily_archive_players`: the page is fetched and parsed once.
+		"""
+		return self.fetch_daily_archive_players(year, month, day, [player], debug=debug, html=html)[player]
+
+	def fetch_daily_archive_players(self, year: int, month: int, day: int, players: Iterable[str], debug: bool = False,
+									html: Optional[str] = None) -> Dict[str, Optional[ArchiveRow]]:
+		"""Fetch a daily challenge archive page once and extract (rank, score, total, duration_seconds) per player.
+
+		Players are matched on their trimmed, lowercased name: first in the embedded JSON
+		leaderboard (total is then the number of questions in DC_DATA), then in the
+		leaderboard table, then with the text heuristics. Returns {player: tuple or None},
+		keyed by the names as given.
 		"""
 		if html is None:
 			path = f"/defi-du-jour/archives/{year:04d}/{month:02d}/{day:02d}/"
 			html = self.fetch(path).text
-		soup = BeautifulSoup(html, 'lxml')
-		player_norm = player.strip().lower()
-		import re
-		def norm(s: str) -> str:
-			return s.replace('\xa0', ' ').strip()
-
-		# 1. Structured table parsing
-		for table in soup.select('table'):
-			rows = table.find_all('tr')
-			for tr in rows:
-				cells = [norm(c.get_text(' ', strip=True)) for c in tr.find_all(['td','th'])]
-				if not cells or len(cells) < 2:
-					continue
-				joined = ' '.join(cells).lower()
-				if player_norm not in joined:
+		wanted: Dict[str, List[str]] = {}
+		for player in players:
+			wanted.setdefault(_norm_name(player), []).append(player)
+		found = self._json_archive_rows(html, wanted, debug)
+		missing = [key for key in wanted if key not in found]
+		if missing:
+			found.update(self._html_archive_rows(parse_html(html), missing, debug))
+		return {player: found.get(key) for key, names in wanted.items() for player in names}
+
+	@staticmethod
+	def _json_archive_rows(html: str, wanted, debug: bool = False) -> Dict[str, ArchiveRow]:
+		"""Rows of the embedded ``[{"good_responses"...}]`` leaderboard for the wanted (normalized) names."""
+		raw = bracket_scan_payload(html)
+		if raw is None:
+			return {}
+		try:
+			rows = parse_results(raw)
+		except ValueError:
+			return {}
+		if not isinstance(rows, list):
+			return {}
+		by_name: Dict[str, Any] = {}
+		for position, row in enumerate(rows, 1):
+			if isinstance(row, dict):
+				# Rows come best first: on duplicate names the better one wins
+				by_name.setdefault(_norm_name(row_user(row)), (position, row))
+		total = None
+		match = _DC_DATA_RE.search(html)
+		if match:
+			try:
+				total = len(json.loads(match.group(1)))
+			except ValueError:
+				pass
+		if debug:
+			print(f"[debug] leaderboard payload: {len(rows)} rows, {total} questions")
+		found = {}
+		for key in wanted:
+			hit = by_name.get(key)
+			if hit is not None:
+				position, row = hit
+				found[key] = (row.get('rank') or position, row.get('good_responses'), total, row.get('elapsed_time'))
+		return found
+
+	@staticmethod
+	def _html_archive_rows(page: HtmlPage, missing: List[str], debug: bool = False) -> Dict[str, ArchiveRow]:
+		"""Rows of the leaderboard table (or, failing that, of the page text) for the missing names."""
+		found: Dict[str, ArchiveRow] = {}
+
+		# 1. Structured table parsing: cell text -> rows, so a name is found without scanning
+		rows: List[List[str]] = []
+		by_cell: Dict[str, List[int]] = {}
+		for table in page.select('table'):
+			for tr in page.select('tr', table):
+				cells = [_norm_cell(page.text(c)) for c in page.select('cell', tr)]
+				if len(cells) < 2:
 					continue
-				if debug:
-					print(f"[debug] matched row cells: {cells}")
-				# Extract fields
-				rank = score = total = duration = None
-				# Rank: first integer in first cell
-				m_rank = re.search(r"\b(\d{1,5})\b", cells[0])
-				if m_rank:
-					rank = int(m_rank.group(1))
-				# Score/total: any cell pattern x / y
-				for c in cells:
-					m_sc = re.search(r"(\d{1,3})\s*/\s*(\d{1,3})", c)
-					if m_sc:
-						score = int(m_sc.group(1))
-						total = int(m_sc.group(2))
-						break
-				# Duration: ### s
-				for c in cells:
-					m_du = re.search(r"(\d{1,5})\s*s", c)
-					if m_du:
-						duration = int(m_du.group(1))
-						break
-				if rank is not None or score is not None or duration is not None:
-					return (rank, score, total, duration)
+				for cell in cells:
+					by_cell.setdefault(cell.lower(), []).append(len(rows))
+				rows.append(cells)
+		joined_rows = None
+		for key in missing:
+			indexes = by_cell.get(key)
+			if indexes is None:
+				# The name is only part of a cell ("alice (FR)"): scan the rows
+				if joined_rows is None:
+					joined_rows = [' '.join(cells).lower() for cells in rows]
+				indexes = [i for i, joined in enumerate(joined_rows) if key in joined]
+			for i in indexes:
+				parsed = _parse_row_cells(rows[i])
+				if parsed is not None:
+					if debug:
+						print(f"[debug] matched row cells: {rows[i]}")
+					found[key] = parsed
+					break
+		missing = [key for key in missing if key not in found]
+		if not missing:
+			return found
 
 		# 2. Fallback: previous heuristic gathering text blocks
-		candidates = []
-		for tr in soup.select('tr'):
-			text = ' '.join(tr.stripped_strings)
-			if player_norm in text.lower():
-				candidates.append(text)
-		for div in soup.select('.score, .result, .classement, li'):
-			text = ' '.join(div.stripped_strings)
-			if player_norm in text.lower():
-				candidates.append(text)
-		if debug:
-			print(f"[debug] fallback candidates: {candidates}")
-		for text in candidates:
-			m = re.search(r"^(\d+)\s+.*?\b" + re.escape(player_norm) + r"\b.*?(\d+)\s*/\s*(\d+).*?-\s*(\d+)\s*s", text.lower())
-			if m:
-				return (int(m.group(1)), int(m.group(2)), int(m.group(3)), int(m.group(4)))
-			# Fallback partial extractions
-			rank_match = re.search(r"^(\d+)", text)
-			score_match = re.search(r"(\d+)\s*/\s*(\d+)", text)
-			dur_match = re.search(r"(\d+)\s*s", text)
-			if player_norm in text.lower() and (rank_match or score_match or dur_match):
-				rank = int(rank_match.group(1)) if rank_match else None
-				score = int(score_match.group(1)) if score_match else None
-				total = int(score_match.group(2)) if score_match else None
-				duration = int(dur_match.group(1)) if dur_match else None
-				return (rank, score, total, duration)
+		blocks = [page.text(tr) for tr in page.select('tr')] + [page.text(div) for div in page.select('result')]
+		blocks = [(text, text.lower()) for text in blocks]
+		for key in missing:
+			candidates = [(text, low) for text, low in blocks if key in low]
+			if debug:
+				print(f"[debug] fallback candidates: {[text for text, _ in candidates]}")
+			if not candidates:
+				continue
+			full_row = re.compile(r"^(\d+)\s+.*?\b" + re.escape(key) + r"\b.*?(\d+)\s*/\s*(\d+).*?-\s*(\d+)\s*s")
+			for text, low in candidates:
+				m = full_row.search(low)
+				if m:
+					found[key] = (int(m.group(1)), int(m.group(2)), int(m.group(3)), int(m.group(4)))
+					break
+				# Fallback partial extractions
+				rank_match = _LEADING_INT_RE.search(text)
+				score_match = _LOOSE_SCORE_RE.search(text)
+				dur_match = _LOOSE_DURATION_RE.search(text)
+				if rank_match or score_match or dur_match:
+					found[key] = (
+						int(rank_match.group(1)) if rank_match else None,
+						int(score_match.group(1)) if score_match else None,
+						int(score_match.group(2)) if score_match else None,
+						int(dur_match.group(1)) if dur_match else None,
+					)
+					break
+		missing = [key for key in missing if key not in found]
+		if not missing:
+			return found
+
 		# 3. Liberal plain-text scan across full page
-		plain = soup.get_text('\n')
-		lines = [norm(line) for line in plain.splitlines() if player_norm in line.lower()]
-		if debug and lines:
-			print(f"[debug] liberal lines containing player: {lines[:10]}")
-		if lines:
-			import re as _re
-			joined = ' '.join(lines)
-			m_rank = _re.search(r"(\d{1,5})\D{0,10}" + player_norm, joined.lower())
-			m_score = _re.search(r"(\d{1,3})\s*/\s*(\d{1,3})", joined)
-			m_dur = _re.search(r"(\d{1,5})\s*s", joined)
+		lines = [(line, line.lower()) for line in page.text(sep='\n', strip=False).splitlines()]
+		for key in missing:
+			matched = [_norm_cell(line) for line, low in lines if key in low]
+			if debug and matched:
+				print(f"[debug] liberal lines containing player: {matched[:10]}")
+			if not matched:
+				continue
+			joined = ' '.join(matched)
+			m_rank = re.search(r"(\d{1,5})\D{0,10}" + re.escape(key), joined.lower())
+			m_score = _SCORE_RE.search(joined)
+			m_dur = _DURATION_RE.search(joined)
 			rank = int(m_rank.group(1)) if m_rank else None
 			score = int(m_score.group(1)) if m_score else None
 			total = int(m_score.group(2)) if m_score else None
 			duration = int(m_dur.group(1)) if m_dur else None
 			if any(v is not None for v in (rank, score, duration)):
-				return (rank, score, total, duration)
-		return None
\ No newline at end of file
+				found[key] = (rank, score, total, duration)
+		return found
\ No newline at end of file
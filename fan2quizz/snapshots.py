@@ -0,0 +1,320 @@
+"""Compact append-only history of one day's leaderboard.
+
+Each line of a ``<date>.jsonl`` log is one snapshot, written only when the
+leaderboard changed:
+
+- a *full* line stores every row column-wise::
+
+    {"t": 1760450000, "cols": ["user", "good_responses", ...], "full": [["alice", 18, ...], ...]}
+
+- a *delta* line stores the users who disappeared (``del``), the rank
+  shift of the remaining rows (``shift``), only the fields that changed in
+  existing rows (``chg``, keyed by lowercased user) and the rows that
+  appeared (``add``)::
+
+    {"t": 1760450120, "del": ["carol"], "shift": [[4, 1]], "chg": [["alice", {"elapsed_time": 95}]],
+     "add": [["bob", 17, ...]]}
+
+``shift`` is a step function over previous ranks: ``[[4, 1], [9, 2]]``
+moves ranks 4-8 down by one and ranks from 9 on by two. A newcomer pushes
+everyone below them one place down, and this records that in a single pair
+instead of one patch per row.
+
+A full line is written every ``checkpoint_every`` lines. Reading snapshot
+*i* seeks to the last full line at or before it and replays fewer than that
+many deltas; line offsets come from a scan that only reads each line's
+header.
+
+A delta is written only if replaying it gives back exactly the new
+leaderboard (same rows, same order), otherwise a full line is written
+instead, so the log is lossless. A torn last line left by an interrupted
+write is ignored, and dropped on the next append.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .leaderboard import row_user
+
+Row = Dict[str, Any]
+
+DEFAULT_CHECKPOINT_EVERY = 50
+_HEAD = re.compile(rb'\{"t":(-?\d+),"(cols|del|shift|chg|add)"')
+
+
+def _rank_key(item: Tuple[int, Row]):
+    position, row = item
+    rank = row.get('rank')
+    return (rank if isinstance(rank, (int, float)) else float('inf'), position)
+
+
+def _order(rows_by_user: Dict[str, Row]) -> List[Row]:
+    """Rows sorted by rank, keeping the previous order among ties and unranked rows."""
+    return [row for _, row in sorted(enumerate(rows_by_user.values()), key=_rank_key)]
+
+
+def _by_user(rows: List[Row]) -> Dict[str, Row]:
+    return {row_user(r).lower(): r for r in rows}
+
+
+def _is_rank(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _apply_shift(state: Dict[str, Row], shift: List[List[int]]) -> Dict[str, Row]:
+    starts = [start for start, _ in shift]
+    shifted = {}
+    for key, row in state.items():
+        rank = row.get('rank')
+        if _is_rank(rank):
+            i = bisect.bisect_right(starts, rank) - 1
+            if i >= 0 and shift[i][1]:
+                row = {**row, 'rank': rank + shift[i][1]}
+        shifted[key] = row
+    return shifted
+
+
+def _rank_shift(old_state: Dict[str, Row], new_state: Dict[str, Row]) -> List[List[int]]:
+    """Step function of rank changes for rows present in both states.
+
+    A previous rank whose rows moved by different amounts is left out (those
+    rows get an explicit patch).
+    """
+    moves: Dict[int, set] = {}
+    for key, old in old_state.items():
+        new = new_state.get(key)
+        if new is not None and _is_rank(old.get('rank')) and _is_rank(new.get('rank')):
+            moves.setdefault(old['rank'], set()).add(new['rank'] - old['rank'])
+    shift, current = [], 0
+    for rank in sorted(moves):
+        if len(moves[rank]) == 1:
+            d = next(iter(moves[rank]))
+            if d != current:
+                shift.append([rank, d])
+                current = d
+    return shift
+
+
+class SnapshotLog:
+    """One day's leaderboard snapshots in a JSON-lines file.
+
+    >>> log = SnapshotLog(path)
+    >>> log.append(rows)            # 'full', 'delta' or 'same'
+    >>> len(log), log.timestamps()
+    >>> log.snapshot(-1) == log.latest()
+    >>> log.snapshot_at(ts)         # leaderboard as it was at ``ts``
+    """
+
+    def __init__(self, path: Path, checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY):
+        self.path = Path(path)
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.cols: Optional[List[str]] = None
+        self._state: Optional[Dict[str, Row]] = None
+        self._since_full = 0
+        self._loaded = False
+        # Per complete line: (byte offset, timestamp, is_full)
+        self._index: Optional[List[Tuple[int, int, bool]]] = None
+        self._size = 0
+
+    def __repr__(self) -> str:
+        return f"SnapshotLog({str(self.path)!r})"
+
+    def __len__(self) -> int:
+        return len(self.index())
+
+    # --- encoding --------------------------------------------------------
+    def _encode(self, row: Row):
+        if self.cols is not None and len(row) == len(self.cols) and all(c in row for c in self.cols):
+            return [row[c] for c in self.cols]
+        return row  # irregular row: keep it as an object
+
+    @staticmethod
+    def _decode(cols: List[str], item) -> Row:
+        return dict(zip(cols, item)) if isinstance(item, list) else dict(item)
+
+    @staticmethod
+    def _columns(rows: List[Row]) -> List[str]:
+        cols: Dict[str, None] = {}
+        for row in rows:
+            for key in row:
+                cols.setdefault(key, None)
+        return list(cols)
+
+    # --- index -----------------------------------------------------------
+    def index(self) -> List[Tuple[int, int, bool]]:
+        """``(offset, timestamp, is_full)`` of every complete line, without decoding the rows."""
+        if self._index is None:
+            index = []
+            offset = 0
+            try:
+                f = open(self.path, 'rb')
+            except FileNotFoundError:
+                f = None
+            if f is not None:
+                with f:
+                    for line in f:
+                        m = _HEAD.match(line)
+                        if m is None or not line.endswith(b'\n'):
+                            break  # torn last line: the log ends here
+                        index.append((offset, int(m.group(1)), m.group(2) == b'cols'))
+                        offset += len(line)
+            self._index = index
+            self._size = offset
+        return self._index
+
+    def timestamps(self) -> List[int]:
+        return [t for _, t, _ in self.index()]
+
+    def disk_bytes(self) -> int:
+        """Size of the valid part of the log."""
+        self.index()
+        return self._size
+
+    # --- reading ---------------------------------------------------------
+    def _replay(self, start: int = 0, stop: Optional[int] = None
+                ) -> Iterator[Tuple[int, Dict[str, Row], List[str]]]:
+        """Apply lines ``start`` (a full line) to ``stop`` (exclusive), yielding the state after each."""
+        index = self.index()
+        stop = len(index) if stop is None else stop
+        if start >= stop:
+            return
+        cols: List[str] = []
+        state: Dict[str, Row] = {}
+        with open(self.path, 'rb') as f:
+            f.seek(index[start][0])
+            for _ in range(start, stop):
+                entry = json.loads(f.readline())
+                if 'full' in entry:
+                    cols = entry['cols']
+                    state = _by_user([self._decode(cols, item) for item in entry['full']])
+                else:
+                    for user in entry.get('del', ()):
+                        state.pop(user, None)
+                    if 'shift' in entry:
+                        state = _apply_shift(state, entry['shift'])
+                    for user, patch in entry.get('chg', ()):
+                        state[user] = {**state[user], **patch}
+                    for item in entry.get('add', ()):
+                        row = self._decode(cols, item)
+                        state[row_user(row).lower()] = row
+                yield entry['t'], state, cols
+
+    def _checkpoint_before(self, i: int) -> int:
+        index = self.index()
+        while i > 0 and not index[i][2]:
+            i -= 1
+        return i
+
+    def iter_snapshots(self) -> Iterator[Tuple[int, List[Row]]]:
+        """Replay the whole log, yielding ``(timestamp, rows)`` after every line."""
+        for t, state, _ in self._replay():
+            yield t, _order(state)
+
+    def snapshot(self, i: int) -> List[Row]:
+        """Leaderboard after line ``i`` (negative indexes count from the end)."""
+        n = len(self.index())
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(f"snapshot {i} out of range ({n} recorded)")
+        state: Dict[str, Row] = {}
+        for _, state, _ in self._replay(self._checkpoint_before(i), i + 1):
+            pass
+        return _order(state)
+
+    def snapshot_at(self, timestamp: float) -> Optional[List[Row]]:
+        """Last leaderboard recorded at or before ``timestamp``, None if the log starts later."""
+        i = bisect.bisect_right(self.timestamps(), timestamp) - 1
+        return None if i < 0 else self.snapshot(i)
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        index = self.index()
+        if not index:
+            return
+        last = len(index) - 1
+        start = self._checkpoint_before(last)
+        for _, state, cols in self._replay(start):
+            self._state, self.cols = dict(state), cols
+        self._since_full = last - start
+
+    def latest(self) -> Optional[List[Row]]:
+        """The last recorded leaderboard, or None if the log is empty."""
+        self._load()
+        return None if self._state is None else _order(self._state)
+
+    # --- writing ---------------------------------------------------------
+    def _delta(self, rows: List[Row], new_state: Dict[str, Row]
+               ) -> Optional[Tuple[Dict[str, Any], Dict[str, Row]]]:
+        """Delta fields and the state they replay to, or None if only a full line is exact."""
+        old_state = self._state
+        removed = [key for key in old_state if key not in new_state]
+        replayed = {key: row for key, row in old_state.items() if key in new_state}
+        shift = _rank_shift(replayed, new_state)
+        if shift:
+            replayed = _apply_shift(replayed, shift)
+        added, patches = [], []
+        for key, row in new_state.items():
+            old = replayed.get(key)
+            if old == row:
+                continue
+            if old is not None and old.keys() == row.keys():
+                patches.append([key, {f: v for f, v in row.items() if old[f] != v}])
+            else:
+                added.append(self._encode(row))
+            replayed[key] = row
+        if _order(replayed) != rows:
+            return None
+        entry: Dict[str, Any] = {}
+        if removed:
+            entry['del'] = removed
+        if shift:
+            entry['shift'] = shift
+        if patches:
+            entry['chg'] = patches
+        if added:
+            entry['add'] = added
+        return entry, replayed
+
+    def append(self, rows: List[Row], timestamp: Optional[int] = None) -> str:
+        """Record ``rows`` as the new state; returns ``'full'``, ``'delta'`` or ``'same'``."""
+        self._load()
+        t = int(time.time()) if timestamp is None else int(timestamp)
+        new_state = _by_user(rows)
+        entry = None
+        if self._state is not None:
+            if self._state == new_state and _order(self._state) == rows:
+                return 'same'
+            if self._since_full + 1 < self.checkpoint_every:
+                delta = self._delta(rows, new_state)
+                if delta is not None:
+                    entry = {'t': t, **delta[0]}
+                    new_state = delta[1]  # same insertion order as a replay from disk
+        is_full = entry is None
+        if is_full:
+            self.cols = self._columns(rows)
+            entry = {'t': t, 'cols': self.cols, 'full': [self._encode(r) for r in rows]}
+
+        index = self.index()
+        line = (json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists() and self.path.stat().st_size != self._size:
+            os.truncate(self.path, self._size)  # drop a torn last line
+        with open(self.path, 'ab') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        index.append((self._size, t, is_full))
+        self._size += len(line)
+        self._state = new_state
+        self._since_full = 0 if is_full else self._since_full + 1
+        return 'full' if is_full else 'delta'
@@ -0,0 +1,340 @@
+"""Compressed cache files with transparent reads.
+
+Archived leaderboards (``data/cache/archive/<date>.json``) and quiz pages
+(``data/cache/quiz_html/<date>.html``) are stored compressed:
+
+- with zstd (``.zst``) when the optional ``zstandard`` package is installed,
+  otherwise gzip (``.gz``) for JSON and zlib (``.zz``) for HTML;
+- JSON is written compact (no indentation);
+- quiz pages share most of their markup, so a dictionary trained on
+  existing pages (:func:`train_dictionary`, kept in ``_dictionaries/`` next
+  to them) primes the compressor and each page only pays for what is
+  specific to it. Both zstd and zlib frames carry the id of their
+  dictionary, so older pages still decode after a retrain.
+
+Callers keep using the logical path (``.../2025-10-14.json``):
+:func:`find` / :func:`load_json` / :func:`load_text` pick whichever variant
+exists (the newest if there are several, so a legacy plain file written by
+an older tool still wins over a stale compressed one), and
+:func:`write_json` / :func:`write_text` replace every other variant.
+``FAN2QUIZZ_CACHE_CODEC=plain`` writes uncompressed files again.
+``scripts/migrate_cache.py`` converts existing caches.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .timing import timed
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # optional dependency
+    zstandard = None
+
+CODEC_ENV = "FAN2QUIZZ_CACHE_CODEC"
+SUFFIXES = {'zst': '.zst', 'gz': '.gz', 'zz': '.zz', 'plain': ''}
+# Codecs whose frames can reference a dictionary
+DICTIONARY_CODECS = ('zst', 'zz')
+DICT_DIR_NAME = "_dictionaries"
+ZSTD_LEVEL = 12
+GZIP_LEVEL = 9
+ZLIB_LEVEL = 9
+ZSTD_DICT_SIZE = 112 * 1024
+ZLIB_DICT_SIZE = 32 * 1024  # deflate window: a larger preset dictionary is never referenced
+
+_DECODE_ERRORS = (zlib.error, EOFError, OSError, ValueError) + ((zstandard.ZstdError,) if zstandard else ())
+
+
+class StorageError(OSError):
+    """A cache file exists but cannot be decoded (corrupt, or needs a missing codec/dictionary)."""
+
+
+def available_codecs() -> List[str]:
+    return [c for c in SUFFIXES if c != 'zst' or zstandard is not None]
+
+
+def default_codec(text: bool = False) -> str:
+    """Codec for new files: ``$FAN2QUIZZ_CACHE_CODEC``, else zstd, else gzip (zlib for ``text``, for dictionaries)."""
+    codec = os.environ.get(CODEC_ENV, '').strip().lower()
+    if codec:
+        if codec not in available_codecs():
+            raise ValueError(f"{CODEC_ENV}={codec!r}: expected one of {', '.join(available_codecs())}")
+        return codec
+    if zstandard is not None:
+        return 'zst'
+    return 'zz' if text else 'gz'
+
+
+def codec_of(path: Path) -> str:
+    for codec, suffix in SUFFIXES.items():
+        if suffix and path.name.endswith(suffix):
+            return codec
+    return 'plain'
+
+
+def variants(base: Path) -> List[Path]:
+    """Every file name ``base`` may be stored under."""
+    base = Path(base)
+    return [base.with_name(base.name + suffix) for suffix in SUFFIXES.values()]
+
+
+def find(base: Path) -> Optional[Path]:
+    """The stored variant of ``base`` (newest if several), or None."""
+    best, best_mtime = None, -1
+    for path in variants(base):
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            continue
+        if mtime > best_mtime:
+            best, best_mtime = path, mtime
+    return best
+
+
+def scan(directory: Path, extension: str) -> Dict[str, Path]:
+    """``{stem: path}`` of every ``<stem><extension>[.zst|.gz|.zz]`` file in ``directory`` (newest variant wins)."""
+    found: Dict[str, Tuple[int, Path]] = {}
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return {}
+    for entry in entries:
+        name = entry.name
+        if name.startswith(('.', '_')) or not entry.is_file():
+            continue
+        for suffix in SUFFIXES.values():
+            ending = extension + suffix
+            if name.endswith(ending):
+                stem = name[:-len(ending)]
+                mtime = entry.stat().st_mtime_ns
+                if stem and (stem not in found or mtime > found[stem][0]):
+                    found[stem] = (mtime, Path(entry.path))
+                break
+    return {stem: path for stem, (_, path) in sorted(found.items())}
+
+
+# --- dictionaries ----------------------------------------------------------
+
+def dictionary_id(codec: str, data: bytes) -> int:
+    if codec == 'zst':
+        return zstandard.ZstdCompressionDict(data).dict_id()
+    return zlib.adler32(data)  # what zlib stores in a stream header (DICTID)
+
+
+class DictionaryStore:
+    """Dictionaries of one cache directory, as ``_dictionaries/<codec>-<id>.dict``."""
+
+    def __init__(self, directory: Path):
+        self.dir = Path(directory) / DICT_DIR_NAME
+        self._loaded: Dict[Tuple[str, int], bytes] = {}
+
+    def path(self, codec: str, dict_id: int) -> Path:
+        return self.dir / f"{codec}-{dict_id}.dict"
+
+    def get(self, codec: str, dict_id: int) -> bytes:
+        key = (codec, dict_id)
+        if key not in self._loaded:
+            try:
+                self._loaded[key] = self.path(codec, dict_id).read_bytes()
+            except FileNotFoundError:
+                raise StorageError(f"Missing {codec} dictionary {dict_id} in {self.dir}") from None
+        return self._loaded[key]
+
+    def current(self, codec: str) -> Optional[bytes]:
+        """Most recently added dictionary for ``codec``, used for new files."""
+        try:
+            candidates = [p for p in self.dir.glob(f"{codec}-*.dict")]
+        except OSError:
+            return None
+        if not candidates:
+            return None
+        newest = max(candidates, key=lambda p: p.stat().st_mtime_ns)
+        return self.get(codec, int(newest.stem.split('-', 1)[1]))
+
+    def add(self, codec: str, data: bytes) -> Path:
+        dict_id = dictionary_id(codec, data)
+        path = self.path(codec, dict_id)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, data)
+        self._loaded[(codec, dict_id)] = data
+        return path
+
+    def total_bytes(self) -> int:
+        try:
+            return sum(p.stat().st_size for p in self.dir.glob("*.dict"))
+        except OSError:
+            return 0
+
+
+_stores: Dict[Path, DictionaryStore] = {}
+
+
+def dictionaries(directory: Path) -> DictionaryStore:
+    directory = Path(directory)
+    store = _stores.get(directory)
+    if store is None:
+        store = _stores[directory] = DictionaryStore(directory)
+    return store
+
+
+def train_dictionary(samples: Sequence[bytes], codec: str, size: Optional[int] = None) -> bytes:
+    """Build a dictionary from sample files for ``codec`` (``zst`` or ``zz``).
+
+    zstd has a real trainer. For zlib the dictionary is the lines shared by
+    most samples, in the order they appear in the most recent sample (so
+    runs of consecutive common lines match as one), capped at the 32 KB
+    deflate window.
+    """
+    if codec == 'zst':
+        if zstandard is None:
+            raise StorageError("zstd dictionaries need the zstandard package")
+        return zstandard.train_dictionary(size or ZSTD_DICT_SIZE, list(samples)).as_bytes()
+    if codec != 'zz':
+        raise ValueError(f"{codec!r} does not support dictionaries")
+    size = min(size or ZLIB_DICT_SIZE, ZLIB_DICT_SIZE)
+    doc_freq: Counter = Counter()
+    for sample in samples:
+        doc_freq.update(set(sample.splitlines(keepends=True)))
+    threshold = max(2, len(samples) // 2)
+    common = {line: n for line, n in doc_freq.items() if n >= threshold and len(line.strip()) >= 8}
+    chosen, budget = set(), size
+    for line in sorted(common, key=lambda ln: common[ln] * len(ln), reverse=True):
+        if len(line) <= budget:
+            chosen.add(line)
+            budget -= len(line)
+    ordered, seen = [], set()
+    for line in samples[-1].splitlines(keepends=True) if samples else ():
+        if line in chosen and line not in seen:
+            ordered.append(line)
+            seen.add(line)
+    ordered += [line for line in chosen if line not in seen]
+    # zlib references the end of the dictionary most cheaply: keep what fits, ending with the page order
+    return b''.join(ordered)[-size:]
+
+
+# --- encoding --------------------------------------------------------------
+
+def compress(data: bytes, codec: str, dictionary: Optional[bytes] = None) -> bytes:
+    if codec == 'plain':
+        return data
+    if codec == 'zst':
+        if zstandard is None:
+            raise StorageError("zstd needs the zstandard package")
+        kwargs = {'dict_data': zstandard.ZstdCompressionDict(dictionary)} if dictionary else {}
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL, **kwargs).compress(data)
+    if codec == 'gz':
+        return gzip.compress(data, GZIP_LEVEL, mtime=0)
+    if codec == 'zz':
+        c = zlib.compressobj(ZLIB_LEVEL, zdict=dictionary) if dictionary else zlib.compressobj(ZLIB_LEVEL)
+        return c.compress(data) + c.flush()
+    raise ValueError(f"Unknown codec {codec!r}")
+
+
+def decompress(blob: bytes, codec: str, directory: Optional[Path] = None) -> bytes:
+    """Decode ``blob``; dictionaries are looked up in ``directory``'s ``_dictionaries/``."""
+    try:
+        if codec == 'plain':
+            return blob
+        if codec == 'gz':
+            return gzip.decompress(blob)
+        if codec == 'zz':
+            if len(blob) >= 6 and blob[1] & 0x20:  # FDICT: DICTID follows the 2-byte header
+                dict_id = int.from_bytes(blob[2:6], 'big')
+                d = zlib.decompressobj(zdict=dictionaries(directory).get('zz', dict_id))
+            else:
+                d = zlib.decompressobj()
+            return d.decompress(blob) + d.flush()
+        if codec == 'zst':
+            if zstandard is None:
+                raise StorageError("Reading .zst caches needs the zstandard package")
+            dict_id = zstandard.get_frame_parameters(blob).dict_id
+            kwargs = {}
+            if dict_id:
+                kwargs['dict_data'] = zstandard.ZstdCompressionDict(dictionaries(directory).get('zst', dict_id))
+            return zstandard.ZstdDecompressor(**kwargs).decompress(blob)
+    except StorageError:
+        raise
+    except _DECODE_ERRORS as e:
+        raise StorageError(f"Corrupt {codec} data: {e}") from e
+    raise ValueError(f"Unknown codec {codec!r}")
+
+
+# --- reading ---------------------------------------------------------------
+
+def read_bytes(path: Path) -> bytes:
+    """Decoded content of a stored variant (codec from its suffix)."""
+    path = Path(path)
+    return decompress(path.read_bytes(), codec_of(path), path.parent)
+
+
+@timed('cache.read')
+def read_json(path: Path) -> Any:
+    return json.loads(read_bytes(path))
+
+
+@timed('cache.read')
+def read_text(path: Path, errors: str = 'strict') -> str:
+    return read_bytes(path).decode('utf-8', errors=errors)
+
+
+def load_json(base: Path) -> Optional[Any]:
+    """Parsed content of whichever variant of ``base`` exists, None if there is none."""
+    path = find(base)
+    return None if path is None else read_json(path)
+
+
+def load_text(base: Path) -> Optional[str]:
+    path = find(base)
+    return None if path is None else read_text(path)
+
+
+# --- writing ---------------------------------------------------------------
+
+def atomic_write(path: Path, data: bytes):
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def write_bytes(base: Path, data: bytes, codec: Optional[str] = None, use_dictionary: bool = False) -> Path:
+    """Store ``data`` as ``base`` + codec suffix (atomically) and remove the other variants."""
+    base = Path(base)
+    codec = codec or default_codec(text=use_dictionary)
+    dictionary = None
+    if use_dictionary and codec in DICTIONARY_CODECS:
+        dictionary = dictionaries(base.parent).current(codec)
+    target = base.with_name(base.name + SUFFIXES[codec])
+    target.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(target, compress(data, codec, dictionary))
+    for other in variants(base):
+        if other != target:
+            other.unlink(missing_ok=True)
+    return target
+
+
+def dump_json(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+@timed('cache.write')
+def write_json(base: Path, obj: Any, codec: Optional[str] = None) -> Path:
+    """Store ``obj`` as compact JSON; ``base`` is the logical ``.json`` path."""
+    return write_bytes(base, dump_json(obj), codec)
+
+
+@timed('cache.write')
+def write_text(base: Path, text: str, codec: Optional[str] = None) -> Path:
+    """Store a text page, compressed with the directory's current dictionary if there is one."""
+    return write_bytes(base, text.encode('utf-8'), codec, use_dictionary=True)
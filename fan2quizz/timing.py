@@ -0,0 +1,251 @@
+"""Timing spans for the hot paths: fetch, rate-limiter waits, extract, decode, DB writes, rendering.
+
+Timing is off by default. While it is off, :func:`span` returns a shared
+no-op context manager and functions wrapped with :func:`timed` call straight
+through, so instrumented code pays one flag check per call::
+
+    from fan2quizz import timing
+
+    timing.enable()
+    with timing.span('extract'):
+        raw = bracket_scan_payload(html)
+    print(timing.format_table())
+    timing.append_record(path, timing.record('daily_report', date='2025-10-14'))
+
+Each stage keeps a call count, its total time and its *self* time. Self time
+is the total minus the time spent in spans nested inside it on the same
+thread. For example, ``fetch`` does not include the ``rate_limit`` wait it
+triggers, so the self times add up to the instrumented part of the run.
+
+Stage names used by the package:
+
+- ``rate_limit``: waits in :class:`fan2quizz.utils.RateLimiter`;
+- ``fetch``: HTTP requests; ``retry_wait``: backoff before a retry;
+- ``extract`` / ``decode``: payload cut out of the page, then JSON decoding;
+- ``parse``: quiz pages turned into questions (:mod:`fan2quizz.ingest`);
+- ``cache.read`` / ``cache.write``: the archive cache;
+- ``db.write`` / ``db.query``: :class:`fan2quizz.database.QuizDB`;
+- ``render``: report output and charts.
+
+The JSON sink is one record per line (see :func:`record`). Runs can be
+compared over time with :func:`load_records` or ``format_table(reference=...)``.
+Listeners registered with :func:`add_listener` get every finished span
+(``fn(name, seconds)``); :mod:`fan2quizz.metrics` uses them for its histograms.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+_enabled = False
+_lock = threading.Lock()
+_local = threading.local()
+_listeners: List[Callable[[str, float], None]] = []
+
+
+class Stage:
+    __slots__ = ('count', 'total', 'self_time', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.self_time = 0.0
+        self.max = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {'count': self.count, 'total': round(self.total, 6), 'self': round(self.self_time, 6),
+                'max': round(self.max, 6)}
+
+
+_stages: Dict[str, Stage] = {}
+_started = time.perf_counter()
+
+
+class _Span:
+    __slots__ = ('name', 'start', 'nested')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.nested = 0.0
+
+    def __enter__(self) -> "_Span":
+        stack = getattr(_local, 'stack', None)
+        if stack is None:
+            stack = _local.stack = []
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        elapsed = time.perf_counter() - self.start
+        stack = _local.stack
+        stack.pop()
+        if stack:
+            stack[-1].nested += elapsed
+        with _lock:
+            stage = _stages.get(self.name)
+            if stage is None:
+                stage = _stages[self.name] = Stage()
+            stage.count += 1
+            stage.total += elapsed
+            stage.self_time += elapsed - self.nested
+            if elapsed > stage.max:
+                stage.max = elapsed
+        for listener in _listeners:
+            listener(self.name, elapsed)
+        return False
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoSpan":
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def add_listener(fn: Callable[[str, float], None]):
+    """Call ``fn(name, seconds)`` for every span that ends while timing is enabled."""
+    if fn not in _listeners:
+        _listeners.append(fn)
+
+
+def remove_listener(fn: Callable[[str, float], None]):
+    if fn in _listeners:
+        _listeners.remove(fn)
+
+
+def reset():
+    """Forget the stages recorded so far and restart the wall clock."""
+    global _started
+    with _lock:
+        _stages.clear()
+        _started = time.perf_counter()
+
+
+def span(name: str):
+    """Context manager timing the enclosed block as stage ``name`` (a no-op while disabled)."""
+    if not _enabled:
+        return _NO_SPAN
+    return _Span(name)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorator timing every call of the function as stage ``name``."""
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(name):
+                return func(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+    return decorate
+
+
+def stages() -> Dict[str, Dict[str, Any]]:
+    """``{stage: {count, total, self, max}}``, slowest (by self time) first."""
+    with _lock:
+        items = sorted(_stages.items(), key=lambda kv: kv[1].self_time, reverse=True)
+        return {name: stage.as_dict() for name, stage in items}
+
+
+def wall_time() -> float:
+    return time.perf_counter() - _started
+
+
+def record(label: str, **meta: Any) -> Dict[str, Any]:
+    """A JSON-serializable snapshot of this run, for :func:`append_record`."""
+    return {
+        'label': label,
+        'at': datetime.now(UTC).isoformat(timespec='seconds'),
+        'wall': round(wall_time(), 6),
+        'meta': meta,
+        'stages': stages(),
+    }
+
+
+def append_record(path: Path, rec: Dict[str, Any]):
+    """Append ``rec`` as one JSON line to ``path``."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(rec, ensure_ascii=False, separators=(',', ':')) + "\n")
+
+
+def load_records(path: Path, label: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Records stored in ``path`` (oldest first), optionally only those with ``label``."""
+    records = []
+    try:
+        lines = Path(path).read_text(encoding='utf-8').splitlines()
+    except OSError:
+        return records
+    for line in lines:
+        try:
+            rec = json.loads(line)
+        except ValueError:
+            continue  # a truncated line from an interrupted run
+        if isinstance(rec, dict) and (label is None or rec.get('label') == label):
+            records.append(rec)
+    return records
+
+
+def _fmt(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.0f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds:.2f} s"
+
+
+def format_table(current: Optional[Dict[str, Any]] = None, reference: Optional[Dict[str, Any]] = None) -> str:
+    """Per-stage breakdown of ``current`` (default: this run), against a previous record if given."""
+    current = current or record('')
+    ref_stages = (reference or {}).get('stages', {})
+    wall = current['wall'] or 1e-9
+    header = f"{'Stage':<14}{'Calls':>7}{'Self':>11}{'Total':>11}{'Max':>11}{'% wall':>8}"
+    if reference:
+        header += f"{'Previous':>11}{'Δ':>8}"
+    lines = [header, "-" * len(header)]
+    accounted = 0.0
+    for name, st in current['stages'].items():
+        accounted += st['self']
+        line = (f"{name:<14}{st['count']:>7}{_fmt(st['self']):>11}{_fmt(st['total']):>11}"
+                f"{_fmt(st['max']):>11}{st['self'] / wall:>8.0%}")
+        if reference:
+            prev = ref_stages.get(name)
+            if prev and prev.get('self'):
+                line += f"{_fmt(prev['self']):>11}{st['self'] / prev['self'] - 1:>+8.0%}"
+            else:
+                line += f"{'--':>11}{'new':>8}"
+        lines.append(line)
+    lines.append(f"{'(other)':<14}{'':>7}{_fmt(max(0.0, wall - accounted)):>11}")
+    lines.append(f"{'wall':<14}{'':>7}{_fmt(wall):>11}")
+    return "\n".join(lines)
@@ -1,6 +1,12 @@
 # src/utils.py
 import time
 import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from .timing import span
 
 
 DEFAULT_USER_AGENT = "quizypedia-parser/0.1 (+https://example.com)"
@@ -16,13 +22,130 @@ def sleep_backoff(min_seconds=0.5, max_seconds=1.5):
 
 
 class RateLimiter:
+	"""At most one request every ``min_delay`` seconds, also when shared between threads.
+
+	Each caller reserves the next free slot under the lock and sleeps outside it,
+	so concurrent workers are spaced out instead of all firing after one wait.
+	"""
+
 	def __init__(self, min_delay: float = 0.5):
 		self.min_delay = min_delay
 		self._last = 0.0
+		self._lock = threading.Lock()
 
 	def wait(self):
-		now = time.time()
-		delta = now - self._last
-		if delta < self.min_delay:
-			time.sleep(self.min_delay - delta)
-		self._last = time.time()
\ No newline at end of file
+		with self._lock:
+			now = time.time()
+			slot = max(now, self._last + self.min_delay)
+			self._last = slot
+		if slot > now:
+			with span('rate_limit'):
+				time.sleep(slot - now)
+
+
+
+
+class RetryPolicy:
+	"""When and how long to retry an idempotent request.
+
+	Delays use exponential backoff with full jitter: attempt ``n`` (1-based) waits
+	``uniform(0, min(max_delay, base_delay * 2 ** (n - 1)))``. On 429/503 a
+	``Retry-After`` header (seconds or HTTP date) is honored instead, capped at
+	``max_retry_after``.
+	"""
+
+	RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+	def __init__(self, max_attempts: int = 4, base_delay: float = 2.0, max_delay: float = 60.0,
+				 max_retry_after: float = 120.0, retry_statuses=RETRY_STATUSES):
+		self.max_attempts = max(1, max_attempts)
+		self.base_delay = base_delay
+		self.max_delay = max_delay
+		self.max_retry_after = max_retry_after
+		self.retry_statuses = frozenset(retry_statuses)
+
+	def __repr__(self):
+		return (f"RetryPolicy(max_attempts={self.max_attempts}, base_delay={self.base_delay}, "
+				f"max_delay={self.max_delay})")
+
+	def backoff(self, attempt: int) -> float:
+		return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+	@staticmethod
+	def parse_retry_after(value: Optional[str]) -> Optional[float]:
+		"""Seconds to wait from a Retry-After header (delta-seconds or HTTP date), None if absent/invalid."""
+		if not value:
+			return None
+		value = value.strip()
+		if value.isdigit():
+			return float(value)
+		try:
+			when = parsedate_to_datetime(value)
+		except (TypeError, ValueError):
+			return None
+		if when.tzinfo is None:
+			when = when.replace(tzinfo=timezone.utc)
+		return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+	def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+		"""Seconds to sleep before attempt ``attempt + 1``."""
+		hinted = self.parse_retry_after(retry_after)
+		if hinted is not None:
+			return min(hinted, self.max_retry_after)
+		return self.backoff(attempt)
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+
+
+class CircuitOpenError(Exception):
+	"""Raised instead of sending a request while the circuit breaker is open."""
+
+	def __init__(self, retry_in: float):
+		super().__init__(f"site unavailable (circuit open), next attempt allowed in {retry_in:.0f}s")
+		self.retry_in = retry_in
+
+
+class CircuitBreaker:
+	"""Stops sending requests after ``failure_threshold`` consecutive failures.
+
+	closed -> open after the threshold; open -> half-open once ``reset_timeout``
+	seconds have passed, letting one trial request through; half-open -> closed
+	if it succeeds, back to open if it fails. Shared by threads.
+	"""
+
+	def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+		self.failure_threshold = failure_threshold
+		self.reset_timeout = reset_timeout
+		self.failures = 0
+		self.state = 'closed'
+		self._opened_at = 0.0
+		self._lock = threading.Lock()
+
+	def __repr__(self):
+		return f"CircuitBreaker(state={self.state!r}, failures={self.failures})"
+
+	def check(self):
+		"""Raise :class:`CircuitOpenError` unless a request may be sent now."""
+		with self._lock:
+			if self.state == 'closed':
+				return
+			remaining = self._opened_at + self.reset_timeout - time.monotonic()
+			if self.state == 'open' and remaining <= 0:
+				self.state = 'half-open'
+				return
+			raise CircuitOpenError(max(0.0, remaining))
+
+	def record_success(self):
+		with self._lock:
+			self.failures = 0
+			self.state = 'closed'
+
+	def record_failure(self):
+		with self._lock:
+			self.failures += 1
+			if self.state == 'half-open' or self.failures >= self.failure_threshold:
+				self.state = 'open'
+				self._opened_at = time.monotonic()
@@ -0,0 +1,186 @@
+"""Offline Wikipedia title index built from a local frwiki dump.
+
+The index is a plain UTF-8 text file with one entry per line::
+
+    <normalized key> \\t <title> \\t <redirect target or empty>
+
+Lines are sorted by the UTF-8 bytes of the key, so lookups are a binary
+search over an mmap'd file: no load step, no per-run parsing, and the OS
+page cache keeps hot regions in memory.
+"""
+
+from __future__ import annotations
+
+import gzip
+import mmap
+import os
+import unicodedata
+from pathlib import Path
+from typing import IO, Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_INDEX_PATH = Path(__file__).resolve().parents[1] / "data" / "cache" / "wiki" / "frwiki_titles.idx"
+
+
+def normalize_title(text: str) -> str:
+    """Accent-fold and case-fold a title for lookup ('Élysée_Palace' -> 'elysee palace')."""
+    text = text.replace('_', ' ')
+    decomposed = unicodedata.normalize('NFKD', text)
+    folded = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return ' '.join(folded.casefold().split())
+
+
+def _open_text(path: Path) -> IO[str]:
+    if path.suffix == '.gz':
+        return gzip.open(path, 'rt', encoding='utf-8', errors='replace')
+    return open(path, 'r', encoding='utf-8', errors='replace')
+
+
+def iter_dump_titles(path: Path) -> Iterator[str]:
+    """Yield main-namespace titles from an ``all-titles`` / ``all-titles-in-ns0`` dump.
+
+    Handles both layouts: bare ``page_title`` lines (ns0 dump) and
+    ``page_namespace<TAB>page_title`` lines (full dump, non-zero namespaces skipped).
+    """
+    with _open_text(path) as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if not line or line in ('page_title', 'page_namespace\tpage_title'):
+                continue
+            if '\t' in line:
+                ns, _, title = line.partition('\t')
+                if ns != '0':
+                    continue
+                line = title
+            yield line.replace('_', ' ')
+
+
+def iter_redirects(path: Path) -> Iterator[Tuple[str, str]]:
+    """Yield ``(source, target)`` pairs from a two-column TSV redirect export."""
+    with _open_text(path) as f:
+        for line in f:
+            parts = line.rstrip('\n').split('\t')
+            if len(parts) < 2 or not parts[0] or not parts[1]:
+                continue
+            yield parts[0].replace('_', ' '), parts[1].replace('_', ' ')
+
+
+def build_index(titles_path: Path, output_path: Path = DEFAULT_INDEX_PATH,
+                redirects_path: Optional[Path] = None) -> int:
+    """Build a sorted title index file and return the number of entries written."""
+    redirects: Dict[str, str] = {}
+    if redirects_path is not None:
+        redirects = dict(iter_redirects(redirects_path))
+
+    entries: List[Tuple[bytes, str, str]] = []
+    seen = set()
+    for title in iter_dump_titles(titles_path):
+        if title in seen:
+            continue
+        seen.add(title)
+        key = normalize_title(title)
+        if key:
+            entries.append((key.encode('utf-8'), title, redirects.get(title, '')))
+    # Redirect sources missing from the title dump are still worth resolving
+    for source, target in redirects.items():
+        if source not in seen:
+            key = normalize_title(source)
+            if key:
+                entries.append((key.encode('utf-8'), source, target))
+    entries.sort()
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_suffix(output_path.suffix + '.tmp')
+    with open(tmp_path, 'wb') as out:
+        for key, title, target in entries:
+            out.write(key + b'\t' + title.encode('utf-8') + b'\t' + target.encode('utf-8') + b'\n')
+    os.replace(tmp_path, output_path)
+    return len(entries)
+
+
+class WikiTitleIndex:
+    """Read-only view over an index file produced by :func:`build_index`."""
+
+    def __init__(self, path: Path = DEFAULT_INDEX_PATH):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+
+    @classmethod
+    def open_default(cls) -> Optional["WikiTitleIndex"]:
+        """Return the index at the default location, or None if it was never built."""
+        if DEFAULT_INDEX_PATH.is_file():
+            return cls(DEFAULT_INDEX_PATH)
+        return None
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+        self._file.close()
+
+    def _lower_bound(self, key: bytes) -> int:
+        """Byte offset of the first line whose key is >= ``key``."""
+        mm = self._mm
+        lo, hi = 0, len(mm)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = mm.rfind(b'\n', 0, mid) + 1
+            tab = mm.find(b'\t', start)
+            if mm[start:tab] < key:
+                lo = mm.find(b'\n', mid) + 1
+                if lo == 0:
+                    return len(mm)
+            else:
+                hi = start
+        return lo
+
+    def _iter_from(self, offset: int) -> Iterator[Tuple[str, str, str]]:
+        mm = self._mm
+        while offset < len(mm):
+            end = mm.find(b'\n', offset)
+            if end == -1:
+                end = len(mm)
+            key, title, target = mm[offset:end].decode('utf-8').split('\t')
+            yield key, title, target
+            offset = end + 1
+
+    def lookup(self, query: str) -> List[Tuple[str, str]]:
+        """Return ``(title, redirect_target)`` pairs whose normalized key equals the query's."""
+        if self._mm is None:
+            return []
+        key = normalize_title(query)
+        matches = []
+        for entry_key, title, target in self._iter_from(self._lower_bound(key.encode('utf-8'))):
+            if entry_key != key:
+                break
+            matches.append((title, target))
+        return matches
+
+    def prefix_search(self, prefix: str, limit: int = 10) -> List[str]:
+        """Return up to ``limit`` titles whose normalized key starts with the normalized prefix."""
+        if self._mm is None:
+            return []
+        key = normalize_title(prefix)
+        results = []
+        for entry_key, title, target in self._iter_from(self._lower_bound(key.encode('utf-8'))):
+            if not entry_key.startswith(key) or len(results) >= limit:
+                break
+            results.append(target or title)
+        return results
+
+    def resolve(self, query: str) -> Optional[str]:
+        """Resolve a free-text answer to a canonical article title.
+
+        Exact (normalized) matches win, preferring the exact-case spelling;
+        redirects are followed once. Falls back to the first prefix match.
+        An empty answer resolves to nothing (every title would match it).
+        """
+        if not normalize_title(query):
+            return None
+        matches = self.lookup(query)
+        if matches:
+            wanted = query.strip().replace('_', ' ')
+            title, target = next((m for m in matches if m[0] == wanted), matches[0])
+            return target or title
+        prefixed = self.prefix_search(query, limit=1)
+        return prefixed[0] if prefixed else None
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Build the offline Wikipedia title index used by the mistake reports.
+
+Download a titles dump once (e.g. https://dumps.wikimedia.org/frwiki/latest/frwiki-latest-all-titles-in-ns0.gz)
+and turn it into a sorted, mmap-friendly index. `mistakes_with_wikipedia.py`
+picks the index up automatically and resolves links without any network access.
+
+Usage:
+    uv run scripts/build_wiki_index.py --titles ~/Downloads/frwiki-latest-all-titles-in-ns0.gz
+    uv run scripts/build_wiki_index.py --titles titles.gz --redirects redirects.tsv
+    uv run scripts/build_wiki_index.py --lookup "Pierre Loti"          # Query an existing index
+    uv run scripts/build_wiki_index.py --prefix "rosa bon"
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from fan2quizz.wikiindex import DEFAULT_INDEX_PATH, WikiTitleIndex, build_index  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build or query the offline Wikipedia title index",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--titles', type=Path,
+                        help='all-titles or all-titles-in-ns0 dump (plain or .gz)')
+    parser.add_argument('--redirects', type=Path,
+                        help='Optional TSV of "source<TAB>target" redirects')
+    parser.add_argument('--output', '-o', type=Path, default=DEFAULT_INDEX_PATH,
+                        help=f'Index file path (default: {DEFAULT_INDEX_PATH.relative_to(ROOT)})')
+    parser.add_argument('--lookup', help='Resolve a query against the index')
+    parser.add_argument('--prefix', help='List titles starting with a prefix')
+    args = parser.parse_args()
+
+    if args.titles:
+        if not args.titles.is_file():
+            print(f"❌ Dump not found: {args.titles}")
+            return 1
+        print(f"📖 Reading {args.titles}...")
+        start = time.perf_counter()
+        count = build_index(args.titles, args.output, args.redirects)
+        elapsed = time.perf_counter() - start
+        size_mb = args.output.stat().st_size / 1_000_000
+        print(f"✅ Indexed {count:,} titles in {elapsed:.1f}s → {args.output} ({size_mb:.1f} MB)")
+
+    if args.lookup or args.prefix:
+        if not args.output.is_file():
+            print(f"❌ No index at {args.output}. Build it first with --titles.")
+            return 1
+        index = WikiTitleIndex(args.output)
+        try:
+            if args.lookup:
+                start = time.perf_counter()
+                title = index.resolve(args.lookup)
+                elapsed_us = (time.perf_counter() - start) * 1_000_000
+                print(f"🔎 {args.lookup!r} → {title!r} ({elapsed_us:.0f} µs)")
+            if args.prefix:
+                for title in index.prefix_search(args.prefix, limit=20):
+                    print(f"  • {title}")
+        finally:
+            index.close()
+
+    if not (args.titles or args.lookup or args.prefix):
+        parser.print_help()
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
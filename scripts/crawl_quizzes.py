@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Discover every category and quiz of the site through a resumable crawl frontier.
+
+The crawl state lives in data/db/frontier.db (see fan2quizz.frontier): every
+URL with its kind, status and fetch time. Quizzes listed in several categories
+are fetched once, an interrupted crawl (Ctrl-C, crash) resumes where it stopped
+on the next run, and --incremental only walks the newest listing pages.
+
+Usage:
+    uv run scripts/crawl_quizzes.py                     # Full crawl (or resume an interrupted one)
+    uv run scripts/crawl_quizzes.py --incremental       # Only what was published since the last crawl
+    uv run scripts/crawl_quizzes.py --fetch-quizzes     # Also download quiz pages to data/cache/quizzes/
+    uv run scripts/crawl_quizzes.py --status            # Frontier counts, no request
+"""
+import sys
+import argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+DEFAULT_DB = ROOT / "data" / "db" / "frontier.db"
+QUIZ_CACHE_DIR = ROOT / "data" / "cache" / "quizzes"
+
+from fan2quizz import metrics, storage, timing
+from fan2quizz.frontier import Crawler, Frontier
+from fan2quizz.scraper import QuizypediaScraper
+from fan2quizz.utils import CircuitBreaker, CircuitOpenError, RateLimiter
+
+
+def print_status(frontier):
+    """Print the frontier counts per kind and status."""
+    stats = frontier.stats()
+    print(f"\n📊 Frontier {frontier.path}")
+    print(f"{'':<10}{'pending':>10}{'running':>10}{'done':>10}{'failed':>10}")
+    for kind, counts in stats.items():
+        print(f"{kind:<10}{counts['pending']:>10}{counts['in_progress']:>10}{counts['done']:>10}{counts['failed']:>10}")
+    failures = frontier.failures(5)
+    if failures:
+        print("\n❌ Given up on:")
+        for url, attempts, error in failures:
+            print(f"   {url} ({attempts} attempts): {error}")
+
+
+def save_quiz(url, html):
+    """Store a quiz page as data/cache/quizzes/<slug>.html (compressed like the other caches)."""
+    slug = url.strip('/').rsplit('/', 1)[-1]
+    storage.write_text(QUIZ_CACHE_DIR / f"{slug}.html", html)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Crawl categories and quizzes through a resumable frontier",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # First crawl, 4 workers sharing one rate limit
+  uv run scripts/crawl_quizzes.py --workers 4
+
+  # Daily: only the quizzes published since the last crawl
+  uv run scripts/crawl_quizzes.py --incremental --fetch-quizzes
+
+  # Walk every listing again (e.g. after changing the link extraction)
+  uv run scripts/crawl_quizzes.py --recrawl
+        """
+    )
+    parser.add_argument('--db', type=Path, default=DEFAULT_DB, help=f'Frontier database (default: {DEFAULT_DB.relative_to(ROOT)})')
+    parser.add_argument('--workers', type=int, default=4, help='Worker threads (default: 4)')
+    parser.add_argument('--delay', type=float, default=0.7,
+                        help='Seconds between requests, shared by all workers (default: 0.7)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Re-check page 1 of each category and follow pages only while they list new quizzes')
+    parser.add_argument('--recrawl', action='store_true', help='Queue the homepage and every listing page again')
+    parser.add_argument('--fetch-quizzes', action='store_true',
+                        help=f'Download pending quiz pages to {QUIZ_CACHE_DIR.relative_to(ROOT)}/')
+    parser.add_argument('--max-attempts', type=int, default=3, help='Give up on a page after this many failed runs')
+    parser.add_argument('--status', action='store_true', help='Print the frontier counts and exit')
+    parser.add_argument('--timings', action='store_true', help='Print the time spent per stage')
+    parser.add_argument('--metrics-dir', metavar='DIR',
+                        help='Write Prometheus metrics (node_exporter textfile) to DIR (default: $FAN2QUIZZ_METRICS_DIR)')
+    args = parser.parse_args()
+
+    with Frontier(str(args.db), max_attempts=args.max_attempts) as frontier:
+        if args.status:
+            print_status(frontier)
+            return 0
+        if args.recrawl:
+            frontier.requeue('home')
+            frontier.requeue('listing')
+
+        if args.timings:
+            timing.reset()
+            timing.enable()
+        metrics_dir = metrics.metrics_dir(args.metrics_dir)
+        if metrics_dir is not None:
+            metrics.enable()
+
+        limiter = RateLimiter(args.delay)
+        breaker = CircuitBreaker()
+        crawler = Crawler(
+            frontier,
+            lambda: QuizypediaScraper(rate_limiter=limiter, breaker=breaker),
+            workers=args.workers,
+            incremental=args.incremental,
+            fetch_quizzes=args.fetch_quizzes,
+            on_quiz=save_quiz,
+        )
+        mode = "incremental" if args.incremental else "full"
+        print(f"🕷️  {mode} crawl, {args.workers} workers, {args.delay:g}s between requests")
+        code = 0
+        try:
+            crawler.run()
+        except KeyboardInterrupt:
+            print("\n⏸️  Interrupted; run again to resume")
+            code = 130
+        except CircuitOpenError as e:
+            print(f"\n🛑 {e}; run again later to resume")
+            code = 1
+
+        counts = crawler.counts
+        print(f"\n✅ {counts['listings']} listing pages, {counts['quizzes_found']} new quizzes"
+              + (f", {counts['quizzes_fetched']} quiz pages saved" if args.fetch_quizzes else "")
+              + (f", {counts['failed']} given up" if counts['failed'] else ""))
+        print_status(frontier)
+
+        timing.disable()
+        if metrics_dir is not None:
+            path = metrics.write_textfile(metrics_dir, 'crawl_quizzes', success=code == 0 and not counts['failed'])
+            print(f"📈 Metrics written to {path}")
+        if args.timings:
+            print("\n⏱️  Time per stage:")
+            print(timing.format_table(timing.record('crawl_quizzes', **counts)))
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,13 +13,25 @@ Usage examples:
   uv run scripts/daily_report.py 2025-10-14
   uv run scripts/daily_report.py 2025-10-14 --no-cache --refresh
   uv run scripts/daily_report.py --fun          # emojis + genz (default if no flags)
+  uv run scripts/daily_report.py --ratings      # + Glicko ratings of selected players
+  uv run scripts/daily_report.py --timings      # + time spent per stage (fetch, decode, DB, render...)
+  uv run scripts/daily_report.py --timings --timings-json data/results/timings.jsonl   # keep history
+
+Daemon mode (DB, players.json, parsed archives and imports stay warm):
+  uv run scripts/daily_report.py --serve &      # start once
+  uv run scripts/daily_report.py --client 2025-10-14 --ratings   # answered by the daemon
+  uv run scripts/daily_report.py --stop-server
+
+Live mode (only new/changed leaderboard rows, adaptive polling interval):
+  uv run scripts/daily_report.py --watch        # today, until Ctrl+C
 """
 
 from __future__ import annotations
 
+import os
 import sys
 import json
-import re
+import hashlib
 import random
 import statistics
 import argparse
@@ -35,6 +47,8 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from fan2quizz.leaderboard import bracket_scan_payload, parse_results  # type: ignore  # noqa: E402
+
 
 # ---------------- Configuration ---------------- #
 DB_PATH = ROOT / "data" / "db" / "quizypedia.db"
@@ -105,33 +119,6 @@ def validate_date(date_str: str) -> str:
     return date_str
 
 
-def bracket_scan_payload(html: str) -> Optional[str]:
-    marker = '[{"good_responses"'
-    start = html.find(marker)
-    if start == -1:
-        return None
-    depth = 0
-    for i, ch in enumerate(html[start:], start=start):
-        if ch == '[':
-            depth += 1
-        elif ch == ']':
-            depth -= 1
-            if depth == 0:
-                return html[start:i+1]
-    return None
-
-
-def parse_results(raw_payload: str) -> List[Dict[str, Any]]:
-    cleaned = raw_payload.strip()
-    if cleaned.endswith(';'):
-        cleaned = cleaned[:-1]
-    try:
-        return json.loads(cleaned)
-    except json.JSONDecodeError:
-        cleaned2 = re.sub(r"//.*?\n", "\n", cleaned)
-        return json.loads(cleaned2)
-
-
 def mmss(seconds: Optional[int]) -> str:
     if seconds is None:
         return ''
@@ -379,6 +366,34 @@ def summarize_distribution(results: List[Dict[str, Any]]):
         print("Durées : aucune entrée numérique")
 
 
+def print_selected_ratings(date_str: str):
+    """Show Glicko ratings (computed over every archived leaderboard) for selected players."""
+    if STATE is not None:
+        book = STATE.rating_book()
+    else:
+        from fan2quizz.ratings import RatingBook  # type: ignore
+        book = RatingBook.open(CACHE_DIR, CACHE_DIR.parent / "derived" / "ratings.json")
+    rows = []
+    for name in SELECTED_PLAYERS:
+        player = book.get(name)
+        if player is None:
+            continue
+        today = player.last_delta if player.last_date == date_str else None
+        rows.append((book.position(name), player, today))
+    if not rows:
+        print("\nClassement Elo : aucun joueur sélectionné dans les archives.")
+        return
+    rows.sort(key=lambda r: r[1].conservative, reverse=True)
+    print(f"\nClassement Elo (Glicko, {len(book.players)} joueurs, archives jusqu'au {book.last_date}) :")
+    print(f"{'POS':>5} {'JOUEUR':<17} {'NOM':<10} {'ELO':>6} {'±RD':>5} {'Δ JOUR':>7} {'PIC':>6} {'PARTIES':>8}")
+    print('-'*72)
+    for pos, player, today in rows:
+        delta = f"{today:+.0f}" if today is not None else ''
+        real_name = REAL_NAME_MAP.get(player.name.lower()) or ''
+        print(f"{pos:>5} {player.name:<17} {real_name:<10} {player.rating:>6.0f} {player.rd:>5.0f} "
+              f"{delta:>7} {player.peak:>6.0f} {player.games:>8}")
+
+
 def show_local_leaderboard(db, date_str: str):
     quiz_id=db.get_daily_quiz(date_str)
     if quiz_id is None:
@@ -406,8 +421,47 @@ def show_local_leaderboard(db, date_str: str):
 def cache_path_for(date_str: str) -> Path: return CACHE_DIR / f"{date_str}.json"
 
 
+def live_log_path(date_str: str) -> Path:
+    return CACHE_DIR.parent / "live" / f"{date_str}.jsonl"
+
+
+def save_archive_cache(cp: Path, date_str: str, results: List[Dict[str, Any]]) -> Path:
+    """Write the archive cache (compressed, see fan2quizz.storage) and index it in the manifest; returns the file written."""
+    from fan2quizz.manifest import save_archive  # type: ignore
+    return save_archive(cp, {
+        'date': date_str,
+        'fetched_at': datetime.now(UTC).isoformat(),
+        'count': len(results),
+        'results': results
+    })
+
+
+def record_snapshot(date_str: str, results: List[Dict[str, Any]], cp: Path) -> str:
+    """Append a freshly fetched leaderboard to the day's snapshot log.
+
+    The first time, the cached copy about to be overwritten is recorded
+    first, so the earlier state of the day is kept.
+    """
+    from fan2quizz import storage  # type: ignore
+    from fan2quizz.snapshots import SnapshotLog  # type: ignore
+    snapshots = SnapshotLog(live_log_path(date_str))
+    stored = storage.find(cp)
+    if not len(snapshots) and stored is not None:
+        try:
+            previous = storage.read_json(stored)
+            fetched_at = datetime.fromisoformat(previous['fetched_at'].rstrip('Z'))
+            snapshots.append(previous['results'], timestamp=int(fetched_at.timestamp()))
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            log(f"[SNAP] Ancien cache ignoré ({e})")
+    kind = snapshots.append(results)
+    log(f"[SNAP] Historique du jour: {kind} ({len(snapshots)} instantanés, "
+        f"{snapshots.disk_bytes() / 1024:.1f} Ko) -> {snapshots.path}")
+    return kind
+
+
 def fetch_daily_results(scraper, date_str: str, *, use_cache: bool=True, refresh: bool=False) -> Optional[Tuple[List[Dict[str,Any]], bool]]:
     """Return (results, from_cache). Adds detailed logging for cache/network lifecycle."""
+    from fan2quizz import metrics, storage  # type: ignore
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
     cp = cache_path_for(date_str)
 
@@ -425,11 +479,11 @@ def fetch_daily_results(scraper, date_str: str, *, use_cache: bool=True, refresh
 
     # Attempt cache read
     if use_cache and not refresh:
-        if cp.is_file():
-            log(f"[CACHE] Lecture du fichier: {cp}")
+        stored = storage.find(cp)
+        if stored is not None:
+            log(f"[CACHE] Lecture du fichier: {stored}")
             try:
-                raw = cp.read_text(encoding='utf-8')
-                data = json.loads(raw)
+                data = STATE.archive(stored) if STATE is not None else storage.read_json(stored)
                 if isinstance(data, dict) and isinstance(data.get('results'), list):
                     fetched_at = data.get('fetched_at')
                     age_txt = "âge inconnu"
@@ -441,6 +495,7 @@ def fetch_daily_results(scraper, date_str: str, *, use_cache: bool=True, refresh
                         except Exception:
                             pass
                     log(f"[CACHE] Succès (entries={len(data['results'])}, âge={age_txt})")
+                    metrics.inc('fan2quizz_cache_requests_total', cache='archive', result='hit')
                     return data['results'], True
                 else:
                     log("[CACHE] Structure inattendue, ignorée.")
@@ -452,6 +507,9 @@ def fetch_daily_results(scraper, date_str: str, *, use_cache: bool=True, refresh
     if refresh:
         log(f"[CACHE] --refresh demandé: on ignore le cache existant pour {date_str}")
 
+    if use_cache:
+        metrics.inc('fan2quizz_cache_requests_total', cache='archive', result='miss')
+
     # Network fetch
     y, m, d = map(int, date_str.split('-'))
     log("[FETCH] Téléchargement de la page d'archive distante…")
@@ -460,6 +518,7 @@ def fetch_daily_results(scraper, date_str: str, *, use_cache: bool=True, refresh
         log(f"[FETCH] Réception OK (taille HTML={len(html)} octets)")
     except Exception as e:
         eprint(f"[FETCH] Échec téléchargement: {e}")
+        metrics.inc('fan2quizz_failures_total', stage='fetch')
         return None
 
     # Payload extraction
@@ -467,6 +526,7 @@ def fetch_daily_results(scraper, date_str: str, *, use_cache: bool=True, refresh
     raw = bracket_scan_payload(html)
     if not raw:
         eprint("[PARSE] Aucune payload détectée.")
+        metrics.inc('fan2quizz_failures_total', stage='extract')
         return None
     log(f"[PARSE] Segment brut détecté (longueur={len(raw)} caractères)")
 
@@ -476,6 +536,7 @@ def fetch_daily_results(scraper, date_str: str, *, use_cache: bool=True, refresh
         log(f"[PARSE] Décodage JSON OK ({len(results)} enregistrements)")
     except Exception as e:
         eprint(f"[PARSE] Échec décodage JSON: {e}")
+        metrics.inc('fan2quizz_failures_total', stage='decode')
         return None
 
     # Cache write
@@ -485,22 +546,16 @@ def fetch_daily_results(scraper, date_str: str, *, use_cache: bool=True, refresh
         else:
             log("[SAVE] Écriture du cache (nouvelle entrée)…")
         try:
-            cp.write_text(
-                json.dumps(
-                    {
-                        'date': date_str,
-                        'fetched_at': datetime.now(UTC).isoformat(),
-                        'count': len(results),
-                        'results': results
-                    },
-                    ensure_ascii=False,
-                    indent=2
-                ),
-                encoding='utf-8'
-            )
-            log(f"[SAVE] OK -> {cp}")
+            record_snapshot(date_str, results, cp)
+        except OSError as e:
+            eprint(f"[SNAP] Échec écriture historique: {e}")
+            metrics.inc('fan2quizz_failures_total', stage='snapshot')
+        try:
+            written = save_archive_cache(cp, date_str, results)
+            log(f"[SAVE] OK -> {written} ({written.stat().st_size} octets)")
         except Exception as e:
             eprint(f"[SAVE] Échec écriture cache: {e}")
+            metrics.inc('fan2quizz_failures_total', stage='cache.write')
 
     return results, False
 
@@ -531,16 +586,7 @@ def create_category_difficulty_radar(date_str: str, quiz_html_path: Optional[Pat
     # Replace difficulty scores by raw counts of questions per category.
     # We attempt to parse the daily quiz HTML (DC_DATA) and count main_category_id occurrences.
     # Mapping main_category_id -> canonical category label.
-    CAT_ID_NAME = {
-        1: "Culture classique",
-        2: "Culture moderne",
-        3: "Culture générale",
-        4: "Géographie",
-        5: "Histoire",
-        6: "Animaux et plantes",
-        7: "Sciences et techniques",
-        8: "Sport",
-    }
+    from fan2quizz.categories import CAT_ID_NAME  # type: ignore
 
     # Initialize counts
     category_counts: Dict[str, int] = {name: 0 for name in CAT_ID_NAME.values()}
@@ -664,7 +710,7 @@ def create_category_difficulty_radar(date_str: str, quiz_html_path: Optional[Pat
     # Save / show
     if output_path is None:
         FIGURES_DIR.mkdir(parents=True, exist_ok=True)
-        output_path = FIGURES_DIR / f"category_difficulty_{date_str}.png"
+        output_path = radar_output_path(date_str)
 
     plt.tight_layout(pad=2.0)
     if show:
@@ -680,38 +726,148 @@ def create_category_difficulty_radar(date_str: str, quiz_html_path: Optional[Pat
         plt.close(fig)
 
 
+def radar_output_path(date_str: str) -> Path:
+    return FIGURES_DIR / f"category_difficulty_{date_str}.png"
+
+
+def radar_fingerprint(date_str: str) -> str:
+    """Fingerprint of the radar inputs (date, quiz HTML, plotting code) for the figure cache."""
+    from fan2quizz.derived import fingerprint  # type: ignore
+    from fan2quizz.render import source_digest  # type: ignore
+    html_path = ROOT / 'data' / 'html' / 'defi_du_jour_debug.html'
+    html_digest = hashlib.sha256(html_path.read_bytes()).hexdigest() if html_path.is_file() else None
+    return fingerprint('radar', date_str, html_digest, source_digest(create_category_difficulty_radar))
+
+
 def run_daily(date_str: str, *, use_cache: bool, refresh: bool, generate_radar: bool = False, 
-              show_radar: bool = False) -> int:
+              show_radar: bool = False, show_ratings: bool = False, force_figures: bool = False) -> int:
     from fan2quizz.database import QuizDB  # type: ignore
     from fan2quizz.scraper import QuizypediaScraper  # type: ignore
     from fan2quizz.utils import RateLimiter  # type: ignore
+    from fan2quizz import timing  # type: ignore
     print(f"== Rapport quotidien du quiz pour {date_str} ==")
-    db = QuizDB(str(DB_PATH))
+    # The radar only depends on the quiz HTML: render it in a side process while the report runs
+    background = None
+    pending_radar = None
+    radar_cached = False
+    if generate_radar and not show_radar:
+        from fan2quizz.render import BackgroundRenderer, RenderJob, is_fresh  # type: ignore
+        radar_path = radar_output_path(date_str)
+        radar_fp = radar_fingerprint(date_str)
+        if not force_figures and is_fresh(radar_path, radar_fp):
+            radar_cached = True
+        else:
+            FIGURES_DIR.mkdir(parents=True, exist_ok=True)
+            background = BackgroundRenderer()
+            pending_radar = background.submit(RenderJob('radar', create_category_difficulty_radar,
+                                                        {'date_str': date_str, 'output_path': radar_path},
+                                                        radar_path, radar_fp))
+    db = STATE.db if STATE is not None else QuizDB(str(DB_PATH))
     show_local_leaderboard(db, date_str)
     print("\nRécupération de la page d'archive publique...")
-    scraper = QuizypediaScraper(rate_limiter=RateLimiter(RATE_LIMIT_SECONDS))
+    scraper = STATE.scraper if STATE is not None else QuizypediaScraper(rate_limiter=RateLimiter(RATE_LIMIT_SECONDS))
     fetched = fetch_daily_results(scraper, date_str, use_cache=use_cache, refresh=refresh)
     if fetched is None:
         print("Aucun résultat disponible pour cette date.")
+        if background is not None:
+            background.close()
         return 0
     results, from_cache = fetched
     # Source line now redundant since detailed logs exist, but keep brief summary:
     print("Source finale : " + ("cache" if from_cache else "réseau"))
     print(f"Analyse de {len(results)} entrées.")
-    print("\nStatistiques de distribution :")
-    summarize_distribution(results)
-    print_selected_players(results)
+    with timing.span('render'):
+        print("\nStatistiques de distribution :")
+        summarize_distribution(results)
+        print_selected_players(results)
+        if show_ratings:
+            print_selected_ratings(date_str)
     
     # Generate category difficulty radar chart if requested
-    if generate_radar:
+    if radar_cached:
+        log(f"[RADAR] Graphique déjà à jour: {radar_output_path(date_str)} (--force pour le redessiner)")
+    elif pending_radar is not None:
+        from fan2quizz.render import write_manifest  # type: ignore
+        print("\n📊 Génération du graphique radar de difficulté par catégorie (arrière-plan)...")
+        with timing.span('render'):
+            radar = pending_radar.result()
+        background.close()
+        if radar.ok:
+            write_manifest(radar_output_path(date_str), radar_fingerprint(date_str), radar.seconds)
+            log(f"[RADAR] Rendu en {radar.seconds:.2f}s")
+        else:
+            print("⚠️  Impossible de générer le graphique radar." + (f" ({radar.error})" if radar.error else ""))
+    elif generate_radar:
         print("\n📊 Génération du graphique radar de difficulté par catégorie...")
-        success = create_category_difficulty_radar(date_str, show=show_radar)
+        with timing.span('render'):
+            success = create_category_difficulty_radar(date_str, show=show_radar)
         if not success:
             print("⚠️  Impossible de générer le graphique radar.")
     
     return 0
 
 
+def format_live_row(row: Dict[str, Any], old: Optional[Dict[str, Any]] = None) -> str:
+    uname = row.get('user') or row.get('player') or '?'
+    star = '★ ' if uname.lower() in {p.lower() for p in SELECTED_PLAYERS} else ''
+    score = f"{row.get('good_responses')}/{QUIZ_TOTAL_FALLBACK}"
+    elapsed = mmss(row.get('elapsed_time'))
+    if old is not None:
+        if old.get('good_responses') != row.get('good_responses'):
+            score = f"{old.get('good_responses')} → {score}"
+        if old.get('elapsed_time') != row.get('elapsed_time'):
+            elapsed = f"{mmss(old.get('elapsed_time'))} → {elapsed}"
+    return f"{star}{uname}: {score} en {elapsed} (rang {row.get('rank', '?')})"
+
+
+def watch_leaderboard(date_str: str, *, min_interval: float, max_interval: float,
+                      duration: Optional[float] = None, use_cache: bool = True) -> int:
+    """Poll the live leaderboard and print only new or changed rows until Ctrl+C / ``duration`` minutes."""
+    import time
+    from fan2quizz.leaderboard import LeaderboardPoller  # type: ignore
+    from fan2quizz.scraper import QuizypediaScraper  # type: ignore
+    from fan2quizz.snapshots import SnapshotLog  # type: ignore
+    from fan2quizz.utils import RateLimiter  # type: ignore
+    if min_interval <= 0 or max_interval < min_interval:
+        eprint(f"[LIVE] Intervalles invalides: --interval {min_interval:g}, --max-interval {max_interval:g} "
+               "(il faut 0 < --interval <= --max-interval)")
+        return 2
+    scraper = QuizypediaScraper(rate_limiter=RateLimiter(RATE_LIMIT_SECONDS))
+    snapshots = SnapshotLog(live_log_path(date_str)) if use_cache else None
+    poller = LeaderboardPoller(scraper, date_str, min_interval=min_interval,
+                               max_interval=max_interval, snapshots=snapshots)
+    until = time.time() + duration * 60 if duration else None
+    print(f"== Classement en direct pour {date_str} (Ctrl+C pour arrêter) ==")
+    if poller.rows:
+        log(f"[LIVE] Reprise depuis {snapshots.path} ({len(poller.rows)} entrées)")
+    changes = 0
+    try:
+        for result in poller.watch(until=until):
+            if result.status == 'error':
+                eprint(f"[LIVE] Échec: {result.error} (nouvel essai dans {result.interval:.0f}s)")
+                continue
+            if not result.changed:
+                log(f"[LIVE] Pas de changement ({result.status}), prochain passage dans {result.interval:.0f}s")
+                continue
+            changes += 1
+            diff = result.diff
+            log(f"[LIVE] {len(result.rows)} entrées: +{len(diff.added)} nouvelles, "
+                f"{len(diff.changed)} modifiées, {len(diff.removed)} retirées")
+            for row in diff.added:
+                print(f"  + {format_live_row(row)}")
+            for old, row in diff.changed:
+                print(f"  ~ {format_live_row(row, old)}")
+            for row in diff.removed:
+                print(f"  - {row.get('user') or row.get('player') or '?'}")
+            if use_cache:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                save_archive_cache(cache_path_for(date_str), date_str, result.rows)
+    except KeyboardInterrupt:
+        print()
+    log(f"[LIVE] Fin: {poller.polls} requêtes, {poller.parses} décodages, {changes} mises à jour")
+    return 0
+
+
 def slack_table(rows: List[Dict[str, Any]]) -> str:
     """
     Build a Slack-friendly monospaced table (ASCII pipes) wrapped in triple backticks.
@@ -899,6 +1055,194 @@ def copy_table_clipboard(rows: List[Dict[str, Any]], *, slack: bool = False):
     log("[CLIPBOARD] Table copiée dans le presse-papiers." + (" (Slack)" if slack else ""))
 
 
+# ---------------- Daemon mode ---------------- #
+# Module globals a request may change (--cache-dir, display toggles) and that
+# must not leak into the next request served by the same process.
+REQUEST_GLOBALS = ('CACHE_DIR', 'EMOJIS_ENABLED', 'GENZ_ENABLED', 'GENZ_EN_ENABLED', 'KIND_ENABLED')
+# Options that only make sense in the client's own process
+CLIENT_ONLY_FLAGS = ('--client', '--serve', '--stop-server')
+
+
+class DaemonState:
+    """Everything a `--serve` daemon keeps warm between report requests.
+
+    Archives, players.json and ratings are revalidated by size/mtime on every
+    request, so the daemon never serves stale data; it only skips re-reading
+    what has not changed.
+    """
+
+    def __init__(self):
+        from fan2quizz.database import QuizDB  # type: ignore
+        from fan2quizz.scraper import QuizypediaScraper  # type: ignore
+        from fan2quizz.utils import RateLimiter  # type: ignore
+        self.db = QuizDB(str(DB_PATH))
+        self.scraper = QuizypediaScraper(rate_limiter=RateLimiter(RATE_LIMIT_SECONDS))
+        self.archives: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        self.players_source: Optional[Tuple[int, int]] = None
+        self.ratings = None
+        self.ratings_dir: Optional[Path] = None
+        self.requests = 0
+
+    def warm_up(self):
+        """Import the heavy optional modules and load the ratings once."""
+        try:
+            import matplotlib  # type: ignore
+            matplotlib.use('Agg')
+            import matplotlib.pyplot  # type: ignore  # noqa: F401
+        except ImportError:
+            pass
+        import fan2quizz.render  # type: ignore  # noqa: F401
+        self.refresh_players()
+        if CACHE_DIR.is_dir():
+            self.rating_book()
+
+    @staticmethod
+    def _source(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def refresh_players(self):
+        global SELECTED_PLAYERS, REAL_NAME_MAP
+        source = self._source(PLAYERS_CONFIG_PATH)
+        if source != self.players_source:
+            SELECTED_PLAYERS, REAL_NAME_MAP = load_players_config()
+            self.players_source = source
+
+    def archive(self, path: Path) -> Dict[str, Any]:
+        """Parsed archive JSON, re-read only when the file changed."""
+        source = self._source(path)
+        cached = self.archives.get(path)
+        if cached is not None and cached[0] == source:
+            return cached[1]
+        from fan2quizz import storage  # type: ignore
+        data = storage.read_json(path)
+        self.archives[path] = (source, data)
+        return data
+
+    def rating_book(self):
+        """Ratings folded up to the newest archive (incremental: only new days are processed)."""
+        from fan2quizz.ratings import RatingBook  # type: ignore
+        if self.ratings is None or self.ratings_dir != CACHE_DIR:
+            self.ratings = RatingBook(CACHE_DIR.parent / "derived" / "ratings.json")
+            self.ratings.load()
+            self.ratings_dir = CACHE_DIR
+        if self.ratings.update(CACHE_DIR):
+            self.ratings.save()
+        return self.ratings
+
+
+STATE: Optional[DaemonState] = None
+
+
+def default_socket_path() -> Path:
+    from fan2quizz.daemon import default_socket_path as _default  # type: ignore
+    return _default('daily-report')
+
+
+def handle_daemon_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one report inside the daemon with its output captured."""
+    global LAST_SELECTED_ROWS
+    from fan2quizz.daemon import captured  # type: ignore
+    if request.get('cmd') == 'stop':
+        return {'code': 0, 'stdout': "[DAEMON] Arrêt demandé.\n", 'stderr': '', 'stop': True}
+
+    start = datetime.now()
+    saved = {name: globals()[name] for name in REQUEST_GLOBALS}
+    cwd = os.getcwd()
+
+    def one_report() -> int:
+        try:
+            args = build_arg_parser().parse_args(request.get('argv', []))
+            if args.show_radar:
+                eprint("--show-radar n'est pas disponible via le démon.")
+                return 2
+            return run_report(args)
+        except SystemExit as e:  # argparse errors, --help, invalid date
+            if isinstance(e.code, str):
+                eprint(e.code)
+                return 1
+            return e.code or 0
+        except Exception as e:
+            eprint(f"[DAEMON] Erreur: {e!r}")
+            return 1
+
+    try:
+        os.chdir(request.get('cwd') or cwd)
+        LAST_SELECTED_ROWS = []
+        STATE.refresh_players()
+        code, out, err = captured(one_report)
+    finally:
+        globals().update(saved)
+        os.chdir(cwd)
+    STATE.requests += 1
+    elapsed_ms = (datetime.now() - start).total_seconds() * 1000
+    log(f"[DAEMON] Requête #{STATE.requests} {' '.join(request.get('argv', []))!r} -> {code} ({elapsed_ms:.0f} ms)")
+    return {'code': code, 'stdout': out, 'stderr': err}
+
+
+def serve_daemon(socket_path: Path) -> int:
+    global STATE
+    from fan2quizz.daemon import serve  # type: ignore
+    start = datetime.now()
+    log("[DAEMON] Préchargement (base, joueurs, imports, classement Elo)…")
+    STATE = DaemonState()
+    STATE.warm_up()
+    warm_s = (datetime.now() - start).total_seconds()
+    try:
+        serve(socket_path, handle_daemon_request,
+              on_ready=lambda: log(f"[DAEMON] Prêt en {warm_s:.2f}s, écoute sur {socket_path} (Ctrl+C pour arrêter)"))
+    except OSError as e:
+        eprint(f"[DAEMON] {e}")
+        return 1
+    finally:
+        STATE.db.close()
+        STATE = None
+    log("[DAEMON] Arrêté.")
+    return 0
+
+
+def stop_daemon(socket_path: Path) -> int:
+    from fan2quizz.daemon import DaemonUnavailable, call  # type: ignore
+    try:
+        response = call(socket_path, {'cmd': 'stop'})
+    except DaemonUnavailable:
+        eprint(f"Aucun démon sur {socket_path}")
+        return 1
+    sys.stdout.write(response.get('stdout', ''))
+    return response.get('code', 0)
+
+
+def run_client(socket_path: Path, argv: List[str], args: argparse.Namespace) -> Optional[int]:
+    """Have the daemon render the report; None means "run it locally instead"."""
+    from fan2quizz.daemon import DaemonUnavailable, call  # type: ignore
+    if args.show_radar:
+        eprint("[CLIENT] --show-radar nécessite un affichage local: exécution sans le démon.")
+        return None
+    forwarded = []
+    skip = False
+    for arg in argv:
+        if skip:
+            skip = False
+        elif arg in CLIENT_ONLY_FLAGS:
+            continue
+        elif arg == '--socket':
+            skip = True
+        elif not arg.startswith('--socket='):
+            forwarded.append(arg)
+    try:
+        response = call(socket_path, {'argv': forwarded, 'cwd': os.getcwd()})
+    except DaemonUnavailable:
+        eprint(f"[CLIENT] Aucun démon sur {socket_path}: exécution locale.")
+        return None
+    sys.stdout.write(response.get('stdout', ''))
+    sys.stdout.flush()
+    sys.stderr.write(response.get('stderr', ''))
+    return response.get('code', 1)
+
+
 def build_arg_parser() -> argparse.ArgumentParser:
     p=argparse.ArgumentParser(description="Daily quiz report")
     p.add_argument('date',nargs='?',default=None,help='Date YYYY-MM-DD (default: yesterday)')
@@ -916,27 +1260,50 @@ def build_arg_parser() -> argparse.ArgumentParser:
     p.add_argument('--slack-print', action='store_true', help='Afficher directement la table Slack sur stdout')
     p.add_argument('--radar', action='store_true', help='Générer le graphique radar de difficulté par catégorie')
     p.add_argument('--show-radar', action='store_true', help='Afficher le graphique radar interactivement (implique --radar)')
+    p.add_argument('--ratings', action='store_true', help='Afficher le classement Elo/Glicko des joueurs sélectionnés')
+    p.add_argument('--force', action='store_true', help='Redessiner les graphiques même si leurs données sont inchangées')
+    p.add_argument('--serve', action='store_true', help='Démarrer le démon (état gardé en mémoire, socket Unix locale)')
+    p.add_argument('--client', action='store_true', help='Demander le rapport au démon (exécution locale si absent)')
+    p.add_argument('--stop-server', action='store_true', help='Arrêter le démon')
+    p.add_argument('--socket', help='Chemin de la socket du démon (défaut: dans le répertoire temporaire)')
+    p.add_argument('--watch', action='store_true', help='Suivre le classement en direct (seules les lignes nouvelles ou modifiées sont affichées)')
+    p.add_argument('--interval', type=float, default=30.0, help='--watch: intervalle minimal entre deux requêtes en secondes (défaut: 30)')
+    p.add_argument('--max-interval', type=float, default=600.0, help='--watch: intervalle maximal quand rien ne change (défaut: 600)')
+    p.add_argument('--timings', action='store_true', help='Afficher le temps passé par étape (réseau, attente, décodage, cache, base, rendu)')
+    p.add_argument('--timings-json', metavar='PATH', help='Ajouter les temps de cette exécution au fichier JSON lines PATH (comparés à la précédente avec --timings)')
+    p.add_argument('--metrics-dir', metavar='DIR', help='Écrire les métriques Prometheus (textfile node_exporter) dans DIR (défaut: $FAN2QUIZZ_METRICS_DIR)')
+    p.add_argument('--duration', type=float, help='--watch: durée du suivi en minutes (défaut: jusqu\'à Ctrl+C)')
     return p
 
 
-def main(argv: List[str]) -> int:
-    parser = build_arg_parser()
-    args = parser.parse_args(argv[1:])
+def report_timings(args: argparse.Namespace, date_str: str, **meta: Any):
+    """Print the per-stage breakdown (--timings) and/or append it to the JSON sink (--timings-json)."""
+    from fan2quizz import timing  # type: ignore
+    rec = timing.record('daily_report', date=date_str, **meta)
+    if args.timings:
+        previous = timing.load_records(Path(args.timings_json), 'daily_report') if args.timings_json else []
+        print("\nTemps par étape" + (f" (comparé à l'exécution du {previous[-1]['at']})" if previous else "") + " :")
+        print(timing.format_table(rec, previous[-1] if previous else None))
+    if args.timings_json:
+        try:
+            timing.append_record(Path(args.timings_json), rec)
+            log(f"[TIME] Temps ajoutés à {args.timings_json}")
+        except OSError as e:
+            eprint(f"[TIME] Échec écriture des temps: {e}")
 
-    interrupted = {'flag': False}
 
-    def on_sigint(sig, frame):
-        interrupted['flag'] = True
-        print("\n[INTERRUPTION] Ctrl+C détecté, tentative de sauvegarde avant sortie...")
-        if args.save_table and LAST_SELECTED_ROWS:
-            try:
-                save_table(Path(args.save_table), LAST_SELECTED_ROWS)
-            except Exception as e:
-                eprint(f"[INT-SAVE] Échec sauvegarde: {e}")
-        raise KeyboardInterrupt
+def write_metrics(directory: Path, success: bool):
+    """Export this run's metrics for node_exporter (see fan2quizz.metrics); never fails the run."""
+    from fan2quizz import metrics  # type: ignore
+    try:
+        path = metrics.write_textfile(directory, 'daily_report', success=success)
+        log(f"[METRICS] Écrites dans {path}")
+    except OSError as e:
+        eprint(f"[METRICS] Échec écriture des métriques: {e}")
 
-    signal.signal(signal.SIGINT, on_sigint)
 
+def run_report(args: argparse.Namespace) -> int:
+    """Configure the display options from ``args`` and print one report."""
     if args.date is None:
         from datetime import date as _date
         date_str=(_date.today()-timedelta(days=1)).strftime('%Y-%m-%d')
@@ -961,12 +1328,29 @@ def main(argv: List[str]) -> int:
     generate_radar = args.radar or args.show_radar
     show_radar = args.show_radar
     
+    from fan2quizz import metrics, timing  # type: ignore
+    if args.timings or args.timings_json:
+        timing.reset()
+        timing.enable()
+    metrics_dir = metrics.metrics_dir(args.metrics_dir)
+    if metrics_dir is not None:
+        metrics.enable()
+    code = 1
     try:
         code = run_daily(date_str, use_cache=use_cache, refresh=refresh, 
-                        generate_radar=generate_radar, show_radar=show_radar)
+                        generate_radar=generate_radar, show_radar=show_radar, show_ratings=args.ratings,
+                        force_figures=args.force)
     except KeyboardInterrupt:
         print("[INTERRUPTION] Arrêt par utilisateur.")
-        return 130
+        code = 130
+        return code
+    finally:
+        timing.disable()
+        if metrics_dir is not None:
+            write_metrics(metrics_dir, success=code == 0 and not metrics.total('fan2quizz_failures_total'))
+            metrics.disable()
+    if args.timings or args.timings_json:
+        report_timings(args, date_str, use_cache=use_cache, refresh=refresh)
 
     # Post-run save / clipboard
     if args.save_table and LAST_SELECTED_ROWS:
@@ -981,5 +1365,47 @@ def main(argv: List[str]) -> int:
     return code
 
 
+def run_watch(args: argparse.Namespace) -> int:
+    """``--watch``: follow today's (or the given date's) leaderboard live."""
+    global CACHE_DIR
+    if args.cache_dir:
+        CACHE_DIR = Path(args.cache_dir)
+    date_str = validate_date(args.date) if args.date else datetime.now().strftime('%Y-%m-%d')
+    return watch_leaderboard(date_str, min_interval=args.interval, max_interval=args.max_interval,
+                             duration=args.duration, use_cache=not args.no_cache)
+
+
+def main(argv: List[str]) -> int:
+    parser = build_arg_parser()
+    args = parser.parse_args(argv[1:])
+    socket_path = Path(args.socket) if args.socket else default_socket_path()
+
+    if args.serve:
+        return serve_daemon(socket_path)
+    if args.stop_server:
+        return stop_daemon(socket_path)
+    if args.watch:
+        return run_watch(args)
+    if args.client:
+        code = run_client(socket_path, argv[1:], args)
+        if code is not None:
+            return code
+
+    interrupted = {'flag': False}
+
+    def on_sigint(sig, frame):
+        interrupted['flag'] = True
+        print("\n[INTERRUPTION] Ctrl+C détecté, tentative de sauvegarde avant sortie...")
+        if args.save_table and LAST_SELECTED_ROWS:
+            try:
+                save_table(Path(args.save_table), LAST_SELECTED_ROWS)
+            except Exception as e:
+                eprint(f"[INT-SAVE] Échec sauvegarde: {e}")
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGINT, on_sigint)
+    return run_report(args)
+
+
 if __name__ == '__main__':  # pragma: no cover
     raise SystemExit(main(sys.argv))
@@ -51,6 +51,7 @@ from typing import Dict, List, Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from fan2quizz.scraper import QuizypediaScraper
+from fan2quizz.utils import CircuitOpenError
 
 ROOT = Path(__file__).parent.parent
 
@@ -317,6 +318,8 @@ def fetch_mistakes_for_date(scraper: QuizypediaScraper, date_str: str, username:
     except ValueError as e:
         print(f"   ⚠️  {e}")
         return None
+    except CircuitOpenError:
+        raise
     except Exception as e:
         print(f"   ❌ Error: {e}")
         return None
@@ -458,8 +461,13 @@ Examples:
     new_mistakes_count = 0
     successful_dates = []
     
-    for date_str in dates_to_fetch:
-        mistakes = fetch_mistakes_for_date(scraper, date_str, args.username)
+    for i, date_str in enumerate(dates_to_fetch):
+        try:
+            mistakes = fetch_mistakes_for_date(scraper, date_str, args.username)
+        except CircuitOpenError as e:
+            print(f"\n⛔ {e}")
+            print(f"   Stopping: {len(dates_to_fetch) - i} date(s) left for the next run")
+            break
         
         if mistakes is None:
             continue
@@ -11,34 +11,31 @@ Usage:
     uv run scripts/generate_failed_questions.py --category "Histoire"  # Filter by domain
     uv run scripts/generate_failed_questions.py --show-mistakes    # Include your wrong answers
     uv run scripts/generate_failed_questions.py --output study.md  # Custom output file
+    uv run scripts/generate_failed_questions.py --output - | less  # Stream to stdout
 """
 import sys
 import json
 import argparse
+import contextlib
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
-from typing import List, Dict, Any
+from collections import Counter
+from itertools import groupby
+from operator import itemgetter
+from typing import List, Dict, Any, Iterator, Tuple
 
 ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from fan2quizz.categories import DOMAIN_MAP, annotate_domains, default_classifier  # noqa: E402
+from fan2quizz.reportwriter import ReportWriter, status_stream  # noqa: E402
 
 # File paths
 MISTAKES_FILE = ROOT / "data" / "results" / "mistakes_history.json"
 DEFAULT_OUTPUT = ROOT / "output" / "reports" / "FAILED_QUESTIONS_EXHAUSTIVE.md"
 
 
-# Category to domain mapping
-DOMAIN_MAP = {
-    "Arts": ["Écrivains", "Personnages masculins d'opéras", "Peinture", "Actrices", "Shakespeare"],
-    "Culture": ["Pâtisseries", "Répliques des Guignols", "Oscars"],
-    "Histoire": ["Événements du XIIIe siècle", "Chanceliers", "Exécutions", "Titanic", "Prix Nobel"],
-    "Géographie": ["La Haute-Garonne", "Quartiers de villes", "Villes de la côte"],
-    "Musique": ["Groupes musicaux", "Célèbres chanteurs"],
-    "Sports": ["Joueurs de l'équipe", "Records de sélections", "Champions internationaux"],
-    "Sciences": ["Pathologies", "Plantes connues", "Reconnaissance de fleurs", "Rides"],
-    "Mythologie": ["Personnages légendaires"]
-}
-
 # Learning notes for each category
 LEARNING_NOTES = {
     "Pâtisseries et desserts français (1)": "La nonnette est une spécialité de Dijon (Côte-d'Or), un petit gâteau au miel souvent fourré de confiture ou de crème.",
@@ -77,31 +74,30 @@ def load_mistakes() -> List[Dict[str, Any]]:
         return []
     
     with open(MISTAKES_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
+        return annotate_domains(json.load(f))
 
 
 def filter_mistakes(mistakes: List[Dict], filter_text: str = None, domain: str = None) -> List[Dict]:
-    """Filter mistakes by text or domain."""
+    """Filter mistakes by text (in date or category) or domain.
+
+    Domains come from the precomputed ``domains`` of each mistake (see
+    :func:`fan2quizz.categories.annotate_domains`), so the domain test is a
+    set lookup.
+    """
     if not filter_text and not domain:
         return mistakes
     
+    needle = filter_text.lower() if filter_text else None
+    wanted = default_classifier().matching_domains(domain) if domain else frozenset()
+    
     filtered = []
     for mistake in mistakes:
         # Filter by text (in date or category)
-        if filter_text:
-            if filter_text.lower() in mistake['date'].lower() or \
-               filter_text.lower() in mistake['category'].lower():
-                filtered.append(mistake)
-                continue
-        
+        if needle and (needle in mistake['date'].lower() or needle in mistake['category'].lower()):
+            filtered.append(mistake)
         # Filter by domain
-        if domain:
-            category = mistake['category']
-            for domain_name, keywords in DOMAIN_MAP.items():
-                if domain.lower() in domain_name.lower():
-                    if any(keyword.lower() in category.lower() for keyword in keywords):
-                        filtered.append(mistake)
-                        break
+        elif wanted and not wanted.isdisjoint(mistake['domains']):
+            filtered.append(mistake)
     
     return filtered if filtered else mistakes
 
@@ -152,109 +148,98 @@ def format_question(mistake: Dict, show_mistakes: bool, show_choices: bool, ques
     return output
 
 
-def generate_by_date(mistakes: List[Dict], show_mistakes: bool, show_choices: bool) -> str:
-    """Generate output grouped by date."""
-    output = ""
-    
-    by_date = defaultdict(list)
+def format_long_date(date: str) -> str:
+    """2025-10-20 -> October 20, 2025"""
+    return datetime.strptime(date, '%Y-%m-%d').strftime('%B %d, %Y')
+
+
+def count_sections(mistakes: List[Dict]) -> Tuple[Counter, Counter]:
+    """Cheap first pass: question counts per date and per category (TOC, stats and headers)."""
+    by_date = Counter()
+    by_category = Counter()
     for mistake in mistakes:
-        by_date[mistake['date']].append(mistake)
+        by_date[mistake['date']] += 1
+        by_category[mistake['category']] += 1
+    return by_date, by_category
+
+
+def generate_by_date(mistakes: List[Dict], show_mistakes: bool, show_choices: bool) -> Iterator[str]:
+    """Yield output grouped by date (newest first), one question at a time."""
+    ordered = sorted(mistakes, key=itemgetter('date'), reverse=True)
+    counts = Counter(m['date'] for m in ordered)
     
-    for date in sorted(by_date.keys(), reverse=True):
-        dt = datetime.strptime(date, '%Y-%m-%d')
-        formatted_date = dt.strftime('%B %d, %Y')
-        questions = by_date[date]
+    for date, questions in groupby(ordered, key=itemgetter('date')):
+        yield f"## {format_long_date(date)} ({counts[date]} questions)\n\n"
         
-        output += f"## {formatted_date} ({len(questions)} questions)\n\n"
-        
-        for i, q in enumerate(questions, 1):
-            output += format_question(q, show_mistakes, show_choices, q['question_number'])
-    
-    return output
+        for q in questions:
+            yield format_question(q, show_mistakes, show_choices, q['question_number'])
 
 
-def generate_by_category(mistakes: List[Dict], show_mistakes: bool, show_choices: bool) -> str:
-    """Generate output grouped by category."""
-    output = ""
-    
-    by_category = defaultdict(list)
-    for mistake in mistakes:
-        by_category[mistake['category']].append(mistake)
-    
-    for category in sorted(by_category.keys()):
-        questions = by_category[category]
-        output += f"## {category} ({len(questions)} question{'s' if len(questions) > 1 else ''})\n\n"
+def generate_by_category(mistakes: List[Dict], show_mistakes: bool, show_choices: bool) -> Iterator[str]:
+    """Yield output grouped by category, one question at a time."""
+    ordered = sorted(mistakes, key=itemgetter('category'))
+    counts = Counter(m['category'] for m in ordered)
+    
+    for category, questions in groupby(ordered, key=itemgetter('category')):
+        count = counts[category]
+        yield f"## {category} ({count} question{'s' if count > 1 else ''})\n\n"
         
         for i, q in enumerate(questions, 1):
-            output += format_question(q, show_mistakes, show_choices, i)
-    
-    return output
+            yield format_question(q, show_mistakes, show_choices, i)
 
 
-def generate_sequential(mistakes: List[Dict], show_mistakes: bool, show_choices: bool) -> str:
-    """Generate output as sequential list."""
-    output = ""
-    
+def generate_sequential(mistakes: List[Dict], show_mistakes: bool, show_choices: bool) -> Iterator[str]:
+    """Yield output as sequential list."""
     for i, mistake in enumerate(mistakes, 1):
-        output += format_question(mistake, show_mistakes, show_choices, i)
-    
-    return output
+        yield format_question(mistake, show_mistakes, show_choices, i)
 
 
-def generate_toc(mistakes: List[Dict], order: str) -> str:
-    """Generate table of contents."""
-    toc = "## Table of Contents\n\n"
+def generate_toc(by_date: Counter, by_category: Counter, order: str) -> Iterator[str]:
+    """Yield the table of contents from the per-section counts."""
+    yield "## Table of Contents\n\n"
     
     if order == 'date':
-        by_date = defaultdict(int)
-        for mistake in mistakes:
-            by_date[mistake['date']] += 1
-        
         for date in sorted(by_date.keys(), reverse=True):
-            dt = datetime.strptime(date, '%Y-%m-%d')
-            formatted_date = dt.strftime('%B %d, %Y')
+            formatted_date = format_long_date(date)
             anchor = formatted_date.lower().replace(' ', '-').replace(',', '')
-            toc += f"- [{formatted_date} ({by_date[date]} questions)](#-{anchor})\n"
+            yield f"- [{formatted_date} ({by_date[date]} questions)](#-{anchor})\n"
     
     elif order == 'category':
-        by_category = defaultdict(int)
-        for mistake in mistakes:
-            by_category[mistake['category']] += 1
-        
         for category in sorted(by_category.keys()):
             anchor = category.lower().replace(' ', '-').replace('(', '').replace(')', '').replace('é', 'e').replace('à', 'a').replace('è', 'e')
-            toc += f"- [{category} ({by_category[category]} question{'s' if by_category[category] > 1 else ''})](#-{anchor})\n"
+            yield f"- [{category} ({by_category[category]} question{'s' if by_category[category] > 1 else ''})](#-{anchor})\n"
     
-    toc += "\n---\n\n"
-    return toc
+    yield "\n---\n\n"
 
 
-def generate_stats(mistakes: List[Dict]) -> str:
-    """Generate statistics section."""
-    stats = "## 📊 Statistics\n\n"
+def generate_stats(by_date: Counter, by_category: Counter) -> Iterator[str]:
+    """Yield the statistics section."""
+    yield "## 📊 Statistics\n\n"
     
-    # By date
-    by_date = defaultdict(int)
-    for mistake in mistakes:
-        by_date[mistake['date']] += 1
-    
-    stats += "**By Date:**\n"
+    yield "**By Date:**\n"
     for date in sorted(by_date.keys(), reverse=True):
-        dt = datetime.strptime(date, '%Y-%m-%d')
-        formatted_date = dt.strftime('%B %d, %Y')
-        stats += f"- {formatted_date}: {by_date[date]} questions\n"
+        yield f"- {format_long_date(date)}: {by_date[date]} questions\n"
     
-    # By category
-    by_category = defaultdict(int)
-    for mistake in mistakes:
-        by_category[mistake['category']] += 1
-    
-    stats += "\n**By Category:**\n"
+    yield "\n**By Category:**\n"
     for category in sorted(by_category.keys()):
-        stats += f"- {category}: {by_category[category]} question{'s' if by_category[category] > 1 else ''}\n"
+        yield f"- {category}: {by_category[category]} question{'s' if by_category[category] > 1 else ''}\n"
+    
+    yield "\n---\n\n"
+
+
+def generate_header(title: str, total: int, args: argparse.Namespace) -> Iterator[str]:
+    """Yield the report title block."""
+    yield f"# 📚 {title}\n\n"
+    yield f"**Total Questions:** {total}  \n"
+    yield f"**Ordered By:** {args.order.title()}  \n"
+    
+    if args.filter:
+        yield f"**Filter:** {args.filter}  \n"
+    if args.domain:
+        yield f"**Domain:** {args.domain}  \n"
     
-    stats += "\n---\n\n"
-    return stats
+    yield f"**Generated:** {datetime.now().strftime('%B %d, %Y at %H:%M')}\n\n"
+    yield "---\n\n"
 
 
 def main():
@@ -311,7 +296,7 @@ Examples:
     parser.add_argument(
         '--domain',
         type=str,
-        choices=['Arts', 'Culture', 'Histoire', 'Géographie', 'Musique', 'Sports', 'Sciences', 'Mythologie'],
+        choices=list(DOMAIN_MAP),
         help='Filter by domain'
     )
     
@@ -331,7 +316,7 @@ Examples:
         '--output',
         type=str,
         default='FAILED_QUESTIONS_EXHAUSTIVE.md',
-        help='Output file name (default: FAILED_QUESTIONS_EXHAUSTIVE.md)'
+        help="Output file name, or '-' for stdout (default: FAILED_QUESTIONS_EXHAUSTIVE.md)"
     )
     
     parser.add_argument(
@@ -341,7 +326,15 @@ Examples:
     )
     
     args = parser.parse_args()
+    out = ReportWriter(args.output if args.output else DEFAULT_OUTPUT)
     
+    # With --output -, stdout carries only the report and progress goes to stderr
+    with contextlib.redirect_stdout(status_stream(args.output)):
+        return write_study_guide(args, out)
+
+
+def write_study_guide(args: argparse.Namespace, out: ReportWriter) -> int:
+    """Load, filter and sort the mistakes, then stream the guide through ``out``."""
     # Load mistakes
     print("📂 Loading mistakes history...")
     mistakes = load_mistakes()
@@ -372,42 +365,27 @@ Examples:
     else:
         title += " - Study Guide"
     
-    output = f"# 📚 {title}\n\n"
-    output += f"**Total Questions:** {len(mistakes)}  \n"
-    output += f"**Ordered By:** {args.order.title()}  \n"
+    # Counts for the TOC and stats, then stream everything section by section
+    by_date, by_category = count_sections(mistakes)
     
-    if args.filter:
-        output += f"**Filter:** {args.filter}  \n"
-    if args.domain:
-        output += f"**Domain:** {args.domain}  \n"
-    
-    output += f"**Generated:** {datetime.now().strftime('%B %d, %Y at %H:%M')}\n\n"
-    output += "---\n\n"
-    
-    # Generate TOC
-    output += generate_toc(mistakes, args.order)
-    
-    # Generate stats if requested
-    if args.stats:
-        output += generate_stats(mistakes)
-    
-    # Generate content
-    print("📝 Generating content...")
     if args.order == 'date':
-        output += generate_by_date(mistakes, args.show_mistakes, args.show_choices)
+        body = generate_by_date(mistakes, args.show_mistakes, args.show_choices)
     elif args.order == 'category':
-        output += generate_by_category(mistakes, args.show_mistakes, args.show_choices)
+        body = generate_by_category(mistakes, args.show_mistakes, args.show_choices)
     else:
-        output += generate_sequential(mistakes, args.show_mistakes, args.show_choices)
-    
-    # Write to file
-    output_file = Path(args.output) if args.output else DEFAULT_OUTPUT
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    output_file.write_text(output, encoding='utf-8')
+        body = generate_sequential(mistakes, args.show_mistakes, args.show_choices)
     
-    print(f"✅ Generated: {output_file}")
-    print(f"📊 Total lines: {len(output.splitlines())}")
-    print(f"💾 File size: {len(output)} bytes")
+    print("📝 Generating content...")
+    with out:
+        out.write_all(generate_header(title, len(mistakes), args))
+        out.write_all(generate_toc(by_date, by_category, args.order))
+        if args.stats:
+            out.write_all(generate_stats(by_date, by_category))
+        out.write_all(body)
+    
+    print(f"✅ Generated: {'stdout' if out.is_stdout else out.path}")
+    print(f"📊 Total lines: {out.line_count}")
+    print(f"💾 File size: {out.char_count} bytes")
     
     return 0
 
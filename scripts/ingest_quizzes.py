@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Index the quiz catalog in the local database (data/db/quizypedia.db) for search and study.
+
+Quiz URLs come from the crawl frontier filled by crawl_quizzes.py, or are
+discovered live from the category listings. Pages are fetched by several
+workers under one shared rate limit, parsed into questions and choices, and
+written in batched transactions (see fan2quizz.ingest). Quizzes already in
+the database are skipped unless --refresh is given; re-running after an
+interruption picks up the rest.
+
+Usage:
+    uv run scripts/ingest_quizzes.py                    # URLs from data/db/frontier.db
+    uv run scripts/ingest_quizzes.py --discover         # Walk the categories live instead
+    uv run scripts/ingest_quizzes.py --refresh          # Re-fetch and update stored quizzes too
+    uv run scripts/ingest_quizzes.py --search "verdi"   # Query the index
+"""
+import sys
+import argparse
+from pathlib import Path
+
+import requests
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+DB_PATH = ROOT / "data" / "db" / "quizypedia.db"
+FRONTIER_PATH = ROOT / "data" / "db" / "frontier.db"
+
+from fan2quizz import metrics, timing
+from fan2quizz.database import QuizDB
+from fan2quizz.frontier import Frontier
+from fan2quizz.ingest import IngestPipeline, discover_quiz_urls
+from fan2quizz.scraper import QuizypediaScraper
+from fan2quizz.utils import CircuitBreaker, CircuitOpenError, RateLimiter
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Fetch quiz pages and index their questions in the local database",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Discover with the crawler, then ingest what it found
+  uv run scripts/crawl_quizzes.py --incremental
+  uv run scripts/ingest_quizzes.py --workers 4
+
+  # Larger transactions for a first full import
+  uv run scripts/ingest_quizzes.py --batch-size 200 --timings
+        """
+    )
+    parser.add_argument('--db', type=Path, default=DB_PATH, help=f'Quiz database (default: {DB_PATH.relative_to(ROOT)})')
+    parser.add_argument('--frontier', type=Path, default=FRONTIER_PATH,
+                        help=f'Crawl frontier to read quiz URLs from (default: {FRONTIER_PATH.relative_to(ROOT)})')
+    parser.add_argument('--discover', action='store_true', help='Discover quiz URLs from the category listings instead')
+    parser.add_argument('--refresh', action='store_true', help='Also re-fetch quizzes already in the database')
+    parser.add_argument('--workers', type=int, default=4, help='Fetch workers (default: 4)')
+    parser.add_argument('--delay', type=float, default=0.7,
+                        help='Seconds between requests, shared by all workers (default: 0.7)')
+    parser.add_argument('--batch-size', type=int, default=50, help='Quizzes per database transaction (default: 50)')
+    parser.add_argument('--queue-size', type=int, default=100, help='Items buffered between stages (default: 100)')
+    parser.add_argument('--search', metavar='QUERY', help='Full-text search in the stored quizzes and exit')
+    parser.add_argument('--timings', action='store_true', help='Print the time spent per stage')
+    parser.add_argument('--metrics-dir', metavar='DIR',
+                        help='Write Prometheus metrics (node_exporter textfile) to DIR (default: $FAN2QUIZZ_METRICS_DIR)')
+    args = parser.parse_args()
+
+    db = QuizDB(str(args.db))
+    if args.search:
+        rows = db.search_quizzes(args.search, limit=20)
+        for quiz_id, title, url in rows:
+            print(f"{quiz_id:>6}  {title}  {url}")
+        print(f"\n🔎 {len(rows)} result(s)")
+        db.close()
+        return 0
+
+    frontier = None
+    if args.discover:
+        urls = discover_quiz_urls(QuizypediaScraper(rate_limiter=RateLimiter(args.delay)))
+    else:
+        if not args.frontier.exists():
+            print(f"❌ No crawl frontier at {args.frontier}: run scripts/crawl_quizzes.py first, or use --discover")
+            db.close()
+            return 1
+        frontier = Frontier(str(args.frontier))
+        urls = frontier.urls('quiz')
+        print(f"📚 {len(urls)} quiz URLs in the frontier")
+
+    if args.timings:
+        timing.reset()
+        timing.enable()
+    metrics_dir = metrics.metrics_dir(args.metrics_dir)
+    if metrics_dir is not None:
+        metrics.enable()
+
+    limiter = RateLimiter(args.delay)
+    breaker = CircuitBreaker()
+    pipeline = IngestPipeline(
+        db,
+        lambda: QuizypediaScraper(rate_limiter=limiter, breaker=breaker),
+        workers=args.workers,
+        batch_size=args.batch_size,
+        queue_size=args.queue_size,
+        skip_known=not args.refresh,
+        frontier=frontier,
+    )
+    code = 0
+    try:
+        pipeline.run(urls)
+    except KeyboardInterrupt:
+        print("\n⏸️  Interrupted; run again to ingest the rest")
+        code = 130
+    except CircuitOpenError as e:
+        print(f"\n🛑 {e}; run again later to ingest the rest")
+        code = 1
+    except requests.RequestException as e:
+        print(f"\n❌ Discovery failed: {e}")
+        code = 1
+    db.close()
+    if frontier is not None:
+        frontier.close()
+
+    counts = pipeline.counts
+    print(f"\n✅ {counts['inserted']} new and {counts['updated']} updated quizzes "
+          f"({counts['questions']} questions) in {counts['batches']} transactions"
+          + (f", {counts['skipped']} already stored" if counts['skipped'] else "")
+          + (f", {counts['failed']} failed" if counts['failed'] else ""))
+
+    timing.disable()
+    if metrics_dir is not None:
+        path = metrics.write_textfile(metrics_dir, 'ingest_quizzes', success=code == 0 and not counts['failed'])
+        print(f"📈 Metrics written to {path}")
+    if args.timings:
+        print("\n⏱️  Time per stage:")
+        print(timing.format_table(timing.record('ingest_quizzes', **counts)))
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -24,6 +24,11 @@ from collections import defaultdict, Counter
 import argparse
 
 ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from fan2quizz import storage  # noqa: E402
+from fan2quizz.analytics import PlayerMatrix  # noqa: E402
 
 # Configuration
 CACHE_DIR = ROOT / "data" / "cache" / "archive"
@@ -60,18 +65,15 @@ def load_archive_data(date_str: str = None) -> List[Dict[str, Any]]:
     archives = []
     
     if date_str:
-        archive_file = CACHE_DIR / f"{date_str}.json"
-        if archive_file.exists():
-            return [json.loads(archive_file.read_text())]
-        return []
+        archive = storage.load_json(CACHE_DIR / f"{date_str}.json")
+        return [archive] if archive is not None else []
     
     # Load all archives
-    for archive_file in sorted(CACHE_DIR.glob("*.json")):
-        if archive_file.name != ".gitkeep":
-            try:
-                archives.append(json.loads(archive_file.read_text()))
-            except:
-                pass
+    for archive_file in storage.scan(CACHE_DIR, ".json").values():
+        try:
+            archives.append(storage.read_json(archive_file))
+        except:
+            pass
     
     return archives
 
@@ -130,31 +132,28 @@ def analyze_mistakes(mistakes: List[Dict[str, Any]]) -> Dict:
 
 def compare_with_friends(archives: List[Dict[str, Any]], friends: List[str]) -> Dict:
     """Compare performance with friends."""
-    comparison = defaultdict(lambda: {"scores": [], "times": [], "ranks": []})
-    
-    for archive in archives:
-        date = archive.get("date")
-        results = archive.get("results", [])
-        
-        for entry in results:
-            user = entry.get("user", "").lower()
-            if user in [f.lower() for f in friends]:
-                comparison[user]["scores"].append(entry.get("good_responses", 0))
-                comparison[user]["times"].append(entry.get("elapsed_time", 0))
-                comparison[user]["ranks"].append(entry.get("rank", 0))
+    matrix = PlayerMatrix.from_archives(archives, friends)
+    games = matrix.games()
+    avg_scores = matrix.mean("score")
+    avg_times = matrix.mean("time")
+    avg_ranks = matrix.mean("rank")
+    best_scores = matrix.best("score")
+    best_ranks = matrix.best("rank")
+    
+    # Players appear in order of their first archived result, like the old dict build
+    first_seen = (~matrix.mask).argmax(axis=1)
+    order = sorted((i for i in range(len(matrix.players)) if games[i]), key=lambda i: first_seen[i])
     
-    # Calculate averages
     summary = {}
-    for user, data in comparison.items():
-        if data["scores"]:
-            summary[user] = {
-                "avg_score": statistics.mean(data["scores"]),
-                "avg_time": statistics.mean(data["times"]),
-                "avg_rank": statistics.mean(data["ranks"]),
-                "total_quizzes": len(data["scores"]),
-                "best_score": max(data["scores"]),
-                "best_rank": min(data["ranks"])
-            }
+    for i in order:
+        summary[matrix.players[i]] = {
+            "avg_score": float(avg_scores[i]),
+            "avg_time": float(avg_times[i]),
+            "avg_rank": float(avg_ranks[i]),
+            "total_quizzes": int(games[i]),
+            "best_score": int(best_scores[i]),
+            "best_rank": int(best_ranks[i])
+        }
     
     return summary
 
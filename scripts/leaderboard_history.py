@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""How a day's leaderboard evolved, from its snapshot log.
+
+Every `daily_report.py --refresh` and every change seen by
+`daily_report.py --watch` is recorded in data/cache/live/<date>.jsonl (one
+full snapshot, then deltas). This script replays that log.
+
+Usage:
+    uv run scripts/leaderboard_history.py                      # Today's timeline
+    uv run scripts/leaderboard_history.py 2025-10-14
+    uv run scripts/leaderboard_history.py 2025-10-14 --at 12:30 --top 20
+    uv run scripts/leaderboard_history.py 2025-10-14 --player BastienZim kamaiel
+    uv run scripts/leaderboard_history.py 2025-10-14 --selected
+"""
+import sys
+import json
+import time
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from fan2quizz.leaderboard import diff_leaderboards, index_by_user, row_user  # noqa: E402
+from fan2quizz.snapshots import SnapshotLog  # noqa: E402
+
+LIVE_DIR = ROOT / "data" / "cache" / "live"
+PLAYERS_CONFIG_PATH = ROOT / "data" / "players.json"
+
+
+def load_selected_players():
+    try:
+        config = json.loads(PLAYERS_CONFIG_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return []
+    return config.get('selected', [])
+
+
+def clock(ts: int) -> str:
+    return datetime.fromtimestamp(ts).strftime('%H:%M:%S')
+
+
+def mmss(seconds) -> str:
+    if not isinstance(seconds, (int, float)):
+        return '--'
+    return f"{int(seconds) // 60}:{int(seconds) % 60:02d}"
+
+
+def parse_at(value: str, date_str: str) -> float:
+    """``HH:MM[:SS]`` on the log's date, or a full ISO timestamp."""
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        pass
+    for fmt in ('%H:%M:%S', '%H:%M'):
+        try:
+            t = datetime.strptime(value, fmt).time()
+            return datetime.combine(datetime.strptime(date_str, '%Y-%m-%d').date(), t).timestamp()
+        except ValueError:
+            continue
+    raise SystemExit(f"❌ Invalid time '{value}' (expected HH:MM, HH:MM:SS or ISO)")
+
+
+def print_timeline(log: SnapshotLog):
+    print(f"\n{'#':>4}  {'Time':<9}{'Entries':>8}{'New':>6}{'Changed':>9}{'Gone':>6}   Top")
+    print("-" * 70)
+    previous = {}
+    for i, (ts, rows) in enumerate(log.iter_snapshots()):
+        diff = diff_leaderboards(previous, rows)
+        top = rows[0] if rows else {}
+        top_txt = f"{row_user(top)} {top.get('good_responses')} pts {mmss(top.get('elapsed_time'))}" if top else ''
+        print(f"{i:>4}  {clock(ts):<9}{len(rows):>8}{len(diff.added):>6}{len(diff.changed):>9}"
+              f"{len(diff.removed):>6}   {top_txt}")
+        previous = index_by_user(rows)
+
+
+def print_players(log: SnapshotLog, players):
+    wanted = {p.lower(): p for p in players}
+    print(f"\n{'Time':<10}{'Player':<22}{'Rank':>6}{'Score':>7}{'Time':>8}")
+    print("-" * 55)
+    last = {}
+    for ts, rows in log.iter_snapshots():
+        for row in rows:
+            key = row_user(row).lower()
+            if key not in wanted:
+                continue
+            state = (row.get('rank'), row.get('good_responses'), row.get('elapsed_time'))
+            if last.get(key) == state:
+                continue
+            last[key] = state
+            print(f"{clock(ts):<10}{row_user(row):<22}{str(row.get('rank', '--')):>6}"
+                  f"{str(row.get('good_responses', '--')):>7}{mmss(row.get('elapsed_time')):>8}")
+    missing = [name for key, name in wanted.items() if key not in last]
+    if missing:
+        print(f"\n⚠️  Never on the leaderboard: {', '.join(missing)}")
+
+
+def print_board(rows, top: int):
+    print(f"\n{'Rank':>5}  {'Player':<22}{'Score':>6}{'Time':>8}")
+    print("-" * 45)
+    for row in rows[:top]:
+        print(f"{str(row.get('rank', '--')):>5}  {row_user(row):<22}{str(row.get('good_responses', '--')):>6}"
+              f"{mmss(row.get('elapsed_time')):>8}")
+    if len(rows) > top:
+        print(f"  ... {len(rows) - top} more")
+
+
+def print_storage(log: SnapshotLog, date_str: str):
+    """Disk cost of the log vs keeping a full archive copy per snapshot."""
+    full_copies = sum(
+        len(json.dumps({'date': date_str, 'fetched_at': datetime.fromtimestamp(ts).isoformat(),
+                        'count': len(rows), 'results': rows}, ensure_ascii=False, indent=2).encode('utf-8'))
+        for ts, rows in log.iter_snapshots()
+    )
+    size = log.disk_bytes()
+    checkpoints = sum(1 for _, _, is_full in log.index() if is_full)
+    ratio = full_copies / size if size else 0
+    print(f"\n💾 {size / 1024:.1f} KB on disk ({checkpoints} full + {len(log) - checkpoints} deltas) "
+          f"vs {full_copies / 1024:.1f} KB as full copies ({ratio:.1f}x smaller)")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Replay a day's leaderboard snapshot log",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Snapshots are recorded by daily_report.py (--refresh and --watch). Rank
+changes caused only by other players finishing are not counted as changes.
+        """
+    )
+    parser.add_argument('date', nargs='?', default=None, help='Date YYYY-MM-DD (default: today)')
+    parser.add_argument('--at', help='Show the leaderboard as it was at HH:MM[:SS] (or ISO timestamp)')
+    parser.add_argument('--top', type=int, default=10, help='Rows to show with --at (default: 10)')
+    parser.add_argument('--player', nargs='+', help='Follow specific players through the day')
+    parser.add_argument('--selected', action='store_true', help='Follow the players from data/players.json')
+    parser.add_argument('--live-dir', type=Path, default=LIVE_DIR, help='Snapshot log directory')
+    args = parser.parse_args()
+
+    date_str = args.date or datetime.now().strftime('%Y-%m-%d')
+    log = SnapshotLog(args.live_dir / f"{date_str}.jsonl")
+    if not len(log):
+        print(f"⚠️  No snapshots recorded for {date_str} ({log.path})")
+        return 1
+
+    timestamps = log.timestamps()
+    print(f"📈 Leaderboard history for {date_str}: {len(log)} snapshots, "
+          f"{clock(timestamps[0])} → {clock(timestamps[-1])}")
+
+    if args.at:
+        start = time.perf_counter()
+        rows = log.snapshot_at(parse_at(args.at, date_str))
+        elapsed = time.perf_counter() - start
+        if rows is None:
+            print(f"⚠️  Nothing recorded before {args.at} (first snapshot at {clock(timestamps[0])})")
+            return 1
+        print(f"\nAs of {args.at} ({len(rows)} entries, rebuilt in {elapsed * 1000:.1f} ms):")
+        print_board(rows, args.top)
+        return 0
+
+    players = list(args.player or [])
+    if args.selected:
+        players += load_selected_players()
+    if players:
+        print_players(log, players)
+    else:
+        print_timeline(log)
+    print_storage(log, date_str)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
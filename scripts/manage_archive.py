@@ -3,16 +3,21 @@
 
 This script helps you:
 1. Check what dates you have data for
-2. Identify missing dates
+2. Identify missing dates (and dates fetched before the day was over)
 3. Download missing historical data
 
+Availability comes from the archive manifest (data/cache/archive/_manifest.json,
+see fan2quizz.manifest), so the report does not open the archive files.
+
 Usage:
     uv run scripts/manage_archive.py                    # Report on available data
     uv run scripts/manage_archive.py --download         # Download missing dates
     uv run scripts/manage_archive.py --from 2025-10-01  # Custom date range
+    uv run scripts/manage_archive.py --verify           # Rebuild the manifest from the files
+    uv run scripts/manage_archive.py --download --timings   # + time per stage of the backfill
+    uv run scripts/manage_archive.py --download --yes --metrics-dir /var/lib/node_exporter   # cron
 """
 import sys
-import json
 from pathlib import Path
 from datetime import datetime, timedelta
 import argparse
@@ -20,9 +25,13 @@ import argparse
 # Add parent directory to path
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
+ARCHIVE_DIR = ROOT / "data" / "cache" / "archive"
 
+from fan2quizz import metrics, timing
+from fan2quizz.leaderboard import bracket_scan_payload, parse_results
+from fan2quizz.manifest import ArchiveManifest, save_archive
 from fan2quizz.scraper import QuizypediaScraper
-from fan2quizz.utils import RateLimiter
+from fan2quizz.utils import CircuitOpenError, RateLimiter
 
 
 def load_env_credentials():
@@ -45,27 +54,29 @@ def load_env_credentials():
     )
 
 
-def get_available_dates():
+def get_available_dates(manifest=None):
     """Get list of dates we have archive data for.
     
+    Args:
+        manifest: ArchiveManifest to read (default: open the archive's)
+    
     Returns:
         list: List of datetime objects for available dates
     """
-    archive_dir = ROOT / "data" / "cache" / "archive"
-    if not archive_dir.exists():
-        return []
+    if manifest is None:
+        if not ARCHIVE_DIR.exists():
+            return []
+        manifest = ArchiveManifest.open(ARCHIVE_DIR)
     
     dates = []
-    for file in archive_dir.glob("*.json"):
-        if file.stem == ".gitkeep":
-            continue
+    for stem in manifest.dates():
         try:
-            date = datetime.strptime(file.stem, "%Y-%m-%d")
+            date = datetime.strptime(stem, "%Y-%m-%d")
             dates.append(date)
         except ValueError:
             continue
     
-    return sorted(dates)
+    return dates
 
 
 def get_date_range(start_date=None, end_date=None):
@@ -107,45 +118,6 @@ def get_all_dates_in_range(start_date, end_date):
     return dates
 
 
-def bracket_scan_payload(html: str):
-    """Extract JSON payload from archive HTML.
-    
-    Args:
-        html: Archive page HTML
-    
-    Returns:
-        str or None: JSON string or None if not found
-    """
-    marker = '[{"good_responses"'
-    start = html.find(marker)
-    if start == -1:
-        return None
-    depth = 0
-    for i, ch in enumerate(html[start:], start=start):
-        if ch == '[':
-            depth += 1
-        elif ch == ']':
-            depth -= 1
-            if depth == 0:
-                return html[start:i+1]
-    return None
-
-
-def parse_results(raw_payload: str):
-    """Parse JSON payload from archive HTML.
-    
-    Args:
-        raw_payload: JSON string
-    
-    Returns:
-        list: List of player results
-    """
-    cleaned = raw_payload.strip()
-    if cleaned.endswith(';'):
-        cleaned = cleaned[:-1]
-    return json.loads(cleaned)
-
-
 def fetch_leaderboard_for_date(scraper, date):
     """Fetch leaderboard data for a specific date.
     
@@ -168,6 +140,7 @@ def fetch_leaderboard_for_date(scraper, date):
         raw_payload = bracket_scan_payload(html)
         if not raw_payload:
             print("⚠️  No data available")
+            metrics.inc('fan2quizz_failures_total', stage='extract')
             return None
         
         # Parse JSON
@@ -180,8 +153,11 @@ def fetch_leaderboard_for_date(scraper, date):
             print("⚠️  No data available")
             return None
             
+    except CircuitOpenError:
+        raise
     except Exception as e:
         print(f"❌ Error: {e}")
+        metrics.inc('fan2quizz_failures_total', stage='fetch')
         return None
 
 
@@ -192,13 +168,11 @@ def save_leaderboard_to_archive(date, leaderboard):
         date: datetime object
         leaderboard: List of player data
     """
-    archive_dir = ROOT / "data" / "cache" / "archive"
-    archive_dir.mkdir(parents=True, exist_ok=True)
-    
     date_str = date.strftime("%Y-%m-%d")
-    output_file = archive_dir / f"{date_str}.json"
+    output_file = ARCHIVE_DIR / f"{date_str}.json"
     
-    # Save in the same format as existing archive files
+    # Same content as existing archive files, stored compressed (see fan2quizz.storage)
+    # and indexed in the manifest
     archive_data = {
         'date': date_str,
         'fetched_at': datetime.now().isoformat() + 'Z',
@@ -206,7 +180,7 @@ def save_leaderboard_to_archive(date, leaderboard):
         'results': leaderboard
     }
     
-    output_file.write_text(json.dumps(archive_data, indent=2, ensure_ascii=False), encoding='utf-8')
+    save_archive(output_file, archive_data)
 
 
 def report_available_data(start_date, end_date):
@@ -223,12 +197,14 @@ def report_available_data(start_date, end_date):
     print(f"{'='*60}")
     print(f"Date range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
     
-    available_dates = get_available_dates()
+    manifest = ArchiveManifest.open(ARCHIVE_DIR)
+    available_dates = get_available_dates(manifest)
     all_dates = get_all_dates_in_range(start_date, end_date)
     
     # Filter to dates in range
+    available_set = set(available_dates)
     available_in_range = [d for d in available_dates if start_date <= d <= end_date]
-    missing_dates = [d for d in all_dates if d not in available_dates]
+    missing_dates = [d for d in all_dates if d not in available_set]
     
     print(f"\n✅ Available: {len(available_in_range)} days")
     if available_in_range:
@@ -238,7 +214,16 @@ def report_available_data(start_date, end_date):
         # Show available dates
         print(f"\n   Dates with data:")
         for date in available_in_range:
-            print(f"     ✓ {date.strftime('%Y-%m-%d (%A)')}")
+            entry = manifest.get(date.strftime('%Y-%m-%d'))
+            print(f"     ✓ {date.strftime('%Y-%m-%d (%A)'):<24}{entry['count']:>5} players")
+        
+        stale = set(manifest.stale())
+        stale_in_range = [d for d in available_in_range if d.strftime('%Y-%m-%d') in stale]
+        if stale_in_range:
+            print("\n   ⏳ Fetched before the day was over (may miss late players):")
+            for date in stale_in_range:
+                print(f"     ~ {date.strftime('%Y-%m-%d')}  "
+                      f"(uv run scripts/daily_report.py {date.strftime('%Y-%m-%d')} --refresh)")
     
     print(f"\n❌ Missing: {len(missing_dates)} days")
     if missing_dates:
@@ -247,11 +232,36 @@ def report_available_data(start_date, end_date):
         for date in missing_dates:
             print(f"     ✗ {date.strftime('%Y-%m-%d (%A)')}")
     
+    print(f"\n💾 {len(manifest)} archived days, {manifest.total_bytes() / 1024:.1f} KB on disk")
     print(f"\n{'='*60}")
     
     return available_in_range, missing_dates
 
 
+def verify_manifest():
+    """Rebuild the archive manifest from the files and report differences.
+    
+    Returns:
+        int: Exit code (1 if some archives could not be read)
+    """
+    print(f"\n🔍 Verifying {ARCHIVE_DIR / '_manifest.json'}...")
+    manifest = ArchiveManifest(ARCHIVE_DIR)
+    report = manifest.verify()
+    labels = {
+        'added': "Missing from the manifest",
+        'removed': "Indexed but no file",
+        'changed': "Outdated entry",
+        'unreadable': "Unreadable archive",
+    }
+    for key, label in labels.items():
+        if report[key]:
+            print(f"   ⚠️  {label}: {', '.join(report[key])}")
+    if not any(report.values()):
+        print("   ✅ Manifest matched every archive")
+    print(f"   📇 Rebuilt: {len(manifest)} dates, {manifest.total_bytes() / 1024:.1f} KB")
+    return 1 if report['unreadable'] else 0
+
+
 def download_missing_data(missing_dates):
     """Download data for missing dates.
     
@@ -298,7 +308,13 @@ def download_missing_data(missing_dates):
     for i, date in enumerate(missing_dates, 1):
         print(f"\n[{i}/{len(missing_dates)}]", end=" ")
         
-        leaderboard = fetch_leaderboard_for_date(scraper, date)
+        try:
+            leaderboard = fetch_leaderboard_for_date(scraper, date)
+        except CircuitOpenError as e:
+            print(f"⛔ {e}")
+            print(f"   Stopping: {len(missing_dates) - i + 1} date(s) left for the next run")
+            metrics.inc('fan2quizz_failures_total', stage='circuit_open')
+            break
         
         if leaderboard:
             save_leaderboard_to_archive(date, leaderboard)
@@ -329,6 +345,9 @@ Examples:
   
   # Download last 14 days
   uv run scripts/manage_archive.py --days 14 --download
+  
+  # Rebuild the manifest after editing the archive by hand
+  uv run scripts/manage_archive.py --verify
         """
     )
     
@@ -358,8 +377,41 @@ Examples:
         help='Download missing data (default: just report)'
     )
     
+    parser.add_argument(
+        '-y', '--yes',
+        action='store_true',
+        help='Download without asking for confirmation (scheduled runs)'
+    )
+    
+    parser.add_argument(
+        '--timings',
+        action='store_true',
+        help='Print the time spent per stage (fetch, rate-limit waits, decode, cache writes)'
+    )
+    
+    parser.add_argument(
+        '--timings-json',
+        metavar='PATH',
+        help='Append this run\'s stage timings to a JSON lines file'
+    )
+    
+    parser.add_argument(
+        '--metrics-dir',
+        metavar='DIR',
+        help='Write Prometheus metrics (node_exporter textfile) to DIR (default: $FAN2QUIZZ_METRICS_DIR)'
+    )
+    
+    parser.add_argument(
+        '--verify',
+        action='store_true',
+        help='Rebuild the archive manifest from the files and report differences'
+    )
+    
     args = parser.parse_args()
     
+    if args.verify:
+        return verify_manifest()
+    
     # Parse dates
     start_date = None
     end_date = None
@@ -382,9 +434,28 @@ Examples:
     if args.download:
         if missing_dates:
             print("\n" + "="*60)
-            response = input("\n❓ Download missing data? [y/N]: ").strip().lower()
+            response = 'y' if args.yes else input("\n❓ Download missing data? [y/N]: ").strip().lower()
             if response in ['y', 'yes']:
-                download_missing_data(missing_dates)
+                if args.timings or args.timings_json:
+                    timing.reset()
+                    timing.enable()
+                metrics_dir = metrics.metrics_dir(args.metrics_dir)
+                if metrics_dir is not None:
+                    metrics.enable()
+                count = download_missing_data(missing_dates)
+                timing.disable()
+                if metrics_dir is not None:
+                    path = metrics.write_textfile(metrics_dir, 'manage_archive',
+                                                  success=count == len(missing_dates))
+                    print(f"📈 Metrics written to {path}")
+                if args.timings or args.timings_json:
+                    rec = timing.record('manage_archive', dates=len(missing_dates), downloaded=count)
+                    if args.timings:
+                        print("\n⏱️  Time per stage:")
+                        print(timing.format_table(rec))
+                    if args.timings_json:
+                        timing.append_record(Path(args.timings_json), rec)
+                        print(f"💾 Timings appended to {args.timings_json}")
             else:
                 print("❌ Download cancelled")
         else:
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Convert the archive and quiz HTML caches to compressed storage.
+
+Archives (data/cache/archive/<date>.json) are rewritten as compact JSON,
+compressed with zstd (if the zstandard package is installed) or gzip. Quiz
+pages (data/cache/quiz_html/<date>.html) are compressed with a dictionary
+trained on the existing pages. Every converted file is read back and
+compared with the original before the original is removed.
+
+Usage:
+    uv run scripts/migrate_cache.py                 # Convert everything
+    uv run scripts/migrate_cache.py --dry-run       # Only report what would be saved
+    uv run scripts/migrate_cache.py --retrain       # New HTML dictionary, re-encode all pages
+    uv run scripts/migrate_cache.py --codec gz      # Force a codec (zst, gz, zz, plain)
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from fan2quizz import storage  # noqa: E402
+from fan2quizz.manifest import ArchiveManifest  # noqa: E402
+
+ARCHIVE_DIR = ROOT / "data" / "cache" / "archive"
+HTML_DIR = ROOT / "data" / "cache" / "quiz_html"
+MAX_TRAINING_SAMPLES = 200
+MIN_TRAINING_SAMPLES = 5
+
+
+def fmt_bytes(n: int) -> str:
+    for unit in ('B', 'KB', 'MB'):
+        if abs(n) < 1024 or unit == 'MB':
+            return f"{n:.0f} {unit}" if unit == 'B' else f"{n:.1f} {unit}"
+        n /= 1024
+
+
+def load(path: Path, is_json: bool):
+    return storage.read_json(path) if is_json else storage.read_bytes(path)
+
+
+def timed_load_all(paths, is_json: bool) -> float:
+    start = time.perf_counter()
+    for path in paths:
+        load(path, is_json)
+    return time.perf_counter() - start
+
+
+def prepare_dictionary(directory: Path, files, codec: str, retrain: bool, dry_run: bool):
+    """Train (or reuse) the HTML dictionary; returns (dictionary bytes or None, newly trained)."""
+    store = storage.dictionaries(directory)
+    current = store.current(codec)
+    if current is not None and not retrain:
+        return current, False
+    paths = list(files.values())[-MAX_TRAINING_SAMPLES:]
+    if len(paths) < MIN_TRAINING_SAMPLES:
+        print(f"   ℹ️  Only {len(paths)} pages: not enough to train a dictionary")
+        return None, False
+    start = time.perf_counter()
+    dictionary = storage.train_dictionary([storage.read_bytes(p) for p in paths], codec)
+    print(f"   📖 Trained a {fmt_bytes(len(dictionary))} {codec} dictionary on {len(paths)} pages "
+          f"in {time.perf_counter() - start:.2f}s")
+    if not dry_run:
+        store.add(codec, dictionary)
+    return dictionary, True
+
+
+def prune_dictionaries(store, codec: str, keep: bytes):
+    keep_path = store.path(codec, storage.dictionary_id(codec, keep))
+    for path in store.dir.glob(f"{codec}-*.dict"):
+        if path != keep_path:
+            path.unlink()
+            print(f"   🧹 Removed unused dictionary {path.name}")
+
+
+def migrate_dir(directory: Path, extension: str, codec: str, *, use_dictionary: bool,
+                retrain: bool, force: bool, dry_run: bool):
+    """Convert one cache directory; returns (before bytes, after bytes, load s before, load s after, errors)."""
+    is_json = extension == '.json'
+    files = storage.scan(directory, extension)
+    print(f"\n📂 {directory} ({len(files)} files, target codec: {codec})")
+    if not files:
+        return 0, 0, 0.0, 0.0, 0
+
+    store = storage.dictionaries(directory)
+    dict_before = store.total_bytes()
+    dictionary, trained = None, False
+    if use_dictionary and codec in storage.DICTIONARY_CODECS:
+        dictionary, trained = prepare_dictionary(directory, files, codec, retrain, dry_run)
+
+    load_before = timed_load_all(files.values(), is_json)
+    before = after = 0
+    converted = skipped = errors = 0
+    new_paths = []
+    for stem, path in files.items():
+        size = path.stat().st_size
+        already = storage.codec_of(path) == codec and not (trained and not is_json)
+        if already and not force:
+            skipped += 1
+            before += size
+            after += size
+            new_paths.append(path)
+            continue
+        raw = storage.read_bytes(path)
+        original = storage.read_json(path) if is_json else raw
+        data = storage.dump_json(original) if is_json else raw
+        base = directory / f"{stem}{extension}"
+        if dry_run:
+            blob = storage.compress(data, codec, dictionary)
+            before += size
+            after += len(blob)
+            converted += 1
+            continue
+        if is_json:
+            new_path = storage.write_json(base, original, codec)
+        else:
+            new_path = storage.write_bytes(base, data, codec, use_dictionary=dictionary is not None)
+        if load(new_path, is_json) != original:
+            # Never lose data: put the original bytes back as a plain file
+            storage.write_bytes(base, raw, 'plain')
+            print(f"   ❌ {stem}: round-trip mismatch, kept the original")
+            errors += 1
+            new_paths.append(storage.find(base))
+            before += size
+            after += size
+            continue
+        before += size
+        after += new_path.stat().st_size
+        converted += 1
+        new_paths.append(new_path)
+
+    if is_json and not dry_run:
+        # File names changed (new suffix): bring the archive manifest up to date
+        ArchiveManifest.open(directory)
+    if trained and not dry_run and not errors:
+        # Every page now uses the new dictionary: the older ones are unreferenced
+        prune_dictionaries(store, codec, dictionary)
+    if dry_run:
+        dict_after = len(dictionary) if trained else dict_before
+    else:
+        dict_after = store.total_bytes()
+    before += dict_before
+    after += dict_after
+    load_after = load_before if dry_run else timed_load_all(new_paths, is_json)
+    saved = before - after
+    pct = 100 * saved / before if before else 0
+    print(f"   ✅ {converted} converted, {skipped} already {codec}" + (f", {errors} errors" if errors else ""))
+    print(f"   💾 {fmt_bytes(before)} → {fmt_bytes(after)}"
+          + (f" (incl. {fmt_bytes(dict_after)} of dictionaries)" if dict_after else "")
+          + f": {fmt_bytes(saved)} saved ({pct:.1f}%)")
+    if not dry_run:
+        print(f"   ⏱️  Loading all files: {load_before * 1000:.1f} ms → {load_after * 1000:.1f} ms")
+    return before, after, load_before, load_after, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert archive/quiz HTML caches to compressed storage",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Readers accept both the compressed and the legacy plain files, so the
+migration can run at any time and be interrupted safely. Set
+FAN2QUIZZ_CACHE_CODEC=plain to make the scripts write plain files again.
+        """
+    )
+    parser.add_argument('--archive-dir', type=Path, default=ARCHIVE_DIR, help='Archive directory')
+    parser.add_argument('--html-dir', type=Path, default=HTML_DIR, help='Quiz HTML cache directory')
+    parser.add_argument('--codec', choices=storage.available_codecs(), help='Codec to use (default: best available)')
+    parser.add_argument('--no-dictionary', action='store_true', help='Compress HTML pages without a dictionary')
+    parser.add_argument('--retrain', action='store_true', help='Train a new HTML dictionary and re-encode all pages')
+    parser.add_argument('--force', action='store_true', help='Re-encode files already in the target codec')
+    parser.add_argument('--dry-run', action='store_true', help='Report the savings without writing anything')
+    args = parser.parse_args()
+
+    print(f"🗜️  Cache migration (zstandard {'available' if storage.zstandard is not None else 'not installed'})"
+          + (" — dry run" if args.dry_run else ""))
+    totals = [0, 0, 0.0, 0.0, 0]
+    for directory, extension in ((args.archive_dir, '.json'), (args.html_dir, '.html')):
+        codec = args.codec or storage.default_codec(text=extension == '.html')
+        result = migrate_dir(directory, extension, codec, use_dictionary=not args.no_dictionary,
+                             retrain=args.retrain, force=args.force, dry_run=args.dry_run)
+        totals = [t + r for t, r in zip(totals, result)]
+
+    before, after, load_before, load_after, errors = totals
+    if before:
+        print(f"\n📊 Total: {fmt_bytes(before)} → {fmt_bytes(after)} "
+              f"({fmt_bytes(before - after)} saved, {100 * (before - after) / before:.1f}%)")
+        if not args.dry_run:
+            print(f"   Load time: {load_before * 1000:.1f} ms → {load_after * 1000:.1f} ms")
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
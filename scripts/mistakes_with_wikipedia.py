@@ -17,13 +17,16 @@ Usage examples:
     uv run scripts/mistakes_with_wikipedia.py --days 7
     uv run scripts/mistakes_with_wikipedia.py --player BastienZim
     uv run scripts/mistakes_with_wikipedia.py --output custom_report.md
+    uv run scripts/mistakes_with_wikipedia.py --no-wikipedia --output - | less
+    uv run scripts/mistakes_with_wikipedia.py --offline   # Local title index only (see build_wiki_index.py)
 """
 import sys
 import json
 import argparse
+import contextlib
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from collections import defaultdict
 import urllib.parse
 import urllib.request
@@ -31,72 +34,41 @@ import urllib.request
 
 
 ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from fan2quizz.categories import extract_category  # noqa: E402
+from fan2quizz.reportwriter import ReportWriter, status_stream  # noqa: E402
+from fan2quizz.wikiindex import WikiTitleIndex  # noqa: E402
+
 MISTAKES_FILE = ROOT / "data" / "results" / "mistakes_history.json"
 OUTPUT_DIR = ROOT / "output" / "reports"
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-# Canonical mapping for category IDs → French category names
-CAT_ID_NAME = {
-    1: "Culture classique",
-    2: "Culture moderne",
-    3: "Culture générale",
-    4: "Géographie",
-    5: "Histoire",
-    6: "Animaux et plantes",
-    7: "Sciences et techniques",
-    8: "Sport",
-}
-
-def resolve_category_name(value) -> str:
-    """Return display category name from a raw value.
-
-    Accepts integer IDs, numeric strings, or already formatted names.
-    Falls back to 'Unknown Category'.
-    """
-    if value is None:
-        return "Unknown Category"
-    # If it's already a string that might be numeric
-    if isinstance(value, str):
-        v = value.strip()
-        if v.isdigit():
-            try:
-                return CAT_ID_NAME.get(int(v), f"Catégorie {v}")
-            except Exception:
-                return f"Catégorie {v}"
-        # If it matches one of our known labels exactly, keep it; else just return original.
-        if any(v == vv for vv in CAT_ID_NAME.values()):
-            return v
-        return v
-    # If it's numeric
-    if isinstance(value, (int, float)):
-        try:
-            return CAT_ID_NAME.get(int(value), f"Catégorie {int(value)}")
-        except Exception:
-            return f"Catégorie {value}"
-    return str(value)
-
-def extract_category(mistake: Dict[str, Any]) -> str:
-    """Extract standardized category from a mistake record.
-
-    Tries common keys: 'category', 'category_id', 'main_category_id'.
-    """
-    for key in ("category", "category_id", "main_category_id"):
-        if key in mistake and mistake[key] not in (None, ""):
-            return resolve_category_name(mistake[key])
-    return "Unknown Category"
-
-
 # --- Wikipedia Helper Class ---
 class WikiHelper:
-    def __init__(self, lang: str = "fr"):
+    def __init__(self, lang: str = "fr", index: Optional[WikiTitleIndex] = None, offline: bool = False):
         self.lang = lang
         self.cache = {}
+        # Local title index (built by scripts/build_wiki_index.py); resolves links without network
+        self.index = index
+        self.offline = offline
 
     def link(self, topic: str) -> str:
         from urllib.parse import quote
         return f"https://{self.lang}.wikipedia.org/wiki/{quote(topic.replace(' ', '_'))}"
 
+    def search_local(self, query: str) -> Optional[str]:
+        """Resolve a query against the local title index, if one is loaded."""
+        if self.index is None:
+            return None
+        title = self.index.resolve(query)
+        return self.link(title) if title else None
+
     def search_api(self, query: str) -> str:
+        local = self.search_local(query)
+        if local or self.offline:
+            return local
         import urllib.request
         import urllib.parse
         import json
@@ -128,12 +100,15 @@ class WikiHelper:
         # Use cache if available
         if topic in self.cache:
             return self.cache[topic]
-        url = self.search_api(topic)
+        url = self.search_local(topic)
+        if url is None and not self.offline:
+            url = self.search_api(topic)
+            if url:
+                import time
+                time.sleep(0.1)  # only throttle real API calls
         if url:
             link = f"[📖 Wikipedia: {topic}]({url})"
             self.cache[topic] = link
-            import time
-            time.sleep(0.1)
             return link
         else:
             self.cache[topic] = "_No Wikipedia page found_"
@@ -190,6 +165,8 @@ class WikiHelper:
 
     def summary(self, topic: str, sentences: int = 2) -> str:
         """Get summary with fallback to API if wikipedia package not available."""
+        if self.offline:
+            return ""
         # Try the improved fetch method first
         result = self.fetch_wikipedia_summary(topic, sentences)
         
@@ -305,18 +282,48 @@ def group_mistakes_by_category(mistakes: List[Dict]) -> Dict[str, List[Dict]]:
     return dict(grouped)
 
 
-def generate_markdown_report(mistakes: List[Dict], output_file: Path, 
+def iter_markdown_report(mistakes: List[Dict], wiki: WikiHelper,
+                         include_wikipedia: bool = True,
+                         group_by_category: bool = False,
+                         include_details: bool = False) -> Iterator[str]:
+    """Yield the report chunk by chunk; Wikipedia lookups happen as each mistake is reached."""
+    yield "# 📚 Mistake Report with Wikipedia Resources\n"
+    yield f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+    yield f"**Total Mistakes:** {len(mistakes)}\n"
+    yield "---\n"
+    
+    if group_by_category:
+        # Group by category
+        grouped = group_mistakes_by_category(mistakes)
+        yield f"\n**Categories:** {len(grouped)}\n"
+        
+        for category, cat_mistakes in sorted(grouped.items()):
+            yield f"\n## 📂 {category}\n"
+            yield f"**{len(cat_mistakes)} mistake(s)**\n"
+            for mistake in cat_mistakes:
+                yield from _format_mistake(mistake, wiki, include_wikipedia, include_details)
+    else:
+        # Chronological order
+        yield "\n## 📅 Mistakes by Date\n"
+        
+        for mistake in mistakes:
+            yield from _format_mistake(mistake, wiki, include_wikipedia, include_details)
+
+
+def generate_markdown_report(mistakes: List[Dict], out: ReportWriter, 
                             include_wikipedia: bool = True,
                             group_by_category: bool = False,
-                            include_details: bool = False) -> bool:
+                            include_details: bool = False,
+                            wiki: Optional[WikiHelper] = None) -> bool:
     """
-    Generate a Markdown report of mistakes with Wikipedia links.
+    Stream a Markdown report of mistakes with Wikipedia links.
     
     Args:
         mistakes: List of mistake dictionaries
-        output_file: Path to output Markdown file
+        out: Writer for the output Markdown file (or stdout)
         include_wikipedia: Whether to include Wikipedia links
         group_by_category: Whether to group mistakes by category
+        wiki: Preconfigured WikiHelper (defaults to a network-backed French helper)
     
     Returns:
         True if successful
@@ -328,39 +335,16 @@ def generate_markdown_report(mistakes: List[Dict], output_file: Path,
     print(f"📝 Generating report with {len(mistakes)} mistake(s)...")
     
     # Wikipedia helper
-    wiki = WikiHelper(lang="fr")
-    
-    # Start building the report
-    lines = []
-    lines.append("# 📚 Mistake Report with Wikipedia Resources\n")
-    lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    lines.append(f"**Total Mistakes:** {len(mistakes)}\n")
-    lines.append("---\n")
-    
-    if group_by_category:
-        # Group by category
-        grouped = group_mistakes_by_category(mistakes)
-        lines.append(f"\n**Categories:** {len(grouped)}\n")
-        
-        for category, cat_mistakes in sorted(grouped.items()):
-            lines.append(f"\n## 📂 {category}\n")
-            lines.append(f"**{len(cat_mistakes)} mistake(s)**\n")
-            for mistake in cat_mistakes:
-                lines.extend(_format_mistake(mistake, wiki, include_wikipedia, include_details))
-    else:
-        # Chronological order
-        lines.append("\n## 📅 Mistakes by Date\n")
-        
-        for mistake in mistakes:
-            lines.extend(_format_mistake(mistake, wiki, include_wikipedia, include_details))
+    if wiki is None:
+        wiki = WikiHelper(lang="fr", index=WikiTitleIndex.open_default())
     
-    # Write to file
+    # Write each mistake as soon as it is formatted
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
-        print(f"✅ Report saved to: {output_file}")
+        with out:
+            out.write_all(iter_markdown_report(mistakes, wiki, include_wikipedia, group_by_category, include_details))
+        print(f"✅ Report saved to: {'stdout' if out.is_stdout else out.path}")
         return True
-    except Exception as e:
+    except OSError as e:
         print(f"❌ Error writing report: {e}")
         return False
 
@@ -519,7 +503,7 @@ Examples:
     parser.add_argument('--days', type=int,
                        help='Only include mistakes from last N days (default: all time)')
     parser.add_argument('--output', '-o',
-                       help='Output file path (default: mistakes_with_wikipedia.md)')
+                       help="Output file path, or '-' for stdout (default: mistakes_with_wikipedia.md)")
     parser.add_argument('--no-wikipedia', action='store_true',
                        help='Skip Wikipedia link generation (faster)')
     # Default is now grouping by category. Provide a flag to switch back to chronological.
@@ -529,9 +513,21 @@ Examples:
                        help='Only show summary statistics, do not generate report')
     parser.add_argument('--show-details', action='store_true',
                        help='Include your wrong answer, the correct answer, and all choices (omitted by default)')
+    parser.add_argument('--wiki-index', type=Path,
+                       help='Local title index built by build_wiki_index.py (default: data/cache/wiki/frwiki_titles.idx if present)')
+    parser.add_argument('--offline', action='store_true',
+                       help='Never call the Wikipedia API; resolve links from the local title index only')
     
     args = parser.parse_args()
+    out = ReportWriter(args.output if args.output else OUTPUT_DIR / "mistakes_with_wikipedia.md")
     
+    # With --output -, stdout carries only the report and progress goes to stderr
+    with contextlib.redirect_stdout(status_stream(args.output)):
+        return run_report(args, out)
+
+
+def run_report(args: argparse.Namespace, out: ReportWriter) -> int:
+    """Load and filter the mistakes, print the summary and stream the report through ``out``."""
     # Load mistakes
     print("📖 Loading mistakes history...")
     mistakes = load_mistakes()
@@ -559,24 +555,33 @@ Examples:
     if args.summary_only:
         return 0
     
-    # Determine output file
-    if args.output:
-        output_file = Path(args.output)
+    # Local title index (optional)
+    if args.wiki_index:
+        if not args.wiki_index.is_file():
+            print(f"❌ Wikipedia index not found: {args.wiki_index}")
+            return 1
+        index = WikiTitleIndex(args.wiki_index)
     else:
-        output_file = OUTPUT_DIR / "mistakes_with_wikipedia.md"
+        index = WikiTitleIndex.open_default()
+    if args.offline and index is None:
+        print("⚠️  --offline without a local index: no Wikipedia links will be resolved")
+        print("   Build one with: uv run scripts/build_wiki_index.py --titles <dump>")
+    wiki = WikiHelper(lang="fr", index=index, offline=args.offline)
     
     # Generate report
     success = generate_markdown_report(
         mistakes,
-        output_file,
+        out,
         include_wikipedia=not args.no_wikipedia,
         group_by_category=not args.chronological,  # default True unless chronological requested
         include_details=args.show_details,
+        wiki=wiki,
     )
     
     if success:
         print("\n✅ Done! Report generated successfully.")
-        print(f"📄 View report: {output_file}")
+        if not out.is_stdout:
+            print(f"📄 View report: {out.path}")
         if not args.no_wikipedia:
             print("💡 Tip: Use --no-wikipedia for faster generation without links")
         print("💡 Tip: Use --days 7 to see only recent mistakes")
@@ -10,15 +10,28 @@ Usage:
     uv run scripts/player_evolution.py --players BastienZim louish kamaiel  # Multiple
     uv run scripts/player_evolution.py --table             # Table format
     uv run scripts/player_evolution.py --csv output.csv    # Export to CSV
+    uv run scripts/player_evolution.py --advanced          # Rolling means, streaks, head-to-head
+    uv run scripts/player_evolution.py --normalized        # Field-size independent percentiles
+    uv run scripts/player_evolution.py --ratings           # Glicko ratings over all archives
 """
 import sys
-import json
 import argparse
+import statistics
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from collections import defaultdict
 
 ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import numpy as np  # noqa: E402
+
+from fan2quizz import storage  # noqa: E402
+from fan2quizz.analytics import PlayerMatrix  # noqa: E402
+from fan2quizz.percentiles import PercentileIndex  # noqa: E402
+from fan2quizz.ratings import RatingBook  # noqa: E402
+
 CACHE_DIR = ROOT / "data" / "cache" / "archive"
 
 # Default players to track
@@ -45,13 +58,11 @@ REAL_NAMES = {
 def load_all_archives() -> List[Dict[str, Any]]:
     """Load all archive files."""
     archives = []
-    for archive_file in sorted(CACHE_DIR.glob("*.json")):
-        if archive_file.name != ".gitkeep":
-            try:
-                data = json.loads(archive_file.read_text())
-                archives.append(data)
-            except Exception:
-                pass
+    for archive_file in storage.scan(CACHE_DIR, ".json").values():
+        try:
+            archives.append(storage.read_json(archive_file))
+        except Exception:
+            pass
     return archives
 
 
@@ -62,6 +73,7 @@ def extract_player_evolution(archives: List[Dict], players: List[str]) -> Dict[s
         Dict mapping player -> {date -> {score, time, rank, total_players}}
     """
     evolution = defaultdict(dict)
+    wanted = {p.lower() for p in players}
     
     for archive in archives:
         date = archive.get("date")
@@ -71,7 +83,7 @@ def extract_player_evolution(archives: List[Dict], players: List[str]) -> Dict[s
         # Extract data for each tracked player
         for entry in results:
             user = entry.get("user", "")
-            if user.lower() in [p.lower() for p in players]:
+            if user.lower() in wanted:
                 evolution[user.lower()][date] = {
                     "score": entry.get("good_responses", 0),
                     "time": entry.get("elapsed_time", 0),
@@ -82,7 +94,7 @@ def extract_player_evolution(archives: List[Dict], players: List[str]) -> Dict[s
     return dict(evolution)
 
 
-def print_evolution_chart(evolution: Dict[str, Dict], players: List[str]):
+def print_evolution_chart(evolution: Dict[str, Dict], players: List[str], matrix: Optional[PlayerMatrix] = None):
     """Print a visual chart of score evolution."""
     print("=" * 100)
     print("📈 PLAYER SCORE EVOLUTION")
@@ -102,6 +114,15 @@ def print_evolution_chart(evolution: Dict[str, Dict], players: List[str]):
     print(f"👥 Players: {len(evolution)}")
     print()
     
+    # Per-player stats, computed once for everyone
+    if matrix is None:
+        matrix = PlayerMatrix.from_evolution(evolution)
+    games = matrix.games()
+    averages = matrix.mean()
+    bests = matrix.best()
+    worsts = matrix.worst()
+    trends = matrix.trend()
+    
     # Print for each player
     for player in players:
         player_lower = player.lower()
@@ -144,18 +165,16 @@ def print_evolution_chart(evolution: Dict[str, Dict], players: List[str]):
             else:
                 print(f"   {date}: {'─'*40} --/-- (no data)")
         
-        if scores:
-            avg = sum(scores) / len(scores)
-            best = max(scores)
-            worst = min(scores)
-            trend = scores[-1] - scores[0] if len(scores) > 1 else 0
+        if scores and player in matrix:
+            row = matrix.row(player)
+            trend = int(trends[row])
             
             print(f"\n   📊 Stats:")
-            print(f"      Games Played: {len(scores)}/{len(dates)}")
-            print(f"      Average: {avg:.1f}/20")
-            print(f"      Best: {best}/20")
-            print(f"      Worst: {worst}/20")
-            if len(scores) > 1:
+            print(f"      Games Played: {int(games[row])}/{len(dates)}")
+            print(f"      Average: {float(averages[row]):.1f}/20")
+            print(f"      Best: {int(bests[row])}/20")
+            print(f"      Worst: {int(worsts[row])}/20")
+            if games[row] > 1:
                 trend_arrow = "📈" if trend > 0 else "📉" if trend < 0 else "➡️"
                 print(f"      Trend: {trend:+.1f} {trend_arrow}")
 
@@ -263,34 +282,38 @@ def export_to_csv(evolution: Dict[str, Dict], players: List[str], filename: str)
     print(f"✅ Exported to {filename}")
 
 
-def print_comparison_summary(evolution: Dict[str, Dict], players: List[str]):
+def print_comparison_summary(evolution: Dict[str, Dict], players: List[str], matrix: Optional[PlayerMatrix] = None):
     """Print a summary comparison of all players."""
     print("\n" + "=" * 100)
     print("🏆 PLAYER COMPARISON SUMMARY")
     print("=" * 100)
     
+    if matrix is None:
+        matrix = PlayerMatrix.from_evolution(evolution)
+    games = matrix.games()
+    avg_scores = matrix.mean("score")
+    avg_times = matrix.mean("time")
+    avg_ranks = matrix.mean("rank")
+    bests = matrix.best("score")
+    worsts = matrix.worst("score")
+    trends = matrix.trend("score")
+    
     stats = []
     for player in players:
-        player_lower = player.lower()
-        if player_lower not in evolution:
+        if player not in matrix:
             continue
-        
-        player_data = evolution[player_lower]
-        scores = [data["score"] for data in player_data.values()]
-        times = [data["time"] for data in player_data.values()]
-        ranks = [data["rank"] for data in player_data.values()]
-        
-        if scores:
+        row = matrix.row(player)
+        if games[row]:
             stats.append({
                 "player": player,
-                "real_name": REAL_NAMES.get(player_lower, player),
-                "avg_score": sum(scores) / len(scores),
-                "best_score": max(scores),
-                "worst_score": min(scores),
-                "avg_time": sum(times) / len(times),
-                "avg_rank": sum(ranks) / len(ranks),
-                "games": len(scores),
-                "trend": scores[-1] - scores[0] if len(scores) > 1 else 0
+                "real_name": REAL_NAMES.get(player.lower(), player),
+                "avg_score": float(avg_scores[row]),
+                "best_score": int(bests[row]),
+                "worst_score": int(worsts[row]),
+                "avg_time": float(avg_times[row]),
+                "avg_rank": float(avg_ranks[row]),
+                "games": int(games[row]),
+                "trend": int(trends[row])
             })
     
     # Sort by average score
@@ -312,6 +335,110 @@ def print_comparison_summary(evolution: Dict[str, Dict], players: List[str]):
               f"{s['avg_rank']:6.0f}")
 
 
+def print_normalized_summary(evolution: Dict[str, Dict], players: List[str], index: PercentileIndex):
+    """Print field-normalized results: daily percentile and z-score, comparable across days."""
+    print("\n" + "=" * 100)
+    print("⚖️  FIELD-NORMALIZED SUMMARY (percentile of the full daily leaderboard)")
+    print("=" * 100)
+    
+    rows = []
+    for player in players:
+        player_data = evolution.get(player.lower())
+        if not player_data:
+            continue
+        percentiles = []
+        zscores = []
+        best = None
+        for date, day in player_data.items():
+            pct = index.percentile(date, day["score"], day["time"])
+            if pct is None:
+                continue
+            percentiles.append(pct)
+            z = index.zscore(date, day["score"])
+            if z is not None:
+                zscores.append(z)
+            if best is None or pct > best[0]:
+                best = (pct, date)
+        if percentiles:
+            rows.append((REAL_NAMES.get(player.lower(), player), percentiles, zscores, best))
+    
+    if not rows:
+        print("\n⚠️  No data available.")
+        return
+    
+    rows.sort(key=lambda r: sum(r[1]) / len(r[1]), reverse=True)
+    print(f"\n{'Player':<15}{'Avg %ile':>10}{'Median':>9}{'Top 10%':>9}{'Avg z':>8}   {'Best day'}")
+    print("-" * 100)
+    for real_name, percentiles, zscores, best in rows:
+        median = statistics.median(percentiles)
+        top10 = sum(1 for p in percentiles if p >= 90)
+        avg_z = f"{sum(zscores) / len(zscores):+.2f}" if zscores else "--"
+        print(f"{real_name:<15}{sum(percentiles) / len(percentiles):>10.1f}{median:>9.1f}{top10:>9d}{avg_z:>8}"
+              f"   {best[1]} ({best[0]:.0f}%)")
+
+
+def print_ratings(players: List[str], book: RatingBook):
+    """Print Glicko ratings (computed over every archived player) for the tracked players."""
+    print("\n" + "=" * 100)
+    print(f"♟️  SKILL RATINGS (Glicko, {len(book.players)} players, archives up to {book.last_date})")
+    print("=" * 100)
+    
+    rated = [book.get(p) for p in players if book.get(p) is not None]
+    if not rated:
+        print("\n⚠️  No data available.")
+        return
+    
+    rated.sort(key=lambda r: r.conservative, reverse=True)
+    print(f"\n{'Pos':>5}  {'Player':<15}{'Rating':>8}{'±RD':>6}{'Last Δ':>8}{'Peak':>7}{'Games':>7}   {'Last played'}")
+    print("-" * 100)
+    for r in rated:
+        real_name = REAL_NAMES.get(r.name.lower(), r.name)
+        print(f"{book.position(r.name):>5}  {real_name:<15}{r.rating:>8.0f}{r.rd:>6.0f}{r.last_delta:>+8.1f}"
+              f"{r.peak:>7.0f}{r.games:>7}   {r.last_date}")
+
+
+def print_advanced_trends(matrix: PlayerMatrix, players: List[str], window: int = 7, streak_at: int = 15):
+    """Print rolling means, slopes, percentile ranks, streaks and head-to-head win rates."""
+    print("\n" + "=" * 100)
+    print("📐 ADVANCED TRENDS")
+    print("=" * 100)
+    
+    tracked = [p for p in players if p in matrix and matrix.games()[matrix.row(p)]]
+    if not tracked:
+        print("\n⚠️  No data available.")
+        return
+    
+    rolling = matrix.rolling_mean(window)
+    slopes = matrix.trend_slopes()
+    group_pct = matrix.percentile_rank().mean(axis=1)
+    field_pct = matrix.field_percentile().mean(axis=1)
+    current, longest = matrix.streaks(streak_at)
+    
+    print(f"\n{'Player':<15}{f'Last {window}d':>10}{'Slope/wk':>10}{'Group %':>9}{'Field %':>9}"
+          f"{f'Streak≥{streak_at}':>12}{'Best run':>10}")
+    print("-" * 100)
+    for player in tracked:
+        row = matrix.row(player)
+        real_name = REAL_NAMES.get(player.lower(), player)
+        latest = rolling[row, -1]
+        latest_txt = f"{float(latest):.1f}" if latest is not np.ma.masked else "--"
+        slope_txt = f"{float(slopes[row]) * 7:+.2f}" if slopes[row] is not np.ma.masked else "--"
+        field_txt = f"{float(field_pct[row]):.0f}" if field_pct[row] is not np.ma.masked else "--"
+        print(f"{real_name:<15}{latest_txt:>10}{slope_txt:>10}{float(group_pct[row]):>9.0f}{field_txt:>9}"
+              f"{int(current[row]):>12}{int(longest[row]):>10}")
+    
+    names, rates = matrix.win_rates(tracked)
+    labels = [REAL_NAMES.get(n, n)[:7] for n in names]
+    print("\n🤺 Head-to-head win rate (row beats column, days both played):")
+    print(f"{'':<15}" + "".join(f"{lbl:>8}" for lbl in labels))
+    for i, name in enumerate(names):
+        cells = "".join(
+            f"{'--':>8}" if rates[i, j] is np.ma.masked else f"{float(rates[i, j]) * 100:>7.0f}%"
+            for j in range(len(names))
+        )
+        print(f"{REAL_NAMES.get(name, name):<15}{cells}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Track player score evolution over time",
@@ -335,6 +462,9 @@ Examples:
   
   # Just show comparison summary
   uv run scripts/player_evolution.py --summary
+  
+  # Compare across days regardless of how many people played
+  uv run scripts/player_evolution.py --summary --normalized
         """
     )
     
@@ -343,6 +473,12 @@ Examples:
     parser.add_argument('--table', action='store_true', help='Show in table format')
     parser.add_argument('--csv', metavar='FILE', help='Export to CSV file')
     parser.add_argument('--summary', action='store_true', help='Show comparison summary only')
+    parser.add_argument('--advanced', action='store_true',
+                        help='Also show rolling means, slopes, percentile ranks, streaks and head-to-head')
+    parser.add_argument('--normalized', action='store_true',
+                        help='Also show percentiles against each full daily leaderboard (cached index)')
+    parser.add_argument('--ratings', action='store_true',
+                        help='Also show Glicko skill ratings computed over all archived leaderboards')
     
     args = parser.parse_args()
     
@@ -363,17 +499,29 @@ Examples:
         print(f"Available archives: {len(archives)}")
         return 1
     
+    # Dense player × date view shared by every statistic below
+    matrix = PlayerMatrix.from_archives(archives, players)
+    
     # Display based on options
     if args.csv:
         export_to_csv(evolution, players, args.csv)
     elif args.summary:
-        print_comparison_summary(evolution, players)
+        print_comparison_summary(evolution, players, matrix)
     elif args.table:
         print_evolution_table(evolution, players)
-        print_comparison_summary(evolution, players)
+        print_comparison_summary(evolution, players, matrix)
     else:
-        print_evolution_chart(evolution, players)
-        print_comparison_summary(evolution, players)
+        print_evolution_chart(evolution, players, matrix)
+        print_comparison_summary(evolution, players, matrix)
+    
+    if args.advanced:
+        print_advanced_trends(matrix, players)
+    
+    if args.normalized:
+        print_normalized_summary(evolution, players, PercentileIndex.open(CACHE_DIR))
+    
+    if args.ratings:
+        print_ratings(players, RatingBook.open(CACHE_DIR))
     
     return 0
 
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Glicko skill ratings for every player found in the archives.
+
+Ratings are updated incrementally: only archives added since the last run are
+processed, the rest comes from data/cache/derived/ratings.json.
+
+Usage:
+    uv run scripts/player_ratings.py                      # Top 25
+    uv run scripts/player_ratings.py --top 100 --min-games 20
+    uv run scripts/player_ratings.py --player BastienZim kamaiel
+    uv run scripts/player_ratings.py --selected           # Players from data/players.json
+    uv run scripts/player_ratings.py --rebuild            # Recompute from scratch
+"""
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from fan2quizz.ratings import DEFAULT_RATINGS_PATH, RatingBook  # noqa: E402
+
+CACHE_DIR = ROOT / "data" / "cache" / "archive"
+PLAYERS_CONFIG_PATH = ROOT / "data" / "players.json"
+
+
+def load_players_config():
+    try:
+        config = json.loads(PLAYERS_CONFIG_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return [], {}
+    return config.get('selected', []), config.get('real_names', {})
+
+
+def print_ratings(book: RatingBook, rows, real_names, min_games: int):
+    print(f"\n{'Pos':>5}  {'Player':<22}{'Name':<11}{'Rating':>8}{'±RD':>6}{'Last Δ':>8}{'Peak':>7}{'Games':>7}   {'Last played'}")
+    print("-" * 100)
+    for player in rows:
+        pos = book.position(player.name, min_games)
+        pos_txt = str(pos) if pos is not None else '--'
+        print(f"{pos_txt:>5}  {player.name:<22}{real_names.get(player.name.lower(), ''):<11}"
+              f"{player.rating:>8.0f}{player.rd:>6.0f}{player.last_delta:>+8.1f}{player.peak:>7.0f}"
+              f"{player.games:>7}   {player.last_date}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Glicko skill ratings over all archived daily leaderboards",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Players are ranked by their conservative rating (rating - 2×RD), so a
+newcomer with a lucky first day does not top the table.
+        """
+    )
+    parser.add_argument('--top', type=int, default=25, help='Number of players to show (default: 25)')
+    parser.add_argument('--min-games', type=int, default=5, help='Minimum days played to be ranked (default: 5)')
+    parser.add_argument('--player', nargs='+', help='Show specific players')
+    parser.add_argument('--selected', action='store_true', help='Show the players from data/players.json')
+    parser.add_argument('--rebuild', action='store_true', help='Ignore saved state and recompute from scratch')
+    parser.add_argument('--archive-dir', type=Path, default=CACHE_DIR, help='Archive directory')
+    parser.add_argument('--state', type=Path, default=DEFAULT_RATINGS_PATH, help='Rating state file')
+    args = parser.parse_args()
+
+    if not args.archive_dir.is_dir():
+        print(f"❌ Archive directory not found: {args.archive_dir}")
+        return 1
+
+    start = time.perf_counter()
+    book = RatingBook(args.state)
+    if not args.rebuild:
+        book.load()
+    processed = book.update(args.archive_dir)
+    if processed:
+        book.save()
+    elapsed = time.perf_counter() - start
+    if not book.players:
+        print("⚠️  No archived leaderboards found.")
+        return 1
+    print(f"♟️  {len(book.players):,} players rated over {len(book.sources)} days "
+          f"({processed} processed in {elapsed:.2f}s)")
+
+    selected, real_names = load_players_config()
+    if args.player or args.selected:
+        wanted = args.player or selected
+        rows = [book.get(name) for name in wanted if book.get(name) is not None]
+        missing = [name for name in wanted if book.get(name) is None]
+        rows.sort(key=lambda p: p.conservative, reverse=True)
+        print_ratings(book, rows, real_names, args.min_games)
+        if missing:
+            print(f"\n⚠️  Not found in archives: {', '.join(missing)}")
+    else:
+        print_ratings(book, book.leaderboard(args.min_games)[:args.top], real_names, args.min_games)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -16,9 +16,12 @@ Usage examples:
     uv run scripts/plot_evolution.py --show         # Show interactively
     uv run scripts/plot_evolution.py --comparison   # Individual player subplots
     uv run scripts/plot_evolution.py --both         # All visualizations
+    uv run scripts/plot_evolution.py --both --split-panels --jobs 8  # + one image per player, in parallel
+    uv run scripts/plot_evolution.py --both --force # Re-render even if figures are up to date
+    uv run scripts/plot_evolution.py --show --preview  # Fast low-dpi draft for long histories
 """
 import sys
-import json
+import time
 import argparse
 from pathlib import Path
 from datetime import datetime
@@ -26,9 +29,24 @@ from typing import List, Dict, Any
 from collections import defaultdict
 
 ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from fan2quizz import storage  # noqa: E402
+from fan2quizz.derived import fingerprint  # noqa: E402
+from fan2quizz.render import RenderJob, lttb, render_all, render_in_process, source_digest  # noqa: E402
+
 CACHE_DIR = ROOT / "data" / "cache" / "archive"
 FIGURES_DIR = ROOT / "data" / "figures"
 
+PUBLICATION_DPI = 300
+
+# Preview mode: low dpi, no value labels, long series decimated with LTTB
+PREVIEW_DPI = 80
+PREVIEW_MAX_POINTS = 400
+PREVIEW_MARKER_LIMIT = 60
+_PREVIEW_RC: Dict[str, Dict[str, Any]] = {}
+
 # Ensure figures directory exists
 FIGURES_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -76,13 +94,11 @@ MARKERS = ['o', 's', '^', 'D', 'v', 'p', '*', 'h', 'X', 'P']
 def load_all_archives() -> List[Dict[str, Any]]:
     """Load all archive files."""
     archives = []
-    for archive_file in sorted(CACHE_DIR.glob("*.json")):
-        if archive_file.name != ".gitkeep":
-            try:
-                data = json.loads(archive_file.read_text())
-                archives.append(data)
-            except Exception:
-                pass
+    for archive_file in storage.scan(CACHE_DIR, ".json").values():
+        try:
+            archives.append(storage.read_json(archive_file))
+        except Exception:
+            pass
     return archives
 
 
@@ -93,6 +109,7 @@ def extract_player_evolution(archives: List[Dict], players: List[str]) -> Dict[s
         Dict mapping player -> {date -> score}
     """
     evolution = defaultdict(dict)
+    wanted = {p.lower() for p in players}
     
     for archive in archives:
         date = archive.get("date")
@@ -101,16 +118,66 @@ def extract_player_evolution(archives: List[Dict], players: List[str]) -> Dict[s
         # Extract data for each tracked player
         for entry in results:
             user = entry.get("user", "")
-            if user.lower() in [p.lower() for p in players]:
+            if user.lower() in wanted:
                 score = entry.get("good_responses", 0)
                 evolution[user.lower()][date] = score
     
     return dict(evolution)
 
 
+def apply_preview_style(style: str = 'default'):
+    """Apply the plot theme from an rcParams snapshot built once per style.
+    
+    Rebuilding the seaborn theme (and re-reading style sheets) on every redraw
+    is avoidable work in preview mode.
+    """
+    import matplotlib
+    rc = _PREVIEW_RC.get(style)
+    if rc is None:
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        with matplotlib.rc_context():
+            sns.set_theme(style="darkgrid" if style == 'dark' else "whitegrid", context="talk")
+            if style == 'dark':
+                plt.style.use('dark_background')
+            elif style == 'ggplot':
+                plt.style.use('ggplot')
+            rc = {k: v for k, v in matplotlib.rcParams.items() if matplotlib.rcParams[k] != matplotlib.rcParamsDefault.get(k)}
+        _PREVIEW_RC[style] = rc
+    matplotlib.rcParams.update(rc)
+
+
+def downsample(x_dates: List[datetime], y_scores: List[int], max_points: int = PREVIEW_MAX_POINTS):
+    """Reduce a long series to ``max_points`` with LTTB, keeping peaks and dips."""
+    if len(x_dates) <= max_points:
+        return x_dates, y_scores
+    keep = lttb([d.toordinal() for d in x_dates], y_scores, max_points)
+    return [x_dates[i] for i in keep], [y_scores[i] for i in keep]
+
+
+def set_preview_date_axis(ax):
+    """Concise automatic date ticks: DayLocator over years of data means thousands of ticks."""
+    import matplotlib.dates as mdates
+    locator = mdates.AutoDateLocator(minticks=3, maxticks=7)
+    ax.xaxis.set_major_locator(locator)
+    ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+
+
+def savefig_kwargs(output, preview: bool) -> Dict[str, Any]:
+    kwargs: Dict[str, Any] = {'dpi': PREVIEW_DPI if preview else PUBLICATION_DPI, 'bbox_inches': 'tight'}
+    if preview and str(output).lower().endswith('.png'):
+        kwargs['pil_kwargs'] = {'compress_level': 1}  # Drafts are throwaway: favour encode speed
+    return kwargs
+
+
+def preview_path(path) -> str:
+    path = Path(path)
+    return str(path.with_name(f"{path.stem}_preview{path.suffix}"))
+
+
 def create_evolution_plot(evolution: Dict[str, Dict], players: List[str], 
                          output_file: str = None, style: str = 'default',
-                         show: bool = False):
+                         show: bool = False, preview: bool = False):
     """Create a matplotlib plot of score evolution."""
     try:
         import matplotlib.pyplot as plt
@@ -121,21 +188,24 @@ def create_evolution_plot(evolution: Dict[str, Dict], players: List[str],
         print("📦 Install them with: uv pip install matplotlib seaborn")
         return False
     
-    # Set seaborn style and context
-    sns.set_theme(style="whitegrid", context="talk")
-    sns.set_palette("husl")
-    
-    # Set style
-    if style == 'dark':
-        sns.set_theme(style="darkgrid", context="talk")
-        plt.style.use('dark_background')
-    elif style == 'ggplot':
-        plt.style.use('ggplot')
-    elif style == 'seaborn':
+    if preview:
+        apply_preview_style(style)
+    else:
+        # Set seaborn style and context
         sns.set_theme(style="whitegrid", context="talk")
+        sns.set_palette("husl")
+        
+        # Set style
+        if style == 'dark':
+            sns.set_theme(style="darkgrid", context="talk")
+            plt.style.use('dark_background')
+        elif style == 'ggplot':
+            plt.style.use('ggplot')
+        elif style == 'seaborn':
+            sns.set_theme(style="whitegrid", context="talk")
     
     # Create figure and axis with better proportions
-    fig, ax = plt.subplots(figsize=(16, 9))
+    fig, ax = plt.subplots(figsize=(16, 9), dpi=PREVIEW_DPI if preview else None)
     
     # Get all dates
     all_dates = set()
@@ -164,7 +234,7 @@ def create_evolution_plot(evolution: Dict[str, Dict], players: List[str],
         
         for date in dates_sorted:
             if date in player_data:
-                x_dates.append(datetime.strptime(date, '%Y-%m-%d'))
+                x_dates.append(datetime.fromisoformat(date))
                 y_scores.append(player_data[date])
         
         if not x_dates:
@@ -175,6 +245,20 @@ def create_evolution_plot(evolution: Dict[str, Dict], players: List[str],
         linestyle = LINE_STYLES[idx % len(LINE_STYLES)]
         marker = MARKERS[idx % len(MARKERS)]
         
+        if preview:
+            # Lightweight draft: decimated series, small markers, no value labels
+            x_dates, y_scores = downsample(x_dates, y_scores)
+            ax.plot(x_dates, y_scores,
+                    marker=marker if len(x_dates) <= PREVIEW_MARKER_LIMIT else None,
+                    linewidth=2,
+                    markersize=5,
+                    label=real_name,
+                    color=color,
+                    linestyle=linestyle,
+                    alpha=0.9,
+                    zorder=10 - idx)
+            continue
+        
         ax.plot(x_dates, y_scores, 
                 marker=marker, 
                 linewidth=3.5, 
@@ -222,8 +306,11 @@ def create_evolution_plot(evolution: Dict[str, Dict], players: List[str],
     ax.set_axisbelow(True)
     
     # Format x-axis dates
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %d'))
-    ax.xaxis.set_major_locator(mdates.DayLocator())
+    if preview:
+        set_preview_date_axis(ax)
+    else:
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %d'))
+        ax.xaxis.set_major_locator(mdates.DayLocator())
     plt.xticks(rotation=30, ha='right', fontsize=11)
     plt.yticks(fontsize=11)
     
@@ -268,7 +355,7 @@ def create_evolution_plot(evolution: Dict[str, Dict], players: List[str],
     
     # Save or show
     if output_file:
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        plt.savefig(output_file, **savefig_kwargs(output_file, preview))
         print(f"✅ Plot saved to: {output_file}")
     
     if show:
@@ -276,20 +363,113 @@ def create_evolution_plot(evolution: Dict[str, Dict], players: List[str],
     
     if not show and not output_file:
         # Default: save to file
-        default_output = FIGURES_DIR / "score_evolution.png"
-        plt.savefig(default_output, dpi=300, bbox_inches='tight')
+        default_output = FIGURES_DIR / ("score_evolution_preview.png" if preview else "score_evolution.png")
+        plt.savefig(default_output, **savefig_kwargs(default_output, preview))
         print(f"✅ Plot saved to: {default_output}")
     
     plt.close()
     return True
 
 
+def draw_player_panel(ax, player: str, player_data: Dict[str, int], dates_sorted: List[str],
+                      color, idx: int, preview: bool = False):
+    """Draw one player's score trend (filled line, value labels, average) on ``ax``."""
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+    import seaborn as sns
+    
+    real_name = REAL_NAMES.get(player.lower(), player)
+    
+    # Prepare data
+    x_dates = []
+    y_scores = []
+    
+    for date in dates_sorted:
+        if date in player_data:
+            x_dates.append(datetime.fromisoformat(date))
+            y_scores.append(player_data[date])
+    
+    if not x_dates:
+        ax.set_visible(False)
+        return
+    
+    # Plot with seaborn styling
+    marker = MARKERS[idx % len(MARKERS)]
+    linestyle = LINE_STYLES[idx % len(LINE_STYLES)]
+    
+    # Stats come from the full series, drawing from the decimated one in preview mode
+    avg_score = sum(y_scores) / len(y_scores)
+    trend = y_scores[-1] - y_scores[0] if len(y_scores) > 1 else 0
+    if preview:
+        x_dates, y_scores = downsample(x_dates, y_scores)
+    
+    # Fill area under curve for better visibility
+    ax.fill_between(x_dates, 0, y_scores, alpha=0.15, color=color)
+    
+    # Plot line
+    if preview:
+        ax.plot(x_dates, y_scores,
+               marker=marker if len(x_dates) <= PREVIEW_MARKER_LIMIT else None,
+               linewidth=2,
+               markersize=5,
+               color=color,
+               linestyle=linestyle)
+    else:
+        ax.plot(x_dates, y_scores, 
+               marker=marker, 
+               linewidth=3.5, 
+               markersize=12,
+               color=color,
+               linestyle=linestyle,
+               markeredgewidth=2.5,
+               markeredgecolor='white',
+               markerfacecolor=color)
+    
+    # Add value labels with better styling
+    for x, y in ([] if preview else zip(x_dates, y_scores)):
+        ax.annotate(f'{y}', 
+                   xy=(x, y), 
+                   xytext=(0, 10),
+                   textcoords='offset points',
+                   ha='center',
+                   fontsize=11,
+                   fontweight='bold',
+                   bbox=dict(boxstyle='round,pad=0.4', 
+                           facecolor='white', 
+                           alpha=0.85,
+                           edgecolor=color,
+                           linewidth=2))
+    
+    # Formatting with stats in title
+    trend_arrow = "↗" if trend > 0 else "↘" if trend < 0 else "→"
+    
+    ax.set_title(f'{real_name}\nAvg: {avg_score:.1f}  |  Trend: {trend:+.0f} {trend_arrow}', 
+                fontweight='bold',
+                fontsize=12,
+                pad=10)
+    ax.set_ylim(-0.5, 20.5)
+    ax.set_yticks(range(0, 21, 5))
+    ax.yaxis.grid(True, alpha=0.3, linestyle='-')
+    ax.xaxis.grid(True, alpha=0.2, linestyle='--')
+    ax.set_axisbelow(True)
+    if preview:
+        set_preview_date_axis(ax)
+    else:
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
+    plt.setp(ax.xaxis.get_majorticklabels(), rotation=40, ha='right', fontsize=9)
+    
+    # Add reference line at average
+    ax.axhline(y=avg_score, color=color, linestyle='--', alpha=0.3, linewidth=2)
+    
+    # Remove spines
+    sns.despine(ax=ax)
+
+
 def create_comparison_plot(evolution: Dict[str, Dict], players: List[str],
-                          output_file: str = None, show: bool = False):
+                          output_file: str = None, show: bool = False, preview: bool = False):
     """Create a subplot comparison with individual player trends."""
     try:
         import matplotlib.pyplot as plt
-        import matplotlib.dates as mdates
         import seaborn as sns
     except ImportError:
         print("❌ Error: matplotlib or seaborn is not installed")
@@ -297,7 +477,10 @@ def create_comparison_plot(evolution: Dict[str, Dict], players: List[str],
         return False
     
     # Set seaborn style
-    sns.set_theme(style="whitegrid", context="talk")
+    if preview:
+        apply_preview_style()
+    else:
+        sns.set_theme(style="whitegrid", context="talk")
     
     # Filter players with data
     players_with_data = [p for p in players if p.lower() in evolution]
@@ -311,7 +494,7 @@ def create_comparison_plot(evolution: Dict[str, Dict], players: List[str],
     n_cols = 3
     n_rows = (n_players + n_cols - 1) // n_cols
     
-    fig, axes = plt.subplots(n_rows, n_cols, figsize=(18, 5 * n_rows))
+    fig, axes = plt.subplots(n_rows, n_cols, figsize=(18, 5 * n_rows), dpi=PREVIEW_DPI if preview else None)
     fig.patch.set_facecolor('white')
     
     if n_players == 1:
@@ -330,81 +513,8 @@ def create_comparison_plot(evolution: Dict[str, Dict], players: List[str],
     
     # Plot each player
     for idx, player in enumerate(players_with_data):
-        player_lower = player.lower()
-        player_data = evolution[player_lower]
-        real_name = REAL_NAMES.get(player_lower, player)
-        
-        ax = axes[idx]
-        
-        # Prepare data
-        x_dates = []
-        y_scores = []
-        
-        for date in dates_sorted:
-            if date in player_data:
-                x_dates.append(datetime.strptime(date, '%Y-%m-%d'))
-                y_scores.append(player_data[date])
-        
-        if not x_dates:
-            ax.set_visible(False)
-            continue
-        
-        # Plot with seaborn styling
-        color = palette[idx % len(palette)]
-        marker = MARKERS[idx % len(MARKERS)]
-        linestyle = LINE_STYLES[idx % len(LINE_STYLES)]
-        
-        # Fill area under curve for better visibility
-        ax.fill_between(x_dates, 0, y_scores, alpha=0.15, color=color)
-        
-        # Plot line
-        ax.plot(x_dates, y_scores, 
-               marker=marker, 
-               linewidth=3.5, 
-               markersize=12,
-               color=color,
-               linestyle=linestyle,
-               markeredgewidth=2.5,
-               markeredgecolor='white',
-               markerfacecolor=color)
-        
-        # Add value labels with better styling
-        for x, y in zip(x_dates, y_scores):
-            ax.annotate(f'{y}', 
-                       xy=(x, y), 
-                       xytext=(0, 10),
-                       textcoords='offset points',
-                       ha='center',
-                       fontsize=11,
-                       fontweight='bold',
-                       bbox=dict(boxstyle='round,pad=0.4', 
-                               facecolor='white', 
-                               alpha=0.85,
-                               edgecolor=color,
-                               linewidth=2))
-        
-        # Formatting with stats in title
-        avg_score = sum(y_scores) / len(y_scores)
-        trend = y_scores[-1] - y_scores[0] if len(y_scores) > 1 else 0
-        trend_arrow = "↗" if trend > 0 else "↘" if trend < 0 else "→"
-        
-        ax.set_title(f'{real_name}\nAvg: {avg_score:.1f}  |  Trend: {trend:+.0f} {trend_arrow}', 
-                    fontweight='bold',
-                    fontsize=12,
-                    pad=10)
-        ax.set_ylim(-0.5, 20.5)
-        ax.set_yticks(range(0, 21, 5))
-        ax.yaxis.grid(True, alpha=0.3, linestyle='-')
-        ax.xaxis.grid(True, alpha=0.2, linestyle='--')
-        ax.set_axisbelow(True)
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=40, ha='right', fontsize=9)
-        
-        # Add reference line at average
-        ax.axhline(y=avg_score, color=color, linestyle='--', alpha=0.3, linewidth=2)
-        
-        # Remove spines
-        sns.despine(ax=ax)
+        draw_player_panel(axes[idx], player, evolution[player.lower()], dates_sorted,
+                          palette[idx % len(palette)], idx, preview)
     
     # Hide unused subplots
     for idx in range(n_players, len(axes)):
@@ -416,25 +526,81 @@ def create_comparison_plot(evolution: Dict[str, Dict], players: List[str],
                 y=0.998,
                 x=0.05,
                 ha='left')
-    plt.tight_layout(rect=[0, 0, 1, 0.99])
+    if preview:
+        # A fixed grid spacing avoids tight_layout's extra measuring draw of every panel
+        fig.subplots_adjust(left=0.05, right=0.98, top=1 - 1.2 / (5 * n_rows), bottom=0.5 / (5 * n_rows),
+                            hspace=0.55, wspace=0.2)
+    else:
+        plt.tight_layout(rect=[0, 0, 1, 0.99])
     
     # Save or show
     if output_file:
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        plt.savefig(output_file, **savefig_kwargs(output_file, preview))
         print(f"✅ Comparison plot saved to: {output_file}")
     
     if show:
         plt.show()
     
     if not show and not output_file:
-        default_output = FIGURES_DIR / "score_comparison.png"
-        plt.savefig(default_output, dpi=300, bbox_inches='tight')
+        default_output = FIGURES_DIR / ("score_comparison_preview.png" if preview else "score_comparison.png")
+        plt.savefig(default_output, **savefig_kwargs(default_output, preview))
         print(f"✅ Comparison plot saved to: {default_output}")
     
     plt.close()
     return True
 
 
+def create_player_panel(evolution: Dict[str, Dict], player: str, idx: int, n_players: int,
+                        output_file: str, preview: bool = False):
+    """Render a single player's comparison panel as its own image."""
+    try:
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+    except ImportError:
+        print("❌ Error: matplotlib or seaborn is not installed")
+        print("📦 Install them with: uv pip install matplotlib seaborn")
+        return False
+    
+    player_data = evolution.get(player.lower())
+    if not player_data:
+        return False
+    
+    if preview:
+        apply_preview_style()
+    else:
+        sns.set_theme(style="whitegrid", context="talk")
+    palette = sns.color_palette("husl", n_players)
+    
+    fig, ax = plt.subplots(figsize=(6, 5), dpi=PREVIEW_DPI if preview else None)
+    fig.patch.set_facecolor('white')
+    draw_player_panel(ax, player, player_data, sorted(player_data), palette[idx % len(palette)], idx, preview)
+    plt.tight_layout()
+    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(output_file, **savefig_kwargs(output_file, preview))
+    plt.close(fig)
+    return True
+
+
+def figure_fingerprint(kind: str, evolution: Dict[str, Dict], players: List[str], **options) -> str:
+    """Fingerprint of everything a figure depends on: data slice, players, options, dpi and plot code."""
+    data = {p.lower(): evolution.get(p.lower(), {}) for p in players}
+    code = source_digest(create_evolution_plot, create_comparison_plot, create_player_panel)
+    dpi = PREVIEW_DPI if options.get('preview') else PUBLICATION_DPI
+    return fingerprint(kind, data, players, options, dpi, code)
+
+
+def print_render_summary(results, wall: float):
+    """Print output path and render time of every figure."""
+    cached = sum(r.cached for r in results)
+    print(f"\n🖼️  Rendered {sum(r.ok and not r.cached for r in results)}/{len(results) - cached} figure(s) "
+          f"in {wall:.1f}s ({sum(r.seconds for r in results):.1f}s of rendering, {cached} up to date):")
+    for r in results:
+        status = "♻️ " if r.cached else "✅" if r.ok else "❌"
+        target = r.output if r.output else r.name
+        timing = "cached" if r.cached else f"{r.seconds:.2f}s"
+        print(f"   {status} {timing:>7}  {target}" + (f"  ({r.error})" if r.error else ""))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate matplotlib plots of score evolution",
@@ -461,6 +627,12 @@ Examples:
   
   # Both main plot and comparison
   uv run scripts/plot_evolution.py --both
+  
+  # Everything, plus one image per player, rendered on 8 processes
+  uv run scripts/plot_evolution.py --both --split-panels --jobs 8
+  
+  # Quick interactive look at a multi-year history
+  uv run scripts/plot_evolution.py --show --preview
         """
     )
     
@@ -477,6 +649,14 @@ Examples:
                        help='Create comparison subplots instead of single plot')
     parser.add_argument('--both', action='store_true',
                        help='Create both main plot and comparison')
+    parser.add_argument('--split-panels', action='store_true',
+                       help='Also render each player panel as its own image in data/figures/players/')
+    parser.add_argument('--jobs', '-j', type=int, default=0,
+                       help='Render processes (default: auto, capped by CPUs and free memory; 1 = sequential)')
+    parser.add_argument('--force', action='store_true',
+                       help='Re-render figures even when their input data has not changed')
+    parser.add_argument('--preview', action='store_true',
+                       help=f'Fast draft: {PREVIEW_DPI} dpi, no value labels, long series downsampled (saved as *_preview.png)')
     
     args = parser.parse_args()
     
@@ -502,26 +682,72 @@ Examples:
     
     print(f"✅ Found data for {len(evolution)} player(s)")
     
-    # Create plots
-    success = False
+    # Create plots (independent figures are rendered in parallel worker processes).
+    # Saved figures are fingerprinted so unchanged ones are not rendered again.
+    jobs = []
+    preview = args.preview
+    
+    def figure_path(name: str) -> str:
+        path = FIGURES_DIR / name
+        return preview_path(path) if preview else str(path)
+    
+    evolution_default = None if args.show else figure_path("score_evolution.png")
+    comparison_default = None if args.show else figure_path("score_comparison.png")
     
     if args.both:
-        # Create both plots
         print("\n📈 Creating main evolution plot...")
-        output1 = args.output or str(FIGURES_DIR / "score_evolution.png")
-        success1 = create_evolution_plot(evolution, players, output1, args.style, args.show)
+        output1 = args.output or figure_path("score_evolution.png")
+        jobs.append(RenderJob("evolution", create_evolution_plot,
+                              dict(evolution=evolution, players=players, output_file=output1,
+                                   style=args.style, show=args.show, preview=preview), output1,
+                              figure_fingerprint("evolution", evolution, players, style=args.style,
+                                                 preview=preview)))
         
         print("\n📊 Creating comparison subplots...")
-        output2 = str(FIGURES_DIR / "score_comparison.png")
-        success2 = create_comparison_plot(evolution, players, output2, args.show)
-        
-        success = success1 or success2
+        output2 = figure_path("score_comparison.png")
+        jobs.append(RenderJob("comparison", create_comparison_plot,
+                              dict(evolution=evolution, players=players, output_file=output2,
+                                   show=args.show, preview=preview), output2,
+                              figure_fingerprint("comparison", evolution, players, preview=preview)))
     elif args.comparison:
         print("\n📊 Creating comparison subplots...")
-        success = create_comparison_plot(evolution, players, args.output, args.show)
+        output = args.output or comparison_default
+        jobs.append(RenderJob("comparison", create_comparison_plot,
+                              dict(evolution=evolution, players=players, output_file=output,
+                                   show=args.show, preview=preview), output,
+                              figure_fingerprint("comparison", evolution, players, preview=preview)))
     else:
         print("\n📈 Creating evolution plot...")
-        success = create_evolution_plot(evolution, players, args.output, args.style, args.show)
+        output = args.output or evolution_default
+        jobs.append(RenderJob("evolution", create_evolution_plot,
+                              dict(evolution=evolution, players=players, output_file=output,
+                                   style=args.style, show=args.show, preview=preview), output,
+                              figure_fingerprint("evolution", evolution, players, style=args.style,
+                                                 preview=preview)))
+    
+    if args.split_panels:
+        players_with_data = [p for p in players if p.lower() in evolution]
+        print(f"\n🧩 Creating {len(players_with_data)} individual player panels...")
+        for idx, player in enumerate(players_with_data):
+            output = figure_path(f"players/{player.lower()}.png")
+            jobs.append(RenderJob(f"panel:{player}", create_player_panel,
+                                  dict(evolution=evolution, player=player, idx=idx,
+                                       n_players=len(players_with_data), output_file=output,
+                                       preview=preview), output,
+                                  figure_fingerprint("panel", evolution, [player], idx=idx,
+                                                     n_players=len(players_with_data), preview=preview)))
+    
+    start = time.perf_counter()
+    if args.show:
+        # Interactive windows need the main process and its GUI backend
+        results = render_in_process(jobs)
+    else:
+        results = render_all(jobs, max_workers=args.jobs or None, force=args.force)
+    if len(jobs) > 1:
+        print_render_summary(results, time.perf_counter() - start)
+    elif results and results[0].cached:
+        print(f"♻️  Up to date, no new data since last render: {results[0].output} (use --force to redraw)")
+    success = any(r.ok for r in results)
     
     if success:
         print("\n✅ Done!")
@@ -31,6 +31,7 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from fan2quizz import storage  # noqa: E402
 from fan2quizz.scraper import QuizypediaScraper  # noqa: E402
 from fan2quizz.utils import RateLimiter  # noqa: E402
 
@@ -103,22 +104,19 @@ def get_cache_path(year: int, month: int, day: int) -> Path:
 
 
 def load_cached_html(year: int, month: int, day: int) -> Optional[str]:
-    """Load cached HTML if it exists."""
-    cache_path = get_cache_path(year, month, day)
-    if cache_path.exists():
-        try:
-            return cache_path.read_text(encoding='utf-8')
-        except Exception:
-            return None
-    return None
+    """Load cached HTML (compressed or legacy plain file) if it exists."""
+    try:
+        return storage.load_text(get_cache_path(year, month, day))
+    except Exception:
+        return None
 
 
 def save_cached_html(html: str, year: int, month: int, day: int):
-    """Save HTML to cache."""
+    """Save HTML to cache (compressed, see fan2quizz.storage)."""
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
     cache_path = get_cache_path(year, month, day)
     try:
-        cache_path.write_text(html, encoding='utf-8')
+        storage.write_text(cache_path, html)
     except Exception:
         pass  # Cache write failure is not critical
 
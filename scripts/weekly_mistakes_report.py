@@ -22,8 +22,17 @@ Usage:
     # Custom output file
     uv run scripts/weekly_mistakes_report.py --output my_report.md
     
+    # Stream to stdout (progress messages go to stderr)
+    uv run scripts/weekly_mistakes_report.py --output - > report.md
+    
     # Show progress while fetching
     uv run scripts/weekly_mistakes_report.py --verbose
+    
+    # Scheduled run exporting Prometheus metrics (node_exporter textfile collector)
+    uv run scripts/weekly_mistakes_report.py --metrics-dir /var/lib/node_exporter
+    
+    # Recompute every day instead of reusing memoized results
+    uv run scripts/weekly_mistakes_report.py --no-memo
 
 Output:
     - output/reports/WEEKLY_MISTAKES_REPORT.md (or custom filename)
@@ -34,18 +43,22 @@ import sys
 import json
 import re
 import argparse
+import contextlib
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
-from collections import defaultdict
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from collections import defaultdict, Counter
 
 # Add parent directory to path
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from fan2quizz import metrics, storage, timing  # noqa: E402
 from fan2quizz.scraper import QuizypediaScraper  # noqa: E402
 from fan2quizz.utils import RateLimiter  # noqa: E402
+from fan2quizz.derived import DerivedStore, hash_text  # noqa: E402
+from fan2quizz.reportwriter import ReportWriter, status_stream  # noqa: E402
 
 # File paths
 DEFAULT_OUTPUT = ROOT / "output" / "reports" / "WEEKLY_MISTAKES_REPORT.md"
@@ -54,6 +67,20 @@ HISTORY_FILE = ROOT / "data" / "results" / "mistakes_history.json"
 # Cache directory for HTML files
 CACHE_DIR = ROOT / "data" / "cache" / "quiz_html"
 
+# Memoized per-day results and rendered report sections, keyed by source-page hash.
+# Bump the versions whenever extraction or section rendering changes.
+DERIVED_DIR = ROOT / "data" / "cache" / "derived"
+DAY_RESULTS_VERSION = 1
+SECTIONS_VERSION = 1
+
+
+def open_day_store() -> DerivedStore:
+    return DerivedStore(DERIVED_DIR, "weekly_days", version=DAY_RESULTS_VERSION)
+
+
+def open_section_store() -> DerivedStore:
+    return DerivedStore(DERIVED_DIR, "weekly_sections", version=SECTIONS_VERSION)
+
 
 def get_cache_path(year: int, month: int, day: int) -> Path:
     """Get cache file path for a specific date."""
@@ -62,22 +89,19 @@ def get_cache_path(year: int, month: int, day: int) -> Path:
 
 
 def load_cached_html(year: int, month: int, day: int) -> Optional[str]:
-    """Load cached HTML if it exists."""
-    cache_path = get_cache_path(year, month, day)
-    if cache_path.exists():
-        try:
-            return cache_path.read_text(encoding='utf-8')
-        except Exception:
-            return None
-    return None
+    """Load cached HTML (compressed or legacy plain file) if it exists."""
+    try:
+        return storage.load_text(get_cache_path(year, month, day))
+    except Exception:
+        return None
 
 
 def save_cached_html(html: str, year: int, month: int, day: int):
-    """Save HTML to cache."""
+    """Save HTML to cache (compressed, see fan2quizz.storage)."""
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
     cache_path = get_cache_path(year, month, day)
     try:
-        cache_path.write_text(html, encoding='utf-8')
+        storage.write_text(cache_path, html)
     except Exception:
         pass  # Cache write failure is not critical
 
@@ -203,8 +227,14 @@ def extract_mistakes(questions: List[Dict[str, Any]], date: str) -> List[Dict[st
     return mistakes
 
 
-def fetch_quiz_data(scraper: QuizypediaScraper, date: datetime, verbose: bool = False, use_cache: bool = True) -> Optional[Dict[str, Any]]:
-    """Fetch quiz data for a specific date."""
+def fetch_quiz_data(scraper: QuizypediaScraper, date: datetime, verbose: bool = False, use_cache: bool = True,
+                    store: Optional[DerivedStore] = None) -> Optional[Dict[str, Any]]:
+    """Fetch quiz data for a specific date.
+
+    When a ``store`` is given, the parsed day (mistakes, totals, category
+    breakdown) is memoized under the date and the hash of the source page,
+    so unchanged days skip DC_DATA extraction entirely.
+    """
     year, month, day = date.year, date.month, date.day
     date_str = date.strftime('%Y-%m-%d')
     
@@ -216,6 +246,7 @@ def fetch_quiz_data(scraper: QuizypediaScraper, date: datetime, verbose: bool =
         html = None
         if use_cache:
             html = load_cached_html(year, month, day)
+            metrics.inc('fan2quizz_cache_requests_total', cache='quiz_html', result='miss' if html is None else 'hit')
             if html and verbose:
                 print("(cached)", end=' ', flush=True)
         
@@ -226,6 +257,14 @@ def fetch_quiz_data(scraper: QuizypediaScraper, date: datetime, verbose: bool =
             if use_cache:
                 save_cached_html(html, year, month, day)
         
+        source_hash = hash_text(html)
+        if store is not None:
+            memo = store.get(date_str, source_hash)
+            if memo is not None:
+                if verbose:
+                    print(f"✓ ({memo['correct']}/{memo['total_questions']}, memoized)")
+                return memo
+        
         questions, user_info = extract_dc_data_from_html(html)
         mistakes = extract_mistakes(questions, date_str)
         
@@ -236,27 +275,85 @@ def fetch_quiz_data(scraper: QuizypediaScraper, date: datetime, verbose: bool =
         if verbose:
             print(f"✓ ({correct_count}/{total_questions})")
         
-        return {
+        day = {
             'date': date_str,
             'total_questions': total_questions,
             'correct': correct_count,
             'mistakes_count': len(mistakes),
             'mistakes': mistakes,
-            'time': user_info.get('elapsed_time', 'N/A')
+            'categories': dict(Counter(m['category'] for m in mistakes)),
+            'time': user_info.get('elapsed_time', 'N/A'),
+            'source_hash': source_hash,
         }
+        if store is not None:
+            store.put(date_str, source_hash, day)
+        return day
     except Exception as e:
+        metrics.inc('fan2quizz_failures_total', stage='fetch_quiz_data')
         if verbose:
             print(f"✗ (Error: {e})")
         return None
 
 
-def generate_markdown_report(quiz_data: List[Dict[str, Any]], start_date: str, end_date: str) -> str:
-    """Generate a markdown report from quiz data."""
+def _cached_section(cache: Optional[DerivedStore], key: str, source_hash: Optional[str], render) -> List[str]:
+    """Return a rendered section's lines, reusing ``cache`` when the source is unchanged."""
+    if cache is None or not source_hash:
+        return render()
+    lines = cache.get(key, source_hash)
+    if lines is None:
+        lines = render()
+        cache.put(key, source_hash, lines)
+    return lines
+
+
+def render_day_details(quiz: Dict[str, Any]) -> List[str]:
+    """Render the detailed mistakes block for a single day."""
+    report = []
+    report.append(f"### 📆 {quiz['date']}")
+    report.append("")
+    
+    for mistake in quiz['mistakes']:
+        report.append(f"#### Question {mistake['question_number']}: {mistake['category']}")
+        report.append("")
+        report.append(f"**Question:** {mistake['question']}")
+        report.append("")
+        
+        if mistake['hints']:
+            report.append("**Hints:**")
+            for hint in mistake['hints']:
+                report.append(f"- {hint}")
+            report.append("")
+        
+        report.append("**Choices:**")
+        for i, choice in enumerate(mistake['all_choices'], 1):
+            marker = ""
+            if choice == mistake['correct_answer']:
+                marker = " ✅ **CORRECT**"
+            elif choice == mistake['your_answer']:
+                marker = " ❌ **YOUR ANSWER**"
+            report.append(f"{i}. {choice}{marker}")
+        report.append("")
+        report.append(f"💭 **You answered:** {mistake['your_answer']}")
+        report.append(f"✓ **Correct answer:** {mistake['correct_answer']}")
+        report.append("")
+        report.append("---")
+        report.append("")
+    return report
+
+
+def generate_markdown_report(quiz_data: List[Dict[str, Any]], start_date: str, end_date: str,
+                             section_cache: Optional[DerivedStore] = None) -> Iterator[str]:
+    """Yield the markdown report from quiz data line by line (join with newlines).
+
+    Per-day sections are looked up in ``section_cache`` by the day's source
+    hash; only the range-wide summary sections are rebuilt on every run.
+    """
     # Filter out None entries
     quiz_data = [q for q in quiz_data if q is not None]
     
     if not quiz_data:
-        return "# Weekly Mistakes Report\n\nNo quiz data available for the specified period.\n"
+        yield from ("# Weekly Mistakes Report", "", "No quiz data available for the specified period.", "")
+        return
     
     # Calculate statistics
     total_quizzes = len(quiz_data)
@@ -266,44 +363,43 @@ def generate_markdown_report(quiz_data: List[Dict[str, Any]], start_date: str, e
     accuracy = (total_correct / total_questions * 100) if total_questions > 0 else 0
     avg_score = total_correct / total_quizzes if total_quizzes > 0 else 0
     
-    # Group mistakes by category
+    # Category breakdown from the per-day counts, details grouped lazily
+    category_counts = Counter()
     mistakes_by_category = defaultdict(list)
-    all_mistakes = []
     for quiz in quiz_data:
+        category_counts.update(quiz.get('categories') or Counter(m['category'] for m in quiz['mistakes']))
         for mistake in quiz['mistakes']:
             mistakes_by_category[mistake['category']].append(mistake)
-            all_mistakes.append(mistake)
     
     # Sort categories by mistake count
     sorted_categories = sorted(mistakes_by_category.items(), key=lambda x: len(x[1]), reverse=True)
     
-    # Build report
-    report = []
-    report.append("# 📋 Weekly Mistakes Report")
-    report.append(f"**Period:** {start_date} to {end_date}")
-    report.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-    report.append("")
-    report.append("---")
-    report.append("")
+    # Stream the report
+    yield "# 📋 Weekly Mistakes Report"
+    yield f"**Period:** {start_date} to {end_date}"
+    yield f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+    yield ""
+    yield "---"
+    yield ""
     
     # Executive Summary
-    report.append("## 📊 Executive Summary")
-    report.append("")
-    report.append(f"- **Quizzes Completed:** {total_quizzes}")
-    report.append(f"- **Total Questions:** {total_questions}")
-    report.append(f"- **Total Correct:** {total_correct}")
-    report.append(f"- **Total Mistakes:** {total_mistakes}")
-    report.append(f"- **Accuracy Rate:** {accuracy:.1f}%")
-    report.append(f"- **Average Score:** {avg_score:.1f}/20 per quiz")
-    report.append("")
-    report.append("---")
-    report.append("")
+    yield "## 📊 Executive Summary"
+    yield ""
+    yield f"- **Quizzes Completed:** {total_quizzes}"
+    yield f"- **Total Questions:** {total_questions}"
+    yield f"- **Total Correct:** {total_correct}"
+    yield f"- **Total Mistakes:** {total_mistakes}"
+    yield f"- **Accuracy Rate:** {accuracy:.1f}%"
+    yield f"- **Average Score:** {avg_score:.1f}/20 per quiz"
+    yield ""
+    yield "---"
+    yield ""
     
     # Daily Breakdown
-    report.append("## 📅 Daily Breakdown")
-    report.append("")
-    report.append("| Date | Score | Mistakes | Time |")
-    report.append("|------|-------|----------|------|")
+    yield "## 📅 Daily Breakdown"
+    yield ""
+    yield "| Date | Score | Mistakes | Time |"
+    yield "|------|-------|----------|------|"
     for quiz in sorted(quiz_data, key=lambda x: x['date']):
         date = quiz['date']
         score = f"{quiz['correct']}/{quiz['total_questions']}"
@@ -311,80 +407,48 @@ def generate_markdown_report(quiz_data: List[Dict[str, Any]], start_date: str, e
         time = quiz['time']
         time_str = f"{time}s" if isinstance(time, int) else str(time)
         emoji = "✅" if mistakes == 0 else "⚠️" if mistakes <= 5 else "❌"
-        report.append(f"| {date} | {emoji} {score} | {mistakes} | {time_str} |")
-    report.append("")
-    report.append("---")
-    report.append("")
+        yield f"| {date} | {emoji} {score} | {mistakes} | {time_str} |"
+    yield ""
+    yield "---"
+    yield ""
     
     # Mistakes by Category
-    report.append("## 🎯 Mistakes by Category")
-    report.append("")
-    report.append("Categories where you made the most mistakes:")
-    report.append("")
-    for i, (category, mistakes) in enumerate(sorted_categories[:10], 1):
-        report.append(f"{i}. **{category}** - {len(mistakes)} mistake(s)")
-    report.append("")
-    report.append("---")
-    report.append("")
+    yield "## 🎯 Mistakes by Category"
+    yield ""
+    yield "Categories where you made the most mistakes:"
+    yield ""
+    for i, (category, count) in enumerate(category_counts.most_common(10), 1):
+        yield f"{i}. **{category}** - {count} mistake(s)"
+    yield ""
+    yield "---"
+    yield ""
+    
+    # All Mistakes Detailed (one cacheable section per day)
+    yield "## ❌ All Mistakes (Detailed)"
+    yield ""
     
-    # All Mistakes Detailed
-    report.append("## ❌ All Mistakes (Detailed)")
-    report.append("")
-    
-    # Group by date
-    mistakes_by_date = defaultdict(list)
-    for mistake in all_mistakes:
-        mistakes_by_date[mistake['date']].append(mistake)
-    
-    for date in sorted(mistakes_by_date.keys()):
-        report.append(f"### 📆 {date}")
-        report.append("")
-        
-        for mistake in mistakes_by_date[date]:
-            report.append(f"#### Question {mistake['question_number']}: {mistake['category']}")
-            report.append("")
-            report.append(f"**Question:** {mistake['question']}")
-            report.append("")
-            
-            if mistake['hints']:
-                report.append("**Hints:**")
-                for hint in mistake['hints']:
-                    report.append(f"- {hint}")
-                report.append("")
-            
-            report.append("**Choices:**")
-            for i, choice in enumerate(mistake['all_choices'], 1):
-                marker = ""
-                if choice == mistake['correct_answer']:
-                    marker = " ✅ **CORRECT**"
-                elif choice == mistake['your_answer']:
-                    marker = " ❌ **YOUR ANSWER**"
-                report.append(f"{i}. {choice}{marker}")
-            report.append("")
-            report.append(f"💭 **You answered:** {mistake['your_answer']}")
-            report.append(f"✓ **Correct answer:** {mistake['correct_answer']}")
-            report.append("")
-            report.append("---")
-            report.append("")
+    for quiz in sorted(quiz_data, key=lambda x: x['date']):
+        if not quiz['mistakes']:
+            continue
+        yield from _cached_section(section_cache, f"details-{quiz['date']}", quiz.get('source_hash'),
+                                   lambda quiz=quiz: render_day_details(quiz))
     
     # Category Breakdown
-    report.append("## 📚 Mistakes by Category (Detailed)")
-    report.append("")
+    yield "## 📚 Mistakes by Category (Detailed)"
+    yield ""
     
     for category, mistakes in sorted_categories:
-        report.append(f"### {category} ({len(mistakes)} mistake(s))")
-        report.append("")
+        yield f"### {category} ({len(mistakes)} mistake(s))"
+        yield ""
         
         for mistake in mistakes:
-            report.append(f"**[{mistake['date']}] Q{mistake['question_number']}:** {mistake['question']}")
-            report.append(f"- ❌ Your answer: {mistake['your_answer']}")
-            report.append(f"- ✅ Correct: {mistake['correct_answer']}")
-            report.append("")
+            yield f"**[{mistake['date']}] Q{mistake['question_number']}:** {mistake['question']}"
+            yield f"- ❌ Your answer: {mistake['your_answer']}"
+            yield f"- ✅ Correct: {mistake['correct_answer']}"
+            yield ""
         
-        report.append("---")
-        report.append("")
-    
-    return "\n".join(report)
+        yield "---"
+        yield ""
 
 
 def main():
@@ -425,7 +489,7 @@ Note: The script automatically uses credentials from .env file.
     parser.add_argument(
         '--output',
         default=None,
-        help='Output filename (default: output/reports/WEEKLY_MISTAKES_REPORT.md)'
+        help="Output filename, or '-' for stdout (default: output/reports/WEEKLY_MISTAKES_REPORT.md)"
     )
     parser.add_argument(
         '--verbose',
@@ -442,9 +506,38 @@ Note: The script automatically uses credentials from .env file.
         action='store_true',
         help='Skip cache, always fetch fresh from server'
     )
+    parser.add_argument(
+        '--no-memo',
+        action='store_true',
+        help='Recompute every day and section instead of reusing memoized results'
+    )
+    parser.add_argument(
+        '--metrics-dir',
+        help='Write Prometheus metrics (node_exporter textfile) to this directory (default: $FAN2QUIZZ_METRICS_DIR)'
+    )
     
     args = parser.parse_args()
-    
+    out = ReportWriter(args.output if args.output else DEFAULT_OUTPUT)
+    metrics_dir = metrics.metrics_dir(args.metrics_dir)
+    if metrics_dir is not None:
+        metrics.enable()
+    
+    # With --output -, stdout carries only the report and progress goes to stderr
+    with contextlib.redirect_stdout(status_stream(args.output)):
+        code = 1
+        try:
+            code = run_report(args, out)
+        finally:
+            timing.disable()
+            if metrics_dir is not None:
+                path = metrics.write_textfile(metrics_dir, 'weekly_mistakes_report',
+                                              success=code == 0 and not metrics.total('fan2quizz_failures_total'))
+                print(f"📈 Metrics written to {path}")
+        return code
+
+
+def run_report(args: argparse.Namespace, out: ReportWriter) -> int:
+    """Fetch the date range, stream the report through ``out`` and optionally update the history."""
     # Determine date range
     if args.days:
         end_date = datetime.now() - timedelta(days=1)
@@ -501,10 +594,12 @@ Note: The script automatically uses credentials from .env file.
     if args.verbose:
         print()
     
-    # Fetch quiz data for each date
+    # Fetch quiz data for each date (unchanged days come straight from the memo store)
+    day_store = None if args.no_memo else open_day_store()
+    section_store = None if args.no_memo else open_section_store()
     quiz_data = []
     for date in dates:
-        data = fetch_quiz_data(scraper, date, verbose=args.verbose, use_cache=not args.no_cache)
+        data = fetch_quiz_data(scraper, date, verbose=args.verbose, use_cache=not args.no_cache, store=day_store)
         if data:
             quiz_data.append(data)
     
@@ -514,13 +609,9 @@ Note: The script automatically uses credentials from .env file.
     
     # Generate report
     print("📝 Generating report...")
-    report = generate_markdown_report(quiz_data, start_str, end_str)
-    
-    # Save report
-    output_path = Path(args.output) if args.output else DEFAULT_OUTPUT
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(report, encoding='utf-8')
-    print(f"✅ Report saved to: {output_path}")
+    with out, timing.span('render'):
+        out.write_lines(generate_markdown_report(quiz_data, start_str, end_str, section_cache=section_store))
+    print(f"✅ Report saved to: {'stdout' if out.is_stdout else out.path}")
     
     # Update history if requested
     if args.update_history:
@@ -556,7 +647,7 @@ Note: The script automatically uses credentials from .env file.
     print("📊 Summary:")
     print(f"   - Quizzes analyzed: {len(quiz_data)}")
     print(f"   - Total mistakes found: {sum(q['mistakes_count'] for q in quiz_data)}")
-    print(f"   - Report saved to: {args.output}")
+    print(f"   - Report saved to: {'stdout' if out.is_stdout else out.path}")
     print("=" * 60)
     
     return 0
@@ -0,0 +1,30 @@
+import json
+
+from fan2quizz.percentiles import PercentileIndex
+
+
+def write_day(archive_dir, day, scores):
+    results = [{'user': f"p{i}", 'good_responses': s, 'elapsed_time': 60} for i, s in enumerate(scores)]
+    (archive_dir / f"{day}.json").write_text(json.dumps({'results': results}), encoding='utf-8')
+
+
+def test_blob_from_another_save_is_rebuilt(tmp_path):
+    archive_dir, index_dir = tmp_path / "archive", tmp_path / "index"
+    archive_dir.mkdir()
+    write_day(archive_dir, "2024-01-01", [10, 5])
+    first = PercentileIndex.open(archive_dir, index_dir)
+    old_header = (index_dir / "index.json").read_text(encoding='utf-8')
+
+    write_day(archive_dir, "2024-01-02", [20, 15, 1])
+    PercentileIndex.open(archive_dir, index_dir)
+    # New keys.bin with the previous header, as after a crash between the two replaces
+    (index_dir / "index.json").write_text(old_header, encoding='utf-8')
+
+    stale = PercentileIndex(index_dir)
+    assert not stale.load()
+    assert stale.dates == []
+
+    rebuilt = PercentileIndex.open(archive_dir, index_dir)
+    assert rebuilt.dates == ["2024-01-01", "2024-01-02"]
+    assert rebuilt.percentile("2024-01-01", 10, 60) == first.percentile("2024-01-01", 10, 60) == 100.0
+    assert PercentileIndex(index_dir).load()
@@ -0,0 +1,53 @@
+import json
+
+from fan2quizz.ratings import RatingBook
+
+
+def write_day(archive_dir, day, results):
+    (archive_dir / f"{day}.json").write_text(json.dumps({'results': results}), encoding='utf-8')
+
+
+def results(*scores):
+    return [{'user': f"p{i}", 'good_responses': score, 'elapsed_time': 100 + i} for i, score in enumerate(scores)]
+
+
+def test_corrupt_archive_does_not_reset_on_next_update(tmp_path, monkeypatch):
+    archive_dir = tmp_path / "archive"
+    archive_dir.mkdir()
+    write_day(archive_dir, "2024-01-01", results(10, 8, 5))
+    (archive_dir / "2024-01-02.json").write_text("{not json", encoding='utf-8')
+    write_day(archive_dir, "2024-01-03", results(7, 9, 4))
+
+    state = tmp_path / "ratings.json"
+    book = RatingBook(state)
+    assert book.update(archive_dir) == 3
+    assert sorted(book.sources) == ["2024-01-01", "2024-01-03"]
+    assert "2024-01-02" in book.skipped
+    book.save()
+
+    write_day(archive_dir, "2024-01-04", results(6, 6, 6))
+    reloaded = RatingBook(state)
+    assert reloaded.load()
+
+    def fail_reset():
+        raise AssertionError("update() rebuilt the ratings from scratch")
+
+    monkeypatch.setattr(reloaded, 'reset', fail_reset)
+    assert reloaded.update(archive_dir) == 1
+    assert "2024-01-04" in reloaded.sources
+    assert reloaded.update(archive_dir) == 0
+
+
+def test_repaired_archive_is_folded_in(tmp_path):
+    archive_dir = tmp_path / "archive"
+    archive_dir.mkdir()
+    write_day(archive_dir, "2024-01-01", results(10, 8))
+    bad = archive_dir / "2024-01-02.json"
+    bad.write_text("{not json", encoding='utf-8')
+
+    book = RatingBook(tmp_path / "ratings.json")
+    book.update(archive_dir)
+    write_day(archive_dir, "2024-01-02", results(3, 9, 1))
+    assert book.update(archive_dir) == 1
+    assert "2024-01-02" in book.sources
+    assert not book.skipped
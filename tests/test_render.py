@@ -0,0 +1,25 @@
+from fan2quizz.render import RenderJob, manifest_path, render_all
+
+
+def write_figure(output):
+    output.write_text("png", encoding='utf-8')
+
+
+def broken_figure(output):
+    raise RuntimeError("no data for this figure")
+
+
+def test_failing_job_does_not_abort_in_process_batch(tmp_path):
+    good, bad, after = tmp_path / "good.png", tmp_path / "bad.png", tmp_path / "after.png"
+    jobs = [
+        RenderJob("good", write_figure, {'output': good}, good, fingerprint="a"),
+        RenderJob("bad", broken_figure, {'output': bad}, bad, fingerprint="b"),
+        RenderJob("after", write_figure, {'output': after}, after, fingerprint="c"),
+    ]
+    results = render_all(jobs, max_workers=1)
+
+    assert [r.name for r in results] == ["good", "bad", "after"]
+    assert [r.ok for r in results] == [True, False, True]
+    assert "RuntimeError: no data for this figure" in results[1].error
+    assert manifest_path(good).is_file() and manifest_path(after).is_file()
+    assert not manifest_path(bad).exists()